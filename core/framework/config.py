@@ -99,6 +99,54 @@ def get_llm_extra_kwargs() -> dict[str, Any]:
     return {}
 
 
+def get_llm_cache_config() -> dict[str, Any]:
+    """Return the ``llm.cache`` section controlling the response cache.
+
+    Example::
+
+        {"llm": {"cache": {"enabled": true, "ttl_seconds": 86400,
+                           "max_entries": 1024, "max_disk_bytes": 268435456}}}
+    """
+    cache = get_hive_config().get("llm", {}).get("cache", {})
+    return cache if isinstance(cache, dict) else {}
+
+
+def get_llm_http_pool_config() -> dict[str, Any] | None:
+    """Return the ``llm.http_pool`` section, or None when pooling is not configured.
+
+    Keys map to ``framework.llm.http_pool.HTTPPoolConfig`` fields, e.g.
+    ``{"max_connections_per_host": 50, "http2": true}``.
+    """
+    pool = get_hive_config().get("llm", {}).get("http_pool")
+    return pool if isinstance(pool, dict) else None
+
+
+def get_llm_rate_limit_config() -> dict[str, Any] | None:
+    """Return the ``llm.rate_limit`` section, or None when no limiter is configured.
+
+    Top-level keys map to ``framework.llm.rate_limiter.RateLimitConfig``
+    fields; ``models`` holds per-model overrides, e.g.
+    ``{"requests_per_minute": 50, "models": {"gpt-4o": {"max_concurrency": 8}}}``.
+    """
+    limits = get_hive_config().get("llm", {}).get("rate_limit")
+    return limits if isinstance(limits, dict) else None
+
+
+def get_llm_routing_config() -> dict[str, Any] | None:
+    """Return the ``llm.routing`` section, or None when routing is not configured.
+
+    ``backends`` lists extra models to route to alongside the primary one;
+    the remaining keys map to ``framework.llm.router.RoutingConfig`` fields::
+
+        {"llm": {"routing": {"hedge_after": 8,
+                             "backends": [{"model": "gpt-4o", "cost_per_mtok": 10}]}}}
+    """
+    routing = get_hive_config().get("llm", {}).get("routing")
+    if not isinstance(routing, dict) or not routing.get("backends"):
+        return None
+    return routing
+
+
 # ---------------------------------------------------------------------------
 # RuntimeConfig – shared across agent templates
 # ---------------------------------------------------------------------------
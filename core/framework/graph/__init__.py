@@ -18,7 +18,16 @@
 )
 from framework.graph.executor import GraphExecutor
 from framework.graph.goal import Constraint, Goal, GoalStatus, SuccessCriterion
+from framework.graph.map_node import MapLedger, MapNode
+from framework.graph.memory_store import (
+    MemoryChangeSet,
+    MemoryMergeError,
+    MemorySnapshot,
+    MemoryStore,
+    MergeConflict,
+)
 from framework.graph.node import NodeContext, NodeProtocol, NodeResult, NodeSpec
+from framework.graph.spillover import SpilledFile, SpilloverStore, get_spillover_store
 
 __all__ = [
     # Goal
@@ -31,6 +40,9 @@
     "NodeContext",
     "NodeResult",
     "NodeProtocol",
+    # Map
+    "MapNode",
+    "MapLedger",
     # Edge
     "EdgeSpec",
     "EdgeCondition",
@@ -48,6 +60,16 @@
     "OutputAccumulator",
     "JudgeProtocol",
     "JudgeVerdict",
+    # Memory
+    "MemoryStore",
+    "MemorySnapshot",
+    "MemoryChangeSet",
+    "MergeConflict",
+    "MemoryMergeError",
+    # Spillover
+    "SpilloverStore",
+    "SpilledFile",
+    "get_spillover_store",
     # Context Handoff
     "ContextHandoff",
     "HandoffContext",
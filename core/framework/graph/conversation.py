@@ -488,7 +488,8 @@ async def prune_old_tool_results(
                 placeholder = (
                     f"[Pruned tool result: {orig_len} chars. "
                     f"Full data in '{spillover}'. "
-                    f"Use load_data('{spillover}') to retrieve.]"
+                    f"Use query_spilled(filename='{spillover}', ...) or "
+                    f"load_data('{spillover}') to retrieve.]"
                 )
             else:
                 placeholder = f"[Pruned tool result: {orig_len} chars cleared from context.]"
@@ -512,26 +513,16 @@ async def prune_old_tool_results(
         self._last_api_input_tokens = None
         return count
 
-    async def compact(
-        self,
-        summary: str,
-        keep_recent: int = 2,
-        phase_graduated: bool = False,
-    ) -> None:
-        """Replace old messages with a summary, optionally keeping recent ones.
+    def compaction_split(self, keep_recent: int = 2, phase_graduated: bool = False) -> int:
+        """Number of leading messages :meth:`compact` would replace.
 
-        Args:
-            summary: Caller-provided summary text.
-            keep_recent: Number of recent messages to preserve (default 2).
-                         Clamped to [0, len(messages) - 1].
-            phase_graduated: When True and messages have phase_id metadata,
-                split at phase boundaries instead of using keep_recent.
-                Keeps current + previous phase intact; compacts older phases.
+        Lets callers plan a compaction ahead of time (e.g. summarize the
+        prefix in the background) and later pass the result back as
+        ``prefix_count``.  Arguments match :meth:`compact`.
         """
-        if not self._messages:
-            return
-
         total = len(self._messages)
+        if total == 0:
+            return 0
 
         # Phase-graduated: find the split point based on phase boundaries.
         # Keeps current phase + previous phase intact, compacts older phases.
@@ -551,6 +542,35 @@ async def compact(
         # compacted (old) portion the tool_result becomes invalid.
         while split < total and self._messages[split].role == "tool":
             split += 1
+        return split
+
+    async def compact(
+        self,
+        summary: str,
+        keep_recent: int = 2,
+        phase_graduated: bool = False,
+        prefix_count: int | None = None,
+    ) -> None:
+        """Replace old messages with a summary, optionally keeping recent ones.
+
+        Args:
+            summary: Caller-provided summary text.
+            keep_recent: Number of recent messages to preserve (default 2).
+                         Clamped to [0, len(messages) - 1].
+            phase_graduated: When True and messages have phase_id metadata,
+                split at phase boundaries instead of using keep_recent.
+                Keeps current + previous phase intact; compacts older phases.
+            prefix_count: Replace exactly this many leading messages, as
+                previously returned by :meth:`compaction_split`.  Overrides
+                *keep_recent* and *phase_graduated*.
+        """
+        if not self._messages:
+            return
+
+        if prefix_count is not None:
+            split = max(0, min(prefix_count, len(self._messages)))
+        else:
+            split = self.compaction_split(keep_recent, phase_graduated)
 
         # Nothing to compact
         if split == 0:
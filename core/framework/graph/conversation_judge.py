@@ -17,6 +17,7 @@
 
 from framework.graph.conversation import NodeConversation
 from framework.llm.provider import LLMProvider
+from framework.llm.rate_limiter import LLMPriority, llm_priority
 
 logger = logging.getLogger(__name__)
 
@@ -86,12 +87,13 @@ async def evaluate_phase_completion(
 FEEDBACK: (reason if RETRY, empty if ACCEPT)"""
 
     try:
-        response = await llm.acomplete(
-            messages=[{"role": "user", "content": user_prompt}],
-            system=system_prompt,
-            max_tokens=max(1024, max_history_tokens // 5),
-            max_retries=1,
-        )
+        with llm_priority(LLMPriority.BACKGROUND):
+            response = await llm.acomplete(
+                messages=[{"role": "user", "content": user_prompt}],
+                system=system_prompt,
+                max_tokens=max(1024, max_history_tokens // 5),
+                max_retries=1,
+            )
         if not response.content or not response.content.strip():
             logger.debug("Level 2 judge: empty response, accepting by default")
             return PhaseVerdict(action="ACCEPT", confidence=0.5, feedback="")
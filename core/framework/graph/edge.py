@@ -454,6 +454,14 @@ class GraphSpec(BaseModel):
         ),
     )
 
+    max_parallel_branches: int | None = Field(
+        default=None,
+        description=(
+            "Maximum fan-out branches running at once in this graph (0 = unlimited). "
+            "A fan-out node's own max_parallel_branches takes precedence."
+        ),
+    )
+
     # Metadata
     description: str = ""
     created_by: str = ""  # "human" or "builder_agent"
@@ -470,6 +478,13 @@ def _resolve_max_tokens(cls, values: Any) -> Any:
             values["max_tokens"] = get_max_tokens()
         return values
 
+    def compile_validators(self) -> None:
+        """Precompile every node's validator (see ``NodeSpec.compiled_validator``)."""
+        for node in self.nodes:
+            compile_validator = getattr(node, "compiled_validator", None)
+            if compile_validator is not None:
+                compile_validator(recompile=True)
+
     def get_node(self, node_id: str) -> Any | None:
         """Get a node by ID."""
         for node in self.nodes:
@@ -497,6 +512,39 @@ def get_incoming_edges(self, node_id: str) -> list[EdgeSpec]:
         """Get all edges entering a node."""
         return [e for e in self.edges if e.target == node_id]
 
+    def _validate_map_nodes(self) -> list[str]:
+        """Check the map_over / map_node wiring of every map node."""
+        from framework.graph.map_node import MAP_REDUCE_MODES
+
+        errors = []
+        for node in self.nodes:
+            if getattr(node, "node_type", "") != "map":
+                continue
+            if not getattr(node, "map_over", None):
+                errors.append(f"Map node '{node.id}' has no map_over key")
+            elif node.input_keys and node.map_over not in node.input_keys:
+                errors.append(
+                    f"Map node '{node.id}' maps over '{node.map_over}', "
+                    f"which is not one of its input_keys"
+                )
+            if not node.output_keys:
+                errors.append(f"Map node '{node.id}' needs an output key for the reduced result")
+            if node.map_reduce not in MAP_REDUCE_MODES:
+                errors.append(
+                    f"Map node '{node.id}' has invalid map_reduce '{node.map_reduce}'. "
+                    f"Valid: {list(MAP_REDUCE_MODES)}"
+                )
+            target = self.get_node(node.map_node) if getattr(node, "map_node", None) else None
+            if target is None:
+                errors.append(f"Map node '{node.id}' references missing map_node '{node.map_node}'")
+            elif getattr(target, "node_type", "") == "map":
+                errors.append(f"Map node '{node.id}' cannot run another map node per element")
+            elif getattr(target, "client_facing", False):
+                errors.append(
+                    f"Map node '{node.id}' cannot run client-facing node '{target.id}' per element"
+                )
+        return errors
+
     def detect_fan_out_nodes(self) -> dict[str, list[str]]:
         """
         Detect nodes that fan-out to multiple targets.
@@ -638,6 +686,12 @@ def validate(self) -> list[str]:
             for edge in self.get_outgoing_edges(current):
                 to_visit.append(edge.target)
 
+        # Nodes run per element by a reachable map node are reachable too
+        for node in self.nodes:
+            if node.id in reachable and getattr(node, "node_type", "") == "map":
+                if getattr(node, "map_node", None):
+                    reachable.add(node.map_node)
+
         # Build set of async entry point nodes for quick lookup
         async_entry_nodes = {ep.entry_node for ep in self.async_entry_points}
 
@@ -653,6 +707,8 @@ def validate(self) -> list[str]:
                     continue
                 errors.append(f"Node '{node.id}' is unreachable from entry")
 
+        errors.extend(self._validate_map_nodes())
+
         # Client-facing fan-out validation
         fan_outs = self.detect_fan_out_nodes()
         for source_id, targets in fan_outs.items():
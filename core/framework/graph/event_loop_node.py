@@ -20,9 +20,11 @@
 from pathlib import Path
 from typing import Any, Literal, Protocol, runtime_checkable
 
-from framework.graph.conversation import ConversationStore, NodeConversation
+from framework.graph.conversation import ConversationStore, Message, NodeConversation
 from framework.graph.node import NodeContext, NodeProtocol, NodeResult
+from framework.graph.spillover import get_spillover_store
 from framework.llm.provider import Tool, ToolResult, ToolUse
+from framework.llm.rate_limiter import LLMPriority, llm_priority
 from framework.llm.stream_events import (
     FinishEvent,
     StreamErrorEvent,
@@ -30,6 +32,7 @@
     ToolCallEvent,
 )
 from framework.runtime.event_bus import EventBus
+from framework.utils.json_stream import loads_lenient, parse_partial_json
 
 logger = logging.getLogger(__name__)
 
@@ -103,6 +106,64 @@ class LoopConfig:
     tool_doom_loop_threshold: int = 3
     tool_doom_loop_enabled: bool = True
 
+    # --- Early tool dispatch ---
+    # Start tools marked ``read_only`` as soon as their call arrives in the
+    # stream instead of after the whole response.  Results are still
+    # recorded in call order and the hard tool-call limit still applies.
+    early_tool_dispatch: bool = True
+
+    # --- Speculative compaction ---
+    # Once usage crosses this fraction of max_history_tokens, the LLM
+    # compaction summary is prepared in the background over the prefix that
+    # will be compacted.  The next compaction swaps it in if that prefix is
+    # unchanged instead of blocking on a fresh summary call.  Opt-in (e.g.
+    # 0.7): it costs extra background LLM calls.  None disables.
+    speculative_compaction_threshold: float | None = None
+
+
+@dataclass
+class SpeculativeCompactionStats:
+    """Counters for background compaction summaries.
+
+    ``latency_saved_seconds`` is summary generation time the loop did not
+    have to wait for: for each hit, how long the summary took minus how
+    long compaction still waited for it.
+    """
+
+    started: int = 0
+    hits: int = 0
+    misses: int = 0
+    latency_saved_seconds: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "started": self.started,
+            "hits": self.hits,
+            "misses": self.misses,
+            "latency_saved_ms": round(self.latency_saved_seconds * 1000),
+        }
+
+
+@dataclass
+class _SpeculativeSummary:
+    """A compaction summary being prepared ahead of time."""
+
+    conversation: NodeConversation
+    prefix_count: int
+    prefix: tuple[tuple[int, str], ...]
+    task: asyncio.Task[tuple[str, float]]
+
+    def matches(self, conversation: NodeConversation) -> bool:
+        """Whether *conversation* still starts with the summarized messages."""
+        return conversation is self.conversation and self.prefix == _prefix_key(
+            conversation.messages[: self.prefix_count]
+        )
+
+
+def _prefix_key(messages: list[Message]) -> tuple[tuple[int, str], ...]:
+    # Content is included because tool-result pruning edits messages in place.
+    return tuple((m.seq, m.content) for m in messages)
+
 
 # ---------------------------------------------------------------------------
 # Output accumulator with write-through persistence
@@ -207,6 +268,15 @@ def __init__(
         self._input_ready = asyncio.Event()
         self._awaiting_input = False
         self._shutdown = False
+        # Background compaction summaries per execution, keyed by id(ctx)
+        # (see LoopConfig.speculative_compaction_threshold)
+        self._speculations: dict[int, _SpeculativeSummary] = {}
+        self._speculative_stats = SpeculativeCompactionStats()
+
+    @property
+    def speculative_compaction_stats(self) -> SpeculativeCompactionStats:
+        """Hit/miss counters and latency saved by speculative compaction."""
+        return self._speculative_stats
 
     def validate_input(self, ctx: NodeContext) -> list[str]:
         """Validate hard requirements only.
@@ -226,6 +296,12 @@ def validate_input(self, ctx: NodeContext) -> list[str]:
 
     async def execute(self, ctx: NodeContext) -> NodeResult:
         """Run the event loop."""
+        try:
+            return await self._execute_loop(ctx)
+        finally:
+            self._discard_speculative_summary(ctx)
+
+    async def _execute_loop(self, ctx: NodeContext) -> NodeResult:
         start_time = time.time()
         total_input_tokens = 0
         total_output_tokens = 0
@@ -344,6 +420,8 @@ async def execute(self, ctx: NodeContext) -> NodeResult:
         if ctx.node_spec.client_facing and not ctx.event_triggered:
             tools.append(self._build_ask_user_tool())
             tools.append(self._build_escalate_tool())
+        if self._config.spillover_dir:
+            tools.append(self._build_query_spilled_tool())
 
         logger.info(
             "[%s] Tools available (%d): %s | client_facing=%s | judge=%s",
@@ -524,6 +602,8 @@ async def execute(self, ctx: NodeContext) -> NodeResult:
             # 6e''. Post-turn compaction check (catches tool-result bloat)
             if conversation.needs_compaction():
                 await self._compact_tiered(ctx, conversation, accumulator)
+            else:
+                self._maybe_start_speculative_summary(ctx, conversation)
 
             # 6e'''. Empty response guard — if the LLM returned nothing
             # (no text, no real tools, no set_output) and all required
@@ -1162,37 +1242,72 @@ async def _run_single_turn(
             accumulated_text = ""
             tool_calls: list[ToolCallEvent] = []
             _stream_error: StreamErrorEvent | None = None
+            # Read-only tools started mid-stream, keyed by tool_use_id.
+            early_tasks: dict[str, asyncio.Future[ToolResult]] = {}
+            early_safe = (
+                {t.name for t in tools if t.read_only}
+                if self._config.early_tool_dispatch
+                else set()
+            )
 
             # Stream LLM response
-            async for event in ctx.llm.stream(
-                messages=messages,
-                system=conversation.system_prompt,
-                tools=tools if tools else None,
-                max_tokens=ctx.max_tokens,
-            ):
-                if isinstance(event, TextDeltaEvent):
-                    accumulated_text = event.snapshot
-                    await self._publish_text_delta(
-                        stream_id, node_id, event.content, event.snapshot, ctx
-                    )
-
-                elif isinstance(event, ToolCallEvent):
-                    tool_calls.append(event)
-
-                elif isinstance(event, FinishEvent):
-                    token_counts["input"] += event.input_tokens
-                    token_counts["output"] += event.output_tokens
-
-                elif isinstance(event, StreamErrorEvent):
-                    if not event.recoverable:
-                        raise RuntimeError(f"Stream error: {event.error}")
-                    _stream_error = event
-                    logger.warning("Recoverable stream error: %s", event.error)
+            # Client-facing turns have a human waiting, so they are admitted
+            # ahead of background LLM work when the rate limiter is queueing.
+            priority = (
+                LLMPriority.INTERACTIVE if ctx.node_spec.client_facing else LLMPriority.NORMAL
+            )
+            try:
+                with llm_priority(priority):
+                    async for event in ctx.llm.stream(
+                        messages=messages,
+                        system=conversation.system_prompt,
+                        tools=tools if tools else None,
+                        max_tokens=ctx.max_tokens,
+                    ):
+                        if isinstance(event, TextDeltaEvent):
+                            accumulated_text = event.snapshot
+                            await self._publish_text_delta(
+                                stream_id, node_id, event.content, event.snapshot, ctx
+                            )
 
-            # If a recoverable stream error produced an empty response,
-            # raise so the outer transient-error retry can handle it
-            # with proper backoff instead of burning judge iterations.
-            if _stream_error and not accumulated_text and not tool_calls:
+                        elif isinstance(event, ToolCallEvent):
+                            tool_calls.append(event)
+                            if self._can_start_early(
+                                event, early_safe, tool_call_count + len(tool_calls)
+                            ):
+                                # Publish the start first so tool_started always
+                                # precedes tool_completed on the event bus.
+                                await self._publish_tool_started(
+                                    stream_id,
+                                    node_id,
+                                    event.tool_use_id,
+                                    event.tool_name,
+                                    event.tool_input,
+                                )
+                                early_tasks[event.tool_use_id] = asyncio.ensure_future(
+                                    self._execute_tool(event)
+                                )
+
+                        elif isinstance(event, FinishEvent):
+                            token_counts["input"] += event.input_tokens
+                            token_counts["output"] += event.output_tokens
+
+                        elif isinstance(event, StreamErrorEvent):
+                            if not event.recoverable:
+                                raise RuntimeError(f"Stream error: {event.error}")
+                            _stream_error = event
+                            logger.warning("Recoverable stream error: %s", event.error)
+            except BaseException:
+                await self._abandon_early_tools(stream_id, node_id, tool_calls, early_tasks)
+                raise
+
+            # If a recoverable stream error produced an empty response, or
+            # cut off a turn that had already emitted tool calls, raise so
+            # the outer transient-error retry can handle it with proper
+            # backoff instead of burning judge iterations.  Tools started
+            # early are cancelled first; the retried turn issues them again.
+            if _stream_error and (tool_calls or not accumulated_text):
+                await self._abandon_early_tools(stream_id, node_id, tool_calls, early_tasks)
                 raise ConnectionError(
                     f"Stream failed with recoverable error: {_stream_error.error}"
                 )
@@ -1256,9 +1371,10 @@ async def _run_single_turn(
                     break
                 executed_in_batch += 1
 
-                await self._publish_tool_started(
-                    stream_id, node_id, tc.tool_use_id, tc.tool_name, tc.tool_input
-                )
+                if tc.tool_use_id not in early_tasks:
+                    await self._publish_tool_started(
+                        stream_id, node_id, tc.tool_use_id, tc.tool_name, tc.tool_input
+                    )
                 logger.info(
                     "[%s] tool_call: %s(%s)",
                     node_id,
@@ -1279,12 +1395,13 @@ async def _run_single_turn(
                         # Parse JSON strings into native types so downstream
                         # consumers get lists/dicts instead of serialised JSON,
                         # and the hallucination validator skips non-string values.
+                        # Raw newlines inside JSON strings are repaired.
                         if isinstance(value, str):
                             try:
-                                parsed = json.loads(value)
+                                parsed = loads_lenient(value)
                                 if isinstance(parsed, (list, dict, bool, int, float)):
                                     value = parsed
-                            except (json.JSONDecodeError, TypeError):
+                            except (ValueError, TypeError):
                                 pass
                         key = tc.tool_input.get("key", "")
                         await accumulator.set(key, value)
@@ -1352,10 +1469,16 @@ async def _run_single_turn(
                     else:
                         pending_real.append(tc)
 
-            # Phase 2: execute real tools in parallel.
+            # Phase 2: execute real tools in parallel.  Tools already started
+            # during the stream are awaited rather than re-run.
             if pending_real:
                 raw_results = await asyncio.gather(
-                    *(self._execute_tool(tc) for tc in pending_real),
+                    *(
+                        early_tasks.pop(tc.tool_use_id)
+                        if tc.tool_use_id in early_tasks
+                        else self._execute_tool(tc)
+                        for tc in pending_real
+                    ),
                     return_exceptions=True,
                 )
                 for tc, raw in zip(pending_real, raw_results, strict=True):
@@ -1367,7 +1490,19 @@ async def _run_single_turn(
                         )
                     else:
                         result = raw
-                    results_by_id[tc.tool_use_id] = self._truncate_tool_result(result, tc.tool_name)
+                    results_by_id[tc.tool_use_id] = await self._truncate_tool_result(
+                        result, tc.tool_name
+                    )
+
+            # Not reached by triage (should not happen); still close out
+            # their tool_started events.
+            await self._abandon_early_tools(
+                stream_id,
+                node_id,
+                tool_calls,
+                early_tasks,
+                "Tool call cancelled: it was not executed in this turn.",
+            )
 
             # Phase 3: record results into conversation in original order,
             # build logged/real lists, and publish completed events.
@@ -1562,6 +1697,47 @@ def _build_escalate_tool(self) -> Tool:
             },
         )
 
+    def _build_query_spilled_tool(self) -> Tool:
+        """Build the synthetic query_spilled tool for reading spilled results.
+
+        Available whenever *spillover_dir* is set.  Handled in
+        ``_execute_tool`` against the session's spillover index, so it runs
+        like any other read-only tool.
+        """
+        return Tool(
+            name="query_spilled",
+            description=(
+                "Fetch only the relevant part of a large tool result that was saved "
+                "to a file. Use ONE of: query (keyword search, returns the best "
+                "matching line windows), json_path (e.g. '$.items[0:10]' or "
+                "'$.items[*].name' for JSON results), or line_range (e.g. '120-180'). "
+                "Prefer this over paging through the file with load_data."
+            ),
+            parameters={
+                "type": "object",
+                "properties": {
+                    "filename": {
+                        "type": "string",
+                        "description": (
+                            "Spilled file name, as shown in the truncation notice. "
+                            "Optional with query: omit to search all saved files."
+                        ),
+                    },
+                    "query": {"type": "string", "description": "Keywords to search for."},
+                    "json_path": {
+                        "type": "string",
+                        "description": "Path into a JSON result: keys, [n], [a:b], [*].",
+                    },
+                    "line_range": {
+                        "type": "string",
+                        "description": "1-based inclusive line range, e.g. '40-80'.",
+                    },
+                },
+                "required": [],
+            },
+            read_only=True,
+        )
+
     def _build_set_output_tool(self, output_keys: list[str] | None) -> Tool | None:
         """Build the synthetic set_output tool for explicit output declaration."""
         if not output_keys:
@@ -1605,10 +1781,15 @@ def _handle_set_output(
             import re
 
             raw = tool_input["_raw"]
-            key_match = re.search(r'"key"\s*:\s*"(\w+)"', raw)
+            # Close the truncated object; this also decodes escapes in value.
+            recovered = parse_partial_json(raw)
+            if isinstance(recovered, dict) and isinstance(recovered.get("key"), str):
+                key = recovered["key"]
+                value = recovered.get("value", "")
+            key_match = None if key else re.search(r'"key"\s*:\s*"(\w+)"', raw)
             if key_match:
                 key = key_match.group(1)
-            val_match = re.search(r'"value"\s*:\s*"', raw)
+            val_match = re.search(r'"value"\s*:\s*"', raw) if key_match else None
             if val_match:
                 start = val_match.end()
                 value = raw[start:].rstrip()
@@ -1620,7 +1801,7 @@ def _handle_set_output(
                 logger.warning(
                     "Recovered set_output args from truncated JSON: key=%s, value_len=%d",
                     key,
-                    len(value),
+                    len(str(value)),
                 )
                 # Re-inject so the caller sees proper key/value
                 tool_input["key"] = key
@@ -1736,7 +1917,7 @@ async def _evaluate(
 
     @staticmethod
     def _extract_tool_call_history(
-        conversation: NodeConversation,
+        conversation: NodeConversation | list[Message],
         max_entries: int = 30,
     ) -> str:
         """Build a compact tool call history from the conversation.
@@ -1767,7 +1948,8 @@ def _summarize_input(name: str, args: dict) -> str:
                 return args.get("filename", "")
             return ""
 
-        for msg in conversation.messages:
+        messages = conversation if isinstance(conversation, list) else conversation.messages
+        for msg in messages:
             if msg.role == "assistant" and msg.tool_calls:
                 for tc in msg.tool_calls:
                     func = tc.get("function", {})
@@ -1956,8 +2138,55 @@ def _is_tool_doom_loop(
             return True, desc
         return False, ""
 
+    def _can_start_early(self, tc: ToolCallEvent, early_safe: set[str], position: int) -> bool:
+        """Whether a streamed tool call may start before the stream ends.
+
+        Mirrors the post-stream triage: only real tools declared read-only,
+        with complete arguments, within the per-turn hard limit.
+        """
+        if tc.tool_name not in early_safe or "_raw" in tc.tool_input:
+            return False
+        if tc.tool_name in ("set_output", "ask_user", "escalate_to_coder"):
+            return False
+        hard_limit = int(
+            self._config.max_tool_calls_per_turn * (1 + self._config.tool_call_overflow_margin)
+        )
+        return position <= hard_limit
+
+    async def _abandon_early_tools(
+        self,
+        stream_id: str,
+        node_id: str,
+        tool_calls: list[ToolCallEvent],
+        early_tasks: dict[str, asyncio.Future[ToolResult]],
+        reason: str = "Tool call cancelled: the LLM response stream failed.",
+    ) -> None:
+        """Cancel tools started mid-stream whose results will not be used.
+
+        Waits for them to stop and closes out their tool_started events with
+        an error carrying *reason*.
+        """
+        if not early_tasks:
+            return
+        for task in early_tasks.values():
+            task.cancel()
+        await asyncio.gather(*early_tasks.values(), return_exceptions=True)
+        names = {tc.tool_use_id: tc.tool_name for tc in tool_calls}
+        for tool_use_id in early_tasks:
+            await self._publish_tool_completed(
+                stream_id,
+                node_id,
+                tool_use_id,
+                names.get(tool_use_id, ""),
+                reason,
+                True,
+            )
+        early_tasks.clear()
+
     async def _execute_tool(self, tc: ToolCallEvent) -> ToolResult:
         """Execute a tool call, handling both sync and async executors."""
+        if tc.tool_name == "query_spilled" and self._config.spillover_dir:
+            return await self._query_spilled(tc)
         if self._tool_executor is None:
             return ToolResult(
                 tool_use_id=tc.tool_use_id,
@@ -1970,7 +2199,28 @@ async def _execute_tool(self, tc: ToolCallEvent) -> ToolResult:
             result = await result
         return result
 
-    def _truncate_tool_result(
+    async def _query_spilled(self, tc: ToolCallEvent) -> ToolResult:
+        """Answer a query_spilled call from the session's spillover index."""
+        assert self._config.spillover_dir is not None
+        store = get_spillover_store(self._config.spillover_dir)
+        args = tc.tool_input
+        # Leave room for the JSON envelope so the answer is never re-spilled.
+        limit = self._config.max_tool_result_chars
+        max_chars = max(500, limit - 500) if limit > 0 else 10_000
+        response = await store.query(
+            filename=str(args.get("filename") or ""),
+            query=str(args.get("query") or ""),
+            json_path=str(args.get("json_path") or ""),
+            line_range=args.get("line_range") or None,
+            max_chars=max_chars,
+        )
+        return ToolResult(
+            tool_use_id=tc.tool_use_id,
+            content=json.dumps(response, ensure_ascii=False),
+            is_error="error" in response,
+        )
+
+    async def _truncate_tool_result(
         self,
         result: ToolResult,
         tool_name: str,
@@ -1978,8 +2228,9 @@ def _truncate_tool_result(
         """Truncate a large tool result to keep the conversation context small.
 
         If *spillover_dir* is configured and the result exceeds
-        *max_tool_result_chars*, the full content is written to a file and
-        the in-context result is replaced with a preview + filename reference.
+        *max_tool_result_chars*, the full content is written to a file (off
+        the event loop, with a searchable index) and the in-context result is
+        replaced with a preview, the file's structure, and how to query it.
         Without *spillover_dir*, large results are truncated with a note.
 
         Small results (and errors) pass through unchanged.
@@ -1988,9 +2239,10 @@ def _truncate_tool_result(
         if limit <= 0 or result.is_error or len(result.content) <= limit:
             return result
 
-        # load_data is the designated mechanism for reading spilled files.
-        # Don't re-spill (circular), but DO truncate with a pagination hint.
-        if tool_name == "load_data":
+        # load_data and query_spilled are the designated mechanisms for
+        # reading spilled files.  Don't re-spill (circular), but DO truncate
+        # with a pagination hint.
+        if tool_name in ("load_data", "query_spilled"):
             preview_chars = max(limit - 300, limit // 2)
             preview = result.content[:preview_chars]
             truncated = (
@@ -2018,29 +2270,24 @@ def _truncate_tool_result(
 
         spill_dir = self._config.spillover_dir
         if spill_dir:
-            spill_path = Path(spill_dir)
-            spill_path.mkdir(parents=True, exist_ok=True)
-            # Use tool_use_id for uniqueness, sanitise for filesystem
-            safe_id = result.tool_use_id.replace("/", "_")[:60]
-            filename = f"tool_{tool_name}_{safe_id}.txt"
-
-            # Pretty-print JSON content so load_data's line-based
-            # pagination works correctly.  Compact JSON (no newlines)
-            # would produce a single line that defeats pagination.
-            write_content = result.content
-            try:
-                parsed = json.loads(result.content)
-                write_content = json.dumps(parsed, indent=2, ensure_ascii=False)
-            except (json.JSONDecodeError, TypeError, ValueError):
-                pass  # Not JSON — write as-is
-
-            (spill_path / filename).write_text(write_content, encoding="utf-8")
+            # Written and indexed in a worker thread.  JSON is pretty-printed
+            # so line ranges and the line-window index are meaningful.
+            spilled = await get_spillover_store(spill_dir).spill(
+                tool_name, result.tool_use_id, result.content
+            )
+            filename = spilled.filename
+            if spilled.format == "text":
+                how = "query='keywords' or line_range='1-80'"
+            else:
+                how = "query='keywords', json_path='$...' or line_range='1-80'"
 
             truncated = (
                 f"[Result from {tool_name}: {len(result.content)} chars — "
-                f"too large for context, saved to '{filename}'. "
-                f"Use load_data(filename='{filename}') "
-                f"to read the full result.]\n\n"
+                f"too large for context, saved to '{filename}' "
+                f"({spilled.describe()}). "
+                f"Use query_spilled(filename='{filename}', {how}) to fetch only "
+                f"what you need, or load_data(filename='{filename}') to read it "
+                f"sequentially.]\n\n"
                 f"Preview:\n{preview}…"
             )
             logger.info(
@@ -2081,6 +2328,10 @@ async def _compact_tiered(
         | 80-100%        | Normal: LLM summary, keep 4 recent messages |
         | 100-120%       | Aggressive: LLM summary, keep 2 recent      |
         | >= 120%        | Emergency: static summary, keep 1 recent     |
+
+        A summary prepared in the background (see
+        ``_maybe_start_speculative_summary``) replaces the LLM call when the
+        prefix it covers is unchanged.
         """
         ratio = conversation.usage_ratio()
 
@@ -2133,20 +2384,39 @@ async def _compact_tiered(
 
         _phase_grad = getattr(ctx, "continuous_mode", False)
 
-        if ratio >= 1.2:
-            level = "emergency"
-            logger.warning("Emergency compaction triggered (usage %.0f%%)", ratio * 100)
-            summary = self._build_emergency_summary(ctx, accumulator, conversation)
-            await conversation.compact(summary, keep_recent=1, phase_graduated=_phase_grad)
-        elif ratio >= 1.0:
-            level = "aggressive"
-            logger.info("Aggressive compaction triggered (usage %.0f%%)", ratio * 100)
-            summary = await self._generate_compaction_summary(ctx, conversation)
-            await conversation.compact(summary, keep_recent=2, phase_graduated=_phase_grad)
-        else:
-            level = "normal"
-            summary = await self._generate_compaction_summary(ctx, conversation)
-            await conversation.compact(summary, keep_recent=4, phase_graduated=_phase_grad)
+        # Swap in a summary prepared in the background, if its prefix is
+        # still intact.  Emergency compaction only takes a finished one.
+        level = ""
+        latency_saved_ms: int | None = None
+        speculative = await self._take_speculative_summary(ctx, conversation, wait=ratio < 1.2)
+        if speculative is not None:
+            summary, prefix_count, saved = speculative
+            await conversation.compact(summary, prefix_count=prefix_count)
+            if conversation.needs_compaction():
+                # Not enough on its own: a fresh summary call follows below.
+                self._speculative_stats.misses += 1
+            else:
+                level = "speculative"
+                latency_saved_ms = round(saved * 1000)
+                self._speculative_stats.hits += 1
+                self._speculative_stats.latency_saved_seconds += saved
+
+        if not level:
+            current = conversation.usage_ratio()
+            if current >= 1.2:
+                level = "emergency"
+                logger.warning("Emergency compaction triggered (usage %.0f%%)", current * 100)
+                summary = self._build_emergency_summary(ctx, accumulator, conversation)
+                await conversation.compact(summary, keep_recent=1, phase_graduated=_phase_grad)
+            elif current >= 1.0:
+                level = "aggressive"
+                logger.info("Aggressive compaction triggered (usage %.0f%%)", current * 100)
+                summary = await self._generate_compaction_summary(ctx, conversation)
+                await conversation.compact(summary, keep_recent=2, phase_graduated=_phase_grad)
+            else:
+                level = "normal"
+                summary = await self._generate_compaction_summary(ctx, conversation)
+                await conversation.compact(summary, keep_recent=4, phase_graduated=_phase_grad)
 
         new_ratio = conversation.usage_ratio()
         logger.info(
@@ -2159,6 +2429,9 @@ async def _compact_tiered(
         # Log compaction to session logs (tool_logs.jsonl)
         before_pct = round(ratio * 100)
         after_pct = round(new_ratio * 100)
+        feedback = f"level={level} before={before_pct}% after={after_pct}%"
+        if latency_saved_ms is not None:
+            feedback += f" speculative_saved_ms={latency_saved_ms}"
         if ctx.runtime_logger:
             ctx.runtime_logger.log_step(
                 node_id=ctx.node_id,
@@ -2166,7 +2439,7 @@ async def _compact_tiered(
                 step_index=-1,  # Not a regular LLM step
                 llm_text=f"Context compacted ({level}): {before_pct}% \u2192 {after_pct}%",
                 verdict="COMPACTION",
-                verdict_feedback=f"level={level} before={before_pct}% after={after_pct}%",
+                verdict_feedback=feedback,
             )
 
         if self._event_bus:
@@ -2181,21 +2454,135 @@ async def _compact_tiered(
                         "level": level,
                         "usage_before": round(ratio * 100),
                         "usage_after": round(new_ratio * 100),
+                        "speculative": latency_saved_ms is not None,
+                        "latency_saved_ms": latency_saved_ms or 0,
                     },
                 )
             )
 
+    # -------------------------------------------------------------------
+    # Speculative compaction
+    # -------------------------------------------------------------------
+
+    def _maybe_start_speculative_summary(
+        self,
+        ctx: NodeContext,
+        conversation: NodeConversation,
+    ) -> None:
+        """Start summarizing the compactable prefix once usage is high.
+
+        Runs at a turn boundary.  The summary covers the same messages a
+        normal compaction would replace right now; ``_compact_tiered`` uses
+        it later if that prefix has not changed in the meantime.
+        """
+        threshold = self._config.speculative_compaction_threshold
+        if threshold is None or conversation.usage_ratio() < threshold:
+            return
+        spec = self._speculations.get(id(ctx))
+        if spec is not None:
+            if spec.matches(conversation):
+                return  # still valid, keep waiting for it
+            self._discard_speculative_summary(ctx, miss=True)
+
+        phase_grad = getattr(ctx, "continuous_mode", False)
+        prefix_count = conversation.compaction_split(keep_recent=4, phase_graduated=phase_grad)
+        if prefix_count == 0:
+            return
+
+        # Summarize exactly the messages the compaction will replace.
+        prefix = conversation.messages[:prefix_count]
+        task = asyncio.create_task(self._speculative_summary_task(ctx, prefix))
+        self._speculations[id(ctx)] = _SpeculativeSummary(
+            conversation=conversation,
+            prefix_count=prefix_count,
+            prefix=_prefix_key(prefix),
+            task=task,
+        )
+        self._speculative_stats.started += 1
+        logger.debug(
+            "[%s] speculative compaction started (usage %.0f%%, prefix=%d msgs)",
+            ctx.node_id,
+            conversation.usage_ratio() * 100,
+            prefix_count,
+        )
+
+    async def _speculative_summary_task(
+        self,
+        ctx: NodeContext,
+        snapshot: list[Message],
+    ) -> tuple[str, float]:
+        start = time.monotonic()
+        with llm_priority(LLMPriority.BACKGROUND):
+            summary = await self._request_compaction_summary(ctx, snapshot)
+        return summary, time.monotonic() - start
+
+    async def _take_speculative_summary(
+        self,
+        ctx: NodeContext,
+        conversation: NodeConversation,
+        wait: bool = True,
+    ) -> tuple[str, int, float] | None:
+        """Claim the background summary for *conversation*, if still usable.
+
+        Returns ``(summary, prefix_count, seconds_saved)`` or None; the
+        caller counts the hit once it knows the summary was enough.  The
+        pending speculation is always consumed: a compaction renumbers the
+        prefix, so a plan can never outlive the next one.
+        """
+        spec = self._speculations.get(id(ctx))
+        if spec is None:
+            return None
+        if not spec.matches(conversation) or not (wait or spec.task.done()):
+            self._discard_speculative_summary(ctx, miss=True)
+            return None
+        del self._speculations[id(ctx)]
+
+        wait_start = time.monotonic()
+        try:
+            summary, generation_seconds = await spec.task
+        except Exception as e:
+            logger.warning("Speculative compaction summary failed: %s", e)
+            self._speculative_stats.misses += 1
+            return None
+        if not spec.matches(conversation):
+            # The prefix changed while we waited for the summary.
+            self._speculative_stats.misses += 1
+            return None
+        saved = max(0.0, generation_seconds - (time.monotonic() - wait_start))
+        return summary, spec.prefix_count, saved
+
+    def _discard_speculative_summary(self, ctx: NodeContext, miss: bool = False) -> None:
+        spec = self._speculations.pop(id(ctx), None)
+        if spec is None:
+            return
+        spec.task.cancel()
+        if miss:
+            self._speculative_stats.misses += 1
+
     async def _generate_compaction_summary(
         self,
         ctx: NodeContext,
         conversation: NodeConversation,
     ) -> str:
         """Use LLM to generate a conversation summary for compaction."""
-        tool_history = self._extract_tool_call_history(conversation)
+        try:
+            return await self._request_compaction_summary(ctx, conversation.messages)
+        except Exception as e:
+            logger.warning(f"Compaction summary generation failed: {e}")
+            tool_history = self._extract_tool_call_history(conversation)
+            if tool_history:
+                return f"Previous conversation context (summary unavailable).\n\n{tool_history}"
+            return "Previous conversation context (summary unavailable)."
 
-        messages_text = "\n".join(
-            f"[{m.role}]: {m.content[:200]}" for m in conversation.messages[-10:]
-        )
+    async def _request_compaction_summary(
+        self,
+        ctx: NodeContext,
+        messages: list[Message],
+    ) -> str:
+        """Ask the LLM to summarize *messages*; raises on failure."""
+        tool_history = self._extract_tool_call_history(messages)
+
+        messages_text = "\n".join(f"[{m.role}]: {m.content[:200]}" for m in messages[-10:])
         prompt = (
             "Summarize this conversation so far in 2-3 sentences, "
             "preserving key decisions and results:\n\n"
@@ -2211,24 +2598,16 @@ async def _generate_compaction_summary(
         # Dynamic budget: reasoning models (o1, gpt-5-mini) spend max_tokens on
         # internal thinking. 500 leaves nothing for the actual summary.
         summary_budget = max(1024, self._config.max_history_tokens // 10)
-        try:
-            response = await ctx.llm.acomplete(
-                messages=[{"role": "user", "content": prompt}],
-                system=(
-                    "Summarize conversations concisely. Always preserve the tool history section."
-                ),
-                max_tokens=summary_budget,
-            )
-            summary = response.content
-            # Ensure tool history is present even if LLM dropped it
-            if tool_history and "TOOLS ALREADY CALLED" not in summary:
-                summary += "\n\n" + tool_history
-            return summary
-        except Exception as e:
-            logger.warning(f"Compaction summary generation failed: {e}")
-            if tool_history:
-                return f"Previous conversation context (summary unavailable).\n\n{tool_history}"
-            return "Previous conversation context (summary unavailable)."
+        response = await ctx.llm.acomplete(
+            messages=[{"role": "user", "content": prompt}],
+            system="Summarize conversations concisely. Always preserve the tool history section.",
+            max_tokens=summary_budget,
+        )
+        summary = response.content
+        # Ensure tool history is present even if LLM dropped it
+        if tool_history and "TOOLS ALREADY CALLED" not in summary:
+            summary += "\n\n" + tool_history
+        return summary
 
     def _build_emergency_summary(
         self,
@@ -2296,7 +2675,9 @@ def _build_emergency_summary(
                     files = sorted(f.name for f in data_dir.iterdir() if f.is_file())
                     if files:
                         file_list = "\n".join(f"  - {f}" for f in files[:30])
-                        parts.append("DATA FILES (use load_data to read):\n" + file_list)
+                        parts.append(
+                            "DATA FILES (use query_spilled or load_data to read):\n" + file_list
+                        )
                     else:
                         parts.append(
                             "NOTE: Large tool results may have been saved to files. "
@@ -10,7 +10,11 @@
 """
 
 import asyncio
+import contextlib
+import functools
 import logging
+import threading
+import time
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -19,6 +23,7 @@
 from framework.graph.checkpoint_config import CheckpointConfig
 from framework.graph.edge import EdgeCondition, EdgeSpec, GraphSpec
 from framework.graph.goal import Goal
+from framework.graph.map_node import MapLedger, MapNode
 from framework.graph.node import (
     NodeContext,
     NodeProtocol,
@@ -33,6 +38,11 @@
 from framework.runtime.core import Runtime
 from framework.schemas.checkpoint import Checkpoint
 from framework.storage.checkpoint_store import CheckpointStore
+from framework.utils.io import atomic_write
+
+# Serializes read-modify-write patches of session state.json files, which
+# the main loop and concurrently finishing map elements both update
+_state_lock = threading.Lock()
 
 
 @dataclass
@@ -59,6 +69,9 @@ class ExecutionResult:
     # Visit tracking (for feedback/callback edges)
     node_visit_counts: dict[str, int] = field(default_factory=dict)  # {node_id: visit_count}
 
+    # Fan-out branch timing, one entry per branch in every fan-out
+    branch_timings: list["BranchTiming"] = field(default_factory=list)
+
     @property
     def is_clean_success(self) -> bool:
         """True only if execution succeeded with no retries or failures."""
@@ -78,9 +91,34 @@ class ParallelBranch:
     node_id: str
     edge: EdgeSpec
     result: "NodeResult | None" = None
-    status: str = "pending"  # pending, running, completed, failed
+    status: str = "pending"  # pending, running, completed, failed, timed_out, cancelled
     retry_count: int = 0
     error: str | None = None
+    queued_ms: int = 0  # time spent waiting for a concurrency slot
+    duration_ms: int = 0  # time spent running (including retries)
+
+
+@dataclass
+class BranchTiming:
+    """Timing of one fan-out branch, reported in ExecutionResult.branch_timings."""
+
+    branch_id: str
+    node_id: str
+    status: str  # completed, failed, timed_out, cancelled
+    queued_ms: int
+    duration_ms: int
+    attempts: int
+
+    @classmethod
+    def from_branch(cls, branch: ParallelBranch) -> "BranchTiming":
+        return cls(
+            branch_id=branch.branch_id,
+            node_id=branch.node_id,
+            status=branch.status,
+            queued_ms=branch.queued_ms,
+            duration_ms=branch.duration_ms,
+            attempts=branch.retry_count + 1 if branch.status != "cancelled" else 0,
+        )
 
 
 @dataclass
@@ -95,8 +133,22 @@ class ParallelExecutionConfig:
     # Memory conflict handling when branches write same key
     memory_conflict_strategy: str = "last_wins"  # "last_wins", "first_wins", "error"
 
-    # Timeout per branch in seconds
-    branch_timeout_seconds: float = 300.0
+    # Timeout per fan-out branch and map element in seconds (None = no
+    # timeout, the default); the node's NodeSpec.branch_timeout_seconds
+    # overrides it
+    branch_timeout_seconds: float | None = None
+
+    # Maximum branches running at once (0 = unlimited); overridden by
+    # GraphSpec.max_parallel_branches and the fan-out node's
+    # NodeSpec.max_parallel_branches (most specific wins)
+    max_parallel_branches: int = 0
+
+    # When execution continues to the fan-in node:
+    # "all" waits for every branch and merges their writes in edge order,
+    # "quorum" continues once `quorum` branches succeeded (first-k) and
+    #   cancels the rest
+    convergence_mode: str = "all"
+    quorum: int = 1
 
 
 class GraphExecutor:
@@ -185,6 +237,9 @@ def __init__(
         # Pause/resume control
         self._pause_requested = asyncio.Event()
 
+        # (memory, version, data) last written to state.json by _write_progress
+        self._progress_memory: tuple[SharedMemory, int, dict[str, Any]] | None = None
+
     def _write_progress(
         self,
         current_node: str,
@@ -203,16 +258,9 @@ def _write_progress(
         """
         if not self._storage_path:
             return
-        try:
-            import json as _json
-            from datetime import datetime
-
-            state_path = self._storage_path / "state.json"
-            if state_path.exists():
-                state_data = _json.loads(state_path.read_text(encoding="utf-8"))
-            else:
-                state_data = {}
+        from datetime import datetime
 
+        def patch(state_data: dict[str, Any]) -> None:
             # Patch progress fields
             progress = state_data.setdefault("progress", {})
             progress["current_node"] = current_node
@@ -226,14 +274,49 @@ def _write_progress(
 
             # Persist full memory so state.json is sufficient for resume
             # even if the process dies before the final write.
-            memory_snapshot = memory.read_all()
+            memory_snapshot = self._progress_memory_for(memory)
             state_data["memory"] = memory_snapshot
             state_data["memory_keys"] = list(memory_snapshot.keys())
+            state_data["memory_version"] = memory.version
+
+        self._patch_state(patch)
+
+    def _patch_state(self, patch: Callable[[dict[str, Any]], None]) -> None:
+        """Apply *patch* to state.json under the state lock (best-effort).
 
-            state_path.write_text(_json.dumps(state_data, indent=2), encoding="utf-8")
+        Every progress writer goes through here, so concurrent updates are
+        serialized and none is lost; the file is replaced atomically.
+        """
+        if not self._storage_path:
+            return
+        try:
+            import json as _json
+
+            state_path = self._storage_path / "state.json"
+            with _state_lock:
+                if state_path.exists():
+                    state_data = _json.loads(state_path.read_text(encoding="utf-8"))
+                else:
+                    state_data = {}
+                patch(state_data)
+                with atomic_write(state_path) as f:
+                    f.write(_json.dumps(state_data, indent=2))
         except Exception:
             pass  # Best-effort — never block execution
 
+    def _progress_memory_for(self, memory: SharedMemory) -> dict[str, Any]:
+        """Full memory for state.json, updated from the change-set since the last write."""
+        cached = self._progress_memory
+        if cached is None or cached[0] is not memory:
+            snapshot = memory.snapshot()
+            self._progress_memory = (memory, snapshot.version, snapshot.to_dict())
+            return self._progress_memory[2]
+        _, version, data = cached
+        changes = memory.changes_since(version)
+        data.update(changes.changes)
+        self._progress_memory = (memory, changes.version, data)
+        return data
+
     def _validate_tools(self, graph: GraphSpec) -> list[str]:
         """
         Validate that all tools declared by nodes are available.
@@ -288,6 +371,9 @@ async def execute(
                 error=f"Invalid graph: {errors}",
             )
 
+        # Derive per-node validators once for this run
+        graph.compile_validators()
+
         # Validate tool availability
         tool_errors = self._validate_tools(graph)
         if tool_errors:
@@ -304,6 +390,7 @@ async def execute(
 
         # Initialize execution state
         memory = SharedMemory()
+        branch_timings: list[BranchTiming] = []
 
         # Continuous conversation mode state
         is_continuous = getattr(graph, "conversation_mode", "isolated") == "continuous"
@@ -708,7 +795,7 @@ async def execute(
                             self.logger.info(f"      {key}: {value_str}")
 
                 # Get or create node implementation
-                node_impl = self._get_node_implementation(node_spec, graph.cleanup_llm_model)
+                node_impl = self._get_node_implementation(node_spec, graph.cleanup_llm_model, graph)
 
                 # Validate inputs
                 validation_errors = node_impl.validate_input(ctx)
@@ -779,11 +866,8 @@ async def execute(
                         and node_spec.output_keys
                         and node_spec.node_type != "event_loop"
                     ):
-                        validation = self.validator.validate_all(
-                            output=result.output,
-                            expected_keys=node_spec.output_keys,
-                            check_hallucination=True,
-                            nullable_keys=node_spec.nullable_output_keys,
+                        validation = node_spec.compiled_validator().validate_outputs(
+                            result.output, check_hallucination=True
                         )
                         if not validation.success:
                             self.logger.error(f"   ✗ Output validation failed: {validation.error}")
@@ -1083,6 +1167,7 @@ async def execute(
                             source_result=result,
                             source_node_spec=node_spec,
                             path=path,
+                            branch_timings=branch_timings,
                         )
 
                         total_tokens += branch_tokens
@@ -1305,6 +1390,7 @@ async def execute(
                 had_partial_failures=len(nodes_failed) > 0,
                 execution_quality=exec_quality,
                 node_visit_counts=dict(node_visit_counts),
+                branch_timings=branch_timings,
                 session_state={
                     "memory": output,  # output IS memory.read_all()
                     "execution_path": list(path),
@@ -1485,6 +1571,7 @@ async def execute(
                 had_partial_failures=len(nodes_failed) > 0,
                 execution_quality="failed",
                 node_visit_counts=dict(node_visit_counts),
+                branch_timings=branch_timings,
                 session_state=session_state_out,
             )
 
@@ -1546,6 +1633,7 @@ def _build_context(
 
     VALID_NODE_TYPES = {
         "event_loop",
+        "map",
     }
     # Node types removed in v0.5 — provide migration guidance
     REMOVED_NODE_TYPES = {
@@ -1557,7 +1645,10 @@ def _build_context(
     }
 
     def _get_node_implementation(
-        self, node_spec: NodeSpec, cleanup_llm_model: str | None = None
+        self,
+        node_spec: NodeSpec,
+        cleanup_llm_model: str | None = None,
+        graph: GraphSpec | None = None,
     ) -> NodeProtocol:
         """Get or create a node implementation."""
         # Check registry first
@@ -1580,54 +1671,140 @@ def _get_node_implementation(
                 f"Must be one of: {sorted(self.VALID_NODE_TYPES)}."
             )
 
-        # Create based on type (only event_loop is valid)
+        # Create based on type
         if node_spec.node_type == "event_loop":
             # Auto-create EventLoopNode with sensible defaults.
             # Custom configs can still be pre-registered via node_registry.
-            from framework.graph.event_loop_node import EventLoopNode, LoopConfig
-
-            # Create a FileConversationStore if a storage path is available
-            conv_store = None
+            store_path = None
             if self._storage_path:
-                from framework.storage.conversation_store import FileConversationStore
-
                 store_path = self._storage_path / "conversations" / node_spec.id
-                conv_store = FileConversationStore(base_path=store_path)
-
-            # Auto-configure spillover directory for large tool results.
-            # When a tool result exceeds max_tool_result_chars, the full
-            # content is written to spillover_dir and the agent gets a
-            # truncated preview with instructions to use load_data().
-            # Uses storage_path/data which is session-scoped, matching the
-            # data_dir set via execution context for data tools.
-            spillover = None
-            if self._storage_path:
-                spillover = str(self._storage_path / "data")
-
-            lc = self._loop_config
-            default_max_iter = 100 if node_spec.client_facing else 50
-            node = EventLoopNode(
-                event_bus=self._event_bus,
-                judge=None,  # implicit judge: accept when output_keys are filled
-                config=LoopConfig(
-                    max_iterations=lc.get("max_iterations", default_max_iter),
-                    max_tool_calls_per_turn=lc.get("max_tool_calls_per_turn", 10),
-                    tool_call_overflow_margin=lc.get("tool_call_overflow_margin", 0.5),
-                    stall_detection_threshold=lc.get("stall_detection_threshold", 3),
-                    max_history_tokens=lc.get("max_history_tokens", 32000),
-                    max_tool_result_chars=lc.get("max_tool_result_chars", 3_000),
-                    spillover_dir=spillover,
-                ),
-                tool_executor=self.tool_executor,
-                conversation_store=conv_store,
-            )
+            node = self._create_event_loop_node(node_spec, store_path)
             # Cache so inject_event() is reachable for client-facing input
             self.node_registry[node_spec.id] = node
             return node
 
+        if node_spec.node_type == "map":
+            if graph is None:
+                raise RuntimeError(f"Map node '{node_spec.id}' needs its graph to resolve map_node")
+            node = self._create_map_node(graph, node_spec)
+            # Cache so the element ledger survives retries of the map node
+            self.node_registry[node_spec.id] = node
+            return node
+
         # Should never reach here due to validation above
         raise RuntimeError(f"Unhandled node type: {node_spec.node_type}")
 
+    def _create_event_loop_node(
+        self, node_spec: NodeSpec, conversation_path: Path | None
+    ) -> NodeProtocol:
+        """Create an EventLoopNode persisting its conversation at *conversation_path*."""
+        from framework.graph.event_loop_node import EventLoopNode, LoopConfig
+
+        # Create a FileConversationStore if a storage path is available
+        conv_store = None
+        if conversation_path is not None:
+            from framework.storage.conversation_store import FileConversationStore
+
+            conv_store = FileConversationStore(base_path=conversation_path)
+
+        # Auto-configure spillover directory for large tool results.
+        # When a tool result exceeds max_tool_result_chars, the full
+        # content is written to spillover_dir and the agent gets a
+        # truncated preview with instructions to use load_data().
+        # Uses storage_path/data which is session-scoped, matching the
+        # data_dir set via execution context for data tools.
+        spillover = None
+        if self._storage_path:
+            spillover = str(self._storage_path / "data")
+
+        lc = self._loop_config
+        default_max_iter = 100 if node_spec.client_facing else 50
+        return EventLoopNode(
+            event_bus=self._event_bus,
+            judge=None,  # implicit judge: accept when output_keys are filled
+            config=LoopConfig(
+                max_iterations=lc.get("max_iterations", default_max_iter),
+                max_tool_calls_per_turn=lc.get("max_tool_calls_per_turn", 10),
+                tool_call_overflow_margin=lc.get("tool_call_overflow_margin", 0.5),
+                stall_detection_threshold=lc.get("stall_detection_threshold", 3),
+                max_history_tokens=lc.get("max_history_tokens", 32000),
+                max_tool_result_chars=lc.get("max_tool_result_chars", 3_000),
+                spillover_dir=spillover,
+            ),
+            tool_executor=self.tool_executor,
+            conversation_store=conv_store,
+        )
+
+    def _create_map_node(self, graph: GraphSpec, node_spec: NodeSpec) -> MapNode:
+        """Create the MapNode for *node_spec*, scheduled like a fan-out."""
+        item_spec = graph.get_node(node_spec.map_node) if node_spec.map_node else None
+        if item_spec is None:
+            raise RuntimeError(
+                f"Map node '{node_spec.id}' references missing map_node '{node_spec.map_node}'"
+            )
+        ledger_path = None
+        if self._storage_path:
+            ledger_path = self._storage_path / "map" / f"{node_spec.id}.jsonl"
+        return MapNode(
+            run_item=functools.partial(self._execute_map_item, graph, item_spec),
+            value_keys=item_spec.output_keys,
+            max_concurrency=self._max_parallel_branches(graph, node_spec),
+            item_timeout=self._branch_timeout(item_spec),
+            fail_fast=self._parallel_config.on_branch_failure == "fail_all",
+            ledger=MapLedger(ledger_path),
+            on_progress=self._write_map_progress,
+        )
+
+    async def _execute_map_item(
+        self,
+        graph: GraphSpec,
+        item_spec: NodeSpec,
+        ctx: NodeContext,
+        index: int,
+        item: Any,
+    ) -> NodeResult:
+        """Run *item_spec* for one element of a map node, isolated from the others."""
+        # A private fork of memory, readable and writable in full by the
+        # sub-node; its writes are dropped, only its output is reduced.
+        memory = ctx.memory.fork().with_permissions(read_keys=[], write_keys=[])
+        item_input = {ctx.node_spec.map_item_key: item}
+        memory.write(ctx.node_spec.map_item_key, item, validate=False)
+
+        if item_spec.id in self.node_registry:
+            node_impl = self.node_registry[item_spec.id]
+        else:
+            # A fresh EventLoopNode per element, each with its own
+            # conversation, which is restored if the element is resumed.
+            conversation_path = None
+            if self._storage_path:
+                conversation_path = self._storage_path / "conversations" / ctx.node_id / str(index)
+            node_impl = self._create_event_loop_node(item_spec, conversation_path)
+
+        from framework.graph.event_loop_node import EventLoopNode
+
+        # Event loop nodes handle retry internally
+        max_retries = 1 if isinstance(node_impl, EventLoopNode) else item_spec.max_retries
+        result = NodeResult(success=False, error="not executed")
+        for _ in range(max(max_retries, 1)):
+            item_ctx = self._build_context(item_spec, memory, ctx.goal, item_input, ctx.max_tokens)
+            result = await node_impl.execute(item_ctx)
+            if result.success:
+                break
+        return result
+
+    def _write_map_progress(self, node_id: str, completed: int, failed: int, total: int) -> None:
+        """Record per-element map progress in state.json (best-effort)."""
+
+        def patch(state_data: dict[str, Any]) -> None:
+            progress = state_data.setdefault("progress", {})
+            progress.setdefault("map", {})[node_id] = {
+                "completed": completed,
+                "failed": failed,
+                "total": total,
+            }
+
+        self._patch_state(patch)
+
     async def _follow_edges(
         self,
         graph: GraphSpec,
@@ -1798,9 +1975,14 @@ async def _execute_parallel_branches(
         source_result: NodeResult,
         source_node_spec: Any,
         path: list[str],
+        branch_timings: list[BranchTiming] | None = None,
     ) -> tuple[dict[str, NodeResult], int, int]:
         """
-        Execute multiple branches in parallel using asyncio.gather.
+        Execute multiple branches in parallel.
+
+        Branches are scheduled under the effective concurrency cap and
+        per-branch timeout, and converge according to
+        ``ParallelExecutionConfig.convergence_mode``.
 
         Args:
             graph: The graph specification
@@ -1810,6 +1992,7 @@ async def _execute_parallel_branches(
             source_result: Result from the source node
             source_node_spec: Spec of the source node
             path: Execution path list to update
+            branch_timings: Optional list to append per-branch timing to
 
         Returns:
             Tuple of (branch_results dict, total_tokens, total_latency)
@@ -1830,10 +2013,15 @@ async def _execute_parallel_branches(
             target_spec = graph.get_node(branch.node_id)
             self.logger.info(f"      • {target_spec.name if target_spec else branch.node_id}")
 
+        # Each branch works on an O(1) copy-on-write fork of memory, so
+        # concurrent branches never see each other's partial writes.
+        branch_memories = {branch_id: memory.fork() for branch_id in branches}
+
         async def execute_single_branch(
             branch: ParallelBranch,
         ) -> tuple[ParallelBranch, NodeResult | Exception]:
             """Execute a single branch with retry logic."""
+            memory = branch_memories[branch.branch_id]
             node_spec = graph.get_node(branch.node_id)
             if node_spec is None:
                 branch.status = "failed"
@@ -1841,7 +2029,7 @@ async def execute_single_branch(
                 return branch, RuntimeError(branch.error)
 
             # Get node implementation to check its type
-            branch_impl = self._get_node_implementation(node_spec, graph.cleanup_llm_model)
+            branch_impl = self._get_node_implementation(node_spec, graph.cleanup_llm_model, graph)
 
             effective_max_retries = node_spec.max_retries
             # Only override for actual EventLoopNode instances, not custom NodeProtocol impls
@@ -1896,7 +2084,9 @@ async def execute_single_branch(
 
                     # Build context for this branch
                     ctx = self._build_context(node_spec, memory, goal, mapped, graph.max_tokens)
-                    node_impl = self._get_node_implementation(node_spec, graph.cleanup_llm_model)
+                    node_impl = self._get_node_implementation(
+                        node_spec, graph.cleanup_llm_model, graph
+                    )
 
                     # Emit node-started event (skip event_loop nodes)
                     if self._event_bus and node_spec.node_type != "event_loop":
@@ -1977,9 +2167,85 @@ async def execute_single_branch(
 
                 return branch, e
 
-        # Execute all branches concurrently
-        tasks = [execute_single_branch(b) for b in branches.values()]
-        results = await asyncio.gather(*tasks, return_exceptions=False)
+        config = self._parallel_config
+        mode = config.convergence_mode
+        if mode not in ("all", "quorum"):
+            raise ValueError(f"Unknown fan-out convergence mode: {mode!r}")
+        quorum = min(max(config.quorum, 1), len(branches))
+        limit = self._max_parallel_branches(graph, source_node_spec)
+        semaphore = asyncio.Semaphore(limit) if limit > 0 else None
+
+        async def run_branch(
+            branch: ParallelBranch,
+        ) -> tuple[ParallelBranch, NodeResult | Exception]:
+            """Wait for a concurrency slot, then run the branch under its timeout."""
+            queued_at = time.monotonic()
+            async with semaphore or contextlib.nullcontext():
+                branch.queued_ms = int((time.monotonic() - queued_at) * 1000)
+                started_at = time.monotonic()
+                timeout = self._branch_timeout(graph.get_node(branch.node_id))
+                try:
+                    return await asyncio.wait_for(execute_single_branch(branch), timeout)
+                except TimeoutError:
+                    branch.status = "timed_out"
+                    branch.error = f"Branch timed out after {timeout}s"
+                    self.logger.error(f"      ✗ Branch {branch.node_id}: {branch.error}")
+                    return branch, TimeoutError(branch.error)
+                finally:
+                    branch.duration_ms = int((time.monotonic() - started_at) * 1000)
+
+        if limit > 0 and limit < len(branches):
+            self.logger.info(f"   ⑂ At most {limit} branches run at once")
+
+        tasks = {asyncio.create_task(run_branch(b)): b for b in branches.values()}
+        outcomes: dict[str, NodeResult | Exception] = {}
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    branch, outcome = task.result()
+                    outcomes[branch.branch_id] = outcome
+
+                succeeded = sum(1 for b in branches.values() if b.status == "completed")
+                if mode == "quorum":
+                    if succeeded >= quorum or succeeded + len(pending) < quorum:
+                        break
+                elif config.on_branch_failure == "fail_all" and len(outcomes) > succeeded:
+                    break
+        finally:
+            # Branches no longer needed (quorum reached, or fail_all after a
+            # failure) are cancelled rather than left running.
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+            for task in pending:
+                tasks[task].status = "cancelled"
+
+        cancelled = [b.node_id for b in branches.values() if b.status == "cancelled"]
+        if cancelled:
+            self.logger.info(f"   ⊘ Cancelled branches no longer needed: {cancelled}")
+
+        # Fan-in: fold branch writes back in edge order, so the result does
+        # not depend on which branch finished first.  Cancelled and timed-out
+        # branches contribute nothing.
+        conflicts = memory.merge(
+            [
+                (b.node_id, branch_memories[b.branch_id])
+                for b in branches.values()
+                if b.status in ("completed", "failed")
+            ],
+            strategy=config.memory_conflict_strategy,
+        )
+        for conflict in conflicts:
+            self.logger.warning(
+                f"   ⚠ Memory conflict on '{conflict.key}': written by "
+                f"{list(conflict.values)}, kept {conflict.chosen}"
+            )
+
+        if branch_timings is not None:
+            branch_timings.extend(BranchTiming.from_branch(b) for b in branches.values())
 
         # Process results
         total_tokens = 0
@@ -1987,8 +2253,11 @@ async def execute_single_branch(
         branch_results: dict[str, NodeResult] = {}
         failed_branches: list[ParallelBranch] = []
 
-        for branch, result in results:
+        for branch in branches.values():
+            if branch.status == "cancelled":
+                continue
             path.append(branch.node_id)
+            result = outcomes.get(branch.branch_id)
 
             if isinstance(result, Exception):
                 failed_branches.append(branch)
@@ -1999,21 +2268,55 @@ async def execute_single_branch(
                 total_latency += result.latency_ms
                 branch_results[branch.branch_id] = result
 
+        if mode == "quorum":
+            if len(branch_results) < quorum:
+                failed_names = [graph.get_node(b.node_id).name for b in failed_branches]
+                raise RuntimeError(
+                    f"Parallel execution failed: quorum of {quorum} not reached "
+                    f"({len(branch_results)} succeeded; failed: {failed_names})"
+                )
+            if failed_branches:
+                self.logger.warning(
+                    f"⚠ {len(failed_branches)} branch(es) failed; quorum of {quorum} reached"
+                )
         # Handle failures based on config
-        if failed_branches:
+        elif failed_branches:
             failed_names = [graph.get_node(b.node_id).name for b in failed_branches]
-            if self._parallel_config.on_branch_failure == "fail_all":
+            if config.on_branch_failure == "fail_all":
                 raise RuntimeError(f"Parallel execution failed: branches {failed_names} failed")
-            elif self._parallel_config.on_branch_failure == "continue_others":
+            elif config.on_branch_failure == "continue_others":
                 self.logger.warning(
                     f"⚠ Some branches failed ({failed_names}), continuing with successful ones"
                 )
 
+        timing = ", ".join(
+            f"{b.node_id}={b.status} {b.duration_ms}ms"
+            + (f" (queued {b.queued_ms}ms)" if b.queued_ms else "")
+            for b in branches.values()
+        )
         self.logger.info(
             f"   ⑃ Fan-out complete: {len(branch_results)}/{len(branches)} branches succeeded"
+            f" [{timing}]"
         )
         return branch_results, total_tokens, total_latency
 
+    def _max_parallel_branches(self, graph: GraphSpec, source_node_spec: Any) -> int:
+        """Effective fan-out concurrency cap: node, then graph, then executor config."""
+        for limit in (
+            getattr(source_node_spec, "max_parallel_branches", None),
+            getattr(graph, "max_parallel_branches", None),
+        ):
+            if limit is not None:
+                return max(int(limit), 0)
+        return max(self._parallel_config.max_parallel_branches, 0)
+
+    def _branch_timeout(self, node_spec: Any) -> float | None:
+        """Timeout for one branch: its NodeSpec override, else the executor config."""
+        timeout = getattr(node_spec, "branch_timeout_seconds", None)
+        if timeout is None:
+            timeout = self._parallel_config.branch_timeout_seconds
+        return timeout if timeout else None
+
     def register_node(self, node_id: str, implementation: NodeProtocol) -> None:
         """Register a custom node implementation."""
         self.node_registry[node_id] = implementation
@@ -2060,7 +2363,7 @@ def _create_checkpoint(
             session_id=self._storage_path.name if self._storage_path else "unknown",
             current_node=current_node,
             execution_path=execution_path,
-            shared_memory=memory.read_all(),
+            shared_memory=memory.snapshot().to_dict(),
             next_node=next_node,
             is_clean=is_clean,
         )
@@ -0,0 +1,296 @@
+"""
+Map nodes: run a sub-node once per element of a list.
+
+A node with ``node_type="map"`` reads a list from memory (``map_over``),
+runs the node named by ``map_node`` once per element, and reduces the
+per-element outputs into its first output key.  Elements run with bounded
+concurrency, each on its own fork of memory and (for event-loop sub-nodes)
+its own conversation, so elements never see each other's state.
+
+Completed elements are recorded in a per-node ledger.  When the map node
+runs again after a failure or an interrupted session (resume), elements
+whose input is unchanged are taken from the ledger instead of re-run.
+The ledger is cleared once the map node succeeds.
+
+Example:
+    NodeSpec(
+        id="summarize-all",
+        name="Summarize all",
+        description="Summarize every URL",
+        node_type="map",
+        map_over="urls",
+        map_node="summarize-one",  # reads "item", writes "summary"
+        input_keys=["urls"],
+        output_keys=["summaries"],
+        max_parallel_branches=4,
+    )
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hashlib
+import json
+import logging
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from pathlib import Path
+from typing import Any
+
+from framework.graph.node import NodeContext, NodeProtocol, NodeResult
+
+logger = logging.getLogger(__name__)
+
+MAP_REDUCE_MODES = ("collect", "concat", "merge")
+
+# (map node context, element index, element) -> result of the sub-node
+ItemRunner = Callable[[NodeContext, int, Any], Awaitable[NodeResult]]
+# (map node id, completed, failed, total)
+ProgressCallback = Callable[[str, int, int, int], None]
+
+
+def item_fingerprint(item: Any) -> str:
+    """Stable digest of an element, used to match ledger entries on resume."""
+    data = json.dumps(item, sort_keys=True, default=str)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()[:16]
+
+
+def reduce_map_outputs(values: Sequence[Any], mode: str) -> Any:
+    """
+    Combine per-element values in element order.
+
+    - ``collect``: a list with one value per element
+    - ``concat``: list values are flattened into one list
+    - ``merge``: dict values are merged, later elements winning
+    """
+    if mode == "collect":
+        return list(values)
+    if mode == "concat":
+        flat: list[Any] = []
+        for value in values:
+            if isinstance(value, list | tuple):
+                flat.extend(value)
+            else:
+                flat.append(value)
+        return flat
+    if mode == "merge":
+        merged: dict[str, Any] = {}
+        for value in values:
+            if not isinstance(value, dict):
+                raise ValueError(f"'merge' reduce needs dict outputs, got {type(value).__name__}")
+            merged.update(value)
+        return merged
+    raise ValueError(f"Unknown map reduce mode {mode!r}; expected one of {MAP_REDUCE_MODES}")
+
+
+class MapLedger:
+    """
+    Per-element results of one map node.
+
+    Entries are kept in memory and, when a path is given, appended to a
+    JSONL file so they survive the process.  Values that are not JSON
+    serializable are only kept in memory.
+    """
+
+    def __init__(self, path: Path | None = None):
+        self.path = path
+        self._entries: dict[int, tuple[str, Any]] = {}
+        self._loaded = False
+
+    def load(self) -> dict[int, tuple[str, Any]]:
+        """index -> (fingerprint, value) for every recorded element."""
+        if not self._loaded:
+            self._loaded = True
+            if self.path and self.path.exists():
+                for line in self.path.read_text(encoding="utf-8").splitlines():
+                    try:
+                        entry = json.loads(line)
+                        self._entries[entry["index"]] = (entry["fingerprint"], entry["value"])
+                    except (ValueError, KeyError, TypeError):
+                        continue  # e.g. a line cut short by a crash
+        return self._entries
+
+    def record(self, index: int, fingerprint: str, value: Any) -> None:
+        self._entries[index] = (fingerprint, value)
+        if not self.path:
+            return
+        try:
+            line = json.dumps({"index": index, "fingerprint": fingerprint, "value": value})
+        except (TypeError, ValueError):
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as f:
+                f.write(line + "\n")
+        except OSError:
+            logger.warning(f"Could not record map element {index} in {self.path}")
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._loaded = True
+        if self.path:
+            with contextlib.suppress(OSError):
+                self.path.unlink(missing_ok=True)
+
+
+class MapNode(NodeProtocol):
+    """Runs ``run_item`` per element of ``node_spec.map_over`` and reduces the results."""
+
+    def __init__(
+        self,
+        run_item: ItemRunner,
+        value_keys: Sequence[str] = (),
+        max_concurrency: int = 0,
+        item_timeout: float | None = None,
+        fail_fast: bool = True,
+        ledger: MapLedger | None = None,
+        on_progress: ProgressCallback | None = None,
+    ):
+        """
+        Args:
+            run_item: Executes the sub-node for one element.
+            value_keys: Sub-node output keys kept per element.  One key keeps
+                its value; several keep a dict; none keeps the whole output.
+            max_concurrency: Elements running at once (0 = unlimited).
+            item_timeout: Seconds allowed per element (None = no timeout).
+            fail_fast: Fail the map as soon as an element fails; otherwise
+                failed elements are left out (``None`` for ``collect``).
+            ledger: Where completed elements are recorded for resume.
+            on_progress: Called after each element finishes.
+        """
+        self.run_item = run_item
+        self.value_keys = list(value_keys)
+        self.max_concurrency = max_concurrency
+        self.item_timeout = item_timeout
+        self.fail_fast = fail_fast
+        self.ledger = ledger or MapLedger()
+        self.on_progress = on_progress
+
+    def _read_items(self, ctx: NodeContext) -> list[Any]:
+        key = getattr(ctx.node_spec, "map_over", None)
+        if not key:
+            raise ValueError("map node has no 'map_over' key")
+        items = ctx.memory.read(key)
+        if items is None:
+            items = ctx.input_data.get(key)
+        if isinstance(items, str):
+            with contextlib.suppress(ValueError):
+                items = json.loads(items)
+        if not isinstance(items, list | tuple):
+            raise ValueError(f"'{key}' must be a list, got {type(items).__name__}")
+        return list(items)
+
+    def _item_value(self, output: dict[str, Any]) -> Any:
+        if len(self.value_keys) == 1:
+            return output.get(self.value_keys[0])
+        if self.value_keys:
+            return {key: output.get(key) for key in self.value_keys}
+        return dict(output)
+
+    async def _run_one(self, ctx: NodeContext, index: int, item: Any, semaphore) -> NodeResult:
+        async with semaphore or contextlib.nullcontext():
+            if self.item_timeout:
+                return await asyncio.wait_for(self.run_item(ctx, index, item), self.item_timeout)
+            return await self.run_item(ctx, index, item)
+
+    async def execute(self, ctx: NodeContext) -> NodeResult:
+        spec = ctx.node_spec
+        start = time.monotonic()
+        if not spec.output_keys:
+            return NodeResult(success=False, error=f"Map node '{spec.id}' has no output key")
+        try:
+            items = self._read_items(ctx)
+        except ValueError as e:
+            return NodeResult(success=False, error=f"Map node '{spec.id}': {e}")
+
+        total = len(items)
+        fingerprints = [item_fingerprint(item) for item in items]
+        values: list[Any] = [None] * total
+        done: set[int] = set()
+        errors: dict[int, str] = {}
+        tokens = 0
+
+        recorded = self.ledger.load()
+        for index, fingerprint in enumerate(fingerprints):
+            entry = recorded.get(index)
+            if entry is not None and entry[0] == fingerprint:
+                values[index] = entry[1]
+                done.add(index)
+        if done:
+            logger.info(f"   ↺ Map {spec.id}: {len(done)}/{total} elements already done")
+        logger.info(
+            f"   ⑂ Map {spec.id}: {total - len(done)} elements "
+            f"(max {self.max_concurrency or 'unlimited'} at once)"
+        )
+
+        semaphore = asyncio.Semaphore(self.max_concurrency) if self.max_concurrency > 0 else None
+        tasks = {
+            asyncio.create_task(self._run_one(ctx, index, items[index], semaphore)): index
+            for index in range(total)
+            if index not in done
+        }
+        pending = set(tasks)
+        try:
+            while pending:
+                finished, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in finished:
+                    index = tasks[task]
+                    try:
+                        result = task.result()
+                    except TimeoutError:
+                        errors[index] = f"timed out after {self.item_timeout}s"
+                        continue
+                    except Exception as e:
+                        errors[index] = str(e) or type(e).__name__
+                        continue
+                    tokens += result.tokens_used
+                    if not result.success:
+                        errors[index] = result.error or "failed"
+                        continue
+                    values[index] = self._item_value(result.output)
+                    done.add(index)
+                    self.ledger.record(index, fingerprints[index], values[index])
+                if self.on_progress:
+                    self.on_progress(spec.id, len(done), len(errors), total)
+                if errors and self.fail_fast:
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        latency_ms = int((time.monotonic() - start) * 1000)
+        if errors:
+            details = "; ".join(f"[{i}] {error}" for i, error in sorted(errors.items())[:5])
+            message = f"{len(errors)}/{total} elements failed: {details}"
+            if self.fail_fast:
+                return NodeResult(
+                    success=False,
+                    error=f"Map node '{spec.id}': {message}",
+                    tokens_used=tokens,
+                    latency_ms=latency_ms,
+                )
+            logger.warning(f"   ⚠ Map {spec.id}: {message}")
+
+        mode = getattr(spec, "map_reduce", "collect")
+        kept = values if mode == "collect" else [values[i] for i in sorted(done)]
+        try:
+            reduced = reduce_map_outputs(kept, mode)
+        except ValueError as e:
+            return NodeResult(
+                success=False,
+                error=f"Map node '{spec.id}': {e}",
+                tokens_used=tokens,
+                latency_ms=latency_ms,
+            )
+
+        logger.info(f"   ⑃ Map {spec.id}: {len(done)}/{total} elements succeeded")
+        self.ledger.clear()
+        return NodeResult(
+            success=True,
+            output={spec.output_keys[0]: reduced},
+            tokens_used=tokens,
+            latency_ms=latency_ms,
+        )
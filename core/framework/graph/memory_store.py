@@ -0,0 +1,245 @@
+"""
+Versioned copy-on-write storage behind SharedMemory.
+
+Every write bumps a store-wide version and records it for the key, so:
+
+- ``snapshot()`` is O(1): it freezes the current dicts and the next write
+  copies them (copy-on-write) instead of mutating what the snapshot sees;
+- ``changes_since(version)`` returns only the keys written after a version,
+  read from the tail of the write-ordered version map, so checkpoint and
+  state writers never diff the whole memory;
+- ``fork()`` is O(1) and gives a parallel branch a private store over the
+  same data; ``merge()`` folds branch writes back in a fixed order and
+  reports keys that more than one writer changed.
+
+Example:
+    branch_a, branch_b = memory.fork(), memory.fork()
+    branch_a.set("x", 1)
+    branch_b.set("x", 2)
+    conflicts = memory.merge([("a", branch_a), ("b", branch_b)])
+    # memory.get("x") == 2 (last_wins), conflicts[0].key == "x"
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+CONFLICT_STRATEGIES = ("last_wins", "first_wins", "error")
+
+# Label used in conflicts for writes made to the base store after a fork.
+BASE_LABEL = "base"
+
+
+class MemorySnapshot(Mapping):
+    """Read-only view of a MemoryStore at one version."""
+
+    __slots__ = ("version", "_data", "_versions")
+
+    def __init__(self, data: dict[str, Any], versions: dict[str, int], version: int):
+        self.version = version
+        self._data = data
+        self._versions = versions
+
+    def __getitem__(self, key: str) -> Any:
+        return self._data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def key_version(self, key: str) -> int:
+        """Version of the last write to *key* (0 if never written)."""
+        return self._versions.get(key, 0)
+
+    def to_dict(self) -> dict[str, Any]:
+        return dict(self._data)
+
+
+@dataclass
+class MemoryChangeSet:
+    """Keys written after ``since_version``, in write order, as of ``version``."""
+
+    since_version: int
+    version: int
+    changes: dict[str, Any] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.changes)
+
+
+@dataclass
+class MergeConflict:
+    """A key written with different values by more than one writer."""
+
+    key: str
+    values: dict[str, Any]  # writer label -> value, in merge order
+    chosen: str | None  # label whose value was kept; None when the merge failed
+
+
+class MemoryMergeError(Exception):
+    """Raised by ``merge(strategy="error")`` when writers conflict."""
+
+    def __init__(self, conflicts: list[MergeConflict]):
+        self.conflicts = conflicts
+        details = ", ".join(f"'{c.key}' ({', '.join(c.values)})" for c in conflicts)
+        super().__init__(f"Conflicting writes to memory keys: {details}")
+
+
+def _differ(values: list[Any]) -> bool:
+    first = values[0]
+    for value in values[1:]:
+        try:
+            if bool(value != first):
+                return True
+        except Exception:  # e.g. ambiguous array comparison
+            if value is not first:
+                return True
+    return False
+
+
+class MemoryStore:
+    """Versioned, copy-on-write key/value store."""
+
+    def __init__(self, data: Mapping[str, Any] | None = None):
+        self._data: dict[str, Any] = {}
+        # key -> version of its last write, kept in write order
+        self._versions: dict[str, int] = {}
+        self.version = 0
+        # Version this store was forked at (0 for a root store)
+        self.base_version = 0
+        # True while a snapshot or fork still references _data/_versions
+        self._shared = False
+        for key, value in (data or {}).items():
+            self.set(key, value)
+
+    # ------------------------------------------------------------------
+    # Reads and writes
+    # ------------------------------------------------------------------
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._data.get(key, default)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def items(self):
+        return self._data.items()
+
+    def key_version(self, key: str) -> int:
+        """Version of the last write to *key* (0 if never written)."""
+        return self._versions.get(key, 0)
+
+    def set(self, key: str, value: Any) -> int:
+        """Write *key* and return the new store version."""
+        if self._shared:
+            self._data = dict(self._data)
+            self._versions = dict(self._versions)
+            self._shared = False
+        self.version += 1
+        self._versions.pop(key, None)
+        self._versions[key] = self.version
+        self._data[key] = value
+        return self.version
+
+    # ------------------------------------------------------------------
+    # Snapshots and change-sets
+    # ------------------------------------------------------------------
+
+    def snapshot(self) -> MemorySnapshot:
+        """O(1) read-only view of the current state."""
+        self._shared = True
+        return MemorySnapshot(self._data, self._versions, self.version)
+
+    def to_dict(self) -> dict[str, Any]:
+        return dict(self._data)
+
+    def changes_since(self, version: int) -> MemoryChangeSet:
+        """Keys written after *version*; cost is proportional to the changes."""
+        recent: list[str] = []
+        for key in reversed(self._versions):
+            if self._versions[key] <= version:
+                break
+            recent.append(key)
+        changes = {key: self._data[key] for key in reversed(recent)}
+        return MemoryChangeSet(since_version=version, version=self.version, changes=changes)
+
+    # ------------------------------------------------------------------
+    # Fork / merge
+    # ------------------------------------------------------------------
+
+    def fork(self) -> MemoryStore:
+        """O(1) private copy for a parallel branch."""
+        child = MemoryStore()
+        child._data = self._data
+        child._versions = self._versions
+        child.version = self.version
+        child.base_version = self.version
+        child._shared = True
+        self._shared = True
+        return child
+
+    def merge(
+        self,
+        branches: Sequence[tuple[str, MemoryStore]],
+        strategy: str = "last_wins",
+    ) -> list[MergeConflict]:
+        """
+        Fold the writes of forked *branches* into this store.
+
+        Branches are applied in the order given, so the result does not
+        depend on which branch finished first.  A key is a conflict when
+        more than one writer set it to different values.  A write made to
+        this store after a branch was forked counts as an earlier writer,
+        labelled ``"base"``.
+
+        Args:
+            branches: (label, store) pairs, each forked from this store.
+            strategy: "last_wins", "first_wins", or "error" (raise
+                ``MemoryMergeError`` and apply nothing).
+
+        Returns:
+            The conflicts found (empty when branches wrote disjoint keys).
+        """
+        if strategy not in CONFLICT_STRATEGIES:
+            raise ValueError(
+                f"Unknown memory conflict strategy {strategy!r}; "
+                f"expected one of {', '.join(CONFLICT_STRATEGIES)}"
+            )
+
+        writers: dict[str, dict[str, Any]] = {}
+        for label, branch in branches:
+            for key, value in branch.changes_since(branch.base_version).changes.items():
+                by_label = writers.setdefault(key, {})
+                if BASE_LABEL not in by_label and self.key_version(key) > branch.base_version:
+                    by_label[BASE_LABEL] = self._data[key]
+                by_label[label] = value
+
+        merged: dict[str, Any] = {}
+        conflicts: list[MergeConflict] = []
+        for key, by_label in writers.items():
+            labels = list(by_label)
+            chosen = labels[0] if strategy == "first_wins" else labels[-1]
+            if len(labels) > 1 and _differ(list(by_label.values())):
+                conflicts.append(
+                    MergeConflict(
+                        key=key,
+                        values=dict(by_label),
+                        chosen=None if strategy == "error" else chosen,
+                    )
+                )
+            if chosen != BASE_LABEL:
+                merged[key] = by_label[chosen]
+
+        if conflicts and strategy == "error":
+            raise MemoryMergeError(conflicts)
+
+        for key, value in merged.items():
+            self.set(key, value)
+        return conflicts
@@ -22,10 +22,18 @@
 from dataclasses import dataclass, field
 from typing import Any
 
-from pydantic import BaseModel, Field
-
+from pydantic import BaseModel, Field, PrivateAttr
+
+from framework.graph.memory_store import (
+    MemoryChangeSet,
+    MemorySnapshot,
+    MemoryStore,
+    MergeConflict,
+)
+from framework.graph.validator import MEMORY_CODE_MATCHER, NodeValidator
 from framework.llm.provider import LLMProvider, Tool
 from framework.runtime.core import Runtime
+from framework.utils.json_stream import IncrementalJSONScanner, escape_control_chars_in_strings
 
 logger = logging.getLogger(__name__)
 
@@ -36,54 +44,7 @@ def _fix_unescaped_newlines_in_json(json_str: str) -> str:
     LLMs sometimes output actual newlines inside JSON strings instead of \\n.
     This function fixes that by properly escaping newlines within string values.
     """
-    result = []
-    in_string = False
-    escape_next = False
-    i = 0
-
-    while i < len(json_str):
-        char = json_str[i]
-
-        if escape_next:
-            result.append(char)
-            escape_next = False
-            i += 1
-            continue
-
-        if char == "\\" and in_string:
-            escape_next = True
-            result.append(char)
-            i += 1
-            continue
-
-        if char == '"' and not escape_next:
-            in_string = not in_string
-            result.append(char)
-            i += 1
-            continue
-
-        # Fix unescaped newlines inside strings
-        if in_string and char == "\n":
-            result.append("\\n")
-            i += 1
-            continue
-
-        # Fix unescaped carriage returns inside strings
-        if in_string and char == "\r":
-            result.append("\\r")
-            i += 1
-            continue
-
-        # Fix unescaped tabs inside strings
-        if in_string and char == "\t":
-            result.append("\\t")
-            i += 1
-            continue
-
-        result.append(char)
-        i += 1
-
-    return "".join(result)
+    return escape_control_chars_in_strings(json_str)
 
 
 def find_json_object(text: str) -> str | None:
@@ -107,34 +68,10 @@ def find_json_object(text: str) -> str | None:
     except json.JSONDecodeError:
         pass
 
-    # Fall back to existing brace matching
-    depth = 0
-    in_string = False
-    escape_next = False
-
-    for i, char in enumerate(text[start:], start):
-        if escape_next:
-            escape_next = False
-            continue
-
-        if char == "\\" and in_string:
-            escape_next = True
-            continue
-
-        if char == '"' and not escape_next:
-            in_string = not in_string
-            continue
-
-        if in_string:
-            continue
-
-        if char == "{":
-            depth += 1
-        elif char == "}":
-            depth -= 1
-            if depth == 0:
-                return text[start : i + 1]
-
+    # Fall back to balanced brace matching (regex-driven, skips string bodies)
+    scanner = IncrementalJSONScanner(repair=False)
+    if scanner.feed(text[start:]):
+        return scanner.text()
     return None
 
 
@@ -166,7 +103,7 @@ class NodeSpec(BaseModel):
     # Node behavior type
     node_type: str = Field(
         default="event_loop",
-        description="Type: 'event_loop' (recommended), 'router', 'human_input'.",
+        description="Type: 'event_loop' (recommended) or 'map' (see map_over).",
     )
 
     # Data flow
@@ -223,6 +160,41 @@ class NodeSpec(BaseModel):
         ),
     )
 
+    # Fan-out scheduling (see ParallelExecutionConfig)
+    max_parallel_branches: int | None = Field(
+        default=None,
+        description=(
+            "When this node fans out (or maps over a list), the maximum number of "
+            "branches or elements running at once (0 = unlimited). Overrides the "
+            "graph and executor settings."
+        ),
+    )
+    branch_timeout_seconds: float | None = Field(
+        default=None,
+        description=(
+            "When this node runs as a fan-out branch, its timeout in seconds "
+            "(0 = no timeout). Overrides the executor's branch timeout."
+        ),
+    )
+
+    # Map over list inputs (node_type="map", see framework.graph.map_node)
+    map_over: str | None = Field(
+        default=None, description="Memory key holding the list a map node iterates over"
+    )
+    map_node: str | None = Field(
+        default=None, description="ID of the node a map node runs once per list element"
+    )
+    map_item_key: str = Field(
+        default="item", description="Input key the current element is passed to map_node as"
+    )
+    map_reduce: str = Field(
+        default="collect",
+        description=(
+            "How per-element outputs are combined into the first output key: "
+            "'collect' (list), 'concat' (flattened list), or 'merge' (dict)."
+        ),
+    )
+
     # Pydantic model for output validation
     output_model: type[BaseModel] | None = Field(
         default=None,
@@ -254,6 +226,20 @@ class NodeSpec(BaseModel):
 
     model_config = {"extra": "allow", "arbitrary_types_allowed": True}
 
+    _validator: NodeValidator | None = PrivateAttr(default=None)
+
+    def compiled_validator(self, recompile: bool = False) -> NodeValidator:
+        """
+        Validator derived from this spec's keys, input_schema and output_model.
+
+        Compiled on first use and cached; pass ``recompile=True`` after
+        changing those fields (``GraphSpec.compile_validators`` does this
+        for every node when a graph is loaded for execution).
+        """
+        if self._validator is None or recompile:
+            self._validator = NodeValidator.from_spec(self)
+        return self._validator
+
 
 class MemoryWriteError(Exception):
     """Raised when an invalid value is written to memory."""
@@ -271,9 +257,15 @@ class SharedMemory:
 
     For parallel execution, use write_async() which provides per-key locking
     to prevent race conditions when multiple nodes write concurrently.
+    Parallel branches can instead work on a ``fork()`` each and be folded
+    back with ``merge()`` at the fan-in node.
+
+    Data lives in a versioned copy-on-write MemoryStore: ``snapshot()`` is
+    O(1) and ``changes_since()`` returns only the keys written after a
+    version, for checkpoint and state writers.
     """
 
-    _data: dict[str, Any] = field(default_factory=dict)
+    _store: MemoryStore = field(default_factory=MemoryStore)
     _allowed_read: set[str] = field(default_factory=set)
     _allowed_write: set[str] = field(default_factory=set)
     # Locks for thread-safe parallel execution
@@ -289,7 +281,7 @@ def read(self, key: str) -> Any:
         """Read a value from shared memory."""
         if self._allowed_read and key not in self._allowed_read:
             raise PermissionError(f"Node not allowed to read key: {key}")
-        return self._data.get(key)
+        return self._store.get(key)
 
     def write(self, key: str, value: Any, validate: bool = True) -> None:
         """
@@ -307,22 +299,10 @@ def write(self, key: str, value: Any, validate: bool = True) -> None:
         if self._allowed_write and key not in self._allowed_write:
             raise PermissionError(f"Node not allowed to write key: {key}")
 
-        if validate and isinstance(value, str):
-            # Check for obviously hallucinated content
-            if len(value) > 5000:
-                # Long strings that look like code are suspicious
-                if self._contains_code_indicators(value):
-                    logger.warning(
-                        f"⚠ Suspicious write to key '{key}': appears to be code "
-                        f"({len(value)} chars). Consider using validate=False if intended."
-                    )
-                    raise MemoryWriteError(
-                        f"Rejected suspicious content for key '{key}': "
-                        f"appears to be hallucinated code ({len(value)} chars). "
-                        "If this is intentional, use validate=False."
-                    )
-
-        self._data[key] = value
+        if validate:
+            self._check_write(key, value)
+
+        self._store.set(key, value)
 
     async def write_async(self, key: str, value: Any, validate: bool = True) -> None:
         """
@@ -352,19 +332,22 @@ async def write_async(self, key: str, value: Any, validate: bool = True) -> None
 
         # Acquire per-key lock and write
         async with self._key_locks[key]:
-            if validate and isinstance(value, str):
-                if len(value) > 5000:
-                    if self._contains_code_indicators(value):
-                        logger.warning(
-                            f"⚠ Suspicious write to key '{key}': appears to be code "
-                            f"({len(value)} chars). Consider using validate=False if intended."
-                        )
-                        raise MemoryWriteError(
-                            f"Rejected suspicious content for key '{key}': "
-                            f"appears to be hallucinated code ({len(value)} chars). "
-                            "If this is intentional, use validate=False."
-                        )
-            self._data[key] = value
+            if validate:
+                self._check_write(key, value)
+            self._store.set(key, value)
+
+    def _check_write(self, key: str, value: Any) -> None:
+        """Reject long strings that look like hallucinated code."""
+        if isinstance(value, str) and len(value) > 5000 and self._contains_code_indicators(value):
+            logger.warning(
+                f"⚠ Suspicious write to key '{key}': appears to be code "
+                f"({len(value)} chars). Consider using validate=False if intended."
+            )
+            raise MemoryWriteError(
+                f"Rejected suspicious content for key '{key}': "
+                f"appears to be hallucinated code ({len(value)} chars). "
+                "If this is intentional, use validate=False."
+            )
 
     def _contains_code_indicators(self, value: str) -> bool:
         """
@@ -380,58 +363,48 @@ def _contains_code_indicators(self, value: str) -> bool:
         Returns:
             True if code indicators are found, False otherwise
         """
-        code_indicators = [
-            # Python
-            "```python",
-            "def ",
-            "class ",
-            "import ",
-            "async def ",
-            "from ",
-            # JavaScript/TypeScript
-            "function ",
-            "const ",
-            "let ",
-            "=> {",
-            "require(",
-            "export ",
-            # SQL
-            "SELECT ",
-            "INSERT ",
-            "UPDATE ",
-            "DELETE ",
-            "DROP ",
-            # HTML/Script injection
-            "<script",
-            "<?php",
-            "<%",
-        ]
-
-        # For strings under 10KB, check the entire content
-        if len(value) < 10000:
-            return any(indicator in value for indicator in code_indicators)
-
-        # For longer strings, sample at strategic positions
-        sample_positions = [
-            0,  # Start
-            len(value) // 4,  # 25%
-            len(value) // 2,  # 50%
-            3 * len(value) // 4,  # 75%
-            max(0, len(value) - 2000),  # Near end
-        ]
-
-        for pos in sample_positions:
-            chunk = value[pos : pos + 2000]
-            if any(indicator in chunk for indicator in code_indicators):
-                return True
-
-        return False
+        return MEMORY_CODE_MATCHER.search(value)
 
     def read_all(self) -> dict[str, Any]:
         """Read all accessible data."""
         if self._allowed_read:
-            return {k: v for k, v in self._data.items() if k in self._allowed_read}
-        return dict(self._data)
+            return {k: v for k, v in self._store.items() if k in self._allowed_read}
+        return self._store.to_dict()
+
+    @property
+    def version(self) -> int:
+        """Store version; increases by one on every write."""
+        return self._store.version
+
+    def snapshot(self) -> MemorySnapshot:
+        """O(1) read-only view of all keys (read permissions do not apply)."""
+        return self._store.snapshot()
+
+    def changes_since(self, version: int) -> MemoryChangeSet:
+        """Keys written after *version* (read permissions do not apply)."""
+        return self._store.changes_since(version)
+
+    def fork(self) -> "SharedMemory":
+        """O(1) private copy with the same permissions, for a parallel branch.
+
+        Writes to the fork are invisible here until ``merge()``.
+        """
+        return SharedMemory(
+            _store=self._store.fork(),
+            _allowed_read=set(self._allowed_read),
+            _allowed_write=set(self._allowed_write),
+        )
+
+    def merge(
+        self,
+        branches: "list[tuple[str, SharedMemory]]",
+        strategy: str = "last_wins",
+    ) -> list[MergeConflict]:
+        """Fold the writes of forked branches back in, in the order given.
+
+        See ``MemoryStore.merge`` for conflict detection and *strategy*.
+        """
+        return self._store.merge([(label, mem._store) for label, mem in branches], strategy)
 
     def with_permissions(
         self,
@@ -444,7 +417,7 @@ def with_permissions(
         enabling thread-safe parallel execution across scoped views.
         """
         return SharedMemory(
-            _data=self._data,
+            _store=self._store,
             _allowed_read=set(read_keys) if read_keys else set(),
             _allowed_write=set(write_keys) if write_keys else set(),
             _lock=self._lock,  # Share lock for thread safety
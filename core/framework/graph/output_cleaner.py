@@ -13,6 +13,9 @@
 from dataclasses import dataclass, field
 from typing import Any
 
+from framework.graph.validator import NodeValidator, type_matches
+from framework.llm.rate_limiter import LLMPriority, llm_priority
+
 logger = logging.getLogger(__name__)
 
 
@@ -141,55 +144,15 @@ def validate_output(
         Returns:
             ValidationResult with errors and optionally cleaned output
         """
-        errors = []
-        warnings = []
-
-        # Check 1: Required input keys present (skip nullable keys)
-        nullable = set(getattr(target_node_spec, "nullable_output_keys", None) or [])
-        for key in target_node_spec.input_keys:
-            if key in nullable:
-                continue
-            if key not in output:
-                errors.append(f"Missing required key: '{key}'")
-                continue
-
-            value = output[key]
-
-            # Check 2: Detect if value is JSON string (the JSON parsing trap!)
-            if isinstance(value, str):
-                # Try parsing as JSON to detect the trap
-                try:
-                    parsed = json.loads(value)
-                    if isinstance(parsed, dict):
-                        if key in parsed:
-                            # Key exists in parsed JSON - classic parsing failure!
-                            errors.append(
-                                f"Key '{key}' contains JSON string with nested '{key}' field - "
-                                f"likely parsing failure from LLM node"
-                            )
-                        elif len(value) > 100:
-                            # Large JSON string, but doesn't contain the key
-                            warnings.append(
-                                f"Key '{key}' contains JSON string ({len(value)} chars)"
-                            )
-                except json.JSONDecodeError:
-                    # Not JSON, check if suspiciously large
-                    if len(value) > 500:
-                        warnings.append(
-                            f"Key '{key}' contains large string ({len(value)} chars), "
-                            f"possibly entire LLM response"
-                        )
-
-            # Check 3: Type validation (if schema provided)
-            if hasattr(target_node_spec, "input_schema") and target_node_spec.input_schema:
-                expected_schema = target_node_spec.input_schema.get(key)
-                if expected_schema:
-                    expected_type = expected_schema.get("type")
-                    if expected_type and not self._type_matches(value, expected_type):
-                        actual_type = type(value).__name__
-                        errors.append(
-                            f"Key '{key}': expected type '{expected_type}', got '{actual_type}'"
-                        )
+        # Checks: required input keys present (nullable keys skipped), the
+        # JSON parsing trap, and input_schema types.  NodeSpecs carry a
+        # precompiled validator; other spec-like objects are compiled here.
+        compiled = getattr(target_node_spec, "compiled_validator", None)
+        if callable(compiled):
+            validator = compiled()
+        else:
+            validator = NodeValidator.from_spec(target_node_spec)
+        errors, warnings = validator.check_inputs(output)
 
         # Warnings don't make validation fail, but errors do
         is_valid = len(errors) == 0
@@ -288,13 +251,15 @@ async def clean_output(
                     f"🧹 Cleaning output from '{source_node_id}' using {self.config.fast_model}"
                 )
 
-            response = await self.llm.acomplete(
-                messages=[{"role": "user", "content": prompt}],
-                system=(
-                    "You clean malformed agent outputs. Return only valid JSON matching the schema."
-                ),
-                max_tokens=2048,  # Sufficient for cleaning most outputs
-            )
+            with llm_priority(LLMPriority.BACKGROUND):
+                response = await self.llm.acomplete(
+                    messages=[{"role": "user", "content": prompt}],
+                    system=(
+                        "You clean malformed agent outputs. "
+                        "Return only valid JSON matching the schema."
+                    ),
+                    max_tokens=2048,  # Sufficient for cleaning most outputs
+                )
 
             # Parse cleaned output
             cleaned_text = response.content.strip()
@@ -363,28 +328,7 @@ def _build_schema_description(self, node_spec: Any) -> str:
 
     def _type_matches(self, value: Any, expected_type: str) -> bool:
         """Check if value matches expected type."""
-        type_map = {
-            "string": str,
-            "str": str,
-            "int": int,
-            "integer": int,
-            "float": float,
-            "number": (int, float),
-            "bool": bool,
-            "boolean": bool,
-            "dict": dict,
-            "object": dict,
-            "list": list,
-            "array": list,
-            "any": object,  # Matches everything
-        }
-
-        expected_class = type_map.get(expected_type.lower())
-        if expected_class:
-            return isinstance(value, expected_class)
-
-        # Unknown type, allow it
-        return True
+        return type_matches(value, expected_type)
 
     def get_stats(self) -> dict[str, Any]:
         """Get cleansing statistics."""
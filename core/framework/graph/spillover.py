@@ -0,0 +1,571 @@
+"""
+Searchable spillover store for oversized tool results.
+
+When a tool result is too large for the conversation, EventLoopNode writes
+it to the session's spillover directory and shows the agent a preview.
+Reading the file back byte-range by byte-range with ``load_data`` costs many
+turns, so the store also records the file's structure and indexes it:
+
+- JSON results are pretty-printed and outlined (paths, types, array
+  lengths), so the agent can ask for ``$.items[10:20]`` directly;
+- every file gets a line-offset table, so a line range is one seek;
+- the text is split into line windows and added to a BM25 index shared by
+  every file in the session directory, so a keyword query returns only the
+  relevant windows.
+
+Writing and indexing run in a worker thread, off the event loop.  Metadata
+is kept in a sidecar (``.spill_index/<filename>.json``) so a resumed session
+can query earlier spills; files without a sidecar (e.g. written by
+``save_data``) are indexed on first query.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import math
+import re
+import threading
+from collections import Counter, OrderedDict
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+INDEX_DIRNAME = ".spill_index"
+# Session stores kept in memory by get_spillover_store()
+MAX_STORES = 8
+
+_TOKEN_RE = re.compile(r"[a-z0-9_]+")
+_PATH_TOKEN_RE = re.compile(r"\.?([^.\[\]]+)|\[([^\]]*)\]")
+
+# BM25 parameters (standard defaults)
+_K1 = 1.5
+_B = 0.75
+
+
+def _tokenize(text: str) -> list[str]:
+    return _TOKEN_RE.findall(text.lower())
+
+
+@dataclass
+class SpilledFile:
+    """Structure recorded for one spilled file."""
+
+    filename: str
+    tool_name: str = ""
+    format: str = "text"  # "json", "jsonl" or "text"
+    size_bytes: int = 0
+    mtime: float = 0.0
+    line_count: int = 0
+    rows: int | None = None  # top-level array length, or JSONL records
+    outline: list[str] = field(default_factory=list)
+    line_offsets: list[int] = field(default_factory=list)
+
+    def describe(self) -> str:
+        """One-line description for the truncation notice."""
+        parts = [self.format.upper() if self.format != "text" else "text"]
+        parts.append(f"{self.line_count} lines")
+        if self.rows is not None:
+            parts.append(f"{self.rows} rows")
+        text = ", ".join(parts)
+        if self.outline:
+            text += "; paths: " + ", ".join(self.outline[:8])
+        return text
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> SpilledFile:
+        return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
+
+
+@dataclass
+class _Chunk:
+    filename: str
+    start_line: int  # 1-based, inclusive
+    end_line: int
+    terms: Counter[str]
+    length: int
+
+
+def _outline(
+    value: Any, path: str = "$", depth: int = 0, out: list[str] | None = None
+) -> list[str]:
+    """Describe the shape of a JSON value as ``path: type`` entries."""
+    out = [] if out is None else out
+    if len(out) >= 20:
+        return out
+    if isinstance(value, dict):
+        if depth > 0:
+            keys = ", ".join(list(value)[:6]) + (", ..." if len(value) > 6 else "")
+            out.append(f"{path}: object{{{keys}}}")
+        if depth < 2:
+            for key, child in value.items():
+                _outline(child, f"{path}.{key}", depth + 1, out)
+    elif isinstance(value, list):
+        out.append(f"{path}: list[{len(value)}]")
+        if value and depth < 2 and isinstance(value[0], (dict, list)):
+            _outline(value[0], f"{path}[*]", depth + 1, out)
+    elif depth > 0:
+        out.append(f"{path}: {type(value).__name__}")
+    return out
+
+
+def parse_json_path(path: str) -> list[str | slice]:
+    """Split ``$.items[0:5].name`` into ``["items", slice(0, 5), "name"]``.
+
+    Keys and ``[n]`` indexes become strings, ``[a:b]`` a slice and ``[*]``
+    the full slice (which also selects every value of an object).  The
+    memory-mapped reader in ``aden_tools`` walks the same steps.
+    """
+    path = path.strip()
+    if path.startswith("$"):
+        path = path[1:]
+    steps: list[str | slice] = []
+    pos = 0
+    while pos < len(path):
+        match = _PATH_TOKEN_RE.match(path, pos)
+        if not match or match.end() == pos:
+            raise ValueError(f"Invalid json_path near '{path[pos:]}'")
+        key, bracket = match.groups()
+        pos = match.end()
+        if key is not None:
+            steps.append(key)
+            continue
+        inner = bracket.strip()
+        if inner == "*":
+            steps.append(slice(None))
+        elif ":" in inner and inner[:1] not in "'\"":
+            first, _, second = inner.partition(":")
+            try:
+                steps.append(slice(int(first) if first else None, int(second) if second else None))
+            except ValueError:
+                raise ValueError(f"Invalid slice [{inner}] in json_path") from None
+        else:
+            steps.append(inner.strip("'\""))
+    return steps
+
+
+def select_json_path(doc: Any, path: str) -> Any:
+    """Evaluate a small JSONPath subset: keys, ``[n]``, ``[a:b]``, ``[*]``.
+
+    Wildcards and slices fan out, so the result is a list whenever one of
+    them is used.
+    """
+    values = [doc]
+    fanned_out = False
+    for step in parse_json_path(path):
+        nxt: list[Any] = []
+        for v in values:
+            if isinstance(step, slice):
+                fanned_out = True
+                if isinstance(v, list):
+                    nxt.extend(v[step])
+                elif isinstance(v, dict) and step == slice(None):
+                    nxt.extend(v.values())
+            elif isinstance(v, dict):
+                if step in v:
+                    nxt.append(v[step])
+            elif isinstance(v, list) and step.lstrip("-").isdigit():
+                idx = int(step)
+                if -len(v) <= idx < len(v):
+                    nxt.append(v[idx])
+        values = nxt
+        if not values:
+            raise KeyError(f"json_path '{path}' matched nothing")
+    return values if fanned_out else values[0]
+
+
+def _mapped_file(path: Path) -> Any:
+    """The shared memory map of *path* used by the data tools, if aden_tools is installed."""
+    try:
+        from aden_tools.utils.mapped_file import get_mapped_file
+    except ImportError:
+        return None
+    return get_mapped_file(path)
+
+
+def parse_line_range(line_range: str | list[int] | tuple[int, int]) -> tuple[int, int]:
+    """Accept ``"10-40"``, ``"10:40"``, ``"10"`` or ``[10, 40]`` (1-based, inclusive)."""
+    if isinstance(line_range, (list, tuple)):
+        if len(line_range) != 2:
+            raise ValueError("line_range list must be [start, end]")
+        start, end = int(line_range[0]), int(line_range[1])
+    else:
+        text = str(line_range).strip().replace(":", "-")
+        first, _, second = text.partition("-")
+        start = int(first)
+        end = int(second) if second.strip() else start
+    if start < 1 or end < start:
+        raise ValueError(f"Invalid line_range {line_range!r}")
+    return start, end
+
+
+class SpilloverStore:
+    """Spill files plus a BM25 index over every file in one directory."""
+
+    def __init__(self, directory: str | Path, chunk_lines: int = 20):
+        self.directory = Path(directory)
+        self.chunk_lines = max(1, chunk_lines)
+        self._lock = threading.Lock()
+        self._files: dict[str, SpilledFile] = {}
+        self._chunks: dict[int, _Chunk] = {}
+        self._chunk_ids: dict[str, list[int]] = {}
+        self._postings: dict[str, set[int]] = {}
+        self._next_chunk = 0
+        self._total_length = 0
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    async def spill(self, tool_name: str, tool_use_id: str, content: str) -> SpilledFile:
+        """Write a tool result to the directory and index it, off the event loop."""
+        safe_id = tool_use_id.replace("/", "_")[:60]
+        filename = f"tool_{tool_name}_{safe_id}.txt"
+        return await asyncio.to_thread(self._spill_sync, filename, tool_name, content)
+
+    def _spill_sync(self, filename: str, tool_name: str, content: str) -> SpilledFile:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fmt, text, rows, outline = self._analyse(content)
+        path = self.directory / filename
+        path.write_text(text, encoding="utf-8")
+        meta = self._index_text(filename, text, path, tool_name, fmt, rows, outline)
+        self._write_sidecar(meta)
+        return meta
+
+    @staticmethod
+    def _analyse(content: str) -> tuple[str, str, int | None, list[str]]:
+        """Detect the format and return ``(format, text_to_write, rows, outline)``."""
+        try:
+            parsed = json.loads(content)
+        except (json.JSONDecodeError, TypeError, ValueError):
+            parsed = None
+        else:
+            # Pretty-print so line ranges and the line-window index are useful;
+            # compact JSON is a single line.
+            text = json.dumps(parsed, indent=2, ensure_ascii=False)
+            rows = len(parsed) if isinstance(parsed, list) else None
+            return "json", text, rows, _outline(parsed)
+
+        lines = [line for line in content.splitlines() if line.strip()]
+        if len(lines) > 1:
+            try:
+                first = json.loads(lines[0])
+                for line in lines[1:]:
+                    json.loads(line)
+            except (json.JSONDecodeError, ValueError):
+                pass
+            else:
+                return "jsonl", content, len(lines), _outline(first, "$[*]", 1)
+        return "text", content, None, []
+
+    def _write_sidecar(self, meta: SpilledFile) -> None:
+        try:
+            index_dir = self.directory / INDEX_DIRNAME
+            index_dir.mkdir(exist_ok=True)
+            (index_dir / f"{meta.filename}.json").write_text(
+                json.dumps(asdict(meta)), encoding="utf-8"
+            )
+        except OSError as e:
+            logger.debug("Could not write spillover sidecar for %s: %s", meta.filename, e)
+
+    # ------------------------------------------------------------------
+    # Indexing
+    # ------------------------------------------------------------------
+
+    def _index_text(
+        self,
+        filename: str,
+        text: str,
+        path: Path,
+        tool_name: str = "",
+        fmt: str = "text",
+        rows: int | None = None,
+        outline: list[str] | None = None,
+    ) -> SpilledFile:
+        lines = text.split("\n")
+        offsets: list[int] = []
+        pos = 0
+        for line in lines:
+            offsets.append(pos)
+            pos += len(line.encode("utf-8")) + 1
+        stat = path.stat()
+        meta = SpilledFile(
+            filename=filename,
+            tool_name=tool_name,
+            format=fmt,
+            size_bytes=stat.st_size,
+            mtime=stat.st_mtime,
+            line_count=len(lines),
+            rows=rows,
+            outline=outline or [],
+            line_offsets=offsets,
+        )
+
+        chunks = []
+        for start in range(0, len(lines), self.chunk_lines):
+            window = lines[start : start + self.chunk_lines]
+            tokens = _tokenize("\n".join(window))
+            if tokens:
+                chunks.append((start + 1, start + len(window), Counter(tokens), len(tokens)))
+
+        with self._lock:
+            self._remove_locked(filename)
+            ids = []
+            for start_line, end_line, terms, length in chunks:
+                chunk_id = self._next_chunk
+                self._next_chunk += 1
+                self._chunks[chunk_id] = _Chunk(filename, start_line, end_line, terms, length)
+                self._total_length += length
+                for term in terms:
+                    self._postings.setdefault(term, set()).add(chunk_id)
+                ids.append(chunk_id)
+            self._chunk_ids[filename] = ids
+            self._files[filename] = meta
+        return meta
+
+    def _remove_locked(self, filename: str) -> None:
+        for chunk_id in self._chunk_ids.pop(filename, []):
+            chunk = self._chunks.pop(chunk_id)
+            self._total_length -= chunk.length
+            for term in chunk.terms:
+                posting = self._postings.get(term)
+                if posting is not None:
+                    posting.discard(chunk_id)
+                    if not posting:
+                        del self._postings[term]
+        self._files.pop(filename, None)
+
+    def _ensure_indexed(self, filename: str) -> SpilledFile:
+        """Index *filename* if it is new or changed since it was indexed."""
+        path = self.directory / filename
+        if not path.is_file():
+            raise FileNotFoundError(f"File not found: {filename}")
+        stat = path.stat()
+        with self._lock:
+            meta = self._files.get(filename)
+        if meta and meta.size_bytes == stat.st_size and meta.mtime == stat.st_mtime:
+            return meta
+
+        sidecar = self.directory / INDEX_DIRNAME / f"{filename}.json"
+        known = SpilledFile(filename=filename)
+        if sidecar.is_file():
+            try:
+                known = SpilledFile.from_dict(json.loads(sidecar.read_text(encoding="utf-8")))
+            except (json.JSONDecodeError, OSError, TypeError):
+                pass
+        text = path.read_text(encoding="utf-8", errors="replace")
+        if known.size_bytes == stat.st_size:
+            fmt, rows, outline = known.format, known.rows, known.outline
+        else:
+            fmt, _, rows, outline = self._analyse(text)
+        return self._index_text(filename, text, path, known.tool_name, fmt, rows, outline)
+
+    def _index_directory(self) -> None:
+        if not self.directory.is_dir():
+            return
+        for path in self.directory.iterdir():
+            if path.is_file():
+                try:
+                    self._ensure_indexed(path.name)
+                except (OSError, UnicodeDecodeError) as e:
+                    logger.debug("Skipping %s in spillover index: %s", path.name, e)
+
+    # ------------------------------------------------------------------
+    # Querying
+    # ------------------------------------------------------------------
+
+    async def query(
+        self,
+        filename: str = "",
+        query: str = "",
+        json_path: str = "",
+        line_range: str | list[int] | None = None,
+        max_chars: int = 3000,
+        top_k: int = 5,
+    ) -> dict[str, Any]:
+        """Return the slice of a spilled file the agent asked for.
+
+        Exactly one of *query*, *json_path* or *line_range* is used (in that
+        order of precedence).  A *query* without *filename* searches every
+        file in the directory.  Errors are returned as ``{"error": ...}``.
+        """
+        return await asyncio.to_thread(
+            self.query_sync, filename, query, json_path, line_range, max_chars, top_k
+        )
+
+    def query_sync(
+        self,
+        filename: str = "",
+        query: str = "",
+        json_path: str = "",
+        line_range: str | list[int] | None = None,
+        max_chars: int = 3000,
+        top_k: int = 5,
+    ) -> dict[str, Any]:
+        if filename and (".." in filename or "/" in filename or "\\" in filename):
+            return {"error": "Invalid filename"}
+        if not (query or json_path or line_range):
+            return {"error": "Provide one of query, json_path or line_range"}
+        if not filename and not query:
+            return {"error": "filename is required for json_path and line_range"}
+        try:
+            if query:
+                return self.search(query, filename or None, top_k, max_chars)
+            if json_path:
+                return self.select(filename, json_path, max_chars)
+            assert line_range is not None
+            return self.read_lines(filename, line_range, max_chars)
+        except FileNotFoundError as e:
+            return {"error": str(e)}
+        except (KeyError, ValueError, json.JSONDecodeError) as e:
+            return {"error": str(e).strip("'\"")}
+
+    def search(
+        self, query: str, filename: str | None = None, top_k: int = 5, max_chars: int = 3000
+    ) -> dict[str, Any]:
+        """BM25 search over line windows, optionally within one file."""
+        if filename:
+            self._ensure_indexed(filename)
+        else:
+            self._index_directory()
+
+        terms = list(dict.fromkeys(_tokenize(query)))
+        with self._lock:
+            n_chunks = len(self._chunks)
+            avg_len = self._total_length / n_chunks if n_chunks else 0.0
+            scores: dict[int, float] = {}
+            for term in terms:
+                posting = self._postings.get(term, set())
+                if not posting:
+                    continue
+                idf = math.log(1 + (n_chunks - len(posting) + 0.5) / (len(posting) + 0.5))
+                for chunk_id in posting:
+                    chunk = self._chunks[chunk_id]
+                    if filename and chunk.filename != filename:
+                        continue
+                    tf = chunk.terms[term]
+                    norm = tf + _K1 * (1 - _B + _B * chunk.length / avg_len)
+                    scores[chunk_id] = scores.get(chunk_id, 0.0) + idf * tf * (_K1 + 1) / norm
+            ranked = sorted(scores.items(), key=lambda item: -item[1])[: max(1, top_k)]
+            hits = [(self._chunks[cid], score) for cid, score in ranked]
+
+        per_hit = max(200, max_chars // max(1, len(hits)))
+        results = []
+        for chunk, score in hits:
+            text = self._read_line_span(chunk.filename, chunk.start_line, chunk.end_line)
+            results.append(
+                {
+                    "filename": chunk.filename,
+                    "lines": f"{chunk.start_line}-{chunk.end_line}",
+                    "score": round(score, 3),
+                    "text": text if len(text) <= per_hit else text[:per_hit] + "…",
+                }
+            )
+        return {"query": query, "matches": len(scores), "results": results}
+
+    def select(self, filename: str, json_path: str, max_chars: int = 3000) -> dict[str, Any]:
+        """Evaluate *json_path* against a spilled JSON (or JSONL) file."""
+        meta = self._ensure_indexed(filename)
+        mapped = _mapped_file(self.directory / filename) if meta.format == "json" else None
+        if mapped is not None:
+            # Shares load_data's JSON index: only the selected values are parsed
+            value = mapped.select(json_path)
+            return self._render_selection(filename, json_path, value, max_chars)
+        text = (self.directory / filename).read_text(encoding="utf-8")
+        if meta.format == "jsonl":
+            doc: Any = [json.loads(line) for line in text.splitlines() if line.strip()]
+        elif meta.format == "json":
+            doc = json.loads(text)
+        else:
+            raise ValueError(f"{filename} is not JSON; use query or line_range")
+        value = select_json_path(doc, json_path)
+        return self._render_selection(filename, json_path, value, max_chars)
+
+    @staticmethod
+    def _render_selection(
+        filename: str, json_path: str, value: Any, max_chars: int
+    ) -> dict[str, Any]:
+        rendered = json.dumps(value, indent=2, ensure_ascii=False)
+        result: dict[str, Any] = {"filename": filename, "json_path": json_path}
+        if isinstance(value, list):
+            result["count"] = len(value)
+        if len(rendered) > max_chars:
+            result["truncated"] = True
+            rendered = rendered[:max_chars] + "…"
+        result["value"] = rendered
+        return result
+
+    def read_lines(
+        self, filename: str, line_range: str | list[int], max_chars: int = 3000
+    ) -> dict[str, Any]:
+        """Return lines *start*..*end* (1-based, inclusive), capped at *max_chars*."""
+        meta = self._ensure_indexed(filename)
+        start, end = parse_line_range(line_range)
+        if start > meta.line_count:
+            raise ValueError(f"{filename} has only {meta.line_count} lines")
+        end = min(end, meta.line_count)
+        text = self._read_line_span(filename, start, end)
+        last = end
+        if len(text) > max_chars:
+            # Keep whole lines; a single oversized line is cut mid-line.
+            kept: list[str] = []
+            size = 0
+            for line in text.split("\n"):
+                if kept and size + len(line) + 1 > max_chars:
+                    break
+                kept.append(line)
+                size += len(line) + 1
+            last = start + len(kept) - 1
+            text = "\n".join(kept)
+            if len(text) > max_chars:
+                text = text[:max_chars] + "…"
+        return {
+            "filename": filename,
+            "lines": f"{start}-{last}",
+            "total_lines": meta.line_count,
+            "has_more": last < meta.line_count,
+            "content": text,
+        }
+
+    def _read_line_span(self, filename: str, start: int, end: int) -> str:
+        mapped = _mapped_file(self.directory / filename)
+        if mapped is not None:
+            begin, stop = mapped.line_span(start - 1, end - start + 1)
+            return mapped.read(begin, stop).decode("utf-8", errors="replace").rstrip("\n")
+        with self._lock:
+            meta = self._files[filename]
+        offsets = meta.line_offsets
+        begin = offsets[start - 1]
+        stop = offsets[end] if end < len(offsets) else None
+        with open(self.directory / filename, "rb") as f:
+            f.seek(begin)
+            raw = f.read() if stop is None else f.read(stop - begin)
+        return raw.decode("utf-8", errors="replace").rstrip("\n")
+
+    def describe(self, filename: str) -> SpilledFile | None:
+        with self._lock:
+            return self._files.get(filename)
+
+
+_stores: OrderedDict[str, SpilloverStore] = OrderedDict()
+_stores_lock = threading.Lock()
+
+
+def get_spillover_store(directory: str | Path) -> SpilloverStore:
+    """Return the shared store for *directory*, one index per session.
+
+    Only the ``MAX_STORES`` most recently used stores are kept in memory; an
+    evicted session's store is rebuilt from its sidecars on next use.
+    """
+    key = str(Path(directory).resolve())
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = _stores[key] = SpilloverStore(directory)
+            while len(_stores) > MAX_STORES:
+                _stores.popitem(last=False)
+        _stores.move_to_end(key)
+        return store
@@ -2,16 +2,217 @@
 
 Validates node outputs against schemas and expected keys to prevent
 garbage from propagating through the graph.
+
+``NodeValidator`` is the compiled form used on the hot path: everything
+that depends only on the NodeSpec (key sets, input types, the Pydantic
+TypeAdapter) is derived once at graph load instead of on every call.
 """
 
+import json
 import logging
+from collections.abc import Iterable
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+try:
+    import ahocorasick  # pyahocorasick, optional ("validation" extra)
+except ImportError:
+    ahocorasick = None
 
 logger = logging.getLogger(__name__)
 
+# Code indicators checked in node outputs.
+OUTPUT_CODE_INDICATORS: tuple[str, ...] = (
+    # Python
+    "def ",
+    "class ",
+    "import ",
+    "from ",
+    "if __name__",
+    "async def ",
+    "await ",
+    "try:",
+    "except:",
+    # JavaScript/TypeScript
+    "function ",
+    "const ",
+    "let ",
+    "=> {",
+    "require(",
+    "export ",
+    # SQL
+    "SELECT ",
+    "INSERT ",
+    "UPDATE ",
+    "DELETE ",
+    "DROP ",
+    # HTML/Script injection
+    "<script",
+    "<?php",
+    "<%",
+)
+
+# Code indicators checked on SharedMemory writes.
+MEMORY_CODE_INDICATORS: tuple[str, ...] = (
+    # Python
+    "```python",
+    "def ",
+    "class ",
+    "import ",
+    "async def ",
+    "from ",
+    # JavaScript/TypeScript
+    "function ",
+    "const ",
+    "let ",
+    "=> {",
+    "require(",
+    "export ",
+    # SQL
+    "SELECT ",
+    "INSERT ",
+    "UPDATE ",
+    "DELETE ",
+    "DROP ",
+    # HTML/Script injection
+    "<script",
+    "<?php",
+    "<%",
+)
+
+# Type names accepted in ``input_schema`` entries.
+TYPE_MAP: dict[str, type | tuple[type, ...]] = {
+    "string": str,
+    "str": str,
+    "int": int,
+    "integer": int,
+    "float": float,
+    "number": (int, float),
+    "bool": bool,
+    "boolean": bool,
+    "dict": dict,
+    "object": dict,
+    "list": list,
+    "array": list,
+    "any": object,  # Matches everything
+}
+
+# A JSON document can only start with one of these (after whitespace).
+_JSON_WHITESPACE = " \t\n\r"
+_JSON_VALUE_STARTS = frozenset('{["-0123456789tfn')
+
+
+class CodeIndicatorMatcher:
+    """
+    Finds any of a fixed set of code indicators in a string.
+
+    Build once per indicator set.  With pyahocorasick installed all
+    indicators are matched in a single pass over the text; otherwise each
+    indicator is a C-level substring scan, which in CPython is faster than
+    one ``re`` alternation over the same literals.
+
+    Strings shorter than ``full_scan_limit`` are checked in full.  Longer
+    strings are sampled at five windows (start, 25%, 50%, 75%, end).
+    """
+
+    def __init__(
+        self,
+        indicators: Iterable[str],
+        full_scan_limit: int = 10000,
+        window: int = 2000,
+    ):
+        self.indicators = tuple(indicators)
+        self.full_scan_limit = full_scan_limit
+        self.window = window
+        self._automaton = None
+        if ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for indicator in self.indicators:
+                automaton.add_word(indicator, indicator)
+            automaton.make_automaton()
+            self._automaton = automaton
+
+    def _match(self, text: str) -> bool:
+        if self._automaton is not None:
+            return next(self._automaton.iter(text), None) is not None
+        return any(indicator in text for indicator in self.indicators)
+
+    def search(self, value: str) -> bool:
+        """Return True if *value* appears to contain code."""
+        if len(value) < self.full_scan_limit:
+            return self._match(value)
+
+        size = len(value)
+        for pos in (0, size // 4, size // 2, 3 * size // 4, max(0, size - self.window)):
+            if self._match(value[pos : pos + self.window]):
+                return True
+        return False
+
+
+OUTPUT_CODE_MATCHER = CodeIndicatorMatcher(OUTPUT_CODE_INDICATORS)
+MEMORY_CODE_MATCHER = CodeIndicatorMatcher(MEMORY_CODE_INDICATORS)
+
+
+@lru_cache(maxsize=256)
+def _model_json_schema(model: type[BaseModel]) -> dict[str, Any]:
+    """JSON schema for *model*, generated once per class."""
+    return model.model_json_schema()
+
+
+def _format_pydantic_errors(error: ValidationError) -> list[str]:
+    errors = []
+    for item in error.errors():
+        field_path = ".".join(str(loc) for loc in item["loc"])
+        errors.append(f"{field_path}: {item['msg']} (type: {item['type']})")
+    return errors
+
+
+def type_matches(value: Any, expected_type: str) -> bool:
+    """Check a value against an ``input_schema`` type name (unknown names pass)."""
+    expected_class = TYPE_MAP.get(expected_type.lower())
+    if expected_class:
+        return isinstance(value, expected_class)
+    return True
+
+
+def check_json_trap(key: str, value: str, errors: list[str], warnings: list[str]) -> None:
+    """
+    Detect the JSON parsing trap: a value that is itself a JSON object
+    containing the key it was stored under.
+
+    Only strings that start like a JSON document are parsed; a plain
+    string is known not to be JSON without calling ``json.loads``.
+    """
+    start = value.lstrip(_JSON_WHITESPACE)[:1]
+    parsed: Any = None
+    is_json = False
+    if start in _JSON_VALUE_STARTS and (start == "{" or len(value) > 500):
+        try:
+            parsed = json.loads(value)
+            is_json = True
+        except json.JSONDecodeError:
+            pass
+
+    if is_json:
+        if isinstance(parsed, dict):
+            if key in parsed:
+                # Key exists in parsed JSON - classic parsing failure!
+                errors.append(
+                    f"Key '{key}' contains JSON string with nested '{key}' field - "
+                    f"likely parsing failure from LLM node"
+                )
+            elif len(value) > 100:
+                # Large JSON string, but doesn't contain the key
+                warnings.append(f"Key '{key}' contains JSON string ({len(value)} chars)")
+    elif len(value) > 500:
+        # Not JSON, check if suspiciously large
+        warnings.append(
+            f"Key '{key}' contains large string ({len(value)} chars), possibly entire LLM response"
+        )
+
 
 @dataclass
 class ValidationResult:
@@ -47,55 +248,7 @@ def _contains_code_indicators(self, value: str) -> bool:
         Returns:
             True if code indicators are found, False otherwise
         """
-        code_indicators = [
-            # Python
-            "def ",
-            "class ",
-            "import ",
-            "from ",
-            "if __name__",
-            "async def ",
-            "await ",
-            "try:",
-            "except:",
-            # JavaScript/TypeScript
-            "function ",
-            "const ",
-            "let ",
-            "=> {",
-            "require(",
-            "export ",
-            # SQL
-            "SELECT ",
-            "INSERT ",
-            "UPDATE ",
-            "DELETE ",
-            "DROP ",
-            # HTML/Script injection
-            "<script",
-            "<?php",
-            "<%",
-        ]
-
-        # For strings under 10KB, check the entire content
-        if len(value) < 10000:
-            return any(indicator in value for indicator in code_indicators)
-
-        # For longer strings, sample at strategic positions
-        sample_positions = [
-            0,  # Start
-            len(value) // 4,  # 25%
-            len(value) // 2,  # 50%
-            3 * len(value) // 4,  # 75%
-            max(0, len(value) - 2000),  # Near end
-        ]
-
-        for pos in sample_positions:
-            chunk = value[pos : pos + 2000]
-            if any(indicator in chunk for indicator in code_indicators):
-                return True
-
-        return False
+        return OUTPUT_CODE_MATCHER.search(value)
 
     def validate_output_keys(
         self,
@@ -158,13 +311,7 @@ def validate_with_pydantic(
             validated = model.model_validate(output)
             return ValidationResult(success=True, errors=[]), validated
         except ValidationError as e:
-            errors = []
-            for error in e.errors():
-                field_path = ".".join(str(loc) for loc in error["loc"])
-                msg = error["msg"]
-                error_type = error["type"]
-                errors.append(f"{field_path}: {msg} (type: {error_type})")
-            return ValidationResult(success=False, errors=errors), None
+            return ValidationResult(success=False, errors=_format_pydantic_errors(e)), None
 
     def format_validation_feedback(
         self,
@@ -182,7 +329,7 @@ def format_validation_feedback(
             Formatted feedback string to include in retry prompt
         """
         # Get the model's JSON schema for reference
-        schema = model.model_json_schema()
+        schema = _model_json_schema(model)
 
         feedback = "Your previous response had validation errors:\n\n"
         feedback += "ERRORS:\n"
@@ -312,3 +459,138 @@ def validate_all(
             all_errors.extend(result.errors)
 
         return ValidationResult(success=len(all_errors) == 0, errors=all_errors)
+
+
+class NodeValidator:
+    """
+    Precompiled validation for one NodeSpec.
+
+    Built by ``NodeSpec.compiled_validator()`` (and for every node by
+    ``GraphSpec.compile_validators()`` at graph load).  The executor uses
+    it to validate node outputs and the OutputCleaner to check edge inputs,
+    so per-call work is limited to looking at the values themselves.
+    """
+
+    def __init__(
+        self,
+        node_id: str,
+        output_keys: Iterable[str] = (),
+        nullable_keys: Iterable[str] = (),
+        input_keys: Iterable[str] = (),
+        input_schema: dict[str, Any] | None = None,
+        output_model: type[BaseModel] | None = None,
+        max_length: int = 50000,
+    ):
+        self.node_id = node_id
+        self.output_keys = tuple(output_keys)
+        self.nullable_keys = frozenset(nullable_keys)
+        self.input_keys = tuple(input_keys)
+        self.max_length = max_length
+        # key -> declared type name, for keys whose schema declares one
+        self.input_types: dict[str, str] = {}
+        for key, key_schema in (input_schema or {}).items():
+            if isinstance(key_schema, dict) and key_schema.get("type"):
+                self.input_types[key] = key_schema["type"]
+        self.output_model = output_model
+        self._adapter = TypeAdapter(output_model) if output_model is not None else None
+
+    @classmethod
+    def from_spec(cls, spec: Any) -> "NodeValidator":
+        """Compile the checks for a NodeSpec (or any object with its fields)."""
+        return cls(
+            node_id=getattr(spec, "id", ""),
+            output_keys=getattr(spec, "output_keys", None) or (),
+            nullable_keys=getattr(spec, "nullable_output_keys", None) or (),
+            input_keys=getattr(spec, "input_keys", None) or (),
+            input_schema=getattr(spec, "input_schema", None),
+            output_model=getattr(spec, "output_model", None),
+        )
+
+    def validate_outputs(
+        self,
+        output: dict[str, Any],
+        check_hallucination: bool = True,
+    ) -> ValidationResult:
+        """
+        Validate a node's own output: expected keys present and non-empty,
+        and (optionally) no hallucination patterns.
+
+        Equivalent to ``OutputValidator.validate_all`` with this node's
+        output keys and nullable keys.
+        """
+        if not isinstance(output, dict):
+            return ValidationResult(
+                success=False, errors=[f"Output is not a dict, got {type(output).__name__}"]
+            )
+
+        errors = []
+        nullable = self.nullable_keys
+        for key in self.output_keys:
+            if key not in output:
+                if key not in nullable:
+                    errors.append(f"Missing required output key: '{key}'")
+                continue
+            value = output[key]
+            if value is None:
+                if key not in nullable:
+                    errors.append(f"Output key '{key}' is None")
+            elif isinstance(value, str) and not value.strip():
+                if key not in nullable:
+                    errors.append(f"Output key '{key}' is empty string")
+
+        if check_hallucination:
+            for key, value in output.items():
+                if not isinstance(value, str):
+                    continue
+                if OUTPUT_CODE_MATCHER.search(value):
+                    logger.warning(f"Output key '{key}' may contain code - verify this is expected")
+                if len(value) > self.max_length:
+                    errors.append(
+                        f"Output key '{key}' exceeds max length ({len(value)} > {self.max_length})"
+                    )
+
+        return ValidationResult(success=len(errors) == 0, errors=errors)
+
+    def check_inputs(self, output: dict[str, Any]) -> tuple[list[str], list[str]]:
+        """
+        Check that *output* satisfies this node's inputs.
+
+        Returns:
+            (errors, warnings): missing keys, the JSON parsing trap and
+            ``input_schema`` type mismatches are errors; suspiciously large
+            or JSON-encoded strings are warnings.
+        """
+        errors: list[str] = []
+        warnings: list[str] = []
+        for key in self.input_keys:
+            if key in self.nullable_keys:
+                continue
+            if key not in output:
+                errors.append(f"Missing required key: '{key}'")
+                continue
+
+            value = output[key]
+            if isinstance(value, str):
+                check_json_trap(key, value, errors, warnings)
+
+            expected_type = self.input_types.get(key)
+            if expected_type and not type_matches(value, expected_type):
+                errors.append(
+                    f"Key '{key}': expected type '{expected_type}', got '{type(value).__name__}'"
+                )
+        return errors, warnings
+
+    def validate_model(self, output: Any) -> tuple[ValidationResult, BaseModel | None]:
+        """Validate *output* against ``output_model`` with the cached TypeAdapter."""
+        if self._adapter is None:
+            return ValidationResult(success=True, errors=[]), None
+        try:
+            return ValidationResult(success=True, errors=[]), self._adapter.validate_python(output)
+        except ValidationError as e:
+            return ValidationResult(success=False, errors=_format_pydantic_errors(e)), None
+
+    def format_feedback(self, validation_result: ValidationResult) -> str:
+        """Retry feedback for a failed ``validate_model`` result."""
+        if self.output_model is None:
+            return validation_result.error
+        return OutputValidator().format_validation_feedback(validation_result, self.output_model)
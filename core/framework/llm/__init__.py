@@ -1,6 +1,10 @@
 """LLM provider abstraction."""
 
+from framework.llm.cache import CacheStats, CachingLLMProvider, LLMResponseCache
+from framework.llm.http_pool import HTTPPoolConfig, LLMHttpPool
 from framework.llm.provider import LLMProvider, LLMResponse
+from framework.llm.rate_limiter import LLMPriority, LLMRateLimiter, RateLimitConfig, llm_priority
+from framework.llm.router import RouterBackend, RoutingConfig, RoutingLLMProvider
 from framework.llm.stream_events import (
     FinishEvent,
     ReasoningDeltaEvent,
@@ -16,6 +20,18 @@
 __all__ = [
     "LLMProvider",
     "LLMResponse",
+    "CachingLLMProvider",
+    "LLMResponseCache",
+    "CacheStats",
+    "HTTPPoolConfig",
+    "LLMHttpPool",
+    "LLMRateLimiter",
+    "RateLimitConfig",
+    "LLMPriority",
+    "llm_priority",
+    "RoutingLLMProvider",
+    "RouterBackend",
+    "RoutingConfig",
     "StreamEvent",
     "TextDeltaEvent",
     "TextEndEvent",
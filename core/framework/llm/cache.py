@@ -0,0 +1,556 @@
+"""Content-addressed response cache for deterministic LLM calls.
+
+Judges, edge routing, output cleaning and context handoff summaries issue
+small, highly repetitive ``complete``/``acomplete`` calls whose inputs recur
+across executions.  ``CachingLLMProvider`` wraps any ``LLMProvider`` and
+serves identical requests from an in-memory LRU backed by an optional
+on-disk store with TTL and size eviction.
+
+Only ``complete``/``acomplete`` are cached.  ``stream`` and the tool-use
+loops pass straight through: they drive conversations with side effects
+and are not safe to replay.
+
+Usage:
+    cache = LLMResponseCache(cache_dir=Path("~/.hive/llm_cache").expanduser())
+    llm = CachingLLMProvider(LiteLLMProvider(model="gpt-4o-mini"), cache=cache)
+    await llm.acomplete(messages=[...])   # miss -> provider
+    await llm.acomplete(messages=[...])   # hit  -> no provider call
+    print(cache.stats.to_dict())
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from framework.llm.provider import LLMProvider, LLMResponse, Tool, ToolResult, ToolUse
+from framework.llm.stream_events import StreamEvent
+from framework.utils.io import atomic_write
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path.home() / ".hive" / "llm_cache"
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+DEFAULT_MAX_DISK_BYTES = 256 * 1024 * 1024
+
+# Bump when the key derivation or the on-disk record layout changes so stale
+# entries from older versions are never served.
+_CACHE_FORMAT_VERSION = 1
+
+
+def make_cache_key(
+    model: str,
+    messages: list[dict[str, Any]],
+    system: str = "",
+    tools: list[Tool] | None = None,
+    max_tokens: int = 1024,
+    response_format: dict[str, Any] | None = None,
+    json_mode: bool = False,
+    extra: dict[str, Any] | None = None,
+) -> str:
+    """Derive a stable content address for a completion request.
+
+    The key covers everything that can change the provider's answer:
+    model, system prompt, messages, tool schemas and generation params.
+    ``extra`` lets wrappers mix in provider-level settings (e.g.
+    temperature) that are not part of the ``complete`` signature.
+    """
+    payload = {
+        "v": _CACHE_FORMAT_VERSION,
+        "model": model,
+        "system": system,
+        "messages": messages,
+        "tools": [
+            {"name": t.name, "description": t.description, "parameters": t.parameters}
+            for t in tools or []
+        ],
+        "max_tokens": max_tokens,
+        "response_format": response_format,
+        "json_mode": json_mode,
+        "extra": extra or {},
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters for an ``LLMResponseCache``."""
+
+    hits: int = 0
+    misses: int = 0
+    disk_hits: int = 0
+    coalesced: int = 0
+    writes: int = 0
+    evictions: int = 0
+    expired: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        data = asdict(self)
+        data["hit_rate"] = round(self.hit_rate, 4)
+        return data
+
+
+class LLMResponseCache:
+    """Two-level (memory LRU + disk) store of ``LLMResponse`` records.
+
+    Thread-safe: the sync ``complete`` path may run in executor threads
+    while async callers share the same instance on the event loop.
+
+    Args:
+        cache_dir: Directory for the persistent store. ``None`` keeps the
+            cache purely in memory.
+        max_entries: Capacity of the in-memory LRU.
+        ttl_seconds: Entries older than this are treated as misses and
+            removed. ``None`` disables expiry.
+        max_disk_bytes: When the on-disk store grows past this size the
+            least recently written entries are deleted.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path | None = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl_seconds: float | None = DEFAULT_TTL_SECONDS,
+        max_disk_bytes: int = DEFAULT_MAX_DISK_BYTES,
+    ):
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.max_disk_bytes = max_disk_bytes
+        self.stats = CacheStats()
+
+        self._memory: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk_bytes: int | None = None  # lazily computed on first write
+
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def get(self, key: str) -> LLMResponse | None:
+        """Return the cached response for ``key`` or None, updating stats."""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                stored_at, record = entry
+                if self._is_expired(stored_at, now):
+                    del self._memory[key]
+                    self.stats.expired += 1
+                else:
+                    self._memory.move_to_end(key)
+                    self.stats.hits += 1
+                    return _response_from_record(record)
+
+        disk_entry = self._read_disk(key, now)
+        with self._lock:
+            if disk_entry is None:
+                self.stats.misses += 1
+                return None
+            stored_at, record = disk_entry
+            self._remember(key, stored_at, record)
+            self.stats.hits += 1
+            self.stats.disk_hits += 1
+        return _response_from_record(record)
+
+    def put(self, key: str, response: LLMResponse) -> None:
+        """Store ``response`` under ``key`` in memory and (if enabled) on disk."""
+        record = _record_from_response(response)
+        stored_at = time.time()
+        with self._lock:
+            self._remember(key, stored_at, record)
+            self.stats.writes += 1
+        self._write_disk(key, stored_at, record)
+
+    def clear(self) -> None:
+        """Drop every entry from memory and disk. Stats are kept."""
+        with self._lock:
+            self._memory.clear()
+            self._disk_bytes = 0
+        if self.cache_dir is not None:
+            for path in self.cache_dir.glob("*/*.json"):
+                path.unlink(missing_ok=True)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._memory)
+
+    def record_coalesced(self) -> None:
+        """Count a request that waited for an identical in-flight one."""
+        with self._lock:
+            self.stats.coalesced += 1
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _is_expired(self, stored_at: float, now: float) -> bool:
+        return self.ttl_seconds is not None and now - stored_at > self.ttl_seconds
+
+    def _remember(self, key: str, stored_at: float, record: dict[str, Any]) -> None:
+        """Insert into the LRU. Caller must hold ``self._lock``."""
+        self._memory[key] = (stored_at, record)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self.stats.evictions += 1
+
+    def _path_for(self, key: str) -> Path:
+        assert self.cache_dir is not None
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def _read_disk(self, key: str, now: float) -> tuple[float, dict[str, Any]] | None:
+        if self.cache_dir is None:
+            return None
+        path = self._path_for(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            stored_at = float(data["stored_at"])
+            record = data["response"]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError):
+            logger.debug("Discarding unreadable LLM cache entry %s", path)
+            path.unlink(missing_ok=True)
+            return None
+        if self._is_expired(stored_at, now):
+            path.unlink(missing_ok=True)
+            with self._lock:
+                self.stats.expired += 1
+            return None
+        return stored_at, record
+
+    def _write_disk(self, key: str, stored_at: float, record: dict[str, Any]) -> None:
+        if self.cache_dir is None:
+            return
+        path = self._path_for(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with atomic_write(path) as f:
+                json.dump({"stored_at": stored_at, "response": record}, f)
+            size = path.stat().st_size
+        except OSError as e:
+            logger.warning("Failed to write LLM cache entry %s: %s", path, e)
+            return
+
+        with self._lock:
+            if self._disk_bytes is None:
+                self._disk_bytes = self._scan_disk_bytes()
+            else:
+                self._disk_bytes += size
+            over_budget = self._disk_bytes > self.max_disk_bytes
+        if over_budget:
+            self._evict_disk()
+
+    def _scan_disk_bytes(self) -> int:
+        assert self.cache_dir is not None
+        total = 0
+        for path in self.cache_dir.glob("*/*.json"):
+            try:
+                total += path.stat().st_size
+            except OSError:
+                continue
+        return total
+
+    def _evict_disk(self) -> None:
+        """Delete oldest entries until the store is back under 90% of budget."""
+        assert self.cache_dir is not None
+        entries: list[tuple[float, int, Path]] = []
+        for path in self.cache_dir.glob("*/*.json"):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+        entries.sort()
+
+        total = sum(size for _, size, _ in entries)
+        target = int(self.max_disk_bytes * 0.9)
+        evicted = 0
+        for _, size, path in entries:
+            if total <= target:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            evicted += 1
+
+        with self._lock:
+            self._disk_bytes = total
+            self.stats.evictions += evicted
+
+
+def build_response_cache(config: dict[str, Any]) -> LLMResponseCache:
+    """Build a cache from the ``llm.cache`` configuration section.
+
+    Recognised keys: ``dir`` (``false`` for memory-only), ``max_entries``,
+    ``ttl_seconds`` and ``max_disk_bytes``.
+    """
+    cache_dir = config.get("dir", str(DEFAULT_CACHE_DIR))
+    return LLMResponseCache(
+        cache_dir=Path(cache_dir).expanduser() if cache_dir else None,
+        max_entries=int(config.get("max_entries", DEFAULT_MAX_ENTRIES)),
+        ttl_seconds=config.get("ttl_seconds", DEFAULT_TTL_SECONDS),
+        max_disk_bytes=int(config.get("max_disk_bytes", DEFAULT_MAX_DISK_BYTES)),
+    )
+
+
+def _record_from_response(response: LLMResponse) -> dict[str, Any]:
+    # raw_response is provider-specific and not serialisable; drop it.
+    return {
+        "content": response.content,
+        "model": response.model,
+        "input_tokens": response.input_tokens,
+        "output_tokens": response.output_tokens,
+        "stop_reason": response.stop_reason,
+    }
+
+
+def _response_from_record(record: dict[str, Any]) -> LLMResponse:
+    return LLMResponse(
+        content=record.get("content", ""),
+        model=record.get("model", ""),
+        input_tokens=record.get("input_tokens", 0),
+        output_tokens=record.get("output_tokens", 0),
+        stop_reason=record.get("stop_reason", ""),
+    )
+
+
+class CachingLLMProvider(LLMProvider):
+    """
+    ``LLMProvider`` wrapper that serves repeated completions from a cache.
+
+    Concurrent identical requests are coalesced (single-flight): the first
+    caller hits the wrapped provider and everyone else awaits its result.
+    Empty responses are never cached, so transient provider failures are
+    not pinned.
+
+    Works with any provider, including ``MockLLMProvider`` in tests.
+    """
+
+    def __init__(
+        self,
+        provider: LLMProvider,
+        cache: LLMResponseCache | None = None,
+    ):
+        """
+        Args:
+            provider: The provider to wrap.
+            cache: Shared cache instance. Defaults to a memory-only cache.
+        """
+        self.provider = provider
+        self.cache = cache if cache is not None else LLMResponseCache()
+        self._async_inflight: dict[str, asyncio.Future[LLMResponse]] = {}
+        self._sync_inflight: dict[str, threading.Event] = {}
+        self._sync_lock = threading.Lock()
+
+    @property
+    def model(self) -> str:
+        return getattr(self.provider, "model", "")
+
+    @property
+    def stats(self) -> CacheStats:
+        return self.cache.stats
+
+    def _key(
+        self,
+        messages: list[dict[str, Any]],
+        system: str,
+        tools: list[Tool] | None,
+        max_tokens: int,
+        response_format: dict[str, Any] | None,
+        json_mode: bool,
+    ) -> str:
+        extra = getattr(self.provider, "extra_kwargs", None) or {}
+        # Headers may carry credentials; they never change the answer.
+        extra = {k: v for k, v in extra.items() if k != "extra_headers"}
+        return make_cache_key(
+            model=self.model,
+            messages=messages,
+            system=system,
+            tools=tools,
+            max_tokens=max_tokens,
+            response_format=response_format,
+            json_mode=json_mode,
+            extra={"provider": type(self.provider).__name__, **extra},
+        )
+
+    def _store(self, key: str, response: LLMResponse) -> None:
+        if response.content:
+            self.cache.put(key, response)
+
+    def complete(
+        self,
+        messages: list[dict[str, Any]],
+        system: str = "",
+        tools: list[Tool] | None = None,
+        max_tokens: int = 1024,
+        response_format: dict[str, Any] | None = None,
+        json_mode: bool = False,
+        max_retries: int | None = None,
+    ) -> LLMResponse:
+        """Cached ``complete``; identical concurrent calls share one request."""
+        key = self._key(messages, system, tools, max_tokens, response_format, json_mode)
+
+        while True:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+            with self._sync_lock:
+                event = self._sync_inflight.get(key)
+                if event is None:
+                    event = threading.Event()
+                    self._sync_inflight[key] = event
+                    leader = True
+                else:
+                    leader = False
+            if leader:
+                break
+            # Wait for the leader, then re-check the cache.  If the leader
+            # failed or got an uncacheable response we become the leader.
+            self.cache.record_coalesced()
+            event.wait()
+
+        try:
+            response = self.provider.complete(
+                messages=messages,
+                system=system,
+                tools=tools,
+                max_tokens=max_tokens,
+                response_format=response_format,
+                json_mode=json_mode,
+                max_retries=max_retries,
+            )
+            self._store(key, response)
+            return response
+        finally:
+            with self._sync_lock:
+                self._sync_inflight.pop(key, None)
+            event.set()
+
+    async def acomplete(
+        self,
+        messages: list[dict[str, Any]],
+        system: str = "",
+        tools: list[Tool] | None = None,
+        max_tokens: int = 1024,
+        response_format: dict[str, Any] | None = None,
+        json_mode: bool = False,
+        max_retries: int | None = None,
+    ) -> LLMResponse:
+        """Cached ``acomplete``; identical in-flight requests are coalesced."""
+        key = self._key(messages, system, tools, max_tokens, response_format, json_mode)
+        loop = asyncio.get_running_loop()
+        while True:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+            inflight = self._async_inflight.get(key)
+            if inflight is None or inflight.get_loop() is not loop:
+                break
+            self.cache.record_coalesced()
+            try:
+                # shield() so one waiter being cancelled doesn't cancel the leader.
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled() or asyncio.current_task().cancelling():
+                    raise  # this task was cancelled, not the leader
+                # The leader was cancelled; like the sync path, take over.
+
+        future: asyncio.Future[LLMResponse] = loop.create_future()
+        self._async_inflight[key] = future
+        try:
+            response = await self.provider.acomplete(
+                messages=messages,
+                system=system,
+                tools=tools,
+                max_tokens=max_tokens,
+                response_format=response_format,
+                json_mode=json_mode,
+                max_retries=max_retries,
+            )
+        except BaseException as e:
+            if not future.done():
+                if isinstance(e, asyncio.CancelledError):
+                    future.cancel()
+                else:
+                    future.set_exception(e)
+                    # Mark retrieved so un-awaited futures don't log warnings.
+                    future.exception()
+            raise
+        else:
+            self._store(key, response)
+            future.set_result(response)
+            return response
+        finally:
+            if self._async_inflight.get(key) is future:
+                del self._async_inflight[key]
+
+    def complete_with_tools(
+        self,
+        messages: list[dict[str, Any]],
+        system: str,
+        tools: list[Tool],
+        tool_executor: Callable[[ToolUse], ToolResult],
+        max_iterations: int = 10,
+    ) -> LLMResponse:
+        """Pass-through: tool loops have side effects and are never cached."""
+        return self.provider.complete_with_tools(
+            messages=messages,
+            system=system,
+            tools=tools,
+            tool_executor=tool_executor,
+            max_iterations=max_iterations,
+        )
+
+    async def acomplete_with_tools(
+        self,
+        messages: list[dict[str, Any]],
+        system: str,
+        tools: list[Tool],
+        tool_executor: Callable[[ToolUse], ToolResult],
+        max_iterations: int = 10,
+    ) -> LLMResponse:
+        """Pass-through: tool loops have side effects and are never cached."""
+        return await self.provider.acomplete_with_tools(
+            messages=messages,
+            system=system,
+            tools=tools,
+            tool_executor=tool_executor,
+            max_iterations=max_iterations,
+        )
+
+    async def stream(
+        self,
+        messages: list[dict[str, Any]],
+        system: str = "",
+        tools: list[Tool] | None = None,
+        max_tokens: int = 4096,
+    ) -> AsyncIterator[StreamEvent]:
+        """Pass-through: streamed conversation turns are never cached."""
+        async for event in self.provider.stream(
+            messages=messages,
+            system=system,
+            tools=tools,
+            max_tokens=max_tokens,
+        ):
+            yield event
@@ -0,0 +1,363 @@
+"""Pooled async HTTP session for LLM providers.
+
+By default every ``litellm.acompletion`` call resolves its own HTTP client
+from litellm's internal cache, with litellm's default limits and no way to
+tune keep-alive, HTTP/2 or per-host concurrency.  ``LLMHttpPool`` owns a
+single configured ``httpx.AsyncClient`` per event loop that every request
+issued by a provider (and by any other provider sharing the pool) reuses,
+so bursts of concurrent streams inside one ``AgentRuntime`` ride warm
+connections instead of paying a fresh TLS handshake each time.
+
+Usage:
+    pool = LLMHttpPool(HTTPPoolConfig(max_connections_per_host=50))
+    llm = LiteLLMProvider(model="gpt-4o-mini", http_pool=pool)
+    ...
+    await pool.aclose()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class HTTPPoolConfig:
+    """Connection-pool settings for ``LLMHttpPool``.
+
+    Attributes:
+        max_connections: Total open connections across all hosts.
+        max_connections_per_host: Concurrent requests allowed per host;
+            further requests queue until a slot frees up.
+        max_keepalive_connections: Idle connections kept warm for reuse.
+        keepalive_expiry: Seconds an idle connection is kept open.
+        http2: Use httpx's native transport and negotiate HTTP/2 (needs
+            ``h2``).  Off by default: the aiohttp-backed HTTP/1.1 transport
+            has lower per-request overhead, while HTTP/2 multiplexes many
+            streams over a few connections to providers that support it.
+        connect_timeout: Seconds to establish a connection.
+        read_timeout: Seconds to wait between received bytes. Long, since
+            reasoning models can pause for minutes before the first token.
+        write_timeout: Seconds to send the request body.
+        pool_timeout: Seconds to wait for a free pooled connection.
+    """
+
+    max_connections: int = 200
+    max_connections_per_host: int = 100
+    max_keepalive_connections: int = 100
+    keepalive_expiry: float = 60.0
+    http2: bool = False
+    connect_timeout: float = 10.0
+    read_timeout: float = 600.0
+    write_timeout: float = 60.0
+    pool_timeout: float = 60.0
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> HTTPPoolConfig:
+        """Build from a config mapping, ignoring unknown keys."""
+        known = {k: v for k, v in data.items() if k in cls.__dataclass_fields__}
+        return cls(**known)
+
+
+def _h2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class _PerHostLimitTransport(httpx.AsyncBaseTransport):
+    """Caps concurrent in-flight requests per host.
+
+    httpx only limits connections globally.  Without a per-host cap one slow
+    provider can monopolise the pool and starve requests to other hosts.
+    The slot is held until the response body is closed, so long-lived
+    streams count against the limit for their full duration.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, max_per_host: int):
+        self._transport = transport
+        self._max_per_host = max_per_host
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+
+    def _semaphore(self, host: str) -> asyncio.Semaphore:
+        sem = self._semaphores.get(host)
+        if sem is None:
+            sem = asyncio.Semaphore(self._max_per_host)
+            self._semaphores[host] = sem
+        return sem
+
+    def in_flight(self) -> dict[str, int]:
+        """Requests currently holding a slot, keyed by host."""
+        return {
+            host: self._max_per_host - sem._value  # noqa: SLF001
+            for host, sem in self._semaphores.items()
+            if sem._value < self._max_per_host  # noqa: SLF001
+        }
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        sem = self._semaphore(request.url.netloc.decode("ascii"))
+        await sem.acquire()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            sem.release()
+            raise
+        response.stream = _ReleasingStream(response.stream, sem)
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+# Leftover bytes we are willing to read on close so an HTTP/1.1 connection
+# can go back to the pool.  SDKs stop reading at the SSE ``[DONE]`` marker
+# and close, which otherwise discards the connection because the chunked
+# terminator was never consumed.  Larger remainders are not worth waiting for.
+_DRAIN_MAX_BYTES = 64 * 1024
+_DRAIN_TIMEOUT = 0.5
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    """Response stream that drains on close and releases its per-host slot once."""
+
+    def __init__(self, stream: Any, semaphore: asyncio.Semaphore):
+        self._stream = stream
+        self._semaphore = semaphore
+        self._iterator: AsyncIterator[bytes] | None = None
+        self._exhausted = False
+        self._released = False
+
+    async def _iterate(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+        self._exhausted = True
+
+    def __aiter__(self) -> AsyncIterator[bytes]:
+        if self._iterator is None:
+            self._iterator = self._iterate()
+        return self._iterator
+
+    async def _drain(self) -> None:
+        drained = 0
+        try:
+            async with asyncio.timeout(_DRAIN_TIMEOUT):
+                async for chunk in self.__aiter__():
+                    drained += len(chunk)
+                    if drained > _DRAIN_MAX_BYTES:
+                        return
+        except (TimeoutError, httpx.HTTPError, OSError):
+            return
+
+    async def aclose(self) -> None:
+        try:
+            if not self._exhausted:
+                await self._drain()
+            if hasattr(self._stream, "aclose"):
+                await self._stream.aclose()
+        finally:
+            if not self._released:
+                self._released = True
+                self._semaphore.release()
+
+
+class LLMHttpPool:
+    """Shared, lazily created ``httpx.AsyncClient`` for LLM traffic.
+
+    httpx connection pools are bound to the event loop that opened them, so
+    the pool keeps one client per running loop.  In the normal case (one
+    ``AgentRuntime`` on one loop) that is exactly one client for every node
+    and stream.
+    """
+
+    def __init__(self, config: HTTPPoolConfig | None = None):
+        self.config = config or HTTPPoolConfig()
+        self._clients: dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+        self._transports: dict[asyncio.AbstractEventLoop, _PerHostLimitTransport] = {}
+        self._litellm_clients: dict[tuple[Any, ...], Any] = {}
+        self.requests_started = 0
+
+    def client(self) -> httpx.AsyncClient:
+        """Return the pooled client for the running event loop."""
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is not None and not client.is_closed:
+            return client
+
+        # Drop clients whose loops have gone away.
+        for stale in [lp for lp in self._clients if lp.is_closed()]:
+            self._clients.pop(stale, None)
+            self._transports.pop(stale, None)
+            for key in [k for k in self._litellm_clients if k[0] is stale]:
+                del self._litellm_clients[key]
+
+        client = self._build_client()
+        self._clients[loop] = client
+        return client
+
+    def _build_client(self) -> httpx.AsyncClient:
+        """Build the per-loop client.
+
+        HTTP/1.1 traffic goes through an aiohttp session (the transport
+        litellm uses by default, and measurably cheaper per request than
+        httpcore).  HTTP/2 needs httpx's native transport with ``h2``.
+        """
+        cfg = self.config
+        http2 = cfg.http2 and _h2_available()
+        if cfg.http2 and not http2:
+            logger.debug("h2 not installed; LLM HTTP pool falling back to HTTP/1.1")
+
+        transport: httpx.AsyncBaseTransport | None = None
+        if not http2:
+            transport = self._aiohttp_transport()
+        if transport is None:
+            limits = httpx.Limits(
+                max_connections=cfg.max_connections,
+                max_keepalive_connections=cfg.max_keepalive_connections,
+                keepalive_expiry=cfg.keepalive_expiry,
+            )
+            transport = _PerHostLimitTransport(
+                httpx.AsyncHTTPTransport(http2=http2, limits=limits),
+                max_per_host=cfg.max_connections_per_host,
+            )
+            self._transports[asyncio.get_running_loop()] = transport
+
+        return httpx.AsyncClient(
+            transport=transport,
+            timeout=httpx.Timeout(
+                connect=cfg.connect_timeout,
+                read=cfg.read_timeout,
+                write=cfg.write_timeout,
+                pool=cfg.pool_timeout,
+            ),
+            event_hooks={"request": [self._on_request]},
+        )
+
+    def _aiohttp_transport(self) -> httpx.AsyncBaseTransport | None:
+        try:
+            import aiohttp
+            from litellm.llms.custom_httpx.aiohttp_transport import LiteLLMAiohttpTransport
+        except ImportError:
+            return None
+
+        cfg = self.config
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=cfg.max_connections,
+                limit_per_host=cfg.max_connections_per_host,
+                keepalive_timeout=cfg.keepalive_expiry,
+            ),
+            timeout=aiohttp.ClientTimeout(
+                sock_connect=cfg.connect_timeout,
+                sock_read=cfg.read_timeout,
+            ),
+        )
+        # Closing the httpx client closes the transport, which closes the session.
+        return LiteLLMAiohttpTransport(client=session)
+
+    async def _on_request(self, request: httpx.Request) -> None:
+        self.requests_started += 1
+
+    def in_flight(self) -> dict[str, int]:
+        """Per-host in-flight request counts (httpx-native transports only)."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return {}
+        transport = self._transports.get(loop)
+        return transport.in_flight() if transport else {}
+
+    def litellm_client(
+        self,
+        model: str,
+        api_key: str | None = None,
+        api_base: str | None = None,
+    ) -> Any | None:
+        """Return a litellm ``client=`` argument backed by this pool.
+
+        Returns None for providers whose litellm code path cannot take an
+        injected client; those keep litellm's default client handling.
+        """
+        loop = asyncio.get_running_loop()
+        key = (loop, model, api_key, api_base)
+        if key in self._litellm_clients:
+            return self._litellm_clients[key]
+        client = _build_litellm_client(self, model, api_key, api_base)
+        self._litellm_clients[key] = client
+        return client
+
+    async def aclose(self) -> None:
+        """Close the client owned by the running loop."""
+        loop = asyncio.get_running_loop()
+        client = self._clients.pop(loop, None)
+        self._transports.pop(loop, None)
+        for key in [k for k in self._litellm_clients if k[0] is loop]:
+            del self._litellm_clients[key]
+        if client is not None:
+            await client.aclose()
+
+
+# ---------------------------------------------------------------------------
+# litellm integration
+# ---------------------------------------------------------------------------
+
+# Providers that litellm routes through the OpenAI SDK.  They accept a
+# pre-built ``AsyncOpenAI`` client via ``client=``.
+_OPENAI_SDK_PROVIDERS = frozenset({"openai", "custom_openai", "text-completion-openai"})
+
+# Providers that litellm routes through its own httpx handler.  They accept
+# an ``AsyncHTTPHandler`` via ``client=``.
+_HTTPX_HANDLER_PROVIDERS = frozenset({"anthropic"})
+
+
+def _build_litellm_client(
+    pool: LLMHttpPool,
+    model: str,
+    api_key: str | None,
+    api_base: str | None,
+) -> Any | None:
+    try:
+        import litellm
+
+        _, provider, dynamic_key, dynamic_base = litellm.get_llm_provider(
+            model=model, api_base=api_base
+        )
+    except Exception:
+        return None
+
+    if provider in _OPENAI_SDK_PROVIDERS:
+        try:
+            from openai import AsyncOpenAI
+        except ImportError:
+            return None
+
+        key = api_key or dynamic_key or os.environ.get("OPENAI_API_KEY")
+        if not key:
+            return None
+        # Retries stay in LiteLLMProvider so 429 handling is consistent.
+        return AsyncOpenAI(
+            api_key=key,
+            base_url=api_base or dynamic_base,
+            http_client=pool.client(),
+            max_retries=0,
+        )
+
+    if provider in _HTTPX_HANDLER_PROVIDERS:
+        try:
+            from litellm.llms.custom_httpx.http_handler import AsyncHTTPHandler
+        except ImportError:
+            return None
+        handler = AsyncHTTPHandler(timeout=pool.config.read_timeout)
+        handler.client = pool.client()
+        return handler
+
+    return None
@@ -8,10 +8,18 @@
 """
 
 import asyncio
+import inspect
 import json
 import logging
 import time
 from collections.abc import AsyncIterator, Callable
+from contextlib import (
+    AbstractAsyncContextManager,
+    AbstractContextManager,
+    AsyncExitStack,
+    ExitStack,
+    nullcontext,
+)
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -23,8 +31,16 @@
     litellm = None  # type: ignore[assignment]
     RateLimitError = Exception  # type: ignore[assignment, misc]
 
+from framework.llm.http_pool import LLMHttpPool
 from framework.llm.provider import LLMProvider, LLMResponse, Tool, ToolResult, ToolUse
+from framework.llm.rate_limiter import (
+    LLMRateLimiter,
+    RateLimitLease,
+    estimate_prompt_tokens,
+    get_default_rate_limiter,
+)
 from framework.llm.stream_events import StreamEvent
+from framework.utils.json_stream import IncrementalJSONScanner
 
 logger = logging.getLogger(__name__)
 
@@ -186,6 +202,58 @@ def _compute_retry_delay(
     return min(delay, max_delay)
 
 
+class _StreamedToolCall:
+    """A tool call being assembled from stream chunks.
+
+    Argument fragments go through an incremental scanner, so completion is
+    detected per chunk without re-parsing everything received so far.
+    """
+
+    def __init__(self) -> None:
+        self.id = ""
+        self.name = ""
+        self.args = IncrementalJSONScanner()
+
+    def complete_args(self) -> dict[str, Any] | None:
+        """Parsed arguments if the call is complete, else None.
+
+        A JSON object is complete once its closing brace has arrived, so no
+        further argument chunks can follow.
+        """
+        if not self.id or not self.name or not self.args.complete:
+            return None
+        try:
+            parsed = self.args.result()
+        except ValueError:
+            return None
+        return parsed if isinstance(parsed, dict) else None
+
+    def final_args(self) -> dict[str, Any]:
+        """Arguments at the end of the stream; ``{"_raw": ...}`` if unparseable."""
+        parsed = self.complete_args() if self.args.complete else None
+        if parsed is not None:
+            return parsed
+        raw = self.args.raw()
+        try:
+            return json.loads(raw)
+        except json.JSONDecodeError:
+            return {"_raw": raw}
+
+
+async def _aclose_stream(response: Any) -> None:
+    """Best-effort close of the transport stream behind a litellm stream wrapper."""
+    stream = getattr(response, "completion_stream", None)
+    close = getattr(stream, "close", None) or getattr(stream, "aclose", None)
+    if close is None:
+        return
+    try:
+        result = close()
+        if inspect.isawaitable(result):
+            await result
+    except Exception:
+        logger.debug("Failed to close completed LLM stream", exc_info=True)
+
+
 def _is_stream_transient_error(exc: BaseException) -> bool:
     """Classify whether a streaming exception is transient (recoverable).
 
@@ -250,6 +318,9 @@ class LiteLLMProvider(LLMProvider):
             model="gpt-4o-mini",
             api_base="https://my-proxy.com/v1"
         )
+
+        # Shared pooled HTTP session (keep-alive, HTTP/2, per-host limits)
+        provider = LiteLLMProvider(model="gpt-4o-mini", http_pool=LLMHttpPool())
     """
 
     def __init__(
@@ -257,6 +328,8 @@ def __init__(
         model: str = "gpt-4o-mini",
         api_key: str | None = None,
         api_base: str | None = None,
+        http_pool: LLMHttpPool | None = None,
+        rate_limiter: LLMRateLimiter | None = None,
         **kwargs: Any,
     ):
         """
@@ -269,11 +342,18 @@ def __init__(
                      look for the appropriate env var (OPENAI_API_KEY,
                      ANTHROPIC_API_KEY, etc.)
             api_base: Custom API base URL (for proxies or local deployments)
+            http_pool: Pooled async HTTP session reused by every async
+                request. Share one pool across providers to share sockets.
+                None keeps litellm's default client handling.
+            rate_limiter: Proactive limiter for all requests. None uses the
+                process-wide default (``set_default_rate_limiter``), if any.
             **kwargs: Additional arguments passed to litellm.completion()
         """
         self.model = model
         self.api_key = api_key
         self.api_base = api_base
+        self.http_pool = http_pool
+        self.rate_limiter = rate_limiter
         self.extra_kwargs = kwargs
 
         if litellm is None:
@@ -288,8 +368,14 @@ def _completion_with_rate_limit_retry(
         model = kwargs.get("model", self.model)
         retries = max_retries if max_retries is not None else RATE_LIMIT_MAX_RETRIES
         for attempt in range(retries + 1):
+            slot = ExitStack()
+            lease = slot.enter_context(self._rate_limit_slot_blocking(kwargs))
             try:
                 response = litellm.completion(**kwargs)  # type: ignore[union-attr]
+                if lease is not None and response.usage:
+                    lease.record_usage(
+                        response.usage.prompt_tokens, response.usage.completion_tokens
+                    )
 
                 # Some providers (e.g. Gemini) return 200 with empty content on
                 # rate limit / quota exhaustion instead of a proper 429.  Treat
@@ -345,21 +431,27 @@ def _completion_with_rate_limit_retry(
                         f"Retrying in {wait}s "
                         f"(attempt {attempt + 1}/{retries})"
                     )
+                    slot.close()
                     time.sleep(wait)
                     continue
 
                 return response
             except RateLimitError as e:
-                # Dump full request to file for debugging
-                messages = kwargs.get("messages", [])
-                token_count, token_method = _estimate_tokens(model, messages)
-                dump_path = _dump_failed_request(
-                    model=model,
-                    kwargs=kwargs,
-                    error_type="rate_limit",
-                    attempt=attempt,
-                )
+                wait = _compute_retry_delay(attempt, exception=e)
+                if lease is not None:
+                    lease.record_rate_limited(wait)
+                slot.close()
                 if attempt == retries:
+                    # Only dump on give-up: under load every call sees 429s
+                    # and per-attempt dumps just add disk I/O.
+                    messages = kwargs.get("messages", [])
+                    token_count, token_method = _estimate_tokens(model, messages)
+                    dump_path = _dump_failed_request(
+                        model=model,
+                        kwargs=kwargs,
+                        error_type="rate_limit",
+                        attempt=attempt,
+                    )
                     logger.error(
                         f"[retry] GAVE UP on {model} after {retries + 1} "
                         f"attempts — rate limit error: {e!s}. "
@@ -367,15 +459,18 @@ def _completion_with_rate_limit_retry(
                         f"Full request dumped to: {dump_path}"
                     )
                     raise
-                wait = _compute_retry_delay(attempt, exception=e)
                 logger.warning(
                     f"[retry] {model} rate limited (429): {e!s}. "
-                    f"~{token_count} tokens ({token_method}). "
-                    f"Full request dumped to: {dump_path}. "
                     f"Retrying in {wait}s "
                     f"(attempt {attempt + 1}/{retries})"
                 )
                 time.sleep(wait)
+            except BaseException:
+                if lease is not None:
+                    lease.record_failure()
+                raise
+            finally:
+                slot.close()
         # unreachable, but satisfies type checker
         raise RuntimeError("Exhausted rate limit retries")
 
@@ -586,9 +681,16 @@ async def _acompletion_with_rate_limit_retry(
         """
         model = kwargs.get("model", self.model)
         retries = max_retries if max_retries is not None else RATE_LIMIT_MAX_RETRIES
+        self._apply_http_pool(kwargs)
         for attempt in range(retries + 1):
+            slot = AsyncExitStack()
+            lease = await slot.enter_async_context(self._rate_limit_slot(kwargs))
             try:
                 response = await litellm.acompletion(**kwargs)  # type: ignore[union-attr]
+                if lease is not None and response.usage:
+                    lease.record_usage(
+                        response.usage.prompt_tokens, response.usage.completion_tokens
+                    )
 
                 content = response.choices[0].message.content if response.choices else None
                 has_tool_calls = bool(response.choices and response.choices[0].message.tool_calls)
@@ -638,20 +740,27 @@ async def _acompletion_with_rate_limit_retry(
                         f"Retrying in {wait}s "
                         f"(attempt {attempt + 1}/{retries})"
                     )
+                    await slot.aclose()
                     await asyncio.sleep(wait)
                     continue
 
                 return response
             except RateLimitError as e:
-                messages = kwargs.get("messages", [])
-                token_count, token_method = _estimate_tokens(model, messages)
-                dump_path = _dump_failed_request(
-                    model=model,
-                    kwargs=kwargs,
-                    error_type="rate_limit",
-                    attempt=attempt,
-                )
+                wait = _compute_retry_delay(attempt, exception=e)
+                if lease is not None:
+                    lease.record_rate_limited(wait)
+                await slot.aclose()
                 if attempt == retries:
+                    # Only dump on give-up: under load every stream sees 429s
+                    # and per-attempt dumps just add disk I/O.
+                    messages = kwargs.get("messages", [])
+                    token_count, token_method = _estimate_tokens(model, messages)
+                    dump_path = _dump_failed_request(
+                        model=model,
+                        kwargs=kwargs,
+                        error_type="rate_limit",
+                        attempt=attempt,
+                    )
                     logger.error(
                         f"[async-retry] GAVE UP on {model} after {retries + 1} "
                         f"attempts — rate limit error: {e!s}. "
@@ -659,15 +768,18 @@ async def _acompletion_with_rate_limit_retry(
                         f"Full request dumped to: {dump_path}"
                     )
                     raise
-                wait = _compute_retry_delay(attempt, exception=e)
                 logger.warning(
                     f"[async-retry] {model} rate limited (429): {e!s}. "
-                    f"~{token_count} tokens ({token_method}). "
-                    f"Full request dumped to: {dump_path}. "
                     f"Retrying in {wait}s "
                     f"(attempt {attempt + 1}/{retries})"
                 )
                 await asyncio.sleep(wait)
+            except BaseException:
+                if lease is not None:
+                    lease.record_failure()
+                raise
+            finally:
+                await slot.aclose()
         raise RuntimeError("Exhausted rate limit retries")
 
     async def acomplete(
@@ -834,6 +946,44 @@ async def acomplete_with_tools(
             raw_response=None,
         )
 
+    def _rate_limit_slot(
+        self, kwargs: dict[str, Any]
+    ) -> AbstractAsyncContextManager[RateLimitLease | None]:
+        """Admission through the proactive rate limiter, if one is configured."""
+        limiter = self.rate_limiter or get_default_rate_limiter()
+        if limiter is None:
+            return nullcontext()
+        return limiter.acquire(
+            model=kwargs.get("model", self.model),
+            input_tokens=estimate_prompt_tokens(kwargs.get("messages", [])),
+            max_output_tokens=kwargs.get("max_tokens"),
+        )
+
+    def _rate_limit_slot_blocking(
+        self, kwargs: dict[str, Any]
+    ) -> AbstractContextManager[RateLimitLease | None]:
+        """``_rate_limit_slot`` for the sync path; blocks the thread while queued."""
+        limiter = self.rate_limiter or get_default_rate_limiter()
+        if limiter is None:
+            return nullcontext()
+        return limiter.acquire_blocking(
+            model=kwargs.get("model", self.model),
+            input_tokens=estimate_prompt_tokens(kwargs.get("messages", [])),
+            max_output_tokens=kwargs.get("max_tokens"),
+        )
+
+    def _apply_http_pool(self, kwargs: dict[str, Any]) -> None:
+        """Route an async request through the shared HTTP pool, if configured."""
+        if self.http_pool is None or "client" in kwargs:
+            return
+        client = self.http_pool.litellm_client(
+            model=kwargs.get("model", self.model),
+            api_key=self.api_key,
+            api_base=self.api_base,
+        )
+        if client is not None:
+            kwargs["client"] = client
+
     def _tool_to_openai_format(self, tool: Tool) -> dict[str, Any]:
         """Convert Tool to OpenAI function calling format."""
         return {
@@ -859,8 +1009,11 @@ async def stream(
         """Stream a completion via litellm.acompletion(stream=True).
 
         Yields StreamEvent objects as chunks arrive from the provider.
-        Tool call arguments are accumulated across chunks and yielded as
-        a single ToolCallEvent with fully parsed JSON when complete.
+        Tool call arguments are accumulated across chunks; each call is
+        yielded as a ToolCallEvent as soon as its arguments parse as a
+        complete JSON object (in index order), so callers can start
+        independent tools while the rest of the response streams.  Calls
+        that never parse are yielded at the end with ``{"_raw": ...}``.
 
         Empty responses (e.g. Gemini stealth rate-limits that return 200
         with no content) are retried with exponential backoff, mirroring
@@ -893,6 +1046,7 @@ async def stream(
             kwargs["api_base"] = self.api_base
         if tools:
             kwargs["tools"] = [self._tool_to_openai_format(t) for t in tools]
+        self._apply_http_pool(kwargs)
 
         for attempt in range(RATE_LIMIT_MAX_RETRIES + 1):
             # Post-stream events (ToolCall, TextEnd, Finish) are buffered
@@ -900,10 +1054,15 @@ async def stream(
             # yielded immediately so callers see tokens in real time.
             tail_events: list[StreamEvent] = []
             accumulated_text = ""
-            tool_calls_acc: dict[int, dict[str, str]] = {}
+            tool_calls_acc: dict[int, _StreamedToolCall] = {}
+            emitted_tool_calls: set[int] = set()
             input_tokens = 0
             output_tokens = 0
 
+            # The rate-limit slot is held for the whole stream and released
+            # before any retry backoff.
+            slot = AsyncExitStack()
+            lease = await slot.enter_async_context(self._rate_limit_slot(kwargs))
             try:
                 response = await litellm.acompletion(**kwargs)  # type: ignore[union-attr]
 
@@ -926,28 +1085,43 @@ async def stream(
                     if delta and delta.tool_calls:
                         for tc in delta.tool_calls:
                             idx = tc.index if hasattr(tc, "index") and tc.index is not None else 0
-                            if idx not in tool_calls_acc:
-                                tool_calls_acc[idx] = {"id": "", "name": "", "arguments": ""}
+                            call = tool_calls_acc.get(idx)
+                            if call is None:
+                                call = tool_calls_acc[idx] = _StreamedToolCall()
                             if tc.id:
-                                tool_calls_acc[idx]["id"] = tc.id
+                                call.id = tc.id
                             if tc.function:
                                 if tc.function.name:
-                                    tool_calls_acc[idx]["name"] = tc.function.name
+                                    call.name = tc.function.name
                                 if tc.function.arguments:
-                                    tool_calls_acc[idx]["arguments"] += tc.function.arguments
+                                    call.args.feed(tc.function.arguments)
+
+                        # Emit calls whose arguments are already complete.
+                        for idx in sorted(tool_calls_acc):
+                            if idx in emitted_tool_calls:
+                                continue
+                            call = tool_calls_acc[idx]
+                            parsed_args = call.complete_args()
+                            if parsed_args is None:
+                                break
+                            emitted_tool_calls.add(idx)
+                            yield ToolCallEvent(
+                                tool_use_id=call.id,
+                                tool_name=call.name,
+                                tool_input=parsed_args,
+                            )
 
                     # --- Finish ---
                     if choice.finish_reason:
-                        for _idx, tc_data in sorted(tool_calls_acc.items()):
-                            try:
-                                parsed_args = json.loads(tc_data["arguments"])
-                            except (json.JSONDecodeError, KeyError):
-                                parsed_args = {"_raw": tc_data.get("arguments", "")}
+                        for idx, call in sorted(tool_calls_acc.items()):
+                            if idx in emitted_tool_calls:
+                                continue
+                            emitted_tool_calls.add(idx)
                             tail_events.append(
                                 ToolCallEvent(
-                                    tool_use_id=tc_data["id"],
-                                    tool_name=tc_data["name"],
-                                    tool_input=parsed_args,
+                                    tool_use_id=call.id,
+                                    tool_name=call.name,
+                                    tool_input=call.final_args(),
                                 )
                             )
 
@@ -958,6 +1132,8 @@ async def stream(
                         if usage:
                             input_tokens = getattr(usage, "prompt_tokens", 0) or 0
                             output_tokens = getattr(usage, "completion_tokens", 0) or 0
+                            if lease is not None:
+                                lease.record_usage(input_tokens, output_tokens)
 
                         tail_events.append(
                             FinishEvent(
@@ -968,6 +1144,10 @@ async def stream(
                             )
                         )
 
+                # Release the HTTP connection back to the pool now rather
+                # than whenever the stream object is garbage-collected.
+                await _aclose_stream(response)
+
                 # Check whether the stream produced any real content.
                 # (If text deltas were yielded above, has_content is True
                 # and we skip the retry path — nothing was yielded in vain.)
@@ -1010,6 +1190,7 @@ async def stream(
                         f"Retrying in {wait}s "
                         f"(attempt {attempt + 1}/{RATE_LIMIT_MAX_RETRIES})"
                     )
+                    await slot.aclose()
                     await asyncio.sleep(wait)
                     continue
 
@@ -1019,8 +1200,16 @@ async def stream(
                 return
 
             except RateLimitError as e:
+                wait = _compute_retry_delay(attempt, exception=e)
+                if lease is not None:
+                    lease.record_rate_limited(wait)
+                await slot.aclose()
+                if emitted_tool_calls:
+                    # Tools may already be running; let the caller stop them
+                    # and retry the whole turn, as for transient errors.
+                    yield StreamErrorEvent(error=str(e), recoverable=True)
+                    return
                 if attempt < RATE_LIMIT_MAX_RETRIES:
-                    wait = _compute_retry_delay(attempt, exception=e)
                     logger.warning(
                         f"[stream-retry] {self.model} rate limited (429): {e!s}. "
                         f"Retrying in {wait:.1f}s "
@@ -1032,7 +1221,15 @@ async def stream(
                 return
 
             except Exception as e:
+                if lease is not None:
+                    lease.record_failure()
+                await slot.aclose()
                 if _is_stream_transient_error(e) and attempt < RATE_LIMIT_MAX_RETRIES:
+                    if emitted_tool_calls:
+                        # Tools may already be running; let the caller stop
+                        # them and retry the whole turn.
+                        yield StreamErrorEvent(error=str(e), recoverable=True)
+                        return
                     wait = _compute_retry_delay(attempt, exception=e)
                     logger.warning(
                         f"[stream-retry] {self.model} transient error "
@@ -1045,3 +1242,6 @@ async def stream(
                 recoverable = _is_stream_transient_error(e)
                 yield StreamErrorEvent(error=str(e), recoverable=recoverable)
                 return
+
+            finally:
+                await slot.aclose()
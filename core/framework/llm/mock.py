@@ -204,6 +204,10 @@ async def acomplete(
             max_retries=max_retries,
         )
 
+    async def acomplete_batch(self, requests: list[dict[str, Any]]) -> list[LLMResponse]:
+        """Local stand-in for a provider batch API: one response per request."""
+        return [self.complete(**request) for request in requests]
+
     async def acomplete_with_tools(
         self,
         messages: list[dict[str, Any]],
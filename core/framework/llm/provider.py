@@ -27,6 +27,9 @@ class Tool:
     name: str
     description: str
     parameters: dict[str, Any] = field(default_factory=dict)
+    # No side effects: safe to start while the LLM is still streaming the
+    # rest of its turn (see EventLoopNode early tool dispatch).
+    read_only: bool = False
 
 
 @dataclass
@@ -0,0 +1,517 @@
+"""Proactive rate limiting and adaptive concurrency for LLM calls.
+
+Provider retry loops only react *after* a 429.  Under load many streams hit
+the limit together, all back off, and all come back at once.  The
+``LLMRateLimiter`` sits in front of every request instead:
+
+- Token buckets per model for requests/min, input tokens/min and output
+  tokens/min, so requests wait *before* exceeding a known quota.
+- An AIMD concurrency governor per model: a 429 halves the allowed number
+  of in-flight requests and pauses the model for the server's retry delay;
+  successes grow it back one slot at a time.  An optional latency target
+  shrinks it when responses slow down.
+- Priority lanes: waiters are admitted in priority order, so client-facing
+  turns jump ahead of background judges and cleanup calls.
+
+One limiter is shared by every ``LLMProvider`` in a runtime (see
+``set_default_rate_limiter``), for async calls (``acquire``) and sync calls
+from worker threads (``acquire_blocking``) alike.  Priority is carried in a context variable
+so call sites opt in without changing provider signatures:
+
+    with llm_priority(LLMPriority.BACKGROUND):
+        await llm.acomplete(...)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+import threading
+import time
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class LLMPriority(IntEnum):
+    """Admission priority; lower values are admitted first."""
+
+    INTERACTIVE = 0  # client-facing turns a human is waiting on
+    NORMAL = 1
+    BACKGROUND = 2  # judges, output cleaning, summaries
+
+
+_current_priority: ContextVar[LLMPriority] = ContextVar("llm_priority", default=LLMPriority.NORMAL)
+
+
+@contextmanager
+def llm_priority(priority: LLMPriority) -> Iterator[None]:
+    """Run LLM calls made in this block at ``priority``."""
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+def current_llm_priority() -> LLMPriority:
+    return _current_priority.get()
+
+
+@dataclass
+class RateLimitConfig:
+    """Per-model limits.  ``None`` disables a bucket.
+
+    Attributes:
+        requests_per_minute: Request quota.
+        input_tokens_per_minute: Prompt-token quota (estimated up front,
+            corrected with the provider's usage report).
+        output_tokens_per_minute: Completion-token quota.
+        max_concurrency: Ceiling for in-flight requests.
+        min_concurrency: Floor the governor never shrinks below.
+        target_latency: Seconds. Responses slower than this shrink the
+            concurrency limit a little.  ``None`` ignores latency.
+        backoff_factor: Multiplier applied to the limit on a 429.
+    """
+
+    requests_per_minute: float | None = None
+    input_tokens_per_minute: float | None = None
+    output_tokens_per_minute: float | None = None
+    max_concurrency: int = 64
+    min_concurrency: int = 1
+    target_latency: float | None = None
+    backoff_factor: float = 0.5
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> RateLimitConfig:
+        """Build from a config mapping, ignoring unknown keys."""
+        known = {k: v for k, v in data.items() if k in cls.__dataclass_fields__}
+        return cls(**known)
+
+
+class TokenBucket:
+    """Continuous-refill token bucket holding at most one minute of quota.
+
+    Debits may push the balance negative (a request used more than was
+    reserved); later callers then wait for the debt to refill.
+    """
+
+    def __init__(self, per_minute: float):
+        self.rate = per_minute / 60.0
+        self.capacity = float(per_minute)
+        self.tokens = self.capacity
+        self._last = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self._last) * self.rate)
+        self._last = now
+
+    def wait_time(self, amount: float) -> float:
+        """Seconds until ``amount`` tokens are available (0 if now)."""
+        self._refill()
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.rate
+
+    def take(self, amount: float) -> None:
+        self._refill()
+        self.tokens -= min(amount, self.capacity)
+
+    def adjust(self, delta: float) -> None:
+        """Correct a reservation: positive ``delta`` debits, negative refunds."""
+        self._refill()
+        self.tokens = min(self.capacity, self.tokens - delta)
+
+
+@dataclass
+class GovernorStats:
+    """Counters for one model's governor."""
+
+    admitted: int = 0
+    rate_limited: int = 0
+    queued_wait_seconds: float = 0.0
+    by_priority: dict[str, int] = field(default_factory=dict)
+
+
+class _Waiter:
+    """A caller queued for a concurrency slot, from a coroutine or a thread."""
+
+    __slots__ = ("granted", "_loop", "_future", "_event")
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop | None = None,
+        future: asyncio.Future[None] | None = None,
+        event: threading.Event | None = None,
+    ):
+        self.granted = False
+        self._loop = loop
+        self._future = future
+        self._event = event
+
+    def grant(self) -> None:
+        self.granted = True
+        if self._event is not None:
+            self._event.set()
+        elif self._loop is not None:
+            self._loop.call_soon_threadsafe(_resolve, self._future)
+
+
+def _resolve(future: asyncio.Future[None] | None) -> None:
+    if future is not None and not future.done():
+        future.set_result(None)
+
+
+class _ModelGovernor:
+    """Buckets, adaptive concurrency and priority queue for one model.
+
+    State is guarded by a lock because sync ``complete`` calls acquire
+    slots from worker threads while async calls run on the event loop.
+    """
+
+    def __init__(self, config: RateLimitConfig):
+        self.config = config
+        self.limit = float(config.max_concurrency)
+        self.in_flight = 0
+        self.cooldown_until = 0.0
+        self.avg_output_tokens = 256.0
+        self.stats = GovernorStats()
+        self.lock = threading.RLock()
+
+        self.requests = (
+            TokenBucket(config.requests_per_minute) if config.requests_per_minute else None
+        )
+        self.input_tokens = (
+            TokenBucket(config.input_tokens_per_minute) if config.input_tokens_per_minute else None
+        )
+        self.output_tokens = (
+            TokenBucket(config.output_tokens_per_minute)
+            if config.output_tokens_per_minute
+            else None
+        )
+
+        self._waiters: list[tuple[int, int, _Waiter]] = []
+        self._seq = itertools.count()
+
+    # -- concurrency slots -------------------------------------------------
+
+    def _has_slot(self) -> bool:
+        return self.in_flight < max(self.config.min_concurrency, int(self.limit))
+
+    def _enqueue(self, priority: LLMPriority, waiter: _Waiter) -> tuple[int, int, _Waiter] | None:
+        """Take a free slot (returns None) or queue *waiter* for one."""
+        with self.lock:
+            if not self._waiters and self._has_slot():
+                self.in_flight += 1
+                return None
+            entry = (int(priority), next(self._seq), waiter)
+            heapq.heappush(self._waiters, entry)
+            return entry
+
+    async def _acquire_slot(self, priority: LLMPriority) -> None:
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[None] = loop.create_future()
+        waiter = _Waiter(loop=loop, future=future)
+        entry = self._enqueue(priority, waiter)
+        if entry is None:
+            return
+        try:
+            await future
+        except asyncio.CancelledError:
+            with self.lock:
+                if waiter.granted:
+                    # Slot was handed to us just as we were cancelled: give it back.
+                    self._release_slot()
+                elif entry in self._waiters:
+                    self._waiters.remove(entry)
+                    heapq.heapify(self._waiters)
+            raise
+
+    def _acquire_slot_blocking(self, priority: LLMPriority) -> None:
+        waiter = _Waiter(event=threading.Event())
+        if self._enqueue(priority, waiter) is not None:
+            waiter._event.wait()  # type: ignore[union-attr]
+
+    def _release_slot(self) -> None:
+        with self.lock:
+            self.in_flight -= 1
+            self._wake()
+
+    def _wake(self) -> None:
+        with self.lock:
+            while self._waiters and self._has_slot():
+                _, _, waiter = heapq.heappop(self._waiters)
+                self.in_flight += 1
+                waiter.grant()
+
+    # -- token buckets -----------------------------------------------------
+
+    def _reserve_quota(self, input_tokens: float, output_tokens: float) -> float:
+        """Take the quota and return 0, or return the seconds to wait first."""
+        with self.lock:
+            wait = max(0.0, self.cooldown_until - time.monotonic())
+            for bucket, amount in (
+                (self.requests, 1),
+                (self.input_tokens, input_tokens),
+                (self.output_tokens, output_tokens),
+            ):
+                if bucket is not None:
+                    wait = max(wait, bucket.wait_time(amount))
+            if wait > 0:
+                return wait
+
+            if self.requests is not None:
+                self.requests.take(1)
+            if self.input_tokens is not None:
+                self.input_tokens.take(input_tokens)
+            if self.output_tokens is not None:
+                self.output_tokens.take(output_tokens)
+            return 0.0
+
+    async def _wait_for_quota(self, input_tokens: float, output_tokens: float) -> None:
+        while (wait := self._reserve_quota(input_tokens, output_tokens)) > 0:
+            await asyncio.sleep(wait)
+
+    def _wait_for_quota_blocking(self, input_tokens: float, output_tokens: float) -> None:
+        while (wait := self._reserve_quota(input_tokens, output_tokens)) > 0:
+            time.sleep(wait)
+
+    # -- feedback ----------------------------------------------------------
+
+    def on_success(self, latency: float) -> None:
+        cfg = self.config
+        with self.lock:
+            if cfg.target_latency is not None and latency > cfg.target_latency:
+                self.limit = max(float(cfg.min_concurrency), self.limit * 0.9)
+            else:
+                # Additive increase: roughly +1 slot per "limit" successes.
+                self.limit = min(
+                    float(cfg.max_concurrency), self.limit + 1.0 / max(self.limit, 1.0)
+                )
+            self._wake()
+
+    def on_rate_limited(self, retry_after: float) -> None:
+        cfg = self.config
+        with self.lock:
+            self.stats.rate_limited += 1
+            self.limit = max(float(cfg.min_concurrency), self.limit * cfg.backoff_factor)
+            self.cooldown_until = max(self.cooldown_until, time.monotonic() + retry_after)
+        logger.info(
+            "[rate-limit] 429 observed; concurrency limit now %d, pausing %.1fs",
+            int(self.limit),
+            retry_after,
+        )
+
+    def snapshot(self) -> dict[str, Any]:
+        with self.lock:
+            return {
+                "limit": int(self.limit),
+                "in_flight": self.in_flight,
+                "queued": len(self._waiters),
+                "admitted": self.stats.admitted,
+                "rate_limited": self.stats.rate_limited,
+                "queued_wait_seconds": round(self.stats.queued_wait_seconds, 3),
+                "by_priority": dict(self.stats.by_priority),
+            }
+
+
+class RateLimitLease:
+    """Handle for one admitted request; report usage and 429s through it."""
+
+    def __init__(self, governor: _ModelGovernor, input_tokens: float, output_tokens: float):
+        self._governor = governor
+        self._reserved_input = input_tokens
+        self._reserved_output = output_tokens
+        self.rate_limited = False
+        self.failed = False
+
+    def record_usage(self, input_tokens: int | None, output_tokens: int | None) -> None:
+        """Reconcile the reservation with the provider's reported usage."""
+        gov = self._governor
+        with gov.lock:
+            if input_tokens and gov.input_tokens is not None:
+                gov.input_tokens.adjust(input_tokens - self._reserved_input)
+                self._reserved_input = input_tokens
+            if output_tokens:
+                if gov.output_tokens is not None:
+                    gov.output_tokens.adjust(output_tokens - self._reserved_output)
+                self._reserved_output = output_tokens
+                gov.avg_output_tokens = 0.8 * gov.avg_output_tokens + 0.2 * output_tokens
+
+    def record_failure(self) -> None:
+        """Mark the request failed so it does not count as a success."""
+        self.failed = True
+
+    def record_rate_limited(self, retry_after: float) -> None:
+        """Report a 429 so every caller of this model backs off together."""
+        self.rate_limited = True
+        self._governor.on_rate_limited(retry_after)
+
+
+class LLMRateLimiter:
+    """Shared admission control for all LLM calls in a runtime.
+
+    Args:
+        default: Limits for models without an explicit entry.
+        models: Per-model overrides keyed by model string.
+    """
+
+    def __init__(
+        self,
+        default: RateLimitConfig | None = None,
+        models: dict[str, RateLimitConfig] | None = None,
+    ):
+        self.default = default or RateLimitConfig()
+        self.models = dict(models or {})
+        self._governors: dict[str, _ModelGovernor] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> LLMRateLimiter:
+        """Build from the ``llm.rate_limit`` config section.
+
+        Top-level keys are the default ``RateLimitConfig``; ``models`` maps
+        model strings to overrides.
+        """
+        models = {
+            name: RateLimitConfig.from_dict(cfg)
+            for name, cfg in (data.get("models") or {}).items()
+            if isinstance(cfg, dict)
+        }
+        return cls(default=RateLimitConfig.from_dict(data), models=models)
+
+    def _governor(self, model: str) -> _ModelGovernor:
+        with self._lock:
+            gov = self._governors.get(model)
+            if gov is None:
+                gov = _ModelGovernor(self.models.get(model, self.default))
+                self._governors[model] = gov
+            return gov
+
+    def _expected_output(self, gov: _ModelGovernor, max_output_tokens: int | None) -> float:
+        expected_output = gov.avg_output_tokens
+        if max_output_tokens:
+            expected_output = min(expected_output, float(max_output_tokens))
+        return expected_output
+
+    @asynccontextmanager
+    async def acquire(
+        self,
+        model: str,
+        input_tokens: int = 0,
+        max_output_tokens: int | None = None,
+        priority: LLMPriority | None = None,
+    ) -> AsyncIterator[RateLimitLease]:
+        """Wait for a concurrency slot and quota, then hold the slot.
+
+        Output tokens are reserved at the model's recent average (capped at
+        ``max_output_tokens``) and reconciled via ``record_usage``.
+        """
+        gov = self._governor(model)
+        prio = priority if priority is not None else current_llm_priority()
+        expected_output = self._expected_output(gov, max_output_tokens)
+
+        queued_at = time.monotonic()
+        await gov._acquire_slot(prio)
+        try:
+            await gov._wait_for_quota(float(input_tokens), expected_output)
+        except BaseException:
+            gov._release_slot()
+            raise
+
+        with _holding(gov, prio, queued_at, float(input_tokens), expected_output) as lease:
+            yield lease
+
+    @contextmanager
+    def acquire_blocking(
+        self,
+        model: str,
+        input_tokens: int = 0,
+        max_output_tokens: int | None = None,
+        priority: LLMPriority | None = None,
+    ) -> Iterator[RateLimitLease]:
+        """``acquire`` for sync callers: blocks the calling thread while queued.
+
+        Sync and async callers share the same slots, buckets and priority queue.
+        """
+        gov = self._governor(model)
+        prio = priority if priority is not None else current_llm_priority()
+        expected_output = self._expected_output(gov, max_output_tokens)
+
+        queued_at = time.monotonic()
+        gov._acquire_slot_blocking(prio)
+        try:
+            gov._wait_for_quota_blocking(float(input_tokens), expected_output)
+        except BaseException:
+            gov._release_slot()
+            raise
+
+        with _holding(gov, prio, queued_at, float(input_tokens), expected_output) as lease:
+            yield lease
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Per-model governor state and counters."""
+        with self._lock:
+            governors = dict(self._governors)
+        return {model: gov.snapshot() for model, gov in governors.items()}
+
+
+@contextmanager
+def _holding(
+    gov: _ModelGovernor,
+    prio: LLMPriority,
+    queued_at: float,
+    input_tokens: float,
+    expected_output: float,
+) -> Iterator[RateLimitLease]:
+    """Hold an admitted slot; feed the outcome back and release it on exit."""
+    with gov.lock:
+        gov.stats.admitted += 1
+        gov.stats.by_priority[prio.name] = gov.stats.by_priority.get(prio.name, 0) + 1
+        gov.stats.queued_wait_seconds += time.monotonic() - queued_at
+
+    lease = RateLimitLease(gov, input_tokens, expected_output)
+    started = time.monotonic()
+    failed = False
+    try:
+        yield lease
+    except BaseException:
+        failed = True
+        raise
+    finally:
+        if not (lease.rate_limited or lease.failed or failed):
+            gov.on_success(time.monotonic() - started)
+        gov._release_slot()
+
+
+_default_limiter: LLMRateLimiter | None = None
+
+
+def set_default_rate_limiter(limiter: LLMRateLimiter | None) -> None:
+    """Install the limiter used by providers that were not given one."""
+    global _default_limiter
+    _default_limiter = limiter
+
+
+def get_default_rate_limiter() -> LLMRateLimiter | None:
+    return _default_limiter
+
+
+def estimate_prompt_tokens(messages: list[dict[str, Any]]) -> int:
+    """Cheap prompt size estimate (~4 chars per token) for quota reservation."""
+    total = 0
+    for m in messages:
+        content = m.get("content", "")
+        total += len(content) if isinstance(content, str) else len(str(content))
+        if m.get("tool_calls"):
+            total += len(str(m["tool_calls"]))
+    return total // 4
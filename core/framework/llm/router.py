@@ -0,0 +1,491 @@
+"""Latency-aware routing across several LLM backends.
+
+``LiteLLMProvider`` is bound to one model, so a slow or failing provider
+stalls every EventLoopNode turn that uses it.  ``RoutingLLMProvider`` wraps
+several providers (different vendors, regions or models) and for each call:
+
+- ranks backends by rolling p95 latency, recent error rate and cost;
+- optionally *hedges*: if the chosen backend has not answered after
+  ``hedge_after`` seconds, the next-ranked backend is started as well, the
+  first good answer wins and the loser is cancelled;
+- fails over to the next backend when one raises or returns a stream error.
+
+For ``stream()`` latency means time to first event; once a backend has
+produced output the router is committed to it.  Tool loops are never
+hedged, since tool execution has side effects.
+
+Per-backend latency histograms are available from ``stats()`` and are
+logged every ``log_interval`` requests.
+
+Usage:
+    llm = RoutingLLMProvider(
+        [
+            RouterBackend("sonnet", LiteLLMProvider(model="claude-sonnet-4-5")),
+            RouterBackend("gpt", LiteLLMProvider(model="gpt-4o"), cost_per_mtok=10.0),
+        ],
+        RoutingConfig(hedge_after=5.0),
+    )
+"""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import logging
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Coroutine
+from dataclasses import dataclass, field
+from typing import Any
+
+from framework.llm.provider import LLMProvider, LLMResponse, Tool, ToolResult, ToolUse
+from framework.llm.stream_events import StreamErrorEvent, StreamEvent
+
+logger = logging.getLogger(__name__)
+
+# Histogram bucket upper bounds in seconds; the last bucket is open-ended.
+HISTOGRAM_BOUNDS: tuple[float, ...] = (0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 16.0, 32.0, 64.0)
+
+
+@dataclass
+class RoutingConfig:
+    """Routing policy for ``RoutingLLMProvider``.
+
+    Attributes:
+        hedge_after: Seconds to wait on the chosen backend before starting a
+            second request on the next-ranked one.  ``None`` disables hedging.
+        latency_weight: Score weight for rolling p95 latency (seconds).
+        error_weight: Score penalty, in seconds, for a 100% error rate.
+        cost_weight: Score weight for ``RouterBackend.cost_per_mtok``.
+        window: Recent samples kept per backend for p95 and error rate.
+        min_samples: Latency samples needed before p95 counts toward a
+            backend's score.  Until then it competes on errors and cost
+            alone, so new backends get tried.
+        log_interval: Log per-backend histograms every N requests (0 = never).
+    """
+
+    hedge_after: float | None = None
+    latency_weight: float = 1.0
+    error_weight: float = 30.0
+    cost_weight: float = 0.0
+    window: int = 100
+    min_samples: int = 5
+    log_interval: int = 200
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> RoutingConfig:
+        """Build from a config mapping, ignoring unknown keys."""
+        known = {k: v for k, v in data.items() if k in cls.__dataclass_fields__}
+        return cls(**known)
+
+
+@dataclass
+class LatencyHistogram:
+    """Fixed-bucket latency histogram (bounds in seconds)."""
+
+    bounds: tuple[float, ...] = HISTOGRAM_BOUNDS
+    counts: list[int] = field(default_factory=lambda: [0] * (len(HISTOGRAM_BOUNDS) + 1))
+    total: float = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, seconds)] += 1
+        self.total += seconds
+
+    def to_dict(self) -> dict[str, int]:
+        labels = [f"le_{b:g}s" for b in self.bounds] + ["inf"]
+        return dict(zip(labels, self.counts, strict=True))
+
+
+@dataclass
+class RouterBackend:
+    """One routable provider.
+
+    Attributes:
+        name: Label used in stats and logs.
+        provider: The wrapped provider.
+        cost_per_mtok: Relative cost (e.g. USD per million output tokens),
+            only used when ``RoutingConfig.cost_weight`` is non-zero.
+    """
+
+    name: str
+    provider: LLMProvider
+    cost_per_mtok: float = 0.0
+
+
+class _BackendStats:
+    """Rolling latency/error window plus lifetime counters for one backend."""
+
+    def __init__(self, window: int):
+        self.latencies: deque[float] = deque(maxlen=window)
+        self.outcomes: deque[bool] = deque(maxlen=window)
+        self.histogram = LatencyHistogram()
+        self.requests = 0
+        self.errors = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+
+    def record_success(self, latency: float) -> None:
+        self.latencies.append(latency)
+        self.outcomes.append(True)
+        self.histogram.observe(latency)
+
+    def record_error(self) -> None:
+        self.errors += 1
+        self.outcomes.append(False)
+
+    def p95(self) -> float | None:
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))]
+
+    def error_rate(self) -> float:
+        if not self.outcomes:
+            return 0.0
+        return self.outcomes.count(False) / len(self.outcomes)
+
+    def to_dict(self) -> dict[str, Any]:
+        p95 = self.p95()
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "error_rate": round(self.error_rate(), 3),
+            "p95_seconds": round(p95, 3) if p95 is not None else None,
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+            "histogram": self.histogram.to_dict(),
+        }
+
+
+class RoutingLLMProvider(LLMProvider):
+    """``LLMProvider`` that routes, hedges and fails over across backends."""
+
+    def __init__(self, backends: list[RouterBackend], config: RoutingConfig | None = None):
+        if not backends:
+            raise ValueError("RoutingLLMProvider needs at least one backend")
+        self.backends = list(backends)
+        self.config = config or RoutingConfig()
+        self._stats = {b.name: _BackendStats(self.config.window) for b in self.backends}
+        self._requests = 0
+
+    @property
+    def model(self) -> str:
+        return getattr(self.rank()[0].provider, "model", "")
+
+    # -- ranking -------------------------------------------------------------
+
+    def _score(self, backend: RouterBackend) -> float:
+        cfg = self.config
+        stats = self._stats[backend.name]
+        score = cfg.error_weight * stats.error_rate() + cfg.cost_weight * backend.cost_per_mtok
+        if len(stats.latencies) >= cfg.min_samples:
+            score += cfg.latency_weight * (stats.p95() or 0.0)
+        return score
+
+    def rank(self) -> list[RouterBackend]:
+        """Backends best-first.  Ties keep configured order."""
+        return sorted(self.backends, key=self._score)
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Per-backend counters, rolling p95 and latency histogram."""
+        return {name: s.to_dict() for name, s in self._stats.items()}
+
+    def _count_request(self) -> None:
+        self._requests += 1
+        interval = self.config.log_interval
+        if interval and self._requests % interval == 0:
+            for name, data in self.stats().items():
+                logger.info("[router] %s: %s", name, data)
+
+    # -- sync ----------------------------------------------------------------
+
+    def _failover_sync(self, call: Callable[[LLMProvider], LLMResponse]) -> LLMResponse:
+        self._count_request()
+        last_error: BaseException | None = None
+        for backend in self.rank():
+            stats = self._stats[backend.name]
+            stats.requests += 1
+            start = time.monotonic()
+            try:
+                response = call(backend.provider)
+            except Exception as e:
+                stats.record_error()
+                last_error = e
+                logger.warning("[router] %s failed, failing over: %s", backend.name, e)
+                continue
+            stats.record_success(time.monotonic() - start)
+            return response
+        assert last_error is not None
+        raise last_error
+
+    def complete(
+        self,
+        messages: list[dict[str, Any]],
+        system: str = "",
+        tools: list[Tool] | None = None,
+        max_tokens: int = 1024,
+        response_format: dict[str, Any] | None = None,
+        json_mode: bool = False,
+        max_retries: int | None = None,
+    ) -> LLMResponse:
+        """Complete on the best backend, failing over on errors."""
+        return self._failover_sync(
+            lambda p: p.complete(
+                messages=messages,
+                system=system,
+                tools=tools,
+                max_tokens=max_tokens,
+                response_format=response_format,
+                json_mode=json_mode,
+                max_retries=max_retries,
+            )
+        )
+
+    def complete_with_tools(
+        self,
+        messages: list[dict[str, Any]],
+        system: str,
+        tools: list[Tool],
+        tool_executor: Callable[[ToolUse], ToolResult],
+        max_iterations: int = 10,
+    ) -> LLMResponse:
+        """Tool loop on the best backend.  Failover only, never hedged."""
+        return self._failover_sync(
+            lambda p: p.complete_with_tools(
+                messages=messages,
+                system=system,
+                tools=tools,
+                tool_executor=tool_executor,
+                max_iterations=max_iterations,
+            )
+        )
+
+    # -- async ---------------------------------------------------------------
+
+    async def _hedged(
+        self,
+        call: Callable[[LLMProvider], Coroutine[Any, Any, LLMResponse]],
+        hedge: bool = True,
+    ) -> LLMResponse:
+        self._count_request()
+        remaining = deque(self.rank())
+        pending: dict[asyncio.Task[LLMResponse], tuple[RouterBackend, float, bool]] = {}
+        hedged = False
+        last_error: BaseException | None = None
+
+        def launch(is_hedge: bool) -> None:
+            backend = remaining.popleft()
+            stats = self._stats[backend.name]
+            stats.requests += 1
+            if is_hedge:
+                stats.hedges += 1
+            task = asyncio.ensure_future(call(backend.provider))
+            pending[task] = (backend, time.monotonic(), is_hedge)
+
+        launch(is_hedge=False)
+        try:
+            while pending:
+                timeout = None
+                if hedge and not hedged and remaining and self.config.hedge_after is not None:
+                    timeout = self.config.hedge_after
+                done, _ = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    hedged = True
+                    logger.debug("[router] hedging after %.1fs", timeout)
+                    launch(is_hedge=True)
+                    continue
+
+                for task in done:
+                    backend, started, is_hedge = pending.pop(task)
+                    stats = self._stats[backend.name]
+                    error = task.exception()
+                    if error is None:
+                        stats.record_success(time.monotonic() - started)
+                        if is_hedge:
+                            stats.hedge_wins += 1
+                        return task.result()
+                    stats.record_error()
+                    last_error = error
+                    logger.warning("[router] %s failed: %s", backend.name, error)
+
+                if not pending and remaining:
+                    launch(is_hedge=False)
+        finally:
+            for task in pending:
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled():
+                    task.exception()  # mark retrieved; the result is discarded
+
+        assert last_error is not None
+        raise last_error
+
+    async def acomplete(
+        self,
+        messages: list[dict[str, Any]],
+        system: str = "",
+        tools: list[Tool] | None = None,
+        max_tokens: int = 1024,
+        response_format: dict[str, Any] | None = None,
+        json_mode: bool = False,
+        max_retries: int | None = None,
+    ) -> LLMResponse:
+        """Complete on the best backend, hedging and failing over as configured."""
+        return await self._hedged(
+            lambda p: p.acomplete(
+                messages=messages,
+                system=system,
+                tools=tools,
+                max_tokens=max_tokens,
+                response_format=response_format,
+                json_mode=json_mode,
+                max_retries=max_retries,
+            )
+        )
+
+    async def acomplete_with_tools(
+        self,
+        messages: list[dict[str, Any]],
+        system: str,
+        tools: list[Tool],
+        tool_executor: Callable[[ToolUse], ToolResult],
+        max_iterations: int = 10,
+    ) -> LLMResponse:
+        """Tool loop on the best backend.  Failover only, never hedged."""
+        return await self._hedged(
+            lambda p: p.acomplete_with_tools(
+                messages=messages,
+                system=system,
+                tools=tools,
+                tool_executor=tool_executor,
+                max_iterations=max_iterations,
+            ),
+            hedge=False,
+        )
+
+    async def stream(
+        self,
+        messages: list[dict[str, Any]],
+        system: str = "",
+        tools: list[Tool] | None = None,
+        max_tokens: int = 4096,
+    ) -> AsyncIterator[StreamEvent]:
+        """Stream from whichever backend produces a first event soonest.
+
+        A backend whose first event is a ``StreamErrorEvent`` (or that raises
+        before producing anything) is failed over.  After the first real
+        event the router is committed to that backend.
+        """
+        self._count_request()
+        remaining = deque(self.rank())
+        pending: dict[
+            asyncio.Task[StreamEvent], tuple[RouterBackend, AsyncIterator[StreamEvent], float, bool]
+        ] = {}
+        hedged = False
+        last_error: StreamErrorEvent | None = None
+        winner: tuple[RouterBackend, AsyncIterator[StreamEvent], float] | None = None
+        first_event: StreamEvent | None = None
+
+        def launch(is_hedge: bool) -> None:
+            backend = remaining.popleft()
+            stats = self._stats[backend.name]
+            stats.requests += 1
+            if is_hedge:
+                stats.hedges += 1
+            agen = backend.provider.stream(
+                messages=messages, system=system, tools=tools, max_tokens=max_tokens
+            )
+            task = asyncio.ensure_future(agen.__anext__())
+            pending[task] = (backend, agen, time.monotonic(), is_hedge)
+
+        launch(is_hedge=False)
+        try:
+            while pending and winner is None:
+                timeout = None
+                if not hedged and remaining and self.config.hedge_after is not None:
+                    timeout = self.config.hedge_after
+                done, _ = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    hedged = True
+                    launch(is_hedge=True)
+                    continue
+
+                for task in done:
+                    backend, agen, started, is_hedge = pending.pop(task)
+                    if winner is not None:
+                        # Both finished together; keep the first, drop this one.
+                        task.exception()
+                        await _aclose(agen)
+                        continue
+                    stats = self._stats[backend.name]
+                    error = task.exception()
+                    event = None if error is not None else task.result()
+                    if event is not None and event.type != "error":
+                        stats.record_success(time.monotonic() - started)
+                        if is_hedge:
+                            stats.hedge_wins += 1
+                        winner = (backend, agen, started)
+                        first_event = event
+                        continue
+
+                    stats.record_error()
+                    if isinstance(event, StreamErrorEvent):
+                        last_error = event
+                    elif isinstance(error, StopAsyncIteration):
+                        last_error = StreamErrorEvent(error="empty stream", recoverable=True)
+                    elif error is not None:
+                        last_error = StreamErrorEvent(error=str(error), recoverable=True)
+                    logger.warning(
+                        "[router] %s stream failed before output: %s",
+                        backend.name,
+                        last_error.error if last_error else "unknown",
+                    )
+                    await _aclose(agen)
+
+                if winner is None and not pending and remaining:
+                    launch(is_hedge=False)
+        finally:
+            for task in pending:
+                task.cancel()
+            try:
+                # The losers' own cancellation or failure is collected; a
+                # cancellation of this stream still propagates from gather.
+                await asyncio.gather(*pending, return_exceptions=True)
+            finally:
+                for _, agen, _, _ in pending.values():
+                    await _aclose(agen)
+
+        if winner is None:
+            yield last_error or StreamErrorEvent(error="all backends failed", recoverable=True)
+            return
+
+        backend, agen, _ = winner
+        assert first_event is not None
+        yield first_event
+        try:
+            async for event in agen:
+                if isinstance(event, StreamErrorEvent):
+                    self._stats[backend.name].record_error()
+                yield event
+        finally:
+            await _aclose(agen)
+
+
+async def _aclose(agen: AsyncIterator[Any]) -> None:
+    aclose = getattr(agen, "aclose", None)
+    if aclose is not None:
+        try:
+            await aclose()
+        except Exception:
+            pass
+
+
+def build_routing_provider(
+    backends: list[RouterBackend], config: dict[str, Any]
+) -> RoutingLLMProvider:
+    """Build a router from the ``llm.routing`` config section."""
+    return RoutingLLMProvider(backends, RoutingConfig.from_dict(config))
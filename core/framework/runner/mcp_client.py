@@ -44,6 +44,16 @@ class MCPTool:
     description: str
     input_schema: dict[str, Any]
     server_name: str
+    read_only: bool = False
+
+
+def _annotations_dict(annotations: Any) -> dict[str, Any]:
+    """MCP ``ToolAnnotations`` (readOnlyHint etc.) as a plain dict."""
+    if annotations is None:
+        return {}
+    if isinstance(annotations, dict):
+        return annotations
+    return annotations.model_dump(exclude_none=True)
 
 
 class MCPClient:
@@ -265,6 +275,7 @@ def _discover_tools(self) -> None:
                     description=tool_data.get("description", ""),
                     input_schema=tool_data.get("inputSchema", {}),
                     server_name=self.config.name,
+                    read_only=bool((tool_data.get("annotations") or {}).get("readOnlyHint")),
                 )
                 self._tools[tool.name] = tool
 
@@ -292,6 +303,7 @@ async def _list_tools_stdio_async(self) -> list[dict]:
                     "name": tool.name,
                     "description": tool.description,
                     "inputSchema": tool.inputSchema,
+                    "annotations": _annotations_dict(getattr(tool, "annotations", None)),
                 }
             )
 
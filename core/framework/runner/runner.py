@@ -8,7 +8,14 @@
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-from framework.config import get_hive_config, get_preferred_model
+from framework.config import (
+    get_hive_config,
+    get_llm_cache_config,
+    get_llm_http_pool_config,
+    get_llm_rate_limit_config,
+    get_llm_routing_config,
+    get_preferred_model,
+)
 from framework.credentials.validation import (
     ensure_credential_key_env as _ensure_credential_key_env,
     validate_agent_credentials,
@@ -828,6 +835,33 @@ def _setup(self) -> None:
                     )
                     raise CredentialError(f"LLM API key not found for model '{self.model}'. {hint}")
 
+        # Opt-in pooled HTTP session shared by every node and stream
+        pool_config = get_llm_http_pool_config()
+        if pool_config is not None and hasattr(self._llm, "http_pool"):
+            from framework.llm.http_pool import HTTPPoolConfig, LLMHttpPool
+
+            self._llm.http_pool = LLMHttpPool(HTTPPoolConfig.from_dict(pool_config))
+
+        # Opt-in proactive rate limiting, shared by every provider in the process
+        rate_limit_config = get_llm_rate_limit_config()
+        if rate_limit_config is not None:
+            from framework.llm.rate_limiter import LLMRateLimiter, set_default_rate_limiter
+
+            set_default_rate_limiter(LLMRateLimiter.from_dict(rate_limit_config))
+
+        # Opt-in routing across several backends with hedging and failover
+        routing_config = get_llm_routing_config()
+        if self._llm is not None and routing_config is not None and not self.mock_mode:
+            self._llm = self._build_routing_llm(self._llm, routing_config)
+
+        # Opt-in response cache for repeated deterministic calls (judges,
+        # edge routing, output cleaning). Streams pass through untouched.
+        cache_config = get_llm_cache_config()
+        if self._llm is not None and cache_config.get("enabled"):
+            from framework.llm.cache import CachingLLMProvider, build_response_cache
+
+            self._llm = CachingLLMProvider(self._llm, cache=build_response_cache(cache_config))
+
         # Get tools for runtime
         tools = list(self._tool_registry.get_tools().values())
         tool_executor = self._tool_registry.get_executor()
@@ -880,6 +914,51 @@ def _get_api_key_env_var(self, model: str) -> str | None:
             # Default: assume OpenAI-compatible
             return "OPENAI_API_KEY"
 
+    def _build_routing_llm(
+        self, primary: LLMProvider, routing_config: dict[str, Any]
+    ) -> LLMProvider:
+        """Wrap the primary provider and the configured extra backends in a router.
+
+        Each entry in ``routing_config["backends"]`` takes ``model`` and
+        optionally ``name``, ``api_key_env_var``, ``api_base`` and
+        ``cost_per_mtok``.  Backends whose API key is missing are skipped.
+        """
+        from framework.llm.litellm import LiteLLMProvider
+        from framework.llm.router import RouterBackend, build_routing_provider
+
+        backends = [
+            RouterBackend(
+                name=self.model,
+                provider=primary,
+                cost_per_mtok=float(routing_config.get("primary_cost_per_mtok", 0.0)),
+            )
+        ]
+        for entry in routing_config.get("backends", []):
+            model = entry.get("model") if isinstance(entry, dict) else None
+            if not model:
+                continue
+            api_key_env = entry.get("api_key_env_var") or self._get_api_key_env_var(model)
+            api_key = os.environ.get(api_key_env) if api_key_env else None
+            if api_key_env and not api_key:
+                logger.warning("Skipping routing backend %s: %s not set", model, api_key_env)
+                continue
+            backends.append(
+                RouterBackend(
+                    name=entry.get("name", model),
+                    provider=LiteLLMProvider(
+                        model=model,
+                        api_key=api_key,
+                        api_base=entry.get("api_base"),
+                        http_pool=getattr(primary, "http_pool", None),
+                    ),
+                    cost_per_mtok=float(entry.get("cost_per_mtok", 0.0)),
+                )
+            )
+
+        if len(backends) == 1:
+            return primary
+        return build_routing_provider(backends, routing_config)
+
     def _get_api_key_from_credential_store(self) -> str | None:
         """Get the LLM API key from the encrypted credential store.
 
@@ -74,6 +74,7 @@ def register_function(
         func: Callable,
         name: str | None = None,
         description: str | None = None,
+        read_only: bool = False,
     ) -> None:
         """
         Register a function as a tool, auto-generating the Tool definition.
@@ -82,6 +83,7 @@ def register_function(
             func: Function to register
             name: Tool name (defaults to function name)
             description: Tool description (defaults to docstring)
+            read_only: Tool has no side effects and may start early
         """
         tool_name = name or func.__name__
         tool_desc = description or func.__doc__ or f"Execute {tool_name}"
@@ -121,6 +123,7 @@ def register_function(
                 "properties": properties,
                 "required": required,
             },
+            read_only=read_only,
         )
 
         def executor(inputs: dict) -> Any:
@@ -212,6 +215,7 @@ def executor(inputs: dict) -> Any:
                     obj,
                     name=metadata.get("name", name),
                     description=metadata.get("description"),
+                    read_only=metadata.get("read_only", False),
                 )
                 count += 1
 
@@ -477,6 +481,7 @@ def _convert_mcp_tool_to_framework_tool(self, mcp_tool: Any) -> Tool:
                 "properties": properties,
                 "required": required,
             },
+            read_only=getattr(mcp_tool, "read_only", False),
         )
 
         return tool
@@ -548,10 +553,14 @@ def __del__(self):
 def tool(
     description: str | None = None,
     name: str | None = None,
+    read_only: bool = False,
 ) -> Callable:
     """
     Decorator to mark a function as a tool.
 
+    Pass ``read_only=True`` for tools without side effects; the event loop
+    may start them before the LLM has finished streaming its turn.
+
     Usage:
         @tool(description="Fetch lead from GTM table")
         def gtm_fetch_lead(lead_id: str) -> dict:
@@ -562,6 +571,7 @@ def decorator(func: Callable) -> Callable:
         func._tool_metadata = {
             "name": name or func.__name__,
             "description": description or func.__doc__,
+            "read_only": read_only,
         }
         return func
 
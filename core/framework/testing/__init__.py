@@ -44,6 +44,9 @@
     BatchApprovalResult,
 )
 
+# Batched judge evaluation
+from framework.testing.batch_eval import BatchJudgeRunner, BatchReport, JudgeRequest
+
 # Error categorization
 from framework.testing.categorizer import ErrorCategorizer
 
@@ -91,6 +94,9 @@
     "ErrorCategorizer",
     # LLM Judge
     "LLMJudge",
+    "BatchJudgeRunner",
+    "BatchReport",
+    "JudgeRequest",
     # Debug
     "DebugTool",
     "DebugInfo",
@@ -0,0 +1,383 @@
+"""
+Batched offline evaluation for LLM judges.
+
+Judging a test suite one synchronous LLM call at a time is slow: 500 cases
+at a few seconds each take the better part of an hour.  ``BatchJudgeRunner``
+evaluates a whole suite at once:
+
+- fans out judge calls with bounded concurrency;
+- dedupes identical prompts, so each distinct prompt is sent once;
+- appends every finished case to a JSONL checkpoint, so an interrupted run
+  resumes where it stopped (failed cases are retried on resume);
+- uses the provider's batch endpoint when it has one (any provider with
+  ``acomplete_batch``, see ``BatchCompletionProvider``);
+- reports throughput, token usage, estimated cost and per-case latency.
+
+Example:
+    runner = BatchJudgeRunner(
+        provider, parse=judge._parse_json_result, checkpoint_path=suite_dir / "judge.jsonl"
+    )
+    report = runner.run_sync(requests)
+    print(report.to_dict())
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import statistics
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
+
+if TYPE_CHECKING:
+    from framework.llm.provider import LLMProvider, LLMResponse
+
+logger = logging.getLogger(__name__)
+
+
+@runtime_checkable
+class BatchCompletionProvider(Protocol):
+    """Provider that accepts many completion requests in one call.
+
+    Each request is a dict of ``acomplete`` keyword arguments; responses are
+    returned in the same order.
+    """
+
+    async def acomplete_batch(self, requests: list[dict[str, Any]]) -> list[LLMResponse]: ...
+
+
+@dataclass
+class JudgeRequest:
+    """One case to judge."""
+
+    case_id: str
+    messages: list[dict[str, Any]]
+    system: str = ""
+    max_tokens: int = 500
+    json_mode: bool = True
+
+    def prompt_key(self) -> str:
+        """Hash of everything sent to the LLM; equal keys get one call."""
+        payload = json.dumps(
+            [self.system, self.messages, self.max_tokens, self.json_mode],
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def completion_kwargs(self) -> dict[str, Any]:
+        return {
+            "messages": self.messages,
+            "system": self.system,
+            "max_tokens": self.max_tokens,
+            "json_mode": self.json_mode,
+        }
+
+
+@dataclass
+class CaseResult:
+    """Outcome for one case, as stored in the checkpoint file."""
+
+    case_id: str
+    prompt_key: str
+    result: dict[str, Any] | None = None
+    error: str | None = None
+    latency_seconds: float = 0.0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    deduped: bool = False
+    resumed: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class BatchReport:
+    """Summary of one ``BatchJudgeRunner.run``."""
+
+    results: list[CaseResult] = field(default_factory=list)
+    wall_seconds: float = 0.0
+    llm_calls: int = 0
+    input_cost_per_mtok: float = 0.0
+    output_cost_per_mtok: float = 0.0
+
+    @property
+    def total(self) -> int:
+        return len(self.results)
+
+    @property
+    def passed(self) -> int:
+        return sum(1 for r in self.results if r.ok and r.result and r.result.get("passes"))
+
+    @property
+    def errors(self) -> int:
+        return sum(1 for r in self.results if not r.ok)
+
+    @property
+    def throughput(self) -> float:
+        """Cases completed per second of wall time (resumed cases excluded)."""
+        fresh = sum(1 for r in self.results if not r.resumed)
+        return fresh / self.wall_seconds if self.wall_seconds > 0 else 0.0
+
+    @property
+    def input_tokens(self) -> int:
+        return sum(r.input_tokens for r in self.results if not r.deduped)
+
+    @property
+    def output_tokens(self) -> int:
+        return sum(r.output_tokens for r in self.results if not r.deduped)
+
+    @property
+    def estimated_cost(self) -> float:
+        return (
+            self.input_tokens * self.input_cost_per_mtok
+            + self.output_tokens * self.output_cost_per_mtok
+        ) / 1_000_000
+
+    def latency_percentile(self, pct: float) -> float:
+        samples = sorted(r.latency_seconds for r in self.results if not r.resumed and r.ok)
+        if not samples:
+            return 0.0
+        return samples[min(len(samples) - 1, int(pct / 100 * len(samples)))]
+
+    def to_dict(self) -> dict[str, Any]:
+        latencies = [r.latency_seconds for r in self.results if not r.resumed and r.ok]
+        return {
+            "total": self.total,
+            "passed": self.passed,
+            "failed": self.total - self.passed - self.errors,
+            "errors": self.errors,
+            "resumed": sum(1 for r in self.results if r.resumed),
+            "deduped": sum(1 for r in self.results if r.deduped),
+            "llm_calls": self.llm_calls,
+            "wall_seconds": round(self.wall_seconds, 3),
+            "throughput_per_second": round(self.throughput, 3),
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "estimated_cost": round(self.estimated_cost, 6),
+            "latency_mean": round(statistics.fmean(latencies), 3) if latencies else 0.0,
+            "latency_p50": round(self.latency_percentile(50), 3),
+            "latency_p95": round(self.latency_percentile(95), 3),
+            "cases": {r.case_id: asdict(r) for r in self.results},
+        }
+
+
+class BatchJudgeRunner:
+    """Evaluate many ``JudgeRequest`` objects against one provider."""
+
+    def __init__(
+        self,
+        provider: LLMProvider,
+        parse: Callable[[str], dict[str, Any]],
+        concurrency: int = 8,
+        checkpoint_path: str | Path | None = None,
+        batch_size: int = 20,
+        input_cost_per_mtok: float = 0.0,
+        output_cost_per_mtok: float = 0.0,
+    ):
+        """
+        Args:
+            provider: LLM used for every case.
+            parse: Turns the raw completion text into a result dict; raising
+                marks the case as errored.
+            concurrency: Maximum in-flight LLM calls (or batch submissions).
+            checkpoint_path: JSONL file for resumable progress.  None keeps
+                progress in memory only.
+            batch_size: Requests per ``acomplete_batch`` call when the
+                provider supports batching.
+            input_cost_per_mtok: Price per million input tokens, for the report.
+            output_cost_per_mtok: Price per million output tokens, for the report.
+        """
+        self.provider = provider
+        self.parse = parse
+        self.concurrency = max(1, concurrency)
+        self.checkpoint_path = Path(checkpoint_path) if checkpoint_path else None
+        self.batch_size = max(1, batch_size)
+        self.input_cost_per_mtok = input_cost_per_mtok
+        self.output_cost_per_mtok = output_cost_per_mtok
+
+    # ------------------------------------------------------------------
+    # Checkpoint
+    # ------------------------------------------------------------------
+
+    def load_checkpoint(self) -> dict[str, CaseResult]:
+        """Completed cases from the checkpoint, keyed by case_id.
+
+        Errored cases are dropped so they are retried.  A torn final line
+        (interrupted write) is ignored.
+        """
+        done: dict[str, CaseResult] = {}
+        if self.checkpoint_path is None or not self.checkpoint_path.exists():
+            return done
+        with open(self.checkpoint_path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    data = json.loads(line)
+                    record = CaseResult(
+                        **{k: v for k, v in data.items() if k in CaseResult.__dataclass_fields__}
+                    )
+                except (json.JSONDecodeError, TypeError):
+                    continue
+                if record.ok:
+                    done[record.case_id] = record
+        return done
+
+    def _append_checkpoint(self, records: list[CaseResult]) -> None:
+        if self.checkpoint_path is None or not records:
+            return
+        self.checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.checkpoint_path, "a", encoding="utf-8") as f:
+            for record in records:
+                f.write(json.dumps(asdict(record), default=str) + "\n")
+            f.flush()
+
+    # ------------------------------------------------------------------
+    # Execution
+    # ------------------------------------------------------------------
+
+    def _to_result(
+        self, request: JudgeRequest, response: LLMResponse | None, error: Exception | None
+    ) -> CaseResult:
+        record = CaseResult(case_id=request.case_id, prompt_key=request.prompt_key())
+        if error is not None:
+            record.error = str(error)
+            return record
+        assert response is not None
+        record.input_tokens = response.input_tokens
+        record.output_tokens = response.output_tokens
+        try:
+            record.result = self.parse(response.content.strip())
+        except Exception as e:
+            record.error = str(e)
+        return record
+
+    async def _run_single(self, request: JudgeRequest) -> list[CaseResult]:
+        start = time.monotonic()
+        try:
+            response = await self.provider.acomplete(**request.completion_kwargs())
+            record = self._to_result(request, response, None)
+        except Exception as e:
+            record = self._to_result(request, None, e)
+        record.latency_seconds = time.monotonic() - start
+        return [record]
+
+    async def _run_chunk(self, requests: list[JudgeRequest]) -> list[CaseResult]:
+        start = time.monotonic()
+        try:
+            responses = await self.provider.acomplete_batch(  # type: ignore[attr-defined]
+                [r.completion_kwargs() for r in requests]
+            )
+            records = [
+                self._to_result(req, resp, None)
+                for req, resp in zip(requests, responses, strict=True)
+            ]
+        except Exception as e:
+            records = [self._to_result(req, None, e) for req in requests]
+        elapsed = time.monotonic() - start
+        for record in records:
+            record.latency_seconds = elapsed
+        return records
+
+    async def run(self, requests: list[JudgeRequest]) -> BatchReport:
+        """Evaluate ``requests``, resuming from the checkpoint if present."""
+        report = BatchReport(
+            input_cost_per_mtok=self.input_cost_per_mtok,
+            output_cost_per_mtok=self.output_cost_per_mtok,
+        )
+        start = time.monotonic()
+
+        checkpoint = self.load_checkpoint()
+        by_key: dict[str, CaseResult] = {r.prompt_key: r for r in checkpoint.values()}
+        keys = {request.case_id: request.prompt_key() for request in requests}
+        # A saved verdict only carries over if the case still sends the same
+        # prompt; an edited or reordered suite is re-judged.
+        done = {
+            case_id: record
+            for case_id, record in checkpoint.items()
+            if keys.get(case_id) == record.prompt_key
+        }
+
+        # Distinct prompts still to evaluate, and every case waiting on each.
+        unique: dict[str, JudgeRequest] = {}
+        waiting: dict[str, list[JudgeRequest]] = {}
+        for request in requests:
+            if request.case_id in done:
+                continue
+            key = keys[request.case_id]
+            if key in by_key:
+                continue
+            unique.setdefault(key, request)
+            waiting.setdefault(key, []).append(request)
+
+        batched = isinstance(self.provider, BatchCompletionProvider) and self.batch_size > 1
+        pending = list(unique.values())
+        step = self.batch_size if batched else 1
+        units = [pending[i : i + step] for i in range(0, len(pending), step)]
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def bounded(unit: list[JudgeRequest]) -> None:
+            async with semaphore:
+                if batched:
+                    records = await self._run_chunk(unit)
+                else:
+                    records = await self._run_single(unit[0])
+            report.llm_calls += 1
+            fresh: list[CaseResult] = []
+            for record in records:
+                by_key[record.prompt_key] = record
+                # Cases sharing this prompt get a copy of the result.
+                for twin in waiting[record.prompt_key][1:]:
+                    fresh.append(
+                        CaseResult(**{**asdict(record), "case_id": twin.case_id, "deduped": True})
+                    )
+                fresh.append(record)
+            self._append_checkpoint(fresh)
+
+        await asyncio.gather(*(bounded(unit) for unit in units))
+
+        for request in requests:
+            if request.case_id in done:
+                report.results.append(_mark_resumed(done[request.case_id]))
+                continue
+            record = by_key[keys[request.case_id]]
+            if record.case_id != request.case_id:
+                record = CaseResult(
+                    **{**asdict(record), "case_id": request.case_id, "deduped": True}
+                )
+            report.results.append(record)
+
+        report.wall_seconds = time.monotonic() - start
+        logger.info(
+            "Batch judge: %d cases, %d LLM calls, %.2f cases/s",
+            report.total,
+            report.llm_calls,
+            report.throughput,
+        )
+        return report
+
+    def run_sync(self, requests: list[JudgeRequest]) -> BatchReport:
+        """Blocking wrapper around ``run`` for CLI and MCP tool use.
+
+        Raises RuntimeError when called from a running event loop; await
+        ``run`` there instead.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.run(requests))
+        raise RuntimeError(
+            "BatchJudgeRunner.run_sync() cannot be called from a running event loop; "
+            "await BatchJudgeRunner.run() instead"
+        )
+
+
+def _mark_resumed(record: CaseResult) -> CaseResult:
+    return CaseResult(**{**asdict(record), "resumed": True})
@@ -7,8 +7,11 @@
 
 import json
 import os
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from framework.testing.batch_eval import BatchJudgeRunner, BatchReport, JudgeRequest
+
 if TYPE_CHECKING:
     from framework.llm.provider import LLMProvider
 
@@ -55,15 +58,10 @@ def _get_fallback_provider(self) -> LLMProvider | None:
 
         return None
 
-    def evaluate(
-        self,
-        constraint: str,
-        source_document: str,
-        summary: str,
-        criteria: str,
-    ) -> dict[str, Any]:
-        """Evaluate whether a summary meets a constraint."""
-        prompt = f"""You are evaluating whether a summary meets a specific constraint.
+    @staticmethod
+    def build_prompt(constraint: str, source_document: str, summary: str, criteria: str) -> str:
+        """Build the judge prompt for one case."""
+        return f"""You are evaluating whether a summary meets a specific constraint.
 
 CONSTRAINT: {constraint}
 CRITERIA: {criteria}
@@ -76,6 +74,16 @@ def evaluate(
 
 Respond with JSON: {{"passes": true/false, "explanation": "..."}}"""
 
+    def evaluate(
+        self,
+        constraint: str,
+        source_document: str,
+        summary: str,
+        criteria: str,
+    ) -> dict[str, Any]:
+        """Evaluate whether a summary meets a constraint."""
+        prompt = self.build_prompt(constraint, source_document, summary, criteria)
+
         try:
             # 1. Use injected provider
             if self._provider:
@@ -103,6 +111,56 @@ def evaluate(
         except Exception as e:
             return {"passes": False, "explanation": f"LLM judge error: {e}"}
 
+    def evaluate_batch(
+        self,
+        cases: list[dict[str, Any]],
+        concurrency: int = 8,
+        checkpoint_path: str | Path | None = None,
+        input_cost_per_mtok: float = 0.0,
+        output_cost_per_mtok: float = 0.0,
+    ) -> BatchReport:
+        """Evaluate many cases concurrently with dedupe and resumable progress.
+
+        Each case is a dict with ``constraint``, ``source_document``,
+        ``summary`` and ``criteria`` keys, plus an optional ``id`` (defaults
+        to the list index).  Use ``checkpoint_path`` to resume an interrupted
+        suite.  Returns a ``BatchReport``; per-case results match ``evaluate``.
+
+        This is a blocking call and must not be used inside a running event
+        loop; async callers should build ``JudgeRequest`` objects and await
+        ``BatchJudgeRunner.run`` directly.
+        """
+        provider = self._provider or self._get_fallback_provider()
+        if provider is None:
+            raise RuntimeError("evaluate_batch needs an LLM provider or an OpenAI/Anthropic key")
+
+        requests = [
+            JudgeRequest(
+                case_id=str(case.get("id", i)),
+                messages=[
+                    {
+                        "role": "user",
+                        "content": self.build_prompt(
+                            case["constraint"],
+                            case["source_document"],
+                            case["summary"],
+                            case["criteria"],
+                        ),
+                    }
+                ],
+            )
+            for i, case in enumerate(cases)
+        ]
+        runner = BatchJudgeRunner(
+            provider,
+            parse=self._parse_json_result,
+            concurrency=concurrency,
+            checkpoint_path=checkpoint_path,
+            input_cost_per_mtok=input_cost_per_mtok,
+            output_cost_per_mtok=output_cost_per_mtok,
+        )
+        return runner.run_sync(requests)
+
     def _parse_json_result(self, text: str) -> dict[str, Any]:
         """Robustly parse JSON output even if LLM adds markdown or chatter."""
         try:
@@ -0,0 +1,252 @@
+"""
+Incremental JSON scanning for streamed LLM output.
+
+Tool-call arguments and structured outputs arrive in many small chunks.
+Re-running ``json.loads`` (or a char-by-char brace matcher) over the whole
+accumulated text after every chunk is quadratic, and it runs on the shared
+event loop.  ``IncrementalJSONScanner`` keeps its position between chunks
+instead: each chunk is scanned once, jumping between structural characters
+with compiled regexes, so completion is known the moment the closing brace
+arrives and ``json.loads`` runs exactly once.
+
+It tolerates the LLM quirks the framework already repairs:
+
+- text before the first ``{`` is skipped and text after the matching ``}``
+  is kept aside in ``trailing``;
+- raw newlines, carriage returns and tabs inside strings are escaped;
+- ``partial()`` returns the best-effort object parsed so far (open strings
+  and containers closed, an unfinished member dropped).
+
+Example:
+    scanner = IncrementalJSONScanner()
+    for chunk in chunks:
+        if scanner.feed(chunk):
+            args = scanner.result()
+            break
+    else:
+        args = scanner.partial()
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import Any
+
+# Characters that change scanner state inside and outside strings.
+_IN_STRING = re.compile(r'["\\]')
+_STRUCTURAL = re.compile(r'["{}\[\],]')
+# A double-quoted region, possibly unterminated at the end of the text.
+_STRING = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"?', re.DOTALL)
+
+_CLOSERS = {"{": "}", "[": "]"}
+
+
+def _escape_controls(text: str) -> str:
+    """Escape raw control characters LLMs leave inside strings."""
+    # Chained str.replace is much faster than str.translate for 1->2 mappings.
+    return text.replace("\n", "\\n").replace("\r", "\\r").replace("\t", "\\t")
+
+
+class IncrementalJSONScanner:
+    """Resumable scanner for one JSON object arriving in chunks."""
+
+    def __init__(self, repair: bool = True):
+        """
+        Args:
+            repair: Escape raw control characters inside strings.  With
+                ``repair=False`` ``text()`` is an exact slice of the input.
+        """
+        self.repair = repair
+        self.started = False
+        self.complete = False
+        self.malformed = False  # saw a closer that did not match its opener
+        self.trailing = ""
+        self._raw: list[str] = []
+        self._parts: list[str] = []
+        self._length = 0
+        self._stack: list[str] = []
+        self._in_string = False
+        self._escape = False
+        # Last point where the text can be closed into valid JSON.
+        self._safe_length = 0
+        self._safe_closers = ""
+        self._result: Any = None
+        self._parsed = False
+
+    # ------------------------------------------------------------------
+    # Feeding
+    # ------------------------------------------------------------------
+
+    def feed(self, chunk: str) -> bool:
+        """Consume *chunk*; return True once the top-level object is complete."""
+        if not chunk:
+            return self.complete
+        self._raw.append(chunk)
+        if self.complete:
+            self.trailing += chunk
+            return True
+
+        pos = 0
+        end = len(chunk)
+        if not self.started:
+            pos = chunk.find("{")
+            if pos == -1:
+                return False
+            self.started = True
+
+        emit = self._emit
+        while pos < end:
+            if self._escape:
+                self._escape = False
+                emit(chunk[pos])
+                pos += 1
+                continue
+
+            if self._in_string:
+                match = _IN_STRING.search(chunk, pos)
+                stop = end if match is None else match.start()
+                if stop > pos:
+                    body = chunk[pos:stop]
+                    emit(_escape_controls(body) if self.repair else body)
+                if match is None:
+                    break
+                char = match.group()
+                if char == '"':
+                    self._in_string = False
+                else:
+                    self._escape = True
+                emit(char)
+                pos = match.end()
+                continue
+
+            match = _STRUCTURAL.search(chunk, pos)
+            if match is None:
+                emit(chunk[pos:])
+                break
+            if match.start() > pos:
+                emit(chunk[pos : match.start()])
+            char = match.group()
+            pos = match.end()
+            if char == '"':
+                self._in_string = True
+                emit(char)
+            elif char == ",":
+                self._mark_safe()
+                emit(char)
+            elif char in _CLOSERS:
+                emit(char)
+                self._stack.append(_CLOSERS[char])
+                self._mark_safe()
+            else:
+                if not self._stack or self._stack[-1] != char:
+                    self.malformed = True
+                    emit(char)
+                    continue
+                self._stack.pop()
+                emit(char)
+                self._mark_safe()
+                if not self._stack:
+                    self.complete = True
+                    self.trailing = chunk[pos:]
+                    return True
+        return self.complete
+
+    def _emit(self, text: str) -> None:
+        self._parts.append(text)
+        self._length += len(text)
+
+    def _mark_safe(self) -> None:
+        self._safe_length = self._length
+        self._safe_closers = "".join(reversed(self._stack))
+
+    # ------------------------------------------------------------------
+    # Results
+    # ------------------------------------------------------------------
+
+    @property
+    def depth(self) -> int:
+        return len(self._stack)
+
+    def text(self) -> str:
+        """The (repaired) object text seen so far, without trailing text."""
+        if len(self._parts) > 1:
+            self._parts = ["".join(self._parts)]
+        return self._parts[0] if self._parts else ""
+
+    def raw(self) -> str:
+        """Everything fed so far, unmodified."""
+        if len(self._raw) > 1:
+            self._raw = ["".join(self._raw)]
+        return self._raw[0] if self._raw else ""
+
+    def result(self) -> Any:
+        """Parse the completed object (once).  Raises ``ValueError`` if incomplete."""
+        if not self.complete:
+            raise ValueError("JSON object is incomplete")
+        if not self._parsed:
+            self._result = json.loads(self.text())
+            self._parsed = True
+        return self._result
+
+    def partial(self) -> Any | None:
+        """Best-effort parse of the object so far, or None.
+
+        Open strings and containers are closed.  If that is not valid JSON
+        (e.g. a key or literal was cut off) the text is rolled back to the
+        last complete member.
+        """
+        if self.complete:
+            try:
+                return self.result()
+            except ValueError:
+                return None
+        if not self.started:
+            return None
+        text = self.text()
+        if self._in_string:
+            text = (text[:-1] if self._escape else text) + '"'
+        for candidate in (
+            text + "".join(reversed(self._stack)),
+            text[: self._safe_length] + self._safe_closers,
+        ):
+            try:
+                return json.loads(candidate)
+            except ValueError:
+                continue
+        return None
+
+
+def parse_partial_json(text: str) -> Any | None:
+    """Parse the first JSON object in *text*, completing it if truncated."""
+    scanner = IncrementalJSONScanner()
+    scanner.feed(text)
+    return scanner.partial()
+
+
+def loads_lenient(text: str) -> Any:
+    """``json.loads`` that also accepts the control-character quirks above.
+
+    Only a single object (optionally surrounded by whitespace) is accepted;
+    raises ``ValueError`` otherwise.
+    """
+    try:
+        return json.loads(text)
+    except ValueError:
+        pass
+    stripped = text.strip()
+    if not stripped.startswith("{"):
+        raise ValueError("Not a JSON object")
+    scanner = IncrementalJSONScanner()
+    if not scanner.feed(stripped) or scanner.trailing.strip():
+        raise ValueError("Not a single JSON object")
+    return scanner.result()
+
+
+def escape_control_chars_in_strings(text: str) -> str:
+    """Escape raw newlines, carriage returns and tabs inside JSON strings.
+
+    Works on arbitrary text (not just one object): every double-quoted
+    region is treated as a string, as a JSON parser would.
+    """
+    return _STRING.sub(lambda m: _escape_controls(m.group()), text)
@@ -0,0 +1,181 @@
+"""Tests for batched, resumable LLM judge evaluation."""
+
+import asyncio
+import json
+
+import pytest
+
+from framework.llm.mock import MockLLMProvider
+from framework.llm.provider import LLMProvider, LLMResponse
+from framework.testing.batch_eval import BatchJudgeRunner, JudgeRequest
+from framework.testing.llm_judge import LLMJudge
+
+
+class SlowJudgeProvider(LLMProvider):
+    """Async judge that passes when the prompt contains 'good'."""
+
+    def __init__(self, delay: float = 0.02, fail_on: str | None = None):
+        self.delay = delay
+        self.fail_on = fail_on
+        self.calls = 0
+        self.in_flight = 0
+        self.peak = 0
+
+    def complete(self, messages, system="", **kwargs):
+        raise NotImplementedError
+
+    def complete_with_tools(self, messages, system, tools, tool_executor, max_iterations=10):
+        raise NotImplementedError
+
+    async def acomplete(self, messages, system="", **kwargs):
+        self.calls += 1
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        prompt = messages[0]["content"]
+        if self.fail_on and self.fail_on in prompt:
+            raise RuntimeError("provider error")
+        passes = "good" in prompt
+        return LLMResponse(
+            content=json.dumps({"passes": passes, "explanation": "ok"}),
+            model="judge",
+            input_tokens=100,
+            output_tokens=10,
+        )
+
+
+def _requests(prompts: list[str]) -> list[JudgeRequest]:
+    return [
+        JudgeRequest(case_id=f"case-{i}", messages=[{"role": "user", "content": p}])
+        for i, p in enumerate(prompts)
+    ]
+
+
+def _runner(provider, **kwargs) -> BatchJudgeRunner:
+    return BatchJudgeRunner(provider, parse=LLMJudge()._parse_json_result, **kwargs)
+
+
+class TestBatchJudgeRunner:
+    def test_bounded_concurrency_and_results(self):
+        provider = SlowJudgeProvider()
+        runner = _runner(provider, concurrency=4)
+
+        report = runner.run_sync(_requests([f"good {i}" for i in range(12)]))
+
+        assert provider.peak <= 4
+        assert report.total == 12 and report.passed == 12
+        assert report.throughput > 0
+        assert report.to_dict()["latency_p95"] > 0
+
+    def test_identical_prompts_are_sent_once(self):
+        provider = SlowJudgeProvider()
+        runner = _runner(provider, input_cost_per_mtok=1.0, output_cost_per_mtok=2.0)
+
+        report = runner.run_sync(_requests(["good"] * 5 + ["bad"] * 5))
+
+        assert provider.calls == 2
+        summary = report.to_dict()
+        assert summary["deduped"] == 8
+        assert summary["passed"] == 5 and summary["failed"] == 5
+        # Only the two real calls are billed.
+        assert summary["input_tokens"] == 200
+        assert report.estimated_cost == (200 * 1.0 + 20 * 2.0) / 1_000_000
+
+    def test_resume_from_checkpoint_skips_finished_cases(self, tmp_path):
+        checkpoint = tmp_path / "suite.jsonl"
+        prompts = [f"good {i}" for i in range(6)] + ["boom"]
+
+        first = _runner(SlowJudgeProvider(fail_on="boom"), checkpoint_path=checkpoint)
+        report = first.run_sync(_requests(prompts))
+        assert report.errors == 1
+
+        provider = SlowJudgeProvider()
+        second = _runner(provider, checkpoint_path=checkpoint)
+        resumed = second.run_sync(_requests(prompts))
+
+        assert provider.calls == 1  # only the failed case is retried
+        assert resumed.errors == 0
+        assert resumed.to_dict()["resumed"] == 6
+
+    def test_edited_case_is_rejudged_on_resume(self, tmp_path):
+        checkpoint = tmp_path / "suite.jsonl"
+        _runner(SlowJudgeProvider(), checkpoint_path=checkpoint).run_sync(
+            _requests(["good 0", "good 1"])
+        )
+
+        provider = SlowJudgeProvider()
+        second = _runner(provider, checkpoint_path=checkpoint)
+        report = second.run_sync(_requests(["good 0", "bad 1"]))
+
+        assert provider.calls == 1
+        summary = report.to_dict()
+        assert summary["resumed"] == 1
+        assert summary["cases"]["case-1"]["result"]["passes"] is False
+
+    def test_run_sync_inside_event_loop_raises(self):
+        runner = _runner(SlowJudgeProvider())
+
+        async def call():
+            runner.run_sync(_requests(["good"]))
+
+        with pytest.raises(RuntimeError, match="await BatchJudgeRunner.run"):
+            asyncio.run(call())
+
+    def test_torn_checkpoint_line_is_ignored(self, tmp_path):
+        checkpoint = tmp_path / "suite.jsonl"
+        runner = _runner(SlowJudgeProvider(), checkpoint_path=checkpoint)
+        runner.run_sync(_requests(["good"]))
+        with open(checkpoint, "a") as f:
+            f.write('{"case_id": "case-1", "prompt')
+
+        assert list(runner.load_checkpoint()) == ["case-0"]
+
+    def test_uses_provider_batch_api(self):
+        class BatchingMock(MockLLMProvider):
+            def __init__(self):
+                super().__init__()
+                self.batches = []
+
+            async def acomplete_batch(self, requests):
+                self.batches.append(len(requests))
+                return [
+                    LLMResponse(content='{"passes": true, "explanation": ""}', model="m")
+                    for _ in requests
+                ]
+
+        provider = BatchingMock()
+        report = _runner(provider, batch_size=4).run_sync(_requests([str(i) for i in range(10)]))
+
+        assert provider.batches == [4, 4, 2]
+        assert report.llm_calls == 3
+        assert report.passed == 10
+
+
+class TestLLMJudgeBatch:
+    def test_evaluate_batch_matches_evaluate(self):
+        judge = LLMJudge(llm_provider=SlowJudgeProvider(delay=0))
+        cases = [
+            {
+                "id": "a",
+                "constraint": "c",
+                "source_document": "doc",
+                "summary": "good summary",
+                "criteria": "x",
+            },
+            {
+                "id": "b",
+                "constraint": "c",
+                "source_document": "doc",
+                "summary": "weak summary",
+                "criteria": "x",
+            },
+        ]
+
+        report = judge.evaluate_batch(cases)
+
+        by_id = {r.case_id: r.result for r in report.results}
+        assert by_id["a"]["passes"] is True
+        assert by_id["b"]["passes"] is False
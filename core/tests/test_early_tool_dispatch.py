@@ -0,0 +1,357 @@
+"""Tests for early tool dispatch: tool calls emitted and started mid-stream."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from framework.graph.event_loop_node import EventLoopNode, LoopConfig
+from framework.graph.node import NodeContext, NodeSpec, SharedMemory
+from framework.llm.litellm import LiteLLMProvider
+from framework.llm.provider import LLMProvider, LLMResponse, Tool, ToolResult, ToolUse
+from framework.llm.stream_events import (
+    FinishEvent,
+    StreamErrorEvent,
+    TextDeltaEvent,
+    ToolCallEvent,
+)
+from framework.runtime.core import Runtime
+
+# ---------------------------------------------------------------------------
+# LiteLLMProvider.stream: emit tool calls as soon as arguments parse
+# ---------------------------------------------------------------------------
+
+
+def _tool_delta(index: int, args: str, call_id: str = "", name: str = "") -> SimpleNamespace:
+    return SimpleNamespace(
+        index=index,
+        id=call_id or None,
+        function=SimpleNamespace(name=name or None, arguments=args),
+    )
+
+
+def _chunk(tool_calls=None, content=None, finish_reason=None) -> SimpleNamespace:
+    delta = SimpleNamespace(content=content, tool_calls=tool_calls)
+    return SimpleNamespace(
+        choices=[SimpleNamespace(delta=delta, finish_reason=finish_reason)],
+        usage=None,
+    )
+
+
+class _FakeStream:
+    """Async iterator over chunks that records how many were consumed."""
+
+    def __init__(self, chunks: list, error_after: Exception | None = None):
+        self.chunks = chunks
+        self.consumed = 0
+        self.error_after = error_after
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self.consumed >= len(self.chunks):
+            if self.error_after is not None:
+                raise self.error_after
+            raise StopAsyncIteration
+        chunk = self.chunks[self.consumed]
+        self.consumed += 1
+        return chunk
+
+
+TWO_CALLS = [
+    _chunk([_tool_delta(0, "", "call_a", "read_file")]),
+    _chunk([_tool_delta(0, '{"path": ')]),
+    _chunk([_tool_delta(0, '"a.txt"}')]),
+    _chunk([_tool_delta(1, "", "call_b", "read_file")]),
+    _chunk([_tool_delta(1, '{"path": "b.txt"')]),
+    _chunk([_tool_delta(1, "}")]),
+    _chunk(finish_reason="tool_calls"),
+]
+
+
+class TestStreamEmitsToolCallsEarly:
+    @pytest.mark.asyncio
+    async def test_tool_call_yielded_before_stream_ends(self):
+        fake = _FakeStream(TWO_CALLS)
+        llm = LiteLLMProvider(model="gpt-4o-mini", api_key="sk-fake")
+
+        seen: list[tuple[str, int]] = []
+        with patch("litellm.acompletion", return_value=fake):
+            async for event in llm.stream(messages=[{"role": "user", "content": "hi"}]):
+                seen.append((event.type, fake.consumed))
+                if isinstance(event, ToolCallEvent):
+                    assert event.tool_input["path"] in ("a.txt", "b.txt")
+
+        tool_events = [consumed for kind, consumed in seen if kind == "tool_call"]
+        assert len(tool_events) == 2
+        # First call is emitted right after its closing brace (chunk 3 of 7).
+        assert tool_events[0] == 3
+        assert seen[-1][0] == "finish"
+
+    @pytest.mark.asyncio
+    async def test_unparseable_arguments_fall_back_to_raw_at_finish(self):
+        chunks = [
+            _chunk([_tool_delta(0, '{"path": "a', "call_a", "read_file")]),
+            _chunk(finish_reason="length"),
+        ]
+        llm = LiteLLMProvider(model="gpt-4o-mini", api_key="sk-fake")
+
+        with patch("litellm.acompletion", return_value=_FakeStream(chunks)):
+            events = [e async for e in llm.stream(messages=[{"role": "user", "content": "hi"}])]
+
+        calls = [e for e in events if isinstance(e, ToolCallEvent)]
+        assert len(calls) == 1 and "_raw" in calls[0].tool_input
+
+    @pytest.mark.asyncio
+    async def test_no_retry_after_tool_call_was_emitted(self):
+        fake = _FakeStream(TWO_CALLS[:3], error_after=ConnectionError("connection reset"))
+        llm = LiteLLMProvider(model="gpt-4o-mini", api_key="sk-fake")
+
+        with patch("litellm.acompletion", return_value=fake) as acompletion:
+            events = [e async for e in llm.stream(messages=[{"role": "user", "content": "hi"}])]
+
+        assert acompletion.call_count == 1
+        assert [e.type for e in events] == ["tool_call", "error"]
+        assert isinstance(events[-1], StreamErrorEvent) and events[-1].recoverable
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_after_tool_call_is_recoverable(self):
+        from litellm.exceptions import RateLimitError
+
+        error = RateLimitError("slow down", llm_provider="openai", model="gpt-4o-mini")
+        fake = _FakeStream(TWO_CALLS[:3], error_after=error)
+        llm = LiteLLMProvider(model="gpt-4o-mini", api_key="sk-fake")
+
+        with patch("litellm.acompletion", return_value=fake) as acompletion:
+            events = [e async for e in llm.stream(messages=[{"role": "user", "content": "hi"}])]
+
+        assert acompletion.call_count == 1
+        assert [e.type for e in events] == ["tool_call", "error"]
+        assert events[-1].recoverable
+
+
+# ---------------------------------------------------------------------------
+# EventLoopNode: start read-only tools while the stream is still running
+# ---------------------------------------------------------------------------
+
+
+class SlowFinishLLM(LLMProvider):
+    """Streams tool calls, then waits before finishing the turn."""
+
+    def __init__(self, calls: list[ToolCallEvent], finish_delay: float = 0.2):
+        self.calls = calls
+        self.finish_delay = finish_delay
+        self.turn = 0
+        self.finished_at = 0.0
+
+    async def stream(self, messages, system="", tools=None, max_tokens=4096):
+        self.turn += 1
+        if self.turn > 1:
+            yield TextDeltaEvent(content="done", snapshot="done")
+            yield FinishEvent(stop_reason="stop", model="mock")
+            return
+        for call in self.calls:
+            yield call
+        await asyncio.sleep(self.finish_delay)
+        self.finished_at = time.monotonic()
+        yield FinishEvent(stop_reason="tool_calls", model="mock")
+
+    def complete(self, messages, system="", **kwargs) -> LLMResponse:
+        return LLMResponse(content="summary", model="mock")
+
+    def complete_with_tools(self, messages, system, tools, tool_executor, **kwargs):
+        return LLMResponse(content="", model="mock")
+
+
+def _ctx(llm: LLMProvider, tools: list[Tool]) -> NodeContext:
+    runtime = MagicMock(spec=Runtime)
+    spec = NodeSpec(
+        id="early",
+        name="Early",
+        description="early dispatch",
+        node_type="event_loop",
+        output_keys=[],
+        system_prompt="test",
+    )
+    return NodeContext(
+        runtime=runtime,
+        node_id=spec.id,
+        node_spec=spec,
+        memory=SharedMemory(),
+        input_data={},
+        llm=llm,
+        available_tools=tools,
+    )
+
+
+def _call(call_id: str, name: str, **tool_input: Any) -> ToolCallEvent:
+    return ToolCallEvent(tool_use_id=call_id, tool_name=name, tool_input=tool_input)
+
+
+class TestEventLoopEarlyDispatch:
+    @pytest.mark.asyncio
+    async def test_read_only_tools_start_before_stream_finishes(self):
+        started: dict[str, float] = {}
+
+        async def executor(tool_use: ToolUse) -> ToolResult:
+            started[tool_use.id] = time.monotonic()
+            await asyncio.sleep(0.01)
+            return ToolResult(tool_use_id=tool_use.id, content=f"{tool_use.name} ok")
+
+        llm = SlowFinishLLM([_call("c1", "lookup", q="a"), _call("c2", "write", q="b")])
+        tools = [
+            Tool(name="lookup", description="read", read_only=True),
+            Tool(name="write", description="side effects"),
+        ]
+        node = EventLoopNode(tool_executor=executor, config=LoopConfig(max_iterations=3))
+
+        result = await node.execute(_ctx(llm, tools))
+
+        assert result.success
+        assert started["c1"] < llm.finished_at  # started mid-stream
+        assert started["c2"] >= llm.finished_at  # waited for the full turn
+
+    @pytest.mark.asyncio
+    async def test_hard_limit_applies_to_early_starts(self):
+        async def executor(tool_use: ToolUse) -> ToolResult:
+            return ToolResult(tool_use_id=tool_use.id, content=tool_use.id)
+
+        calls = [_call(f"c{i}", "lookup", i=i) for i in range(1, 5)]
+        llm = SlowFinishLLM(calls, finish_delay=0.0)
+        node = EventLoopNode(
+            tool_executor=executor,
+            config=LoopConfig(
+                max_iterations=3, max_tool_calls_per_turn=2, tool_call_overflow_margin=0.5
+            ),
+        )
+        ctx = _ctx(llm, [Tool(name="lookup", description="read", read_only=True)])
+
+        executed: list[str] = []
+        original = node._execute_tool
+
+        async def tracking(tc):
+            executed.append(tc.tool_use_id)
+            return await original(tc)
+
+        node._execute_tool = tracking
+        await node.execute(ctx)
+
+        # Hard limit = 2 * 1.5 = 3: the fourth call never runs, early or late.
+        assert executed == ["c1", "c2", "c3"]
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_config(self):
+        started: dict[str, float] = {}
+
+        async def executor(tool_use: ToolUse) -> ToolResult:
+            started[tool_use.id] = time.monotonic()
+            return ToolResult(tool_use_id=tool_use.id, content="ok")
+
+        llm = SlowFinishLLM([_call("c1", "lookup")])
+        node = EventLoopNode(
+            tool_executor=executor,
+            config=LoopConfig(max_iterations=3, early_tool_dispatch=False),
+        )
+
+        await node.execute(_ctx(llm, [Tool(name="lookup", description="read", read_only=True)]))
+
+        assert started["c1"] >= llm.finished_at
+
+    @pytest.mark.asyncio
+    async def test_tool_started_is_published_before_completed(self):
+        order: list[tuple[str, str]] = []
+        bus = AsyncMock()
+        bus.emit_tool_call_started.side_effect = lambda **kw: order.append(
+            ("started", kw["tool_use_id"])
+        )
+        bus.emit_tool_call_completed.side_effect = lambda **kw: order.append(
+            ("completed", kw["tool_use_id"])
+        )
+
+        async def executor(tool_use: ToolUse) -> ToolResult:
+            return ToolResult(tool_use_id=tool_use.id, content="ok")
+
+        llm = SlowFinishLLM([_call("c1", "lookup")])
+        node = EventLoopNode(
+            event_bus=bus, tool_executor=executor, config=LoopConfig(max_iterations=3)
+        )
+
+        await node.execute(_ctx(llm, [Tool(name="lookup", description="read", read_only=True)]))
+
+        assert order == [("started", "c1"), ("completed", "c1")]
+
+
+class ErrorAfterToolCallLLM(SlowFinishLLM):
+    """First turn emits a tool call, then the stream fails."""
+
+    async def stream(self, messages, system="", tools=None, max_tokens=4096):
+        self.turn += 1
+        if self.turn == 1:
+            for call in self.calls:
+                yield call
+            await asyncio.sleep(self.finish_delay)
+            yield StreamErrorEvent(error="connection reset", recoverable=True)
+            return
+        if self.turn == 2:
+            for call in self.calls:
+                yield call
+            yield FinishEvent(stop_reason="tool_calls", model="mock")
+            return
+        yield TextDeltaEvent(content="done", snapshot="done")
+        yield FinishEvent(stop_reason="stop", model="mock")
+
+
+class TestStreamErrorAfterEarlyDispatch:
+    @pytest.mark.asyncio
+    async def test_early_tools_are_cancelled_and_the_turn_retried(self):
+        started: list[str] = []
+        finished: list[str] = []
+
+        async def executor(tool_use: ToolUse) -> ToolResult:
+            started.append(tool_use.id)
+            await asyncio.sleep(0.05)
+            finished.append(tool_use.id)
+            return ToolResult(tool_use_id=tool_use.id, content="ok")
+
+        bus = AsyncMock()
+        llm = ErrorAfterToolCallLLM([_call("c1", "lookup")], finish_delay=0.01)
+        node = EventLoopNode(
+            event_bus=bus,
+            tool_executor=executor,
+            config=LoopConfig(max_iterations=5, stream_retry_backoff_base=0.0),
+        )
+
+        result = await node.execute(
+            _ctx(llm, [Tool(name="lookup", description="read", read_only=True)])
+        )
+
+        assert result.success
+        assert llm.turn == 3  # failed turn, retried turn, final answer
+        assert started == ["c1", "c1"]
+        assert finished == ["c1"]  # the first run was cancelled
+        completed = [c.kwargs for c in bus.emit_tool_call_completed.await_args_list]
+        assert [c["is_error"] for c in completed] == [True, False]
+        assert bus.emit_tool_call_started.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_abandoned_early_tools_get_a_completed_event(self):
+        bus = AsyncMock()
+        node = EventLoopNode(event_bus=bus)
+        task = asyncio.ensure_future(asyncio.sleep(10))
+
+        await node._abandon_early_tools(
+            "s", "n", [_call("c1", "lookup")], {"c1": task}, "Tool call cancelled: unused."
+        )
+
+        assert task.cancelled()
+        bus.emit_tool_call_completed.assert_awaited_once()
+        completed = bus.emit_tool_call_completed.await_args.kwargs
+        assert completed["tool_use_id"] == "c1" and completed["tool_name"] == "lookup"
+        assert completed["result"] == "Tool call cancelled: unused."
+        assert completed["is_error"] is True
@@ -364,6 +364,16 @@ async def test_missing_keys_triggers_retry(self, runtime, node_spec, memory):
         assert result.success is True
         assert result.output["result"] == "done"
 
+    def test_truncated_args_recover_a_non_string_value(self):
+        """Truncated set_output JSON with a numeric value is recovered, not crashed on."""
+        node = EventLoopNode()
+        tool_input = {"_raw": '{"key": "count", "value": 42'}
+
+        result = node._handle_set_output(tool_input, ["count"])
+
+        assert not result.is_error
+        assert tool_input["key"] == "count" and tool_input["value"] == 42
+
 
 # ===========================================================================
 # Stall detection
@@ -254,8 +254,8 @@ async def test_event_loop_max_retries_positive_logs_warning(runtime, caplog):
 
 
 def test_existing_node_types_unchanged():
-    """Only event_loop is a valid node type."""
-    expected = {"event_loop"}
+    """Only event_loop and map are valid node types."""
+    expected = {"event_loop", "map"}
     assert expected == GraphExecutor.VALID_NODE_TYPES
 
     # Default node_type is event_loop
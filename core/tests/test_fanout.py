@@ -12,6 +12,7 @@
 - Single-edge paths unaffected
 """
 
+import asyncio
 from unittest.mock import MagicMock
 
 import pytest
@@ -19,7 +20,7 @@
 from framework.graph.edge import EdgeCondition, EdgeSpec, GraphSpec
 from framework.graph.executor import GraphExecutor, ParallelExecutionConfig
 from framework.graph.goal import Goal
-from framework.graph.node import NodeContext, NodeProtocol, NodeResult, NodeSpec
+from framework.graph.node import NodeContext, NodeProtocol, NodeResult, NodeSpec, SharedMemory
 from framework.runtime.core import Runtime
 
 # --- Test node implementations ---
@@ -492,3 +493,256 @@ async def test_parallel_disabled_uses_sequential(runtime, goal):
     # Only one branch should have executed (sequential follows first edge)
     executed_count = sum([b1_impl.executed, b2_impl.executed])
     assert executed_count == 1
+
+
+# === 12. Memory conflict strategies ===
+
+
+class DelayedWriteNode(NodeProtocol):
+    """Sleeps, records what it could see of another branch, then writes."""
+
+    def __init__(self, delay: float, output: dict, peek: str):
+        self.delay = delay
+        self._output = output
+        self.peek = peek
+        self.seen = "unset"
+
+    async def execute(self, ctx: NodeContext) -> NodeResult:
+        await asyncio.sleep(self.delay)
+        self.seen = ctx.memory.read(self.peek)
+        return NodeResult(success=True, output=self._output, tokens_used=1, latency_ms=1)
+
+
+def _conflict_graph() -> GraphSpec:
+    branches = [
+        NodeSpec(
+            id=b,
+            name=b.upper(),
+            description=b,
+            node_type="event_loop",
+            output_keys=["shared", f"{b}_out"],
+        )
+        for b in ("b1", "b2")
+    ]
+    return _make_fanout_graph(branches)
+
+
+def _register_conflicting_branches(executor: GraphExecutor) -> tuple:
+    # b2 finishes first; b1 writes last in wall-clock time.
+    b1 = DelayedWriteNode(0.05, {"shared": "from b1", "b1_out": 1}, peek="b2_out")
+    b2 = DelayedWriteNode(0.0, {"shared": "from b2", "b2_out": 2}, peek="b1_out")
+    executor.register_node("source", SuccessNode({"data": "x"}))
+    executor.register_node("b1", b1)
+    executor.register_node("b2", b2)
+    return b1, b2
+
+
+@pytest.mark.asyncio
+async def test_branch_writes_merge_in_edge_order(runtime, goal):
+    """last_wins follows edge order, not completion order; branches are isolated."""
+    executor = GraphExecutor(runtime=runtime, enable_parallel_execution=True)
+    b1, b2 = _register_conflicting_branches(executor)
+    memory = SharedMemory()
+
+    await executor._execute_parallel_branches(
+        graph=_conflict_graph(),
+        goal=goal,
+        edges=_conflict_graph().get_outgoing_edges("source"),
+        memory=memory,
+        source_result=NodeResult(success=True, output={"data": "x"}),
+        source_node_spec=None,
+        path=[],
+    )
+
+    assert memory.read("shared") == "from b2"
+    assert memory.read("b1_out") == 1 and memory.read("b2_out") == 2
+    assert b1.seen is None  # b2's write was not visible to b1 mid-flight
+
+
+@pytest.mark.asyncio
+async def test_error_strategy_fails_on_conflicting_writes(runtime, goal):
+    executor = GraphExecutor(
+        runtime=runtime,
+        enable_parallel_execution=True,
+        parallel_config=ParallelExecutionConfig(memory_conflict_strategy="error"),
+    )
+    _register_conflicting_branches(executor)
+
+    result = await executor.execute(_conflict_graph(), goal, {})
+
+    assert not result.success
+    assert "shared" in result.error
+
+
+# === 13. Scheduling: concurrency caps, timeouts, convergence modes ===
+
+
+class SleepNode(NodeProtocol):
+    """Sleeps, tracking how many SleepNodes run at the same time."""
+
+    running = 0
+    peak = 0
+
+    def __init__(self, delay: float, output: dict | None = None):
+        self.delay = delay
+        self._output = output or {}
+        self.finished = False
+
+    async def execute(self, ctx: NodeContext) -> NodeResult:
+        SleepNode.running += 1
+        SleepNode.peak = max(SleepNode.peak, SleepNode.running)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            SleepNode.running -= 1
+        self.finished = True
+        return NodeResult(success=True, output=self._output, tokens_used=1, latency_ms=1)
+
+
+def _sleep_graph(delays: list[float], **source_kwargs) -> tuple[GraphSpec, list[SleepNode]]:
+    SleepNode.running = SleepNode.peak = 0
+    specs = [
+        NodeSpec(
+            id=f"b{i}",
+            name=f"B{i}",
+            description="branch",
+            node_type="event_loop",
+            output_keys=[f"b{i}_out"],
+        )
+        for i in range(len(delays))
+    ]
+    source = NodeSpec(
+        id="source",
+        name="Source",
+        description="entry",
+        node_type="event_loop",
+        output_keys=["data"],
+        **source_kwargs,
+    )
+    impls = [SleepNode(d, {f"b{i}_out": i}) for i, d in enumerate(delays)]
+    return _make_fanout_graph(specs, source_node=source), impls
+
+
+def _executor(runtime, graph_impls, **config) -> GraphExecutor:
+    executor = GraphExecutor(
+        runtime=runtime,
+        enable_parallel_execution=True,
+        parallel_config=ParallelExecutionConfig(**config),
+    )
+    executor.register_node("source", SuccessNode({"data": "x"}))
+    for i, impl in enumerate(graph_impls):
+        executor.register_node(f"b{i}", impl)
+    return executor
+
+
+@pytest.mark.asyncio
+async def test_max_parallel_branches_caps_concurrency(runtime, goal):
+    graph, impls = _sleep_graph([0.02] * 5)
+    graph.max_parallel_branches = 4  # graph-level setting
+    executor = _executor(runtime, impls)
+
+    result = await executor.execute(graph, goal, {})
+
+    assert result.success
+    assert SleepNode.peak == 4
+    assert [t.status for t in result.branch_timings] == ["completed"] * 5
+    assert max(t.queued_ms for t in result.branch_timings) >= 15
+
+
+@pytest.mark.asyncio
+async def test_node_level_cap_overrides_graph(runtime, goal):
+    graph, impls = _sleep_graph([0.01] * 3, max_parallel_branches=1)
+    graph.max_parallel_branches = 3
+
+    result = await _executor(runtime, impls).execute(graph, goal, {})
+
+    assert result.success and SleepNode.peak == 1
+
+
+@pytest.mark.asyncio
+async def test_quorum_continues_early_and_cancels_the_rest(runtime, goal):
+    graph, impls = _sleep_graph([0.0, 0.01, 5.0])
+    executor = _executor(runtime, impls, convergence_mode="quorum", quorum=2)
+
+    result = await asyncio.wait_for(executor.execute(graph, goal, {}), timeout=2)
+
+    assert result.success
+    assert not impls[2].finished
+    assert result.output.get("b2_out") is None
+    assert {t.node_id: t.status for t in result.branch_timings} == {
+        "b0": "completed",
+        "b1": "completed",
+        "b2": "cancelled",
+    }
+    assert "b2" not in result.path
+
+
+@pytest.mark.asyncio
+async def test_quorum_unreachable_fails(runtime, goal):
+    graph, impls = _sleep_graph([0.0, 0.0])
+    impls[1] = FailNode()
+    executor = _executor(runtime, impls, convergence_mode="quorum", quorum=2)
+
+    result = await executor.execute(graph, goal, {})
+
+    assert not result.success
+    assert "quorum of 2 not reached" in result.error
+
+
+@pytest.mark.asyncio
+async def test_branch_timeout_from_node_spec(runtime, goal):
+    graph, impls = _sleep_graph([0.0, 5.0])
+    graph.get_node("b1").branch_timeout_seconds = 0.05
+    executor = _executor(runtime, impls, on_branch_failure="continue_others")
+
+    result = await asyncio.wait_for(executor.execute(graph, goal, {}), timeout=2)
+
+    assert result.success
+    assert [t.status for t in result.branch_timings] == ["completed", "timed_out"]
+    assert result.output.get("b0_out") == 0
+
+
+def test_branches_have_no_timeout_by_default(runtime):
+    executor = _executor(runtime, [])
+
+    assert ParallelExecutionConfig().branch_timeout_seconds is None
+    assert executor._branch_timeout(NodeSpec(id="n", name="n", description="")) is None
+
+
+@pytest.mark.asyncio
+async def test_fan_in_merges_in_edge_order_whatever_finishes_first(runtime, goal):
+    graph, impls = _sleep_graph([0.05, 0.0])
+    executor = _executor(runtime, impls)
+    memory = SharedMemory()
+    merges: list[list[str]] = []
+    original_merge = memory.merge
+
+    def recording_merge(branches, strategy="last_wins"):
+        merges.append([label for label, _ in branches])
+        return original_merge(branches, strategy)
+
+    memory.merge = recording_merge
+    await executor._execute_parallel_branches(
+        graph=graph,
+        goal=goal,
+        edges=graph.get_outgoing_edges("source"),
+        memory=memory,
+        source_result=NodeResult(success=True, output={"data": "x"}),
+        source_node_spec=None,
+        path=[],
+    )
+
+    # b1 finished first, but both are merged once, in declared order.
+    assert merges == [["b0", "b1"]]
+    assert memory.read("b0_out") == 0 and memory.read("b1_out") == 1
+
+
+@pytest.mark.asyncio
+async def test_unknown_convergence_mode_is_rejected(runtime, goal):
+    graph, impls = _sleep_graph([0.0, 0.0])
+    executor = _executor(runtime, impls, convergence_mode="streaming")
+
+    result = await executor.execute(graph, goal, {})
+
+    assert not result.success
+    assert "Unknown fan-out convergence mode: 'streaming'" in result.error
@@ -0,0 +1,140 @@
+"""Tests for the incremental JSON scanner used for streamed LLM output."""
+
+from __future__ import annotations
+
+import json
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from framework.llm.litellm import LiteLLMProvider
+from framework.llm.stream_events import ToolCallEvent
+from framework.utils.json_stream import (
+    IncrementalJSONScanner,
+    escape_control_chars_in_strings,
+    loads_lenient,
+    parse_partial_json,
+)
+
+
+def _feed_all(text: str, size: int) -> IncrementalJSONScanner:
+    scanner = IncrementalJSONScanner()
+    for i in range(0, len(text), size):
+        scanner.feed(text[i : i + size])
+    return scanner
+
+
+class TestScanner:
+    @pytest.mark.parametrize("size", [1, 2, 3, 7, 1000])
+    def test_any_chunking_gives_the_same_result(self, size):
+        doc = {"a": 'x\\"}{', "b": [1, {"c": "]"}], "d": "line\\nbreak"}
+        text = "prefix " + json.dumps(doc) + " trailing"
+
+        scanner = _feed_all(text, size)
+
+        assert scanner.complete
+        assert scanner.result() == doc
+        assert scanner.trailing == " trailing"
+
+    def test_raw_control_characters_are_escaped(self):
+        scanner = _feed_all('{"body": "line 1\nline 2\ttab"}', 4)
+
+        assert scanner.result() == {"body": "line 1\nline 2\ttab"}
+
+    def test_repair_disabled_keeps_text_exact(self):
+        text = '{"body": "a\nb"}'
+        scanner = IncrementalJSONScanner(repair=False)
+        scanner.feed(text)
+
+        assert scanner.complete and scanner.text() == text
+
+    def test_result_before_completion_raises(self):
+        scanner = IncrementalJSONScanner()
+        scanner.feed('{"a": 1')
+
+        assert not scanner.complete and scanner.depth == 1
+        with pytest.raises(ValueError):
+            scanner.result()
+
+
+class TestPartial:
+    def test_open_string_and_containers_are_closed(self):
+        assert parse_partial_json('{"a": [1, 2], "b": "hal') == {"a": [1, 2], "b": "hal"}
+
+    def test_unfinished_member_is_dropped(self):
+        assert parse_partial_json('{"a": 1, "b": tr') == {"a": 1}
+        assert parse_partial_json('{"a": 1, "b') == {"a": 1}
+
+    def test_dangling_escape_is_dropped(self):
+        assert parse_partial_json('{"a": "x\\') == {"a": "x"}
+
+    def test_no_object(self):
+        assert parse_partial_json("no json here") is None
+
+
+class TestHelpers:
+    def test_loads_lenient(self):
+        assert loads_lenient("[1, 2]") == [1, 2]
+        assert loads_lenient(' {"a": "x\ny"} ') == {"a": "x\ny"}
+        with pytest.raises(ValueError):
+            loads_lenient('{"a": 1} extra')
+        with pytest.raises(ValueError):
+            loads_lenient('{"a": 1')
+
+    def test_escape_only_touches_strings(self):
+        text = '{\n  "a": "x\ny",\n  "b": "\\"q\n"\n}'
+
+        fixed = escape_control_chars_in_strings(text)
+
+        assert fixed == '{\n  "a": "x\\ny",\n  "b": "\\"q\\n"\n}'
+        assert json.loads(fixed) == {"a": "x\ny", "b": '"q\n'}
+
+
+def _tool_delta(index: int, args: str, call_id: str = "", name: str = "") -> SimpleNamespace:
+    return SimpleNamespace(
+        index=index,
+        id=call_id or None,
+        function=SimpleNamespace(name=name or None, arguments=args),
+    )
+
+
+def _chunk(tool_calls=None, finish_reason=None) -> SimpleNamespace:
+    delta = SimpleNamespace(content=None, tool_calls=tool_calls)
+    return SimpleNamespace(
+        choices=[SimpleNamespace(delta=delta, finish_reason=finish_reason)],
+        usage=None,
+    )
+
+
+class _FakeStream:
+    def __init__(self, chunks: list):
+        self.chunks = iter(chunks)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self.chunks)
+        except StopIteration:
+            raise StopAsyncIteration from None
+
+
+class TestStreamedToolArguments:
+    @pytest.mark.asyncio
+    async def test_raw_newlines_in_arguments_are_repaired(self):
+        chunks = [
+            _chunk([_tool_delta(0, "", "call_a", "write_file")]),
+            _chunk([_tool_delta(0, '{"path": "a.md", "content": "# Title')]),
+            _chunk([_tool_delta(0, '\n\nBody\n"}')]),
+            _chunk(finish_reason="tool_calls"),
+        ]
+        llm = LiteLLMProvider(model="gpt-4o-mini", api_key="sk-fake")
+
+        with patch("litellm.acompletion", return_value=_FakeStream(chunks)):
+            events = [e async for e in llm.stream(messages=[{"role": "user", "content": "hi"}])]
+
+        calls = [e for e in events if isinstance(e, ToolCallEvent)]
+        assert len(calls) == 1
+        assert calls[0].tool_input == {"path": "a.md", "content": "# Title\n\nBody\n"}
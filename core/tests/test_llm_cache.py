@@ -0,0 +1,220 @@
+"""Tests for the content-addressed LLM response cache."""
+
+import asyncio
+import json
+import os
+import time
+
+import pytest
+
+from framework.llm.cache import (
+    CachingLLMProvider,
+    LLMResponseCache,
+    build_response_cache,
+    make_cache_key,
+)
+from framework.llm.mock import MockLLMProvider
+from framework.llm.provider import LLMResponse, Tool
+
+
+class CountingMockProvider(MockLLMProvider):
+    """MockLLMProvider that counts calls and can be slowed down."""
+
+    def __init__(self, delay: float = 0.0, content: str | None = None):
+        super().__init__()
+        self.calls = 0
+        self.delay = delay
+        self.content = content
+
+    def complete(self, messages, system="", **kwargs):
+        self.calls += 1
+        if self.delay:
+            time.sleep(self.delay)
+        response = super().complete(messages, system=system, **kwargs)
+        if self.content is not None:
+            response.content = self.content
+        return response
+
+    async def acomplete(self, messages, system="", **kwargs):
+        self.calls += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        response = MockLLMProvider.complete(self, messages, system=system, **kwargs)
+        if self.content is not None:
+            response.content = self.content
+        return response
+
+
+MESSAGES = [{"role": "user", "content": "Route this"}]
+
+
+class TestCacheKey:
+    def test_key_is_stable(self):
+        assert make_cache_key("m", MESSAGES) == make_cache_key("m", list(MESSAGES))
+
+    def test_key_depends_on_inputs(self):
+        base = make_cache_key("m", MESSAGES)
+        assert make_cache_key("other", MESSAGES) != base
+        assert make_cache_key("m", MESSAGES, system="s") != base
+        assert make_cache_key("m", MESSAGES, max_tokens=5) != base
+        assert make_cache_key("m", MESSAGES, json_mode=True) != base
+        assert make_cache_key("m", MESSAGES, tools=[Tool(name="t", description="d")]) != base
+
+
+class TestCachingProvider:
+    def test_sync_hit_skips_provider(self):
+        inner = CountingMockProvider()
+        llm = CachingLLMProvider(inner)
+
+        first = llm.complete(MESSAGES, system="s")
+        second = llm.complete(MESSAGES, system="s")
+
+        assert inner.calls == 1
+        assert second.content == first.content
+        assert llm.stats.hits == 1
+        assert llm.stats.misses == 1
+
+    @pytest.mark.asyncio
+    async def test_async_hit_skips_provider(self):
+        inner = CountingMockProvider()
+        llm = CachingLLMProvider(inner)
+
+        await llm.acomplete(MESSAGES, json_mode=True)
+        await llm.acomplete(MESSAGES, json_mode=True)
+        await llm.acomplete(MESSAGES, json_mode=False)
+
+        assert inner.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_requests_are_coalesced(self):
+        inner = CountingMockProvider(delay=0.05)
+        llm = CachingLLMProvider(inner)
+
+        results = await asyncio.gather(*(llm.acomplete(MESSAGES) for _ in range(10)))
+
+        assert inner.calls == 1
+        assert len({r.content for r in results}) == 1
+        assert llm.stats.coalesced == 9
+
+    @pytest.mark.asyncio
+    async def test_waiter_takes_over_when_leader_is_cancelled(self):
+        inner = CountingMockProvider(delay=0.05)
+        llm = CachingLLMProvider(inner)
+
+        leader = asyncio.create_task(llm.acomplete(MESSAGES))
+        await asyncio.sleep(0)
+        waiters = [asyncio.create_task(llm.acomplete(MESSAGES)) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        leader.cancel()
+
+        results = await asyncio.gather(*waiters)
+
+        assert leader.cancelled()
+        assert len({r.content for r in results}) == 1
+        assert inner.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_sync_calls_from_threads_are_coalesced(self):
+        inner = CountingMockProvider(delay=0.05)
+        llm = CachingLLMProvider(inner)
+        loop = asyncio.get_running_loop()
+
+        await asyncio.gather(
+            *(loop.run_in_executor(None, lambda: llm.complete(MESSAGES)) for _ in range(5))
+        )
+
+        assert inner.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_leader_error_propagates_and_is_not_cached(self):
+        class FailingProvider(CountingMockProvider):
+            async def acomplete(self, messages, system="", **kwargs):
+                self.calls += 1
+                raise RuntimeError("boom")
+
+        inner = FailingProvider()
+        llm = CachingLLMProvider(inner)
+
+        with pytest.raises(RuntimeError):
+            await llm.acomplete(MESSAGES)
+        with pytest.raises(RuntimeError):
+            await llm.acomplete(MESSAGES)
+        assert inner.calls == 2
+
+    def test_empty_responses_are_not_cached(self):
+        inner = CountingMockProvider(content="")
+        llm = CachingLLMProvider(inner)
+
+        llm.complete(MESSAGES)
+        llm.complete(MESSAGES)
+
+        assert inner.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_stream_passes_through(self):
+        inner = CountingMockProvider()
+        llm = CachingLLMProvider(inner)
+
+        events = [e async for e in llm.stream(MESSAGES)]
+
+        assert events[-1].type == "finish"
+        assert llm.stats.hits == 0 and llm.stats.misses == 0
+
+
+class TestResponseCache:
+    def test_lru_eviction(self):
+        cache = LLMResponseCache(max_entries=2)
+        for key in ("a", "b", "c"):
+            cache.put(key, LLMResponse(content=key, model="m"))
+
+        assert len(cache) == 2
+        assert cache.get("a") is None
+        assert cache.get("c").content == "c"
+        assert cache.stats.evictions == 1
+
+    def test_ttl_expiry(self):
+        cache = LLMResponseCache(ttl_seconds=0.01)
+        cache.put("k", LLMResponse(content="v", model="m"))
+        time.sleep(0.02)
+
+        assert cache.get("k") is None
+        assert cache.stats.expired == 1
+
+    def test_disk_store_survives_new_instance(self, tmp_path):
+        LLMResponseCache(cache_dir=tmp_path).put("abcd", LLMResponse(content="v", model="m"))
+
+        fresh = LLMResponseCache(cache_dir=tmp_path)
+        hit = fresh.get("abcd")
+
+        assert hit is not None and hit.content == "v"
+        assert fresh.stats.disk_hits == 1
+
+    def test_disk_ttl_removes_file(self, tmp_path):
+        cache = LLMResponseCache(cache_dir=tmp_path, ttl_seconds=60)
+        cache.put("abcd", LLMResponse(content="v", model="m"))
+        path = tmp_path / "ab" / "abcd.json"
+        data = json.loads(path.read_text())
+        data["stored_at"] -= 120
+        path.write_text(json.dumps(data))
+
+        assert LLMResponseCache(cache_dir=tmp_path, ttl_seconds=60).get("abcd") is None
+        assert not path.exists()
+
+    def test_disk_size_eviction_drops_oldest(self, tmp_path):
+        cache = LLMResponseCache(cache_dir=tmp_path, max_disk_bytes=600)
+        for i in range(10):
+            cache.put(f"{i:04d}", LLMResponse(content="x" * 50, model="m"))
+            path = tmp_path / f"{i:04d}"[:2] / f"{i:04d}.json"
+            os.utime(path, (i, i))
+
+        remaining = sorted(p.stem for p in tmp_path.glob("*/*.json"))
+        total = sum(p.stat().st_size for p in tmp_path.glob("*/*.json"))
+        assert total <= 600
+        assert "0009" in remaining and "0000" not in remaining
+
+    def test_build_from_config(self, tmp_path):
+        cache = build_response_cache({"dir": str(tmp_path), "max_entries": 3, "ttl_seconds": 5})
+        assert cache.cache_dir == tmp_path
+        assert cache.max_entries == 3
+
+        assert build_response_cache({"dir": False}).cache_dir is None
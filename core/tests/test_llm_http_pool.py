@@ -0,0 +1,217 @@
+"""Tests for the pooled LLM HTTP session.
+
+Runs LiteLLMProvider against a local fake OpenAI-compatible server, so no
+API keys are needed.  Socket reuse is checked through the client ports the
+server sees.
+
+Run with:
+    cd core
+    pytest tests/test_llm_http_pool.py -v -s
+"""
+
+import asyncio
+import json
+from contextlib import asynccontextmanager
+
+import pytest
+
+from framework.llm.http_pool import HTTPPoolConfig, LLMHttpPool
+from framework.llm.litellm import LiteLLMProvider
+
+web = pytest.importorskip("aiohttp.web")
+
+CONCURRENT_STREAMS = 200
+
+
+class FakeOpenAIServer:
+    """Minimal /v1/chat/completions server that streams SSE chunks."""
+
+    def __init__(self, token_delay: float = 0.005, tokens: int = 5):
+        self.token_delay = token_delay
+        self.tokens = tokens
+        self.connections: set[tuple] = set()
+        self.requests = 0
+        self.max_concurrent = 0
+        self._concurrent = 0
+        self._runner: web.AppRunner | None = None
+        self.base_url = ""
+
+    async def _chat(self, request: web.Request) -> web.StreamResponse:
+        self.requests += 1
+        self._concurrent += 1
+        self.max_concurrent = max(self.max_concurrent, self._concurrent)
+        self.connections.add(request.transport.get_extra_info("peername"))
+        try:
+            body = await request.json()
+            if not body.get("stream"):
+                await asyncio.sleep(self.token_delay)
+                return web.json_response(_completion("ok"))
+
+            resp = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+            await resp.prepare(request)
+            for i in range(self.tokens):
+                await asyncio.sleep(self.token_delay)
+                await resp.write(_sse(_chunk({"content": f"t{i} "})))
+            await resp.write(_sse(_chunk({}, finish_reason="stop")))
+            await resp.write(b"data: [DONE]\n\n")
+            await resp.write_eof()
+            return resp
+        finally:
+            self._concurrent -= 1
+
+    async def start(self) -> None:
+        app = web.Application()
+        app.router.add_post("/v1/chat/completions", self._chat)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0, backlog=1024)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.base_url = f"http://127.0.0.1:{port}/v1"
+
+    async def stop(self) -> None:
+        if self._runner:
+            await self._runner.cleanup()
+
+
+def _sse(payload: dict) -> bytes:
+    return f"data: {json.dumps(payload)}\n\n".encode()
+
+
+def _chunk(delta: dict, finish_reason: str | None = None) -> dict:
+    return {
+        "id": "chatcmpl-fake",
+        "object": "chat.completion.chunk",
+        "created": 0,
+        "model": "fake",
+        "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+    }
+
+
+def _completion(content: str) -> dict:
+    return {
+        "id": "chatcmpl-fake",
+        "object": "chat.completion",
+        "created": 0,
+        "model": "fake",
+        "choices": [
+            {
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop",
+            }
+        ],
+        "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+    }
+
+
+@asynccontextmanager
+async def running_server():
+    server = FakeOpenAIServer()
+    await server.start()
+    try:
+        yield server
+    finally:
+        await server.stop()
+
+
+def _provider(server: FakeOpenAIServer, pool: LLMHttpPool | None) -> LiteLLMProvider:
+    return LiteLLMProvider(
+        model="openai/fake-model",
+        api_key="sk-fake",
+        api_base=server.base_url,
+        http_pool=pool,
+    )
+
+
+async def _one_stream(llm: LiteLLMProvider) -> None:
+    text = ""
+    async for event in llm.stream(messages=[{"role": "user", "content": "hi"}]):
+        if event.type == "text_delta":
+            text = event.snapshot
+    assert text.startswith("t0")
+
+
+class TestHTTPPoolConfig:
+    def test_from_dict_ignores_unknown_keys(self):
+        cfg = HTTPPoolConfig.from_dict({"max_connections_per_host": 7, "bogus": 1})
+        assert cfg.max_connections_per_host == 7
+
+    @pytest.mark.asyncio
+    async def test_client_reused_within_loop(self):
+        pool = LLMHttpPool()
+        assert pool.client() is pool.client()
+        await pool.aclose()
+
+    @pytest.mark.asyncio
+    async def test_non_injectable_provider_returns_none(self):
+        pool = LLMHttpPool()
+        assert pool.litellm_client("ollama/llama3") is None
+        await pool.aclose()
+
+
+class TestPooledProvider:
+    @pytest.mark.asyncio
+    async def test_acomplete_uses_pool(self):
+        async with running_server() as fake_server:
+            pool = LLMHttpPool()
+            llm = _provider(fake_server, pool)
+
+            response = await llm.acomplete(messages=[{"role": "user", "content": "hi"}])
+
+            assert response.content == "ok"
+            assert pool.requests_started == 1
+            await pool.aclose()
+
+    @pytest.mark.asyncio
+    async def test_connections_are_reused_across_requests(self):
+        async with running_server() as fake_server:
+            pool = LLMHttpPool()
+            llm = _provider(fake_server, pool)
+
+            for _ in range(5):
+                await _one_stream(llm)
+
+            assert pool.requests_started == 5
+            assert len(fake_server.connections) == 1
+            await pool.aclose()
+
+    @pytest.mark.asyncio
+    async def test_per_host_limit_caps_concurrency(self):
+        async with running_server() as fake_server:
+            pool = LLMHttpPool(HTTPPoolConfig(max_connections_per_host=4))
+            llm = _provider(fake_server, pool)
+
+            await asyncio.gather(*(_one_stream(llm) for _ in range(12)))
+
+            assert fake_server.requests == 12
+            assert fake_server.max_concurrent <= 4
+            assert pool.in_flight() == {}
+            await pool.aclose()
+
+
+class TestConcurrentStreams:
+    """CONCURRENT_STREAMS streams at once through one pool."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_streams_reuse_pooled_connections(self):
+        async with running_server() as fake_server:
+            pool = LLMHttpPool(
+                HTTPPoolConfig(
+                    max_connections=CONCURRENT_STREAMS,
+                    max_connections_per_host=CONCURRENT_STREAMS,
+                )
+            )
+            llm = _provider(fake_server, pool)
+
+            await asyncio.gather(*(_one_stream(llm) for _ in range(CONCURRENT_STREAMS)))
+            first_burst = set(fake_server.connections)
+            await asyncio.gather(*(_one_stream(llm) for _ in range(CONCURRENT_STREAMS)))
+
+            assert pool.requests_started == fake_server.requests == 2 * CONCURRENT_STREAMS
+            assert len(pool._clients) == 1
+            # Never more than one socket per concurrent stream, and the second
+            # burst runs entirely on sockets the first one opened.
+            assert len(first_burst) <= CONCURRENT_STREAMS
+            assert fake_server.connections == first_burst
+            await pool.aclose()
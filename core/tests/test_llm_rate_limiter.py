@@ -0,0 +1,273 @@
+"""Tests for the proactive LLM rate limiter and adaptive concurrency governor."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from litellm.exceptions import RateLimitError
+
+from framework.llm.litellm import LiteLLMProvider
+from framework.llm.rate_limiter import (
+    LLMPriority,
+    LLMRateLimiter,
+    RateLimitConfig,
+    TokenBucket,
+    current_llm_priority,
+    llm_priority,
+)
+
+
+def _response(content: str = "ok", prompt_tokens: int = 10, completion_tokens: int = 5):
+    response = MagicMock()
+    response.choices = [MagicMock()]
+    response.choices[0].message.content = content
+    response.choices[0].message.tool_calls = None
+    response.choices[0].finish_reason = "stop"
+    response.model = "gpt-4o-mini"
+    response.usage.prompt_tokens = prompt_tokens
+    response.usage.completion_tokens = completion_tokens
+    return response
+
+
+class TestTokenBucket:
+    def test_wait_time_after_draining(self):
+        bucket = TokenBucket(per_minute=60)  # one token per second
+        bucket.take(60)
+
+        assert bucket.wait_time(1) == pytest.approx(1.0, abs=0.05)
+
+    def test_adjust_refunds_overestimate(self):
+        bucket = TokenBucket(per_minute=600)
+        bucket.take(500)
+        bucket.adjust(-400)
+
+        assert bucket.wait_time(400) == 0.0
+
+
+class TestPriority:
+    def test_context_var_default_and_override(self):
+        assert current_llm_priority() == LLMPriority.NORMAL
+        with llm_priority(LLMPriority.BACKGROUND):
+            assert current_llm_priority() == LLMPriority.BACKGROUND
+        assert current_llm_priority() == LLMPriority.NORMAL
+
+    @pytest.mark.asyncio
+    async def test_waiters_admitted_in_priority_order(self):
+        limiter = LLMRateLimiter(RateLimitConfig(max_concurrency=1))
+        order: list[str] = []
+        release = asyncio.Event()
+
+        async def holder():
+            async with limiter.acquire("m"):
+                await release.wait()
+
+        async def request(name: str, priority: LLMPriority):
+            async with limiter.acquire("m", priority=priority):
+                order.append(name)
+
+        first = asyncio.create_task(holder())
+        await asyncio.sleep(0)
+        waiters = [
+            asyncio.create_task(request("background", LLMPriority.BACKGROUND)),
+            asyncio.create_task(request("normal", LLMPriority.NORMAL)),
+            asyncio.create_task(request("interactive", LLMPriority.INTERACTIVE)),
+        ]
+        await asyncio.sleep(0.01)
+        release.set()
+        await asyncio.gather(first, *waiters)
+
+        assert order == ["interactive", "normal", "background"]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_leak_slot(self):
+        limiter = LLMRateLimiter(RateLimitConfig(max_concurrency=1))
+
+        async with limiter.acquire("m"):
+            waiter = asyncio.create_task(limiter.acquire("m").__aenter__())
+            await asyncio.sleep(0)
+            waiter.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiter
+
+        stats = limiter.stats()["m"]
+        assert stats["in_flight"] == 0
+        assert stats["queued"] == 0
+
+
+class TestGovernor:
+    @pytest.mark.asyncio
+    async def test_rate_limit_halves_concurrency_and_pauses(self):
+        limiter = LLMRateLimiter(RateLimitConfig(max_concurrency=8))
+
+        async with limiter.acquire("m") as lease:
+            lease.record_rate_limited(0.05)
+
+        assert limiter.stats()["m"]["limit"] == 4
+        start = time.monotonic()
+        async with limiter.acquire("m"):
+            pass
+        assert time.monotonic() - start >= 0.04
+
+    @pytest.mark.asyncio
+    async def test_success_grows_limit_back(self):
+        limiter = LLMRateLimiter(RateLimitConfig(max_concurrency=4))
+        async with limiter.acquire("m") as lease:
+            lease.record_rate_limited(0)
+        assert limiter.stats()["m"]["limit"] == 2
+
+        for _ in range(10):
+            async with limiter.acquire("m"):
+                pass
+
+        assert limiter.stats()["m"]["limit"] == 4
+
+    @pytest.mark.asyncio
+    async def test_request_bucket_throttles_before_the_provider(self):
+        limiter = LLMRateLimiter(RateLimitConfig(requests_per_minute=1200))  # 20/s
+        bucket = limiter._governor("m").requests
+        bucket.take(bucket.capacity)
+
+        start = time.monotonic()
+        for _ in range(2):
+            async with limiter.acquire("m"):
+                pass
+
+        assert time.monotonic() - start >= 0.08
+
+    def test_from_dict_per_model_overrides(self):
+        limiter = LLMRateLimiter.from_dict(
+            {"max_concurrency": 10, "models": {"gpt-4o": {"max_concurrency": 2}}}
+        )
+        assert limiter.default.max_concurrency == 10
+        assert limiter.models["gpt-4o"].max_concurrency == 2
+
+
+class TestProviderIntegration:
+    @pytest.mark.asyncio
+    async def test_acomplete_goes_through_limiter(self):
+        limiter = LLMRateLimiter(RateLimitConfig(max_concurrency=2))
+        llm = LiteLLMProvider(model="gpt-4o-mini", api_key="sk-fake", rate_limiter=limiter)
+
+        in_flight = 0
+        peak = 0
+
+        async def fake_acompletion(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return _response()
+
+        with patch("litellm.acompletion", side_effect=fake_acompletion):
+            await asyncio.gather(
+                *(llm.acomplete(messages=[{"role": "user", "content": "hi"}]) for _ in range(6))
+            )
+
+        assert peak <= 2
+        assert limiter.stats()["gpt-4o-mini"]["admitted"] == 6
+
+    @pytest.mark.asyncio
+    async def test_429_is_reported_to_governor(self):
+        limiter = LLMRateLimiter(RateLimitConfig(max_concurrency=8))
+        llm = LiteLLMProvider(model="gpt-4o-mini", api_key="sk-fake", rate_limiter=limiter)
+        error = RateLimitError("slow down", llm_provider="openai", model="gpt-4o-mini")
+
+        with (
+            patch("litellm.acompletion", new=AsyncMock(side_effect=[error, _response()])),
+            patch("framework.llm.litellm._compute_retry_delay", return_value=0),
+        ):
+            response = await llm.acomplete(messages=[{"role": "user", "content": "hi"}])
+
+        stats = limiter.stats()["gpt-4o-mini"]
+        assert response.content == "ok"
+        assert stats["rate_limited"] == 1
+        assert stats["limit"] == 4
+        assert stats["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_sync_complete_shares_slots_with_async_calls(self):
+        limiter = LLMRateLimiter(RateLimitConfig(max_concurrency=2))
+        llm = LiteLLMProvider(model="gpt-4o-mini", api_key="sk-fake", rate_limiter=limiter)
+        messages = [{"role": "user", "content": "hi"}]
+
+        lock = threading.Lock()
+        in_flight = 0
+        peak = 0
+
+        def enter():
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+
+        def leave():
+            nonlocal in_flight
+            with lock:
+                in_flight -= 1
+
+        def fake_completion(**kwargs):
+            enter()
+            time.sleep(0.02)
+            leave()
+            return _response()
+
+        async def fake_acompletion(**kwargs):
+            enter()
+            await asyncio.sleep(0.02)
+            leave()
+            return _response()
+
+        loop = asyncio.get_running_loop()
+        with (
+            patch("litellm.completion", side_effect=fake_completion),
+            patch("litellm.acompletion", side_effect=fake_acompletion),
+        ):
+            await asyncio.gather(
+                *(loop.run_in_executor(None, lambda: llm.complete(messages)) for _ in range(4)),
+                *(llm.acomplete(messages=messages) for _ in range(4)),
+            )
+
+        stats = limiter.stats()["gpt-4o-mini"]
+        assert peak <= 2
+        assert stats["admitted"] == 8
+        assert stats["in_flight"] == 0
+
+    def test_sync_429_is_reported_to_governor(self):
+        limiter = LLMRateLimiter(RateLimitConfig(max_concurrency=8))
+        llm = LiteLLMProvider(model="gpt-4o-mini", api_key="sk-fake", rate_limiter=limiter)
+        error = RateLimitError("slow down", llm_provider="openai", model="gpt-4o-mini")
+
+        with (
+            patch("litellm.completion", side_effect=[error, _response()]),
+            patch("framework.llm.litellm._compute_retry_delay", return_value=0),
+            patch("framework.llm.litellm._dump_failed_request", return_value="-"),
+        ):
+            response = llm.complete(messages=[{"role": "user", "content": "hi"}])
+
+        stats = limiter.stats()["gpt-4o-mini"]
+        assert response.content == "ok"
+        assert stats["rate_limited"] == 1
+        assert stats["limit"] == 4
+        assert stats["in_flight"] == 0
+
+    def test_sync_429_dumps_the_request_only_on_give_up(self):
+        llm = LiteLLMProvider(model="gpt-4o-mini", api_key="sk-fake")
+        error = RateLimitError("slow down", llm_provider="openai", model="gpt-4o-mini")
+        messages = [{"role": "user", "content": "hi"}]
+
+        with (
+            patch("litellm.completion", side_effect=[error, error, _response(), error, error]),
+            patch("framework.llm.litellm._compute_retry_delay", return_value=0),
+            patch("framework.llm.litellm._dump_failed_request", return_value="-") as dump,
+        ):
+            assert llm._completion_with_rate_limit_retry(max_retries=2, messages=messages)
+            assert dump.call_count == 0
+
+            with pytest.raises(RateLimitError):
+                llm._completion_with_rate_limit_retry(max_retries=1, messages=messages)
+
+        assert dump.call_count == 1
+        assert dump.call_args.kwargs["error_type"] == "rate_limit"
@@ -0,0 +1,197 @@
+"""Tests for latency-aware multi-backend routing, hedging and failover."""
+
+import asyncio
+
+import pytest
+
+from framework.llm.mock import MockLLMProvider
+from framework.llm.router import (
+    LatencyHistogram,
+    RouterBackend,
+    RoutingConfig,
+    RoutingLLMProvider,
+)
+from framework.llm.stream_events import (
+    FinishEvent,
+    StreamErrorEvent,
+    TextDeltaEvent,
+    TextEndEvent,
+)
+
+MESSAGES = [{"role": "user", "content": "hi"}]
+
+
+class FakeBackend(MockLLMProvider):
+    """Mock provider with configurable delay, failure and stream behaviour."""
+
+    def __init__(self, name: str, delay: float = 0.0, fail: bool = False, stream_error=False):
+        super().__init__(model=name)
+        self.name = name
+        self.delay = delay
+        self.fail = fail
+        self.stream_error = stream_error
+        self.calls = 0
+        self.cancelled = 0
+
+    def complete(self, messages, system="", **kwargs):
+        self.calls += 1
+        if self.fail:
+            raise RuntimeError(f"{self.name} down")
+        response = super().complete(messages, system=system, **kwargs)
+        response.content = self.name
+        return response
+
+    async def acomplete(self, messages, system="", **kwargs):
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.fail:
+            raise RuntimeError(f"{self.name} down")
+        response = MockLLMProvider.complete(self, messages, system=system)
+        response.content = self.name
+        return response
+
+    async def stream(self, messages, system="", tools=None, max_tokens=4096):
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.stream_error:
+            yield StreamErrorEvent(error=f"{self.name} down", recoverable=True)
+            return
+        yield TextDeltaEvent(content=self.name, snapshot=self.name)
+        yield TextEndEvent(full_text=self.name)
+        yield FinishEvent(stop_reason="stop", model=self.name)
+
+
+async def _collect(stream) -> list:
+    return [event async for event in stream]
+
+
+def _router(*providers: FakeBackend, **config) -> RoutingLLMProvider:
+    return RoutingLLMProvider(
+        [RouterBackend(p.name, p) for p in providers], RoutingConfig(**config)
+    )
+
+
+class TestRanking:
+    def test_histogram_buckets(self):
+        hist = LatencyHistogram()
+        for seconds in (0.1, 0.3, 100.0):
+            hist.observe(seconds)
+
+        buckets = hist.to_dict()
+        assert buckets["le_0.25s"] == 1
+        assert buckets["le_0.5s"] == 1
+        assert buckets["inf"] == 1
+
+    def test_prefers_lower_p95_then_config_order(self):
+        fast, slow = FakeBackend("fast"), FakeBackend("slow")
+        router = _router(slow, fast, min_samples=1)
+        assert router.rank()[0].name == "slow"  # no data yet: configured order
+
+        router._stats["slow"].record_success(5.0)
+        router._stats["fast"].record_success(0.5)
+
+        assert [b.name for b in router.rank()] == ["fast", "slow"]
+
+    def test_errors_push_backend_down(self):
+        a, b = FakeBackend("a"), FakeBackend("b")
+        router = _router(a, b)
+        router._stats["a"].record_error()
+
+        assert router.rank()[0].name == "b"
+
+
+class TestFailover:
+    def test_sync_failover(self):
+        router = _router(FakeBackend("a", fail=True), FakeBackend("b"))
+
+        assert router.complete(MESSAGES).content == "b"
+        assert router.stats()["a"]["errors"] == 1
+
+    @pytest.mark.asyncio
+    async def test_async_failover(self):
+        router = _router(FakeBackend("a", fail=True), FakeBackend("b"))
+
+        response = await router.acomplete(MESSAGES)
+
+        assert response.content == "b"
+
+    @pytest.mark.asyncio
+    async def test_all_backends_failing_raises_last_error(self):
+        router = _router(FakeBackend("a", fail=True), FakeBackend("b", fail=True))
+
+        with pytest.raises(RuntimeError, match="b down"):
+            await router.acomplete(MESSAGES)
+
+    @pytest.mark.asyncio
+    async def test_stream_fails_over_on_error_event(self):
+        router = _router(FakeBackend("a", stream_error=True), FakeBackend("b"))
+
+        events = [e async for e in router.stream(MESSAGES)]
+
+        assert events[0].type == "text_delta" and events[0].content == "b"
+        assert events[-1].type == "finish"
+
+
+class TestHedging:
+    @pytest.mark.asyncio
+    async def test_hedge_wins_and_loser_is_cancelled(self):
+        slow, fast = FakeBackend("slow", delay=1.0), FakeBackend("fast", delay=0.01)
+        router = _router(slow, fast, hedge_after=0.02)
+
+        response = await router.acomplete(MESSAGES)
+        await asyncio.sleep(0)
+
+        assert response.content == "fast"
+        assert slow.cancelled == 1
+        stats = router.stats()
+        assert stats["fast"]["hedges"] == 1
+        assert stats["fast"]["hedge_wins"] == 1
+
+    @pytest.mark.asyncio
+    async def test_no_hedge_when_primary_is_fast(self):
+        primary, backup = FakeBackend("primary"), FakeBackend("backup")
+        router = _router(primary, backup, hedge_after=0.5)
+
+        await router.acomplete(MESSAGES)
+
+        assert backup.calls == 0
+
+    @pytest.mark.asyncio
+    async def test_stream_hedge_on_slow_first_token(self):
+        slow, fast = FakeBackend("slow", delay=1.0), FakeBackend("fast", delay=0.01)
+        router = _router(slow, fast, hedge_after=0.02)
+
+        events = [e async for e in router.stream(MESSAGES)]
+
+        assert events[0].content == "fast"
+        assert slow.cancelled == 1
+        assert router.stats()["fast"]["histogram"]["le_0.25s"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelling_the_caller_during_loser_cleanup_propagates(self):
+        class SlowToStop(FakeBackend):
+            async def stream(self, messages, system="", tools=None, max_tokens=4096):
+                try:
+                    await asyncio.sleep(self.delay)
+                except asyncio.CancelledError:
+                    await asyncio.sleep(0.5)  # slow cleanup after being cancelled
+                    raise
+                yield TextDeltaEvent(content=self.name, snapshot=self.name)
+
+        slow, fast = SlowToStop("slow", delay=5.0), FakeBackend("fast", delay=0.01)
+        router = _router(slow, fast, hedge_after=0.02)
+
+        consumer = asyncio.create_task(_collect(router.stream(MESSAGES)))
+        await asyncio.sleep(0.1)  # fast has won; the router is waiting for slow to stop
+        consumer.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await consumer
@@ -0,0 +1,243 @@
+"""Tests for map nodes: one sub-node run per list element, reduced into an output key."""
+
+import asyncio
+import json
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from framework.graph.edge import EdgeCondition, EdgeSpec, GraphSpec
+from framework.graph.executor import GraphExecutor, ParallelExecutionConfig
+from framework.graph.goal import Goal
+from framework.graph.map_node import reduce_map_outputs
+from framework.graph.node import NodeContext, NodeProtocol, NodeResult, NodeSpec
+from framework.runtime.core import Runtime
+
+
+class SourceNode(NodeProtocol):
+    def __init__(self, items: list):
+        self.items = items
+
+    async def execute(self, ctx: NodeContext) -> NodeResult:
+        return NodeResult(success=True, output={"items": self.items})
+
+
+class DoubleNode(NodeProtocol):
+    """Doubles ctx.input_data["item"], tracking concurrency and what it could see."""
+
+    def __init__(self, fail_on: set | None = None, delays: dict | None = None):
+        self.fail_on = fail_on or set()
+        self.delays = delays or {}
+        self.seen: list = []
+        self.running = self.peak = 0
+
+    async def execute(self, ctx: NodeContext) -> NodeResult:
+        item = ctx.input_data["item"]
+        self.seen.append((item, ctx.memory.read("item"), ctx.memory.read("value")))
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            await asyncio.sleep(self.delays.get(item, 0.001))
+        finally:
+            self.running -= 1
+        ctx.memory.write("value", item, validate=False)
+        if item in self.fail_on:
+            return NodeResult(success=False, error=f"bad item {item}")
+        return NodeResult(success=True, output={"value": [item * 2]}, tokens_used=1)
+
+
+@pytest.fixture
+def runtime():
+    rt = MagicMock(spec=Runtime)
+    rt.start_run = MagicMock(return_value="run_id")
+    rt.decide = MagicMock(return_value="decision_id")
+    rt.execution_id = "exec"
+    return rt
+
+
+@pytest.fixture
+def goal():
+    return Goal(id="g1", name="Test", description="Map tests")
+
+
+def _map_graph(**map_kwargs) -> GraphSpec:
+    source = NodeSpec(id="source", name="Source", description="entry", output_keys=["items"])
+    map_spec = NodeSpec(
+        id="map_all",
+        name="Map all",
+        description="double every item",
+        node_type="map",
+        map_over="items",
+        map_node="double",
+        input_keys=["items"],
+        output_keys=["doubled"],
+        max_retries=1,
+        **map_kwargs,
+    )
+    item_spec = NodeSpec(
+        id="double",
+        name="Double",
+        description="double one item",
+        input_keys=["item", "value"],
+        output_keys=["value"],
+        max_retries=1,
+    )
+    return GraphSpec(
+        id="g",
+        goal_id="g1",
+        entry_node="source",
+        terminal_nodes=["map_all"],
+        nodes=[source, map_spec, item_spec],
+        edges=[
+            EdgeSpec(
+                id="source_to_map",
+                source="source",
+                target="map_all",
+                condition=EdgeCondition.ON_SUCCESS,
+            )
+        ],
+    )
+
+
+def _executor(runtime, items, item_node, storage_path=None, **config) -> GraphExecutor:
+    executor = GraphExecutor(
+        runtime=runtime,
+        parallel_config=ParallelExecutionConfig(**config),
+        storage_path=storage_path,
+    )
+    executor.register_node("source", SourceNode(items))
+    executor.register_node("double", item_node)
+    return executor
+
+
+@pytest.mark.asyncio
+async def test_results_in_element_order_with_bounded_concurrency(runtime, goal):
+    node = DoubleNode(delays={1: 0.05, 2: 0.03, 3: 0.01, 4: 0.0})
+    executor = _executor(runtime, [1, 2, 3, 4], node)
+
+    result = await executor.execute(_map_graph(max_parallel_branches=2), goal, {})
+
+    assert result.success
+    assert result.output["doubled"] == [[2], [4], [6], [8]]
+    assert node.peak == 2
+    # Each element saw only its own item, never another element's writes
+    assert all(item == read and value is None for item, read, value in node.seen)
+    assert "value" not in result.output and "item" not in result.output
+
+
+@pytest.mark.asyncio
+async def test_concat_reduce_and_continue_on_failure(runtime, goal):
+    executor = _executor(
+        runtime, [1, 2, 3], DoubleNode(fail_on={2}), on_branch_failure="continue_others"
+    )
+
+    result = await executor.execute(_map_graph(map_reduce="concat"), goal, {})
+
+    assert result.success
+    assert result.output["doubled"] == [2, 6]
+
+
+@pytest.mark.asyncio
+async def test_failed_map_resumes_from_element_ledger(runtime, goal, tmp_path):
+    graph = _map_graph(max_parallel_branches=1)
+    first = _executor(runtime, [1, 2, 3, 4], DoubleNode(fail_on={3}), storage_path=tmp_path)
+
+    result = await first.execute(graph, goal, {})
+
+    assert not result.success and "[2] bad item 3" in result.error
+    ledger = tmp_path / "map" / "map_all.jsonl"
+    recorded = [json.loads(line)["index"] for line in ledger.read_text().splitlines()]
+    assert recorded == [0, 1]
+    state = json.loads((tmp_path / "state.json").read_text())
+    assert state["progress"]["map"]["map_all"] == {"completed": 2, "failed": 1, "total": 4}
+
+    node = DoubleNode()
+    second = _executor(runtime, [1, 2, 3, 4], node, storage_path=tmp_path)
+    result = await second.execute(graph, goal, {})
+
+    assert result.success
+    assert result.output["doubled"] == [[2], [4], [6], [8]]
+    assert [item for item, _, _ in node.seen] == [3, 4]
+    assert not ledger.exists()
+
+
+@pytest.mark.asyncio
+async def test_changed_elements_are_not_taken_from_ledger(runtime, goal, tmp_path):
+    graph = _map_graph(max_parallel_branches=1)
+    await _executor(runtime, [1, 2], DoubleNode(fail_on={2}), storage_path=tmp_path).execute(
+        graph, goal, {}
+    )
+
+    node = DoubleNode()
+    result = await _executor(runtime, [5, 2], node, storage_path=tmp_path).execute(graph, goal, {})
+
+    assert result.output["doubled"] == [[10], [4]]
+    assert [item for item, _, _ in node.seen] == [5, 2]
+
+
+@pytest.mark.asyncio
+async def test_event_loop_elements_get_their_own_conversations(runtime, goal, tmp_path):
+    executor = GraphExecutor(runtime=runtime, storage_path=tmp_path)
+    executor.register_node("source", SourceNode(["a", "b"]))
+    created = []
+
+    def fake_event_loop_node(spec, conversation_path):
+        node = DoubleNode()
+        node.execute = MagicMock(
+            side_effect=lambda ctx: asyncio.sleep(0, NodeResult(True, {"value": ctx.node_id}))
+        )
+        created.append((node, conversation_path))
+        return node
+
+    with patch.object(executor, "_create_event_loop_node", side_effect=fake_event_loop_node):
+        result = await executor.execute(_map_graph(), goal, {})
+
+    assert result.success and result.output["doubled"] == ["double", "double"]
+    assert sorted(path for _, path in created) == [
+        tmp_path / "conversations" / "map_all" / "0",
+        tmp_path / "conversations" / "map_all" / "1",
+    ]
+    assert created[0][0] is not created[1][0]
+
+
+class TestValidation:
+    def test_map_target_counts_as_reachable(self):
+        assert _map_graph().validate() == []
+
+    def test_bad_wiring_is_reported(self):
+        graph = _map_graph(map_reduce="sum")
+        graph.nodes[1].map_over = "other"
+        graph.nodes[1].map_node = "missing"
+
+        errors = graph.validate()
+
+        assert any("not one of its input_keys" in e for e in errors)
+        assert any("invalid map_reduce 'sum'" in e for e in errors)
+        assert any("missing map_node 'missing'" in e for e in errors)
+
+
+def test_reduce_modes():
+    assert reduce_map_outputs([[1], 2, (3, 4)], "concat") == [1, 2, 3, 4]
+    assert reduce_map_outputs([{"a": 1}, {"a": 2, "b": 3}], "merge") == {"a": 2, "b": 3}
+    with pytest.raises(ValueError):
+        reduce_map_outputs([{"a": 1}, "x"], "merge")
+
+
+def test_concurrent_map_progress_writes_are_not_lost(runtime, tmp_path):
+    executor = _executor(runtime, [], DoubleNode(), storage_path=tmp_path)
+    node_ids = [f"map_{i}" for i in range(8)]
+
+    def write(node_id: str) -> None:
+        for done in range(1, 26):
+            executor._write_map_progress(node_id, done, 0, 25)
+
+    threads = [threading.Thread(target=write, args=(node_id,)) for node_id in node_ids]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    state = json.loads((tmp_path / "state.json").read_text())
+    expected = {"completed": 25, "failed": 0, "total": 25}
+    assert state["progress"]["map"] == dict.fromkeys(node_ids, expected)
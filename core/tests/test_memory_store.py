@@ -0,0 +1,138 @@
+"""Tests for the versioned copy-on-write store behind SharedMemory."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from framework.graph.executor import GraphExecutor
+from framework.graph.memory_store import MemoryMergeError, MemoryStore
+from framework.graph.node import SharedMemory
+
+
+class TestSnapshots:
+    def test_snapshot_is_frozen_by_copy_on_write(self):
+        store = MemoryStore({"a": 1})
+        snap = store.snapshot()
+
+        store.set("a", 2)
+        store.set("b", 3)
+
+        assert dict(snap) == {"a": 1} and snap.version == 1
+        assert store.to_dict() == {"a": 2, "b": 3} and store.version == 3
+
+    def test_writes_without_snapshot_do_not_copy(self):
+        store = MemoryStore()
+        store.set("a", 1)
+        data = store._data
+
+        store.set("b", 2)
+        assert store._data is data
+
+        store.snapshot()
+        store.set("c", 3)
+        assert store._data is not data
+
+
+class TestChangeSets:
+    def test_changes_since_in_write_order(self):
+        store = MemoryStore()
+        for key in ("a", "b", "c"):
+            store.set(key, key.upper())
+        mark = store.version
+        store.set("a", "A2")
+        store.set("d", "D")
+
+        changes = store.changes_since(mark)
+
+        assert list(changes.changes.items()) == [("a", "A2"), ("d", "D")]
+        assert changes.since_version == mark and changes.version == store.version
+        assert len(store.changes_since(store.version)) == 0
+
+
+class TestForkMerge:
+    def test_fork_is_isolated_until_merge(self):
+        memory = SharedMemory()
+        memory.write("shared", "base")
+        branch = memory.fork()
+
+        branch.write("result", "done")
+
+        assert memory.read("result") is None
+        assert branch.read("shared") == "base"
+        assert memory.merge([("b", branch)]) == []
+        assert memory.read("result") == "done"
+
+    @pytest.mark.parametrize(
+        ("strategy", "expected", "chosen"),
+        [("last_wins", "from b2", "b2"), ("first_wins", "from b1", "b1")],
+    )
+    def test_conflicts_follow_strategy(self, strategy, expected, chosen):
+        store = MemoryStore({"x": 0})
+        b1, b2, b3 = store.fork(), store.fork(), store.fork()
+        b1.set("x", "from b1")
+        b2.set("x", "from b2")
+        b1.set("same", 1)
+        b2.set("same", 1)
+        b3.set("only_b3", True)
+
+        conflicts = store.merge([("b1", b1), ("b2", b2), ("b3", b3)], strategy=strategy)
+
+        assert [(c.key, c.chosen) for c in conflicts] == [("x", chosen)]
+        assert store.to_dict() == {"x": expected, "same": 1, "only_b3": True}
+
+    def test_error_strategy_applies_nothing(self):
+        store = MemoryStore()
+        b1, b2 = store.fork(), store.fork()
+        b1.set("x", 1)
+        b1.set("y", 1)
+        b2.set("x", 2)
+
+        with pytest.raises(MemoryMergeError) as exc_info:
+            store.merge([("b1", b1), ("b2", b2)], strategy="error")
+
+        assert exc_info.value.conflicts[0].values == {"b1": 1, "b2": 2}
+        assert store.to_dict() == {}
+
+    def test_base_write_after_fork_is_a_conflict(self):
+        store = MemoryStore({"x": 0})
+        branch = store.fork()
+        store.set("x", "base")
+        branch.set("x", "branch")
+
+        conflicts = store.merge([("b", branch)], strategy="first_wins")
+
+        assert conflicts[0].values == {"base": "base", "b": "branch"}
+        assert store.get("x") == "base"
+
+    def test_unknown_strategy(self):
+        with pytest.raises(ValueError):
+            MemoryStore().merge([], strategy="random")
+
+
+def test_scoped_views_share_the_store():
+    memory = SharedMemory()
+    view = memory.with_permissions(read_keys=["a"], write_keys=["a"])
+    before = memory.version
+
+    view.write("a", 1)
+
+    assert memory.read("a") == 1
+    assert memory.changes_since(before).changes == {"a": 1}
+
+
+def test_progress_writer_applies_change_sets(tmp_path):
+    executor = GraphExecutor(runtime=MagicMock(), storage_path=tmp_path)
+    memory = SharedMemory()
+    memory.write("a", 1)
+    executor._write_progress("n1", ["n1"], memory, {})
+    memory.write("b", 2)
+    memory.write("a", 3)
+
+    with patch.object(memory, "snapshot", wraps=memory.snapshot) as snapshot:
+        executor._write_progress("n2", ["n1", "n2"], memory, {})
+
+    state = json.loads((tmp_path / "state.json").read_text(encoding="utf-8"))
+    assert state["memory"] == {"a": 3, "b": 2}
+    assert state["memory_version"] == memory.version
+    snapshot.assert_not_called()  # only the change-set was read
@@ -8,7 +8,8 @@
 import json
 import time
 
-from framework.graph.node import find_json_object
+from framework.graph.node import _fix_unescaped_newlines_in_json, find_json_object
+from framework.utils.json_stream import IncrementalJSONScanner
 
 # Test inputs
 
@@ -70,3 +71,67 @@ def test_worst_case_performance(self):
         # unless we formed valid {"a":{"b":...}}
         # But this tests the scanner performance
         assert duration < 0.5, f"Worst-case scan took too long: {duration:.4f}s"
+
+
+def chunked(text: str, size: int) -> list[str]:
+    """Split text into stream-sized chunks."""
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+class TestIncrementalJsonPerformance:
+    """Benchmarks for streamed tool arguments and LLM JSON repair."""
+
+    def test_streamed_arguments_are_scanned_once(self):
+        """500KB of arguments in 64-byte chunks: linear, one json.loads."""
+        payload = json.dumps({"rows": [{"id": i, "text": "lorem ipsum " * 8} for i in range(4200)]})
+        assert len(payload) > LARGE_JSON_SIZE
+        chunks = chunked(payload, 64)
+
+        start = time.perf_counter()
+        scanner = IncrementalJSONScanner()
+        done = [scanner.feed(chunk) for chunk in chunks]
+        result = scanner.result()
+        duration = time.perf_counter() - start
+
+        assert done.index(True) == len(chunks) - 1
+        assert len(result["rows"]) == 4200
+        assert duration < 1.0, f"Incremental scan took too long: {duration:.4f}s"
+
+    def test_streamed_large_string_with_raw_newlines(self):
+        """A 500KB string value with raw newlines is repaired while streaming."""
+        body = "line of generated report text\n" * (LARGE_JSON_SIZE // 30)
+        payload = '{"key": "report", "value": "' + body + '"} trailing note'
+
+        start = time.perf_counter()
+        scanner = IncrementalJSONScanner()
+        for chunk in chunked(payload, 256):
+            scanner.feed(chunk)
+        result = scanner.result()
+        duration = time.perf_counter() - start
+
+        assert result["value"] == body
+        assert scanner.trailing == " trailing note"
+        assert duration < 0.5, f"Repairing scan took too long: {duration:.4f}s"
+
+    def test_find_json_object_fallback_path(self):
+        """Fast path fails (stray '}' after the object); the fallback stays linear."""
+        large_json = generate_large_json(LARGE_JSON_SIZE)
+        input_text = f"Here you go: {large_json} -- end of answer }}"
+
+        start = time.perf_counter()
+        result = find_json_object(input_text)
+        duration = time.perf_counter() - start
+
+        assert result == large_json
+        assert duration < 0.1, f"Fallback scan took too long: {duration:.4f}s"
+
+    def test_fix_unescaped_newlines_performance(self):
+        """Repairing a 1MB payload does not walk it one character at a time."""
+        broken = '{"value": "' + "text\n" * (LARGE_TEXT_SIZE // 5) + '"}'
+
+        start = time.perf_counter()
+        fixed = _fix_unescaped_newlines_in_json(broken)
+        duration = time.perf_counter() - start
+
+        assert json.loads(fixed)["value"].count("\n") == LARGE_TEXT_SIZE // 5
+        assert duration < 0.5, f"Repair took too long: {duration:.4f}s"
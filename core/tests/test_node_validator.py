@@ -0,0 +1,147 @@
+"""Tests for precompiled per-node validators (NodeValidator)."""
+
+import json
+from unittest.mock import patch
+
+from pydantic import BaseModel, Field
+
+from framework.graph.edge import GraphSpec
+from framework.graph.node import NodeSpec
+from framework.graph.output_cleaner import CleansingConfig, OutputCleaner
+from framework.graph.validator import (
+    OUTPUT_CODE_INDICATORS,
+    CodeIndicatorMatcher,
+    NodeValidator,
+    OutputValidator,
+)
+
+
+class Ticket(BaseModel):
+    category: str
+    priority: int = Field(ge=1, le=5)
+
+
+def _spec(**kwargs) -> NodeSpec:
+    defaults = {"id": "n1", "name": "N1", "description": "test node"}
+    return NodeSpec(**{**defaults, **kwargs})
+
+
+class TestCompiledValidatorCache:
+    def test_compiled_once_and_recompiled_on_graph_load(self):
+        spec = _spec(output_keys=["a"])
+        first = spec.compiled_validator()
+
+        assert spec.compiled_validator() is first
+
+        spec.output_keys = ["a", "b"]
+        graph = GraphSpec(id="g", goal_id="goal", entry_node="n1", nodes=[spec], edges=[])
+        graph.compile_validators()
+
+        assert spec.compiled_validator() is not first
+        assert spec.compiled_validator().output_keys == ("a", "b")
+
+
+class TestValidateOutputs:
+    def test_matches_output_validator(self):
+        spec = _spec(output_keys=["a", "b", "c", "d"], nullable_output_keys=["d"])
+        outputs = [
+            {"a": "x", "b": 1, "c": [], "d": None},
+            {"a": "", "b": None, "d": None},
+            {"a": "x" * 60000, "b": "def f(): pass", "c": "ok"},
+            "not a dict",
+        ]
+
+        compiled = spec.compiled_validator()
+        reference = OutputValidator()
+        for output in outputs:
+            expected = reference.validate_all(
+                output=output,
+                expected_keys=spec.output_keys,
+                check_hallucination=isinstance(output, dict),
+                nullable_keys=spec.nullable_output_keys,
+            )
+            assert compiled.validate_outputs(output).errors == expected.errors
+
+
+class TestCheckInputs:
+    def test_json_trap_types_and_warnings(self):
+        validator = NodeValidator.from_spec(
+            _spec(
+                input_keys=["report", "count", "raw", "maybe"],
+                nullable_output_keys=["maybe"],
+                input_schema={"count": {"type": "integer"}, "raw": {"description": "no type"}},
+            )
+        )
+        output = {
+            "report": json.dumps({"report": "nested"}),
+            "count": "3",
+            "raw": "plain text " * 60,
+        }
+
+        errors, warnings = validator.check_inputs(output)
+
+        assert errors == [
+            "Key 'report' contains JSON string with nested 'report' field - "
+            "likely parsing failure from LLM node",
+            "Key 'count': expected type 'integer', got 'str'",
+        ]
+        assert warnings == [
+            "Key 'raw' contains large string (660 chars), possibly entire LLM response"
+        ]
+
+    def test_plain_strings_are_not_parsed(self):
+        validator = NodeValidator.from_spec(_spec(input_keys=["a", "b"]))
+
+        with patch("framework.graph.validator.json.loads") as loads:
+            validator.check_inputs({"a": "hello", "b": "x" * 1000})
+
+        loads.assert_not_called()
+
+    def test_large_json_array_is_not_flagged_as_raw_text(self):
+        validator = NodeValidator.from_spec(_spec(input_keys=["items"]))
+
+        errors, warnings = validator.check_inputs({"items": json.dumps(list(range(300)))})
+
+        assert errors == [] and warnings == []
+
+    def test_output_cleaner_uses_compiled_validator(self):
+        spec = _spec(input_keys=["a"])
+        cleaner = OutputCleaner(CleansingConfig(enabled=False))
+
+        with patch.object(NodeValidator, "from_spec", wraps=NodeValidator.from_spec) as compile_:
+            for _ in range(3):
+                result = cleaner.validate_output({"a": "ok"}, "src", spec)
+
+        assert result.valid
+        assert compile_.call_count == 1
+
+
+class TestOutputModel:
+    def test_type_adapter_validation_and_feedback(self):
+        validator = _spec(output_model=Ticket).compiled_validator()
+
+        ok, ticket = validator.validate_model({"category": "bug", "priority": 2})
+        bad, none = validator.validate_model({"category": "bug", "priority": 9})
+
+        assert ok.success and ticket == Ticket(category="bug", priority=2)
+        assert not bad.success and none is None
+        assert bad.errors[0].startswith("priority:")
+        feedback = validator.format_feedback(bad)
+        assert "Model: Ticket" in feedback and "priority: integer (required)" in feedback
+
+    def test_without_model_everything_passes(self):
+        result, model = NodeValidator("n").validate_model({"anything": 1})
+
+        assert result.success and model is None
+
+
+class TestCodeIndicatorMatcher:
+    def test_full_scan_and_sampling(self):
+        matcher = CodeIndicatorMatcher(OUTPUT_CODE_INDICATORS)
+        size = 50000
+
+        assert matcher.search("A" * 600 + "import os")
+        assert matcher.search("A" * 37500 + "class Hidden:" + "B" * 12487)
+        # Between sample windows: long strings are sampled, not fully scanned.
+        assert not matcher.search("A" * 5000 + "import os" + "B" * (size - 5009))
+        assert not matcher.search("This is a perfectly normal document. " * 300)
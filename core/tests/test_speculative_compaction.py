@@ -0,0 +1,280 @@
+"""Tests for speculative (background) compaction in EventLoopNode."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from framework.graph.conversation import NodeConversation
+from framework.graph.event_loop_node import EventLoopNode, JudgeVerdict, LoopConfig
+from framework.graph.node import NodeContext, NodeSpec, SharedMemory
+from framework.llm.provider import LLMProvider, LLMResponse
+from framework.llm.stream_events import FinishEvent, TextDeltaEvent
+from framework.runtime.core import Runtime
+
+
+class SlowSummaryLLM(LLMProvider):
+    """Streams one text turn per call; ``acomplete`` (the summarizer) is slow."""
+
+    def __init__(self, input_tokens: list[int] | None = None, summary_delay: float = 0.05):
+        self.input_tokens = input_tokens or []
+        self.summary_delay = summary_delay
+        self.turn = 0
+        self.summary_calls = 0
+        self.summaries_finished = 0
+        self.summary_prompts: list[str] = []
+
+    async def stream(self, messages, system="", tools=None, max_tokens=4096):
+        tokens = self.input_tokens[self.turn] if self.turn < len(self.input_tokens) else 0
+        self.turn += 1
+        await asyncio.sleep(0.1)
+        text = f"turn {self.turn}"
+        yield TextDeltaEvent(content=text, snapshot=text)
+        yield FinishEvent(stop_reason="stop", input_tokens=tokens, model="mock")
+
+    async def acomplete(self, messages, system="", **kwargs) -> LLMResponse:
+        self.summary_calls += 1
+        self.summary_prompts.append(messages[-1]["content"])
+        await asyncio.sleep(self.summary_delay)
+        self.summaries_finished += 1
+        return LLMResponse(content=f"summary #{self.summary_calls}", model="mock")
+
+    def complete(self, messages, system="", **kwargs) -> LLMResponse:
+        return LLMResponse(content="summary", model="mock")
+
+    def complete_with_tools(self, messages, system, tools, tool_executor, **kwargs):
+        return LLMResponse(content="", model="mock")
+
+
+def _ctx(llm: LLMProvider) -> NodeContext:
+    spec = NodeSpec(
+        id="spec",
+        name="Spec",
+        description="speculative compaction",
+        node_type="event_loop",
+        output_keys=[],
+        system_prompt="test",
+    )
+    return NodeContext(
+        runtime=MagicMock(spec=Runtime),
+        node_id=spec.id,
+        node_spec=spec,
+        memory=SharedMemory(),
+        input_data={},
+        llm=llm,
+        runtime_logger=MagicMock(),
+    )
+
+
+async def _conversation(n: int) -> NodeConversation:
+    conv = NodeConversation(max_history_tokens=1000)
+    for i in range(n):
+        if i % 2:
+            await conv.add_assistant_message(f"answer {i}")
+        else:
+            await conv.add_user_message(f"question {i}")
+    return conv
+
+
+class TestConversationPrefix:
+    @pytest.mark.asyncio
+    async def test_split_skips_tool_results_at_boundary(self):
+        conv = NodeConversation()
+        await conv.add_user_message("go")
+        await conv.add_assistant_message("", tool_calls=[{"id": "t1", "function": {}}])
+        await conv.add_tool_result("t1", "result")
+        await conv.add_assistant_message("done")
+
+        # keep_recent=2 would start at the tool result; it moves past it.
+        assert conv.compaction_split(keep_recent=2) == 3
+
+    @pytest.mark.asyncio
+    async def test_compact_exact_prefix(self):
+        conv = await _conversation(6)
+
+        await conv.compact("summary", prefix_count=3)
+
+        assert [m.content for m in conv.messages] == [
+            "summary",
+            "answer 3",
+            "question 4",
+            "answer 5",
+        ]
+
+
+class TestSpeculativeSummary:
+    @pytest.mark.asyncio
+    async def test_background_summary_is_swapped_in(self):
+        llm = SlowSummaryLLM()
+        node = EventLoopNode(
+            config=LoopConfig(max_history_tokens=1000, speculative_compaction_threshold=0.7)
+        )
+        ctx = _ctx(llm)
+        conv = await _conversation(8)
+
+        conv.update_token_count(750)
+        node._maybe_start_speculative_summary(ctx, conv)
+        await asyncio.sleep(0.1)  # the next LLM turn runs meanwhile
+        await conv.add_user_message("newer question")
+        conv.update_token_count(850)
+        await node._compact_tiered(ctx, conv)
+
+        assert llm.summary_calls == 1
+        contents = [m.content for m in conv.messages]
+        # Prefix planned at 8 messages (keep 4), plus the message added later.
+        assert contents == [
+            "summary #1",
+            "question 4",
+            "answer 5",
+            "question 6",
+            "answer 7",
+            "newer question",
+        ]
+        stats = node.speculative_compaction_stats
+        assert stats.hits == 1 and stats.misses == 0
+        assert stats.latency_saved_seconds > 0.03
+        feedback = ctx.runtime_logger.log_step.call_args.kwargs["verdict_feedback"]
+        assert feedback.startswith("level=speculative") and "speculative_saved_ms=" in feedback
+
+    @pytest.mark.asyncio
+    async def test_summary_covers_only_the_compacted_prefix(self):
+        llm = SlowSummaryLLM(summary_delay=0)
+        node = EventLoopNode(
+            config=LoopConfig(max_history_tokens=1000, speculative_compaction_threshold=0.7)
+        )
+        ctx = _ctx(llm)
+        conv = await _conversation(8)
+
+        conv.update_token_count(750)
+        node._maybe_start_speculative_summary(ctx, conv)
+        await asyncio.sleep(0.01)
+
+        assert "answer 3" in llm.summary_prompts[0]
+        assert "question 4" not in llm.summary_prompts[0]
+
+    @pytest.mark.asyncio
+    async def test_insufficient_summary_counts_as_miss(self):
+        llm = SlowSummaryLLM(summary_delay=0)
+        node = EventLoopNode(
+            config=LoopConfig(max_history_tokens=1000, speculative_compaction_threshold=0.7)
+        )
+        ctx = _ctx(llm)
+        conv = await _conversation(8)
+
+        conv.update_token_count(750)
+        node._maybe_start_speculative_summary(ctx, conv)
+        await asyncio.sleep(0.01)
+        for i in range(6):
+            await conv.add_user_message("x" * 700 + str(i))
+        conv.update_token_count(1100)
+        await node._compact_tiered(ctx, conv)
+
+        assert llm.summary_calls == 2  # the background one was not enough
+        stats = node.speculative_compaction_stats
+        assert stats.hits == 0 and stats.misses == 1
+        feedback = ctx.runtime_logger.log_step.call_args.kwargs["verdict_feedback"]
+        assert "speculative_saved_ms" not in feedback
+
+    @pytest.mark.asyncio
+    async def test_executions_keep_separate_speculations(self):
+        llm = SlowSummaryLLM(summary_delay=0.05)
+        node = EventLoopNode(
+            config=LoopConfig(max_history_tokens=1000, speculative_compaction_threshold=0.7)
+        )
+        first, second = _ctx(llm), _ctx(llm)
+        conv_a, conv_b = await _conversation(8), await _conversation(8)
+        conv_a.update_token_count(750)
+        conv_b.update_token_count(750)
+
+        node._maybe_start_speculative_summary(first, conv_a)
+        node._maybe_start_speculative_summary(second, conv_b)
+
+        assert len(node._speculations) == 2
+        assert node.speculative_compaction_stats.misses == 0
+        node._discard_speculative_summary(first)
+        assert list(node._speculations) == [id(second)]
+        node._discard_speculative_summary(second)
+
+    @pytest.mark.asyncio
+    async def test_changed_prefix_falls_back_to_fresh_summary(self):
+        llm = SlowSummaryLLM(summary_delay=0)
+        node = EventLoopNode(
+            config=LoopConfig(max_history_tokens=1000, speculative_compaction_threshold=0.7)
+        )
+        ctx = _ctx(llm)
+        conv = await _conversation(8)
+
+        conv.update_token_count(750)
+        node._maybe_start_speculative_summary(ctx, conv)
+        await asyncio.sleep(0)
+        await conv.compact("someone else compacted", keep_recent=2)
+        for i in range(4):
+            await conv.add_user_message(f"more {i}")
+        conv.update_token_count(850)
+        await node._compact_tiered(ctx, conv)
+
+        assert llm.summary_calls == 2
+        assert conv.messages[0].content == "summary #2"
+        stats = node.speculative_compaction_stats
+        assert stats.hits == 0 and stats.misses == 1
+
+    @pytest.mark.asyncio
+    async def test_disabled_or_below_threshold(self):
+        llm = SlowSummaryLLM()
+        conv = await _conversation(8)
+        conv.update_token_count(750)
+
+        off = EventLoopNode(config=LoopConfig(max_history_tokens=1000))
+        off._maybe_start_speculative_summary(_ctx(llm), conv)
+        high = EventLoopNode(
+            config=LoopConfig(max_history_tokens=1000, speculative_compaction_threshold=0.78)
+        )
+        high._maybe_start_speculative_summary(_ctx(llm), conv)
+
+        assert not off._speculations and not high._speculations
+
+
+class TestEventLoopSpeculativeCompaction:
+    @pytest.mark.asyncio
+    async def test_compaction_after_turn_uses_background_summary(self):
+        llm = SlowSummaryLLM(input_tokens=[750, 850])
+        verdicts = iter(["RETRY", "ACCEPT"])
+        judge = MagicMock()
+
+        async def evaluate(context):
+            return JudgeVerdict(action=next(verdicts))
+
+        judge.evaluate = evaluate
+        node = EventLoopNode(
+            judge=judge,
+            config=LoopConfig(max_history_tokens=1000, speculative_compaction_threshold=0.7),
+        )
+
+        result = await node.execute(_ctx(llm))
+
+        assert result.success
+        assert llm.summary_calls == 1
+        assert node.speculative_compaction_stats.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_pending_summary_is_cancelled_on_exit(self):
+        llm = SlowSummaryLLM(input_tokens=[750], summary_delay=0.05)
+        judge = MagicMock()
+
+        async def evaluate(context):
+            return JudgeVerdict(action="ACCEPT")
+
+        judge.evaluate = evaluate
+        node = EventLoopNode(
+            judge=judge,
+            config=LoopConfig(max_history_tokens=1000, speculative_compaction_threshold=0.7),
+        )
+
+        await node.execute(_ctx(llm))
+        await asyncio.sleep(0.1)
+
+        assert node.speculative_compaction_stats.started == 1
+        assert not node._speculations
+        assert llm.summaries_finished == 0
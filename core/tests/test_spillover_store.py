@@ -0,0 +1,162 @@
+"""Tests for the searchable spillover store and the query_spilled tool."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from framework.graph import spillover
+from framework.graph.event_loop_node import EventLoopNode, LoopConfig
+from framework.graph.spillover import (
+    INDEX_DIRNAME,
+    SpilloverStore,
+    get_spillover_store,
+    select_json_path,
+)
+from framework.llm.provider import ToolResult
+from framework.llm.stream_events import ToolCallEvent
+
+ITEMS = {
+    "total": 60,
+    "items": [
+        {"id": i, "name": f"repo-{i}", "topic": "zebra" if i == 42 else "misc"} for i in range(60)
+    ],
+}
+
+
+class TestSpill:
+    @pytest.mark.asyncio
+    async def test_json_is_pretty_printed_and_outlined(self, tmp_path):
+        store = SpilloverStore(tmp_path)
+
+        meta = await store.spill("github_search", "call/1", json.dumps(ITEMS))
+
+        assert meta.filename == "tool_github_search_call_1.txt"
+        assert meta.format == "json"
+        assert meta.line_count > 60  # pretty-printed, not one line
+        assert "$.items: list[60]" in meta.outline
+        assert "$.items[*]: object{id, name, topic}" in meta.outline
+        assert (tmp_path / INDEX_DIRNAME / f"{meta.filename}.json").is_file()
+
+    @pytest.mark.asyncio
+    async def test_jsonl_counts_rows(self, tmp_path):
+        store = SpilloverStore(tmp_path)
+        content = "\n".join(json.dumps({"n": i}) for i in range(5))
+
+        meta = await store.spill("export", "c1", content)
+
+        assert meta.format == "jsonl" and meta.rows == 5
+        result = store.query_sync(meta.filename, json_path="$[1:3].n")
+        assert json.loads(result["value"]) == [1, 2]
+
+
+class TestQuery:
+    @pytest.mark.asyncio
+    async def test_json_path_selection(self, tmp_path):
+        store = SpilloverStore(tmp_path)
+        meta = await store.spill("search", "c1", json.dumps(ITEMS))
+
+        one = store.query_sync(meta.filename, json_path="$.items[2].name")
+        many = store.query_sync(meta.filename, json_path="$.items[*].id")
+
+        assert json.loads(one["value"]) == "repo-2"
+        assert many["count"] == 60
+        assert select_json_path(ITEMS, "items[-1].id") == 59
+
+    @pytest.mark.asyncio
+    async def test_line_range_is_capped_at_whole_lines(self, tmp_path):
+        store = SpilloverStore(tmp_path)
+        text = "\n".join(f"line {i:03d}" for i in range(1, 201))
+        meta = await store.spill("logs", "c1", text)
+
+        result = store.query_sync(meta.filename, line_range="10-20")
+        capped = store.query_sync(meta.filename, line_range=[1, 200], max_chars=45)
+
+        assert result["content"].splitlines() == [f"line {i:03d}" for i in range(10, 21)]
+        assert capped["lines"] == "1-5" and capped["has_more"] is True
+
+    @pytest.mark.asyncio
+    async def test_bm25_search_finds_the_relevant_window(self, tmp_path):
+        store = SpilloverStore(tmp_path, chunk_lines=10)
+        meta = await store.spill("search", "c1", json.dumps(ITEMS))
+        await store.spill("other", "c2", "nothing to see here\n" * 50)
+
+        result = await store.query(meta.filename, query="zebra")
+        everywhere = await store.query(query="zebra")
+
+        top = result["results"][0]
+        assert '"zebra"' in top["text"]
+        assert everywhere["results"][0]["filename"] == meta.filename
+
+    @pytest.mark.asyncio
+    async def test_unindexed_and_modified_files_are_indexed_on_demand(self, tmp_path):
+        (tmp_path / "notes.txt").write_text("alpha\nbeta\n", encoding="utf-8")
+        store = SpilloverStore(tmp_path)
+
+        assert store.query_sync("notes.txt", query="beta")["matches"] == 1
+
+        (tmp_path / "notes.txt").write_text("alpha\ngamma delta\n", encoding="utf-8")
+        assert store.query_sync("notes.txt", query="beta")["matches"] == 0
+        assert store.query_sync("notes.txt", query="gamma")["matches"] == 1
+
+    @pytest.mark.asyncio
+    async def test_new_store_reuses_sidecar_metadata(self, tmp_path):
+        meta = await SpilloverStore(tmp_path).spill("search", "c1", json.dumps(ITEMS))
+
+        restarted = SpilloverStore(tmp_path)
+        result = restarted.query_sync(meta.filename, json_path="$.total")
+
+        assert json.loads(result["value"]) == 60
+        assert restarted.describe(meta.filename).tool_name == "search"
+
+    def test_errors_are_returned_not_raised(self, tmp_path):
+        (tmp_path / "plain.txt").write_text("just text", encoding="utf-8")
+        store = SpilloverStore(tmp_path)
+
+        assert "error" in store.query_sync("../etc/passwd", query="x")
+        assert "error" in store.query_sync("missing.txt", line_range="1-2")
+        assert "error" in store.query_sync("plain.txt", json_path="$.a")
+        assert "error" in store.query_sync("plain.txt")
+
+    def test_least_recently_used_stores_are_evicted(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(spillover, "_stores", spillover.OrderedDict())
+        monkeypatch.setattr(spillover, "MAX_STORES", 2)
+
+        first = get_spillover_store(tmp_path / "a")
+        get_spillover_store(tmp_path / "b")
+        assert get_spillover_store(tmp_path / "a") is first
+        get_spillover_store(tmp_path / "c")
+
+        assert get_spillover_store(tmp_path / "a") is first
+        assert [Path(p).name for p in spillover._stores] == ["c", "a"]
+
+
+class TestEventLoopSpillover:
+    @pytest.mark.asyncio
+    async def test_oversized_result_is_spilled_and_queryable(self, tmp_path):
+        node = EventLoopNode(
+            config=LoopConfig(max_tool_result_chars=500, spillover_dir=str(tmp_path))
+        )
+        big = ToolResult(tool_use_id="call_9", content=json.dumps(ITEMS))
+
+        truncated = await node._truncate_tool_result(big, "github_search")
+
+        assert "saved to 'tool_github_search_call_9.txt'" in truncated.content
+        assert "query_spilled(" in truncated.content and "json_path" in truncated.content
+
+        answer = await node._execute_tool(
+            ToolCallEvent(
+                tool_use_id="q1",
+                tool_name="query_spilled",
+                tool_input={
+                    "filename": "tool_github_search_call_9.txt",
+                    "json_path": "$.items[42]",
+                },
+            )
+        )
+
+        assert not answer.is_error
+        assert json.loads(json.loads(answer.content)["value"])["topic"] == "zebra"
+        assert node._build_query_spilled_tool().read_only
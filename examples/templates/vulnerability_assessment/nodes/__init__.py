@@ -71,19 +71,30 @@
 5. **tech_stack_detect(url)** — Detects web server, framework, CMS, JS libraries, cookies
 6. **subdomain_enumerate(domain)** — Queries Certificate Transparency logs for subdomains
 
+Do NOT scan the subdomains on the first round. Subdomains found in Certificate \
+Transparency logs are often third-party services (SaaS hosts behind a CNAME) that the user \
+does not own, so they are only scanned once the user confirms them as in scope.
+
+7. **security_scan_batch(hosts="<confirmed hosts>", scans="ssl,ports")** — Follow-up \
+rounds only, and only when the feedback lists hosts the user confirmed as in scope. Pass \
+exactly those hosts in ONE call (not one tool call per host) and never use the domain \
+parameter, which would scan every discovered subdomain. Returns per-host results with a \
+risk score each and the hosts ranked worst first
+
 **IMPORTANT:**
 - Extract just the hostname/domain from the URL for tools that need it \
 (e.g., "example.com" not "https://example.com")
 - Use the full URL (with https://) for http_headers_scan and tech_stack_detect
-- Run tools in batches of 2-3 to avoid overwhelming the system
+- The scanning tools are non-blocking, so you can run several of them at once
 - If a tool fails, note the error and continue with the remaining tools
 
 **After all tools complete, compile results:**
 
 Combine ALL tool outputs into a single JSON object and store it:
 
-set_output("scan_results", "<JSON string containing all 6 tool results: \
-{ssl: {...}, headers: {...}, dns: {...}, ports: {...}, tech: {...}, subdomains: {...}}>")
+set_output("scan_results", "<JSON string containing the results of every tool you ran: \
+{ssl: {...}, headers: {...}, dns: {...}, ports: {...}, tech: {...}, subdomains: {...}, \
+hosts: <the ranked list from security_scan_batch, if you ran it>}>")
 
 Each tool returns a grade_input dict — preserve these as-is, the risk scorer needs them.
 """,
@@ -94,6 +105,7 @@
         "port_scan",
         "tech_stack_detect",
         "subdomain_enumerate",
+        "security_scan_batch",
     ],
 )
 
@@ -183,8 +195,14 @@
    - D (40-59): Poor, significant vulnerabilities
    - F (0-39): Critical, immediate action required
 
-5. **Options** — Ask: "Would you like me to:
-   - **Continue scanning** — I can focus on specific weak areas for a deeper look
+5. **Discovered Subdomains** — If scan_results lists subdomains that have not been scanned \
+yet, list them and explain that they were found in public Certificate Transparency logs \
+and may belong to third parties (e.g. SaaS providers). Ask the user which of them they \
+own and are authorized to scan; none are scanned without their confirmation.
+
+6. **Options** — Ask: "Would you like me to:
+   - **Continue scanning** — I can focus on specific weak areas for a deeper look, or scan \
+the subdomains you confirm as in scope
    - **Generate the report** — I'll compile a full HTML risk dashboard with all \
 findings and remediation steps"
 
@@ -195,7 +213,8 @@
 If the user wants to continue:
 - set_output("continue_scanning", "true")
 - set_output("feedback", "What the user wants investigated further, or \
-'focus on weakest categories'")
+'focus on weakest categories'. If the user confirmed subdomains as in scope, include \
+'Confirmed in-scope hosts: <comma-separated hostnames>' with exactly the hosts they named")
 - set_output("all_findings", "Accumulated findings from all rounds so far as JSON string")
 
 If the user wants to stop and get the report:
@@ -13,6 +13,7 @@
             "apollo_enrich_person",
             "apollo_enrich_company",
             "apollo_search_people",
+            "apollo_fetch_people",
             "apollo_search_companies",
         ],
         required=True,
@@ -14,6 +14,7 @@
             "github_get_repo",
             "github_search_repos",
             "github_list_issues",
+            "github_fetch_issues",
             "github_get_issue",
             "github_create_issue",
             "github_update_issue",
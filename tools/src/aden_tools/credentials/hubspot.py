@@ -11,6 +11,7 @@
         env_var="HUBSPOT_ACCESS_TOKEN",
         tools=[
             "hubspot_search_contacts",
+            "hubspot_fetch_contacts",
             "hubspot_get_contact",
             "hubspot_create_contact",
             "hubspot_update_contact",
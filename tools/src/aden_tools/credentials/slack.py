@@ -13,6 +13,7 @@
             "slack_send_message",
             "slack_list_channels",
             "slack_get_channel_history",
+            "slack_fetch_channel_history",
             "slack_add_reaction",
             "slack_get_user_info",
             "slack_update_message",
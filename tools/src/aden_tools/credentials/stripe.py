@@ -14,6 +14,7 @@
             "stripe_get_customer_by_email",
             "stripe_update_customer",
             "stripe_list_customers",
+            "stripe_fetch_customers",
             "stripe_get_subscription",
             "stripe_get_subscription_status",
             "stripe_list_subscriptions",
@@ -23,6 +23,7 @@
 # Import register_tools from each tool module
 from .account_info_tool import register_tools as register_account_info
 from .apollo_tool import register_tools as register_apollo
+from .batch_security_scanner import register_tools as register_batch_security_scanner
 from .bigquery_tool import register_tools as register_bigquery
 from .calcom_tool import register_tools as register_calcom
 from .calendar_tool import register_tools as register_calendar
@@ -143,6 +144,7 @@ def register_all_tools(
     register_tech_stack_detector(mcp)
     register_subdomain_enumerator(mcp)
     register_risk_scorer(mcp)
+    register_batch_security_scanner(mcp)
     register_stripe(mcp, credentials=credentials)
 
     # Return the list of all registered tool names
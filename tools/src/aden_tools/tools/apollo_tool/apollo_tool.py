@@ -21,10 +21,16 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.utils.pagination import Page, collect_pages, paginate_numbered, safe_filename
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
 APOLLO_API_BASE = "https://api.apollo.io/api/v1"
+# per_page and concurrent page requests used when following pages;
+# kept low because Apollo rate-limits per minute
+SEARCH_PAGE_SIZE = 100
+SEARCH_CONCURRENCY = 2
 
 
 class _ApolloClient:
@@ -204,11 +210,12 @@ def search_people(
         industries: list[str] | None = None,
         technologies: list[str] | None = None,
         limit: int = 10,
+        page: int = 1,
     ) -> dict[str, Any]:
         """Search for people with filters."""
         body: dict[str, Any] = {
             "per_page": min(limit, 100),
-            "page": 1,
+            "page": max(1, page),
         }
 
         if titles:
@@ -236,7 +243,7 @@ def search_people(
             people = result.get("people", [])
             return {
                 "total": result.get("pagination", {}).get("total_entries", len(people)),
-                "page": result.get("pagination", {}).get("page", 1),
+                "page": result.get("pagination", {}).get("page", page),
                 "per_page": result.get("pagination", {}).get("per_page", limit),
                 "results": [
                     {
@@ -526,6 +533,71 @@ def apollo_search_people(
         except httpx.RequestError as e:
             return {"error": f"Network error: {e}"}
 
+    @mcp.tool()
+    def apollo_fetch_people(
+        titles: list[str] | None = None,
+        seniorities: list[str] | None = None,
+        locations: list[str] | None = None,
+        company_sizes: list[str] | None = None,
+        industries: list[str] | None = None,
+        technologies: list[str] | None = None,
+        max_items: int = 500,
+        data_dir: str = "",
+    ) -> dict:
+        """
+        Fetch up to max_items contacts matching filters, following pages.
+
+        Takes the same filters as apollo_search_people; use it when you need
+        more than one page of results. Contacts are saved to a JSONL data file
+        when a data directory is available; the result then holds the filename
+        and a short preview.
+
+        Args:
+            titles: Job titles to search for
+            seniorities: Seniority levels
+            locations: Geographic locations
+            company_sizes: Company employee count ranges
+            industries: Industry tags
+            technologies: Technologies used by company
+            max_items: Maximum number of contacts to fetch (default 500)
+
+        Returns:
+            Dict with count, pages, has_more and either the contacts or the
+            data filename, or error
+        """
+        client = _get_client()
+        if isinstance(client, dict):
+            return client
+
+        def fetch(page: int) -> Page:
+            result = client.search_people(
+                titles=titles,
+                seniorities=seniorities,
+                locations=locations,
+                company_sizes=company_sizes,
+                industries=industries,
+                technologies=technologies,
+                limit=SEARCH_PAGE_SIZE,
+                page=page,
+            )
+            if "error" in result:
+                return Page(error=result["error"])
+            return Page(items=result["results"])
+
+        try:
+            return collect_pages(
+                paginate_numbered(
+                    fetch, SEARCH_PAGE_SIZE, max_items, concurrency=SEARCH_CONCURRENCY
+                ),
+                max_items,
+                data_dir,
+                safe_filename("apollo_people"),
+            )
+        except httpx.TimeoutException:
+            return {"error": "Request timed out"}
+        except httpx.RequestError as e:
+            return {"error": f"Network error: {e}"}
+
     # --- Company Search ---
 
     @mcp.tool()
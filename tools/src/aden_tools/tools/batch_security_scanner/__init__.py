@@ -0,0 +1,5 @@
+"""Batch Security Scanner - Scan many hosts concurrently and score each one."""
+
+from .batch_security_scanner import iter_host_scans, register_tools
+
+__all__ = ["iter_host_scans", "register_tools"]
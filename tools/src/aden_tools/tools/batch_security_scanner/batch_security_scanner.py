@@ -0,0 +1,197 @@
+"""
+Batch Security Scanner - Scan many hosts concurrently and score each one.
+
+Runs the SSL/TLS, port and DNS scanners over a batch of hosts (given
+explicitly, or every live subdomain of a domain found in Certificate
+Transparency logs) on the shared async scanning engine.  Hosts are scanned
+concurrently, all port probes share one adaptive socket budget, and each
+host's results are fed to the risk scorer as soon as that host is done.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import re
+import time
+from collections.abc import AsyncIterator
+
+from fastmcp import FastMCP
+
+from aden_tools.utils.scan_engine import (
+    DEFAULT_HOST_CONCURRENCY,
+    AdaptiveLimiter,
+    clean_hostname,
+    scan_hosts,
+)
+
+from ..dns_security_scanner.dns_security_scanner import scan_dns
+from ..port_scanner.port_scanner import (
+    INITIAL_CONCURRENCY,
+    TOP20_PORTS,
+    parse_ports,
+    scan_ports,
+)
+from ..risk_scorer.risk_scorer import score_results
+from ..ssl_tls_scanner.ssl_tls_scanner import scan_tls
+from ..subdomain_enumerator.subdomain_enumerator import enumerate_subdomains
+
+SCAN_TYPES = ("ssl", "ports", "dns")
+# Risk scorer category for each scan type
+SCAN_CATEGORIES = {"ssl": "ssl_tls", "ports": "network_exposure", "dns": "dns_security"}
+
+MAX_HOSTS = 200
+MAX_HOST_CONCURRENCY = 50
+# Open sockets across every host's port scan
+MAX_BATCH_SOCKETS = 500
+
+
+async def _scan_host(
+    host: str,
+    scans: tuple[str, ...],
+    port_list: list[int],
+    timeout: float,
+    ssl_port: int,
+    limiter: AdaptiveLimiter,
+) -> dict:
+    started = time.perf_counter()
+    jobs = {
+        "ssl": lambda: scan_tls(host, ssl_port),
+        "ports": lambda: scan_ports(host, port_list, timeout, limiter),
+        "dns": lambda: scan_dns(host),
+    }
+    outputs = await asyncio.gather(*(jobs[scan]() for scan in scans))
+    result: dict = {"host": host, **dict(zip(scans, outputs, strict=True))}
+
+    scored = {
+        SCAN_CATEGORIES[scan]: result[scan]
+        for scan in scans
+        if isinstance(result[scan], dict) and "grade_input" in result[scan]
+    }
+    if scored:
+        risk = score_results(scored)
+        risk.pop("grade_scale")
+        result["risk"] = risk
+    else:
+        result["risk"] = None
+    result["elapsed_ms"] = round((time.perf_counter() - started) * 1000)
+    return result
+
+
+async def iter_host_scans(
+    hosts: list[str],
+    scans: tuple[str, ...] = ("ssl", "ports"),
+    port_list: list[int] = TOP20_PORTS,
+    timeout: float = 3.0,
+    concurrency: int = DEFAULT_HOST_CONCURRENCY,
+    ssl_port: int = 443,
+) -> AsyncIterator[dict]:
+    """
+    Scan *hosts* concurrently and yield each host's results and risk score
+    as soon as it is done.
+    """
+    limiter = AdaptiveLimiter(
+        min(INITIAL_CONCURRENCY * concurrency, MAX_BATCH_SOCKETS), maximum=MAX_BATCH_SOCKETS
+    )
+
+    async def scan(host: str) -> dict:
+        return await _scan_host(host, scans, port_list, timeout, ssl_port, limiter)
+
+    async for host, result in scan_hosts(hosts, scan, concurrency):
+        if "host" not in result:
+            result = {"host": host, **result, "risk": None}
+        yield result
+
+
+def register_tools(mcp: FastMCP) -> None:
+    """Register batch security scanning tools with the MCP server."""
+
+    @mcp.tool()
+    async def security_scan_batch(
+        hosts: str = "",
+        domain: str = "",
+        scans: str = "ssl,ports",
+        ports: str = "top20",
+        timeout: float = 3.0,
+        max_hosts: int = 50,
+        concurrency: int = DEFAULT_HOST_CONCURRENCY,
+        ssl_port: int = 443,
+    ) -> dict:
+        """
+        Scan many hosts in one call and grade each one.
+
+        Runs SSL/TLS, port and DNS scans over every host concurrently and
+        scores each host with the risk scorer as soon as its scans finish.
+        Pass hosts explicitly, or a domain to scan the domain plus every live
+        subdomain found in Certificate Transparency logs. Port and TLS scans
+        connect to every host, so only scan hosts the user has confirmed are
+        in scope; discovered subdomains are often third-party services.
+
+        Args:
+            hosts: Comma- or newline-separated hostnames (e.g., "example.com,api.example.com")
+            domain: Also discover and scan the live subdomains of this domain
+            scans: Scans to run per host, comma-separated: "ssl", "ports", "dns"
+            ports: Ports for the port scan: "top20" (default), "top100" or "80,443,8080"
+            timeout: Connection timeout per port in seconds (default 3.0, max 10.0)
+            max_hosts: Maximum number of hosts to scan (default 50, max 200)
+            concurrency: Hosts scanned at the same time (default 10, max 50)
+            ssl_port: Port for the SSL/TLS scan (default 443)
+
+        Returns:
+            Dict with per-host results in completion order (raw ssl/ports/dns
+            results, each with grade_input, plus a risk score), the hosts
+            ranked worst first, and the subdomain enumeration when domain was given.
+        """
+        scan_types = tuple(dict.fromkeys(s.strip() for s in scans.split(",") if s.strip()))
+        unknown = [s for s in scan_types if s not in SCAN_TYPES]
+        if unknown or not scan_types:
+            return {"error": f"scans must be a comma-separated subset of {', '.join(SCAN_TYPES)}"}
+        try:
+            port_list = parse_ports(ports)
+        except ValueError:
+            return {"error": f"Invalid port list: {ports}. Use 'top20', 'top100', or '80,443'"}
+
+        max_hosts = max(1, min(max_hosts, MAX_HOSTS))
+        targets = [clean_hostname(h) for h in re.split(r"[,\s]+", hosts) if h.strip()]
+
+        result: dict = {}
+        if domain:
+            domain = clean_hostname(domain)
+            subdomains = await enumerate_subdomains(domain, max_hosts, probe=True)
+            result["subdomains"] = subdomains
+            targets += [domain, *subdomains.get("live_subdomains", [])]
+
+        targets = list(dict.fromkeys(t for t in targets if t))[:max_hosts]
+        if not targets:
+            return {"error": "Provide hosts or a domain to scan", **result}
+
+        started = time.perf_counter()
+        host_results = [
+            host_result
+            async for host_result in iter_host_scans(
+                targets,
+                scan_types,
+                port_list,
+                min(timeout, 10.0),
+                max(1, min(concurrency, MAX_HOST_CONCURRENCY)),
+                ssl_port,
+            )
+        ]
+
+        graded = [r for r in host_results if r["risk"]]
+        ranked = sorted(graded, key=lambda r: (r["risk"]["overall_score"], r["host"]))
+        return {
+            "hosts_scanned": len(host_results),
+            "scans": list(scan_types),
+            "results": host_results,
+            "ranked": [
+                {
+                    "host": r["host"],
+                    "overall_score": r["risk"]["overall_score"],
+                    "overall_grade": r["risk"]["overall_grade"],
+                }
+                for r in ranked
+            ],
+            "failed_hosts": [r["host"] for r in host_results if not r["risk"]],
+            "elapsed_ms": round((time.perf_counter() - started) * 1000),
+            **result,
+        }
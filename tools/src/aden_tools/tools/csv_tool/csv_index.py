@@ -0,0 +1,222 @@
+"""
+Row-offset index for CSV files.
+
+Reading rows ``offset..offset+limit`` of a CSV normally means parsing every
+row before ``offset``, so paging through a large file is quadratic.  The
+index records the byte offset of every ``STRIDE``-th data row (found with
+the csv module, so quoted fields spanning lines are handled), along with
+the header and the total row count.  A read then seeks to the nearest
+checkpoint and parses at most ``STRIDE - 1`` rows before the first one
+returned.
+
+Indexes are built on first use in one pass over the file, kept in memory,
+and saved as a JSON sidecar in a private per-user directory under the temp
+directory (see ``aden_tools.utils.private_dir``) so other processes can
+reuse them; sidecars are trusted when loaded, so a directory owned by
+another user is never read.  They are keyed by the file's real path and reused while its
+mtime and size are unchanged; ``extend_csv_index`` updates an index after
+rows are appended instead of rescanning the file.
+"""
+
+from __future__ import annotations
+
+import csv
+import hashlib
+import io
+import json
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+from typing import Any, BinaryIO
+
+from aden_tools.utils.private_dir import make_private_dir, user_temp_dir
+
+STRIDE = 64
+INDEX_VERSION = 1
+MAX_CACHED_INDEXES = 32
+
+INDEX_DIR = user_temp_dir("aden_csv_index")
+
+_cache: OrderedDict[str, CsvIndex] = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+class _LineReader:
+    """Decoded lines of a binary file, tracking the byte offset consumed."""
+
+    def __init__(self, f: BinaryIO, offset: int):
+        self._f = f
+        self.offset = offset
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> str:
+        line = self._f.readline()
+        if not line:
+            raise StopIteration
+        self.offset += len(line)
+        return line.decode("utf-8")
+
+
+@dataclass
+class CsvIndex:
+    path: str
+    mtime_ns: int
+    size: int
+    # None when the file is empty
+    columns: list[str] | None
+    total_rows: int = 0
+    # Byte offset of data rows 0, STRIDE, 2 * STRIDE, ...
+    checkpoints: list[int] = field(default_factory=list)
+    stride: int = STRIDE
+    version: int = INDEX_VERSION
+
+    def is_current(self) -> bool:
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return False
+        return (stat.st_mtime_ns, stat.st_size) == (self.mtime_ns, self.size)
+
+    def read_rows(
+        self,
+        offset: int = 0,
+        limit: int | None = None,
+        columns: list[str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Rows ``offset..offset+limit`` as dicts (like ``csv.DictReader``),
+        optionally keeping only *columns*.  A negative *offset* reads from
+        the first row.
+        """
+        offset = max(offset, 0)
+        if self.columns is None or offset >= self.total_rows or limit == 0:
+            return []
+        checkpoint = offset // self.stride
+        skip = offset - checkpoint * self.stride
+        rows: list[dict[str, Any]] = []
+        with open(self.path, "rb") as raw:
+            raw.seek(self.checkpoints[checkpoint])
+            text = io.TextIOWrapper(raw, encoding="utf-8", newline="")
+            for row in csv.DictReader(text, fieldnames=self.columns):
+                if skip:
+                    skip -= 1
+                    continue
+                rows.append({c: row.get(c) for c in columns} if columns else row)
+                if limit is not None and len(rows) >= limit:
+                    break
+        return rows
+
+
+def _scan(index: CsvIndex, f: BinaryIO, start: int) -> None:
+    """Index the data rows from byte *start* to the end of the file."""
+    f.seek(start)
+    lines = _LineReader(f, start)
+    reader = csv.reader(lines)
+    while True:
+        row_start = lines.offset
+        try:
+            row = next(reader)
+        except StopIteration:
+            break
+        if not row:
+            continue  # blank line, skipped like csv.DictReader does
+        if index.total_rows % index.stride == 0:
+            index.checkpoints.append(row_start)
+        index.total_rows += 1
+
+
+def _build(path: str) -> CsvIndex:
+    stat = os.stat(path)
+    with open(path, "rb") as f:
+        lines = _LineReader(f, 0)
+        try:
+            header = next(csv.reader(lines))
+        except StopIteration:
+            return CsvIndex(path, stat.st_mtime_ns, stat.st_size, columns=None)
+        index = CsvIndex(path, stat.st_mtime_ns, stat.st_size, columns=header)
+        _scan(index, f, lines.offset)
+    return index
+
+
+def _sidecar_path(path: str) -> str:
+    digest = hashlib.sha256(path.encode("utf-8")).hexdigest()[:24]
+    return os.path.join(INDEX_DIR, f"{digest}.json")
+
+
+def _load_sidecar(path: str) -> CsvIndex | None:
+    try:
+        make_private_dir(INDEX_DIR)
+        with open(_sidecar_path(path), encoding="utf-8") as f:
+            index = CsvIndex(**json.load(f))
+    except (OSError, ValueError, TypeError):
+        return None
+    if index.path != path or index.version != INDEX_VERSION or not index.is_current():
+        return None
+    return index
+
+
+def _save_sidecar(index: CsvIndex) -> None:
+    sidecar = _sidecar_path(index.path)
+    try:
+        make_private_dir(INDEX_DIR)
+        tmp = f"{sidecar}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(asdict(index), f)
+        os.replace(tmp, sidecar)
+    except OSError:
+        pass  # the in-memory index still works
+
+
+def _remember(index: CsvIndex) -> CsvIndex:
+    with _cache_lock:
+        _cache[index.path] = index
+        _cache.move_to_end(index.path)
+        while len(_cache) > MAX_CACHED_INDEXES:
+            _cache.popitem(last=False)
+    return index
+
+
+def get_csv_index(path: str) -> CsvIndex:
+    """The index for *path*, built on first use and rebuilt when the file changes."""
+    path = os.path.realpath(path)
+    with _cache_lock:
+        index = _cache.get(path)
+    if index is not None and index.is_current():
+        return index
+    index = _load_sidecar(path)
+    if index is None:
+        index = _build(path)
+        _save_sidecar(index)
+    return _remember(index)
+
+
+def extend_csv_index(index: CsvIndex) -> CsvIndex:
+    """
+    Update *index* after rows were appended to its file, scanning only the
+    new bytes.  Falls back to a full rebuild if the file did not just grow.
+    """
+    stat = os.stat(index.path)
+    grew = stat.st_size > index.size and index.columns is not None
+    if grew:
+        with open(index.path, "rb") as f:
+            if index.size:
+                f.seek(index.size - 1)
+                grew = f.read(1) == b"\n"  # the old last row was complete
+            if grew:
+                extended = CsvIndex(
+                    index.path,
+                    stat.st_mtime_ns,
+                    stat.st_size,
+                    columns=index.columns,
+                    total_rows=index.total_rows,
+                    checkpoints=list(index.checkpoints),
+                    stride=index.stride,
+                )
+                _scan(extended, f, index.size)
+    if not grew:
+        extended = _build(index.path)
+    _save_sidecar(extended)
+    return _remember(extended)
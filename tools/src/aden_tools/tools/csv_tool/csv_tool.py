@@ -5,7 +5,10 @@
 
 from fastmcp import FastMCP
 
+from aden_tools.utils.query_engine import DEFAULT_MAX_ROWS, get_query_engine, single_select_error
+
 from ..file_system_toolkits.security import get_secure_path
+from .csv_index import extend_csv_index, get_csv_index
 
 
 def register_tools(mcp: FastMCP) -> None:
@@ -19,10 +22,14 @@ def csv_read(
         session_id: str,
         limit: int | None = None,
         offset: int = 0,
+        columns: list[str] | None = None,
     ) -> dict:
         """
         Read a CSV file and return its contents.
 
+        Paging with offset is cheap: the file is indexed on first read, so
+        later reads seek straight to the requested rows.
+
         Args:
             path: Path to the CSV file (relative to session sandbox)
             workspace_id: Workspace identifier
@@ -30,6 +37,7 @@ def csv_read(
             session_id: Session identifier
             limit: Maximum number of rows to return (None = all rows)
             offset: Number of rows to skip from the beginning
+            columns: Only return these columns (None = all columns)
 
         Returns:
             dict with success status, data, and metadata
@@ -45,37 +53,26 @@ def csv_read(
             if not path.lower().endswith(".csv"):
                 return {"error": "File must have .csv extension"}
 
-            # Read CSV
-            with open(secure_path, encoding="utf-8", newline="") as f:
-                reader = csv.DictReader(f)
-
-                if reader.fieldnames is None:
-                    return {"error": "CSV file is empty or has no headers"}
+            index = get_csv_index(secure_path)
+            if index.columns is None:
+                return {"error": "CSV file is empty or has no headers"}
 
-                columns = list(reader.fieldnames)
+            if columns:
+                unknown = [c for c in columns if c not in index.columns]
+                if unknown:
+                    return {"error": f"Unknown columns: {unknown}. Available: {index.columns}"}
 
-                # Apply offset and limit
-                rows = []
-                for i, row in enumerate(reader):
-                    if i < offset:
-                        continue
-                    if limit is not None and len(rows) >= limit:
-                        break
-                    rows.append(row)
-
-            # Get total row count (re-read for accurate count)
-            with open(secure_path, encoding="utf-8", newline="") as f:
-                reader = csv.reader(f)
-                total_rows = sum(1 for row in reader if any(row)) - 1
+            rows = index.read_rows(offset, limit, columns)
+            selected = list(columns) if columns else list(index.columns)
 
             return {
                 "success": True,
                 "path": path,
-                "columns": columns,
-                "column_count": len(columns),
+                "columns": selected,
+                "column_count": len(selected),
                 "rows": rows,
                 "row_count": len(rows),
-                "total_rows": total_rows,
+                "total_rows": index.total_rows,
                 "offset": offset,
                 "limit": limit,
             }
@@ -177,12 +174,11 @@ def csv_append(
             if not rows:
                 return {"error": "rows cannot be empty"}
 
-            # Read existing columns
-            with open(secure_path, encoding="utf-8", newline="") as f:
-                reader = csv.DictReader(f)
-                if reader.fieldnames is None:
-                    return {"error": "CSV file is empty or has no headers"}
-                columns = list(reader.fieldnames)
+            # Existing columns (and row count) from the index
+            index = get_csv_index(secure_path)
+            if index.columns is None:
+                return {"error": "CSV file is empty or has no headers"}
+            columns = index.columns
 
             # Append rows
             with open(secure_path, "a", encoding="utf-8", newline="") as f:
@@ -192,16 +188,14 @@ def csv_append(
                     filtered_row = {k: v for k, v in row.items() if k in columns}
                     writer.writerow(filtered_row)
 
-            # Get new total row count
-            with open(secure_path, encoding="utf-8", newline="") as f:
-                reader = csv.reader(f)
-                total_rows = sum(1 for row in reader if any(row)) - 1  # Subtract header
+            # Index only the appended rows for the new total
+            index = extend_csv_index(index)
 
             return {
                 "success": True,
                 "path": path,
                 "rows_appended": len(rows),
-                "total_rows": total_rows,
+                "total_rows": index.total_rows,
             }
 
         except csv.Error as e:
@@ -242,24 +236,17 @@ def csv_info(
             # Get file size
             file_size = os.path.getsize(secure_path)
 
-            # Read headers and count rows
-            with open(secure_path, encoding="utf-8", newline="") as f:
-                reader = csv.DictReader(f)
-
-                if reader.fieldnames is None:
-                    return {"error": "CSV file is empty or has no headers"}
-
-                columns = list(reader.fieldnames)
-
-                # Count rows
-                total_rows = sum(1 for _ in reader)
+            # Headers and row count from the index (cached after the first call)
+            index = get_csv_index(secure_path)
+            if index.columns is None:
+                return {"error": "CSV file is empty or has no headers"}
 
             return {
                 "success": True,
                 "path": path,
-                "columns": columns,
-                "column_count": len(columns),
-                "total_rows": total_rows,
+                "columns": list(index.columns),
+                "column_count": len(index.columns),
+                "total_rows": index.total_rows,
                 "file_size_bytes": file_size,
             }
 
@@ -277,11 +264,15 @@ def csv_sql(
         agent_id: str,
         session_id: str,
         query: str,
+        max_rows: int = DEFAULT_MAX_ROWS,
+        data_dir: str = "",
     ) -> dict:
         """
         Query a CSV file using SQL (powered by DuckDB).
 
         The CSV file is loaded as a table named 'data'. Use standard SQL syntax.
+        The file is parsed once per session and reused by later queries until
+        it changes, so running several queries on the same file is cheap.
 
         Args:
             path: Path to the CSV file (relative to session sandbox)
@@ -290,6 +281,9 @@ def csv_sql(
             session_id: Session identifier
             query: SQL query to execute. The CSV is available as table 'data'.
                    Example: "SELECT * FROM data WHERE price > 100 ORDER BY name LIMIT 10"
+            max_rows: Maximum rows to return (default 1000). Larger results are
+                   marked truncated and, when a data directory is available,
+                   saved in full to a data file.
 
         Returns:
             dict with query results, columns, and row count
@@ -309,7 +303,7 @@ def csv_sql(
             query="SELECT * FROM data WHERE LOWER(name) LIKE '%phone%'"
         """
         try:
-            import duckdb
+            import duckdb  # noqa: F401
         except ImportError:
             return {
                 "error": (
@@ -351,31 +345,21 @@ def csv_sql(
                 if keyword in query_upper:
                     return {"error": f"'{keyword}' is not allowed in queries"}
 
-            # Execute query using in-memory DuckDB
-            con = duckdb.connect(":memory:")
-            try:
-                # Load CSV as 'data' table
-                con.execute(f"CREATE TABLE data AS SELECT * FROM read_csv_auto('{secure_path}')")
-
-                # Execute user query
-                result = con.execute(query)
-                columns = [desc[0] for desc in result.description]
-                rows = result.fetchall()
-
-                # Convert to list of dicts
-                rows_as_dicts = [dict(zip(columns, row, strict=False)) for row in rows]
-
-                return {
-                    "success": True,
-                    "path": path,
-                    "query": query,
-                    "columns": columns,
-                    "column_count": len(columns),
-                    "rows": rows_as_dicts,
-                    "row_count": len(rows_as_dicts),
-                }
-            finally:
-                con.close()
+            statement_error = single_select_error(query)
+            if statement_error:
+                return {"error": statement_error}
+
+            # Session-scoped engine: the CSV is parsed once and cached as 'data'
+            engine = get_query_engine(f"{workspace_id}/{agent_id}/{session_id}")
+            tables = engine.csv_tables(secure_path)
+            result = engine.query(
+                query,
+                tables,
+                max_rows=max(max_rows, 0),
+                data_dir=data_dir,
+                spill_name=f"csv_sql_{os.path.splitext(os.path.basename(path))[0]}",
+            )
+            return {"success": True, "path": path, "query": query, **result}
 
         except Exception as e:
             error_msg = str(e)
@@ -2,13 +2,20 @@
 DNS Security Scanner - Check SPF, DMARC, DKIM, DNSSEC, and zone transfer.
 
 Performs non-intrusive DNS queries to evaluate email security configuration
-and DNS infrastructure hardening. Uses dnspython for all lookups.
+and DNS infrastructure hardening. All lookups run concurrently through the
+shared caching resolver (``aden_tools.utils.dns_resolver``), so repeated scans
+of a domain, or of hosts sharing nameservers, reuse cached answers.
 """
 
 from __future__ import annotations
 
+import asyncio
+
 from fastmcp import FastMCP
 
+from aden_tools.utils.dns_resolver import DnsResolver, get_resolver
+from aden_tools.utils.scan_engine import clean_hostname
+
 try:
     import dns.exception
     import dns.name
@@ -26,11 +33,53 @@
 DKIM_SELECTORS = ["default", "google", "selector1", "selector2", "k1", "mail", "dkim", "s1"]
 
 
+async def scan_dns(domain: str, resolver: DnsResolver | None = None) -> dict:
+    """Check *domain*'s DNS security records, as returned by ``dns_security_scan``."""
+    if not _DNS_AVAILABLE:
+        return {
+            "error": ("dnspython is not installed. Install it with: pip install dnspython"),
+        }
+
+    resolver = resolver or get_resolver()
+
+    spf, dmarc, dkim, dnssec, mx, caa, zone_transfer = await asyncio.gather(
+        _check_spf(resolver, domain),
+        _check_dmarc(resolver, domain),
+        _check_dkim(resolver, domain),
+        _check_dnssec(resolver, domain),
+        _check_mx(resolver, domain),
+        _check_caa(resolver, domain),
+        _check_zone_transfer(resolver, domain),
+    )
+
+    grade_input = {
+        "spf_present": spf["present"],
+        "spf_strict": spf.get("policy") == "hardfail",
+        "dmarc_present": dmarc["present"],
+        "dmarc_enforcing": dmarc.get("policy") in ("quarantine", "reject"),
+        "dkim_found": len(dkim.get("selectors_found", [])) > 0,
+        "dnssec_enabled": dnssec["enabled"],
+        "zone_transfer_blocked": not zone_transfer["vulnerable"],
+    }
+
+    return {
+        "domain": domain,
+        "spf": spf,
+        "dmarc": dmarc,
+        "dkim": dkim,
+        "dnssec": dnssec,
+        "mx_records": mx,
+        "caa_records": caa,
+        "zone_transfer": zone_transfer,
+        "grade_input": grade_input,
+    }
+
+
 def register_tools(mcp: FastMCP) -> None:
     """Register DNS security scanning tools with the MCP server."""
 
     @mcp.tool()
-    def dns_security_scan(domain: str) -> dict:
+    async def dns_security_scan(domain: str) -> dict:
         """
         Scan a domain's DNS records for email security and infrastructure hardening.
 
@@ -45,56 +94,13 @@ def dns_security_scan(domain: str) -> dict:
             Dict with SPF, DMARC, DKIM, DNSSEC, MX, CAA results, zone transfer
             status, and grade_input for the risk_scorer tool.
         """
-        if not _DNS_AVAILABLE:
-            return {
-                "error": ("dnspython is not installed. Install it with: pip install dnspython"),
-            }
-
-        # Clean domain
-        domain = domain.replace("https://", "").replace("http://", "").strip("/")
-        domain = domain.split("/")[0]
-        if ":" in domain:
-            domain = domain.split(":")[0]
-
-        resolver = dns.resolver.Resolver()
-        resolver.timeout = 10
-        resolver.lifetime = 10
-
-        spf = _check_spf(resolver, domain)
-        dmarc = _check_dmarc(resolver, domain)
-        dkim = _check_dkim(resolver, domain)
-        dnssec = _check_dnssec(resolver, domain)
-        mx = _check_mx(resolver, domain)
-        caa = _check_caa(resolver, domain)
-        zone_transfer = _check_zone_transfer(resolver, domain)
-
-        grade_input = {
-            "spf_present": spf["present"],
-            "spf_strict": spf.get("policy") == "hardfail",
-            "dmarc_present": dmarc["present"],
-            "dmarc_enforcing": dmarc.get("policy") in ("quarantine", "reject"),
-            "dkim_found": len(dkim.get("selectors_found", [])) > 0,
-            "dnssec_enabled": dnssec["enabled"],
-            "zone_transfer_blocked": not zone_transfer["vulnerable"],
-        }
-
-        return {
-            "domain": domain,
-            "spf": spf,
-            "dmarc": dmarc,
-            "dkim": dkim,
-            "dnssec": dnssec,
-            "mx_records": mx,
-            "caa_records": caa,
-            "zone_transfer": zone_transfer,
-            "grade_input": grade_input,
-        }
+        return await scan_dns(clean_hostname(domain))
 
 
-def _check_spf(resolver: dns.resolver.Resolver, domain: str) -> dict:
+async def _check_spf(resolver: DnsResolver, domain: str) -> dict:
     """Check SPF record."""
     try:
-        answers = resolver.resolve(domain, "TXT")
+        answers = await resolver.resolve(domain, "TXT")
         for rdata in answers:
             txt = rdata.to_text().strip('"')
             if txt.startswith("v=spf1"):
@@ -137,10 +143,10 @@ def _check_spf(resolver: dns.resolver.Resolver, domain: str) -> dict:
     }
 
 
-def _check_dmarc(resolver: dns.resolver.Resolver, domain: str) -> dict:
+async def _check_dmarc(resolver: DnsResolver, domain: str) -> dict:
     """Check DMARC record."""
     try:
-        answers = resolver.resolve(f"_dmarc.{domain}", "TXT")
+        answers = await resolver.resolve(f"_dmarc.{domain}", "TXT")
         for rdata in answers:
             txt = rdata.to_text().strip('"')
             if txt.startswith("v=DMARC1"):
@@ -178,29 +184,27 @@ def _check_dmarc(resolver: dns.resolver.Resolver, domain: str) -> dict:
     }
 
 
-def _check_dkim(resolver: dns.resolver.Resolver, domain: str) -> dict:
+async def _check_dkim(resolver: DnsResolver, domain: str) -> dict:
     """Probe common DKIM selectors."""
-    found = []
-    missing = []
 
-    for selector in DKIM_SELECTORS:
+    async def has_key(selector: str) -> bool:
         try:
-            answers = resolver.resolve(f"{selector}._domainkey.{domain}", "TXT")
-            if answers:
-                found.append(selector)
+            answers = await resolver.resolve(f"{selector}._domainkey.{domain}", "TXT")
+            return bool(answers)
         except (dns.resolver.NoAnswer, dns.resolver.NXDOMAIN, dns.exception.DNSException):
-            missing.append(selector)
+            return False
 
+    present = await asyncio.gather(*(has_key(selector) for selector in DKIM_SELECTORS))
     return {
-        "selectors_found": found,
-        "selectors_missing": missing,
+        "selectors_found": [s for s, ok in zip(DKIM_SELECTORS, present, strict=True) if ok],
+        "selectors_missing": [s for s, ok in zip(DKIM_SELECTORS, present, strict=True) if not ok],
     }
 
 
-def _check_dnssec(resolver: dns.resolver.Resolver, domain: str) -> dict:
+async def _check_dnssec(resolver: DnsResolver, domain: str) -> dict:
     """Check if DNSSEC is enabled."""
     try:
-        answers = resolver.resolve(domain, "DNSKEY")
+        answers = await resolver.resolve(domain, "DNSKEY")
         if answers:
             return {"enabled": True, "issues": []}
     except dns.resolver.NoAnswer:
@@ -216,35 +220,37 @@ def _check_dnssec(resolver: dns.resolver.Resolver, domain: str) -> dict:
     }
 
 
-def _check_mx(resolver: dns.resolver.Resolver, domain: str) -> list[str]:
+async def _check_mx(resolver: DnsResolver, domain: str) -> list[str]:
     """Get MX records."""
     try:
-        answers = resolver.resolve(domain, "MX")
+        answers = await resolver.resolve(domain, "MX")
         return [f"{r.preference} {r.exchange}" for r in answers]
     except (dns.resolver.NoAnswer, dns.resolver.NXDOMAIN, dns.exception.DNSException):
         return []
 
 
-def _check_caa(resolver: dns.resolver.Resolver, domain: str) -> list[str]:
+async def _check_caa(resolver: DnsResolver, domain: str) -> list[str]:
     """Get CAA records."""
     try:
-        answers = resolver.resolve(domain, "CAA")
+        answers = await resolver.resolve(domain, "CAA")
         return [rdata.to_text() for rdata in answers]
     except (dns.resolver.NoAnswer, dns.resolver.NXDOMAIN, dns.exception.DNSException):
         return []
 
 
-def _check_zone_transfer(resolver: dns.resolver.Resolver, domain: str) -> dict:
+async def _check_zone_transfer(resolver: DnsResolver, domain: str) -> dict:
     """Test if zone transfer (AXFR) is allowed — a common misconfiguration."""
     try:
-        ns_answers = resolver.resolve(domain, "NS")
+        ns_answers = await resolver.resolve(domain, "NS")
     except (dns.resolver.NoAnswer, dns.resolver.NXDOMAIN, dns.exception.DNSException):
         return {"vulnerable": False, "error": "Could not resolve NS records"}
 
     for ns_rdata in ns_answers:
         ns_host = str(ns_rdata.target)
         try:
-            zone = dns.zone.from_xfr(dns.query.xfr(ns_host, domain, timeout=5))
+            # AXFR needs the nameserver's address, not its name
+            ns_ip = await resolver.address(ns_host)
+            zone = await asyncio.to_thread(_transfer_zone, ns_ip, domain)
             if zone:
                 return {
                     "vulnerable": True,
@@ -261,3 +267,8 @@ def _check_zone_transfer(resolver: dns.resolver.Resolver, domain: str) -> dict:
             continue
 
     return {"vulnerable": False}
+
+
+def _transfer_zone(ns_ip: str, domain: str) -> dns.zone.Zone:
+    """Blocking AXFR of *domain* from *ns_ip*; raises when it is refused."""
+    return dns.zone.from_xfr(dns.query.xfr(ns_ip, domain, timeout=5))
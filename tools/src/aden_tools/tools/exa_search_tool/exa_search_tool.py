@@ -19,6 +19,8 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.utils.fetch_cache import cached
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
@@ -38,6 +40,7 @@ def _get_api_key() -> str | None:
             return credentials.get("exa_search")
         return os.getenv("EXA_API_KEY")
 
+    @cached("exa_search", exclude=("api_key",))
     def _make_request(
         endpoint: str,
         payload: dict,
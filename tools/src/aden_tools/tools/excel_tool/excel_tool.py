@@ -6,7 +6,10 @@
 
 from fastmcp import FastMCP
 
+from aden_tools.utils.query_engine import DEFAULT_MAX_ROWS, get_query_engine, single_select_error
+
 from ..file_system_toolkits.security import get_secure_path
+from .workbook_cache import MATCH_TYPES, get_workbook_cache, invalidate_workbook_cache
 
 
 def register_tools(mcp: FastMCP) -> None:
@@ -41,7 +44,7 @@ def excel_read(
             return {"error": "offset and limit must be non-negative"}
 
         try:
-            from openpyxl import load_workbook
+            import openpyxl  # noqa: F401
         except ImportError:
             return {
                 "error": (
@@ -59,87 +62,70 @@ def excel_read(
             if not path.lower().endswith((".xlsx", ".xlsm")):
                 return {"error": "File must have .xlsx or .xlsm extension"}
 
-            # Load workbook in read-only mode for better performance
-            wb = load_workbook(secure_path, read_only=True, data_only=True)
+            workbook = get_workbook_cache(secure_path)
 
-            try:
-                # Get the specified sheet or active sheet
-                if sheet:
-                    if sheet not in wb.sheetnames:
-                        return {
-                            "error": f"Sheet '{sheet}' not found. Available sheets: {wb.sheetnames}"
-                        }
-                    ws = wb[sheet]
-                else:
-                    ws = wb.active
-
-                if ws is None:
-                    return {"error": "Workbook has no active sheet"}
-
-                # Read all rows
-                all_rows = []
-                for row in ws.iter_rows(values_only=True):
-                    # Convert cell values to serializable format
-                    converted_row = [_convert_cell_value(cell) for cell in row]
-                    all_rows.append(converted_row)
-
-                if not all_rows:
+            # Get the specified sheet or active sheet
+            if sheet:
+                if workbook.sheet(sheet) is None:
                     return {
-                        "success": True,
-                        "path": path,
-                        "sheet_name": ws.title,
-                        "columns": [],
-                        "column_count": 0,
-                        "rows": [],
-                        "row_count": 0,
-                        "total_rows": 0,
-                        "offset": offset,
-                        "limit": limit,
+                        "error": (
+                            f"Sheet '{sheet}' not found. Available sheets: {workbook.sheet_names}"
+                        )
                     }
+                ws = workbook.sheet(sheet)
+            else:
+                ws = workbook.sheet(workbook.active) if workbook.active else None
 
-                # First row as headers
-                columns = all_rows[0] if all_rows else []
-                data_rows = all_rows[1:]  # Rows without header
-
-                # Apply offset and limit to data rows
-                total_rows = len(data_rows)
-                if offset > 0:
-                    data_rows = data_rows[offset:]
-                if limit is not None:
-                    data_rows = data_rows[:limit]
-
-                # Convert rows to list of dicts with column names as keys
-                rows_as_dicts = []
-                for row in data_rows:
-                    row_dict = {}
-                    for i, value in enumerate(row):
-                        if i < len(columns) and columns[i]:
-                            col_name = columns[i]
-                        else:
-                            col_name = f"Column_{i + 1}"
-                        row_dict[str(col_name)] = value
-                    rows_as_dicts.append(row_dict)
-
-                # Format column names
-                formatted_columns = [
-                    str(c) if c is not None else f"Column_{i + 1}" for i, c in enumerate(columns)
-                ]
+            if ws is None:
+                return {"error": "Workbook has no active sheet"}
 
+            if ws.header is None:
                 return {
                     "success": True,
                     "path": path,
-                    "sheet_name": ws.title,
-                    "columns": formatted_columns,
-                    "column_count": len(columns),
-                    "rows": rows_as_dicts,
-                    "row_count": len(rows_as_dicts),
-                    "total_rows": total_rows,
+                    "sheet_name": ws.name,
+                    "columns": [],
+                    "column_count": 0,
+                    "rows": [],
+                    "row_count": 0,
+                    "total_rows": 0,
                     "offset": offset,
                     "limit": limit,
                 }
 
-            finally:
-                wb.close()
+            # First row as headers; only the requested page of data rows is read
+            columns = ws.header
+            data_rows = workbook.read_rows(ws, offset, limit)
+
+            # Convert rows to list of dicts with column names as keys
+            rows_as_dicts = []
+            for row in data_rows:
+                row_dict = {}
+                for i, value in enumerate(row):
+                    if i < len(columns) and columns[i]:
+                        col_name = columns[i]
+                    else:
+                        col_name = f"Column_{i + 1}"
+                    row_dict[str(col_name)] = value
+                rows_as_dicts.append(row_dict)
+
+            # Format column names
+            formatted_columns = [
+                str(c) if c is not None else f"Column_{i + 1}" for i, c in enumerate(columns)
+            ]
+
+            return {
+                "success": True,
+                "path": path,
+                "sheet_name": ws.name,
+                "columns": formatted_columns,
+                "column_count": len(columns),
+                "rows": rows_as_dicts,
+                "row_count": len(rows_as_dicts),
+                "total_rows": ws.row_count,
+                "offset": offset,
+                "limit": limit,
+            }
 
         except Exception as e:
             return {"error": f"Failed to read Excel file: {str(e)}"}
@@ -214,6 +200,7 @@ def excel_write(
             # Save workbook
             wb.save(secure_path)
             wb.close()
+            invalidate_workbook_cache(secure_path)
 
             return {
                 "success": True,
@@ -311,6 +298,7 @@ def excel_append(
 
                 # Save workbook
                 wb.save(secure_path)
+                invalidate_workbook_cache(secure_path)
 
                 # Get new total row count (excluding header)
                 total_rows = next_row - 2  # -1 for header, -1 because next_row was incremented
@@ -349,7 +337,7 @@ def excel_info(
             dict with file metadata (sheets, columns per sheet, row counts, file size)
         """
         try:
-            from openpyxl import load_workbook
+            import openpyxl  # noqa: F401
         except ImportError:
             return {
                 "error": (
@@ -370,48 +358,28 @@ def excel_info(
             # Get file size
             file_size = os.path.getsize(secure_path)
 
-            # Load workbook in read-only mode
-            wb = load_workbook(secure_path, read_only=True, data_only=True)
-
-            try:
-                sheets_info = []
-                for sheet_name in wb.sheetnames:
-                    ws = wb[sheet_name]
-
-                    # Get columns from first row
-                    columns = []
-                    first_row = next(ws.iter_rows(min_row=1, max_row=1, values_only=True), None)
-                    if first_row:
-                        columns = [
-                            str(c) if c is not None else f"Column_{i + 1}"
-                            for i, c in enumerate(first_row)
-                        ]
-
-                    # Count rows (excluding header)
-                    row_count = 0
-                    for _ in ws.iter_rows(min_row=2, values_only=True):
-                        row_count += 1
-
-                    sheets_info.append(
-                        {
-                            "name": sheet_name,
-                            "columns": columns,
-                            "column_count": len(columns),
-                            "row_count": row_count,
-                        }
-                    )
+            # Row counts and column stats were computed when the workbook was cached
+            workbook = get_workbook_cache(secure_path)
 
-                return {
-                    "success": True,
-                    "path": path,
-                    "file_size_bytes": file_size,
-                    "sheet_count": len(wb.sheetnames),
-                    "sheet_names": wb.sheetnames,
-                    "sheets": sheets_info,
+            sheets_info = [
+                {
+                    "name": ws.name,
+                    "columns": ws.columns,
+                    "column_count": len(ws.columns),
+                    "row_count": ws.row_count,
+                    "column_stats": ws.column_stats,
                 }
+                for ws in workbook.sheets
+            ]
 
-            finally:
-                wb.close()
+            return {
+                "success": True,
+                "path": path,
+                "file_size_bytes": file_size,
+                "sheet_count": len(workbook.sheets),
+                "sheet_names": workbook.sheet_names,
+                "sheets": sheets_info,
+            }
 
         except Exception as e:
             return {"error": f"Failed to get Excel info: {str(e)}"}
@@ -478,12 +446,16 @@ def excel_sql(
         session_id: str,
         query: str,
         sheet: str | None = None,
+        max_rows: int = DEFAULT_MAX_ROWS,
+        data_dir: str = "",
     ) -> dict:
         """
         Query an Excel file using SQL (powered by DuckDB).
 
         Each sheet is available as a table with its sheet name (spaces replaced
         with underscores). Use 'data' as alias for the specified/active sheet.
+        The workbook is loaded once per session and reused by later queries
+        until it changes.
 
         Args:
             path: Path to the Excel file (relative to session sandbox)
@@ -493,6 +465,9 @@ def excel_sql(
             query: SQL query. Use 'data' for the target sheet, or sheet names
                    (with spaces as underscores) to query/join multiple sheets.
             sheet: Sheet to use as 'data' table (default: first sheet)
+            max_rows: Maximum rows to return (default 1000). Larger results are
+                   marked truncated and, when a data directory is available,
+                   saved in full to a data file.
 
         Returns:
             dict with query results, columns, and row count
@@ -508,7 +483,7 @@ def excel_sql(
             query="SELECT s.*, p.name FROM Sales s JOIN Products p ON s.product_id = p.id"
         """
         try:
-            import duckdb
+            import duckdb  # noqa: F401
         except ImportError:
             return {
                 "error": (
@@ -518,7 +493,7 @@ def excel_sql(
             }
 
         try:
-            from openpyxl import load_workbook
+            import openpyxl  # noqa: F401
         except ImportError:
             return {
                 "error": (
@@ -560,88 +535,48 @@ def excel_sql(
                 if keyword in query_upper:
                     return {"error": f"'{keyword}' is not allowed in queries"}
 
-            # Load workbook
-            wb = load_workbook(secure_path, read_only=True, data_only=True)
-
-            try:
-                # Determine target sheet for 'data' alias
-                if sheet:
-                    if sheet not in wb.sheetnames:
-                        return {"error": (f"Sheet '{sheet}' not found. Available: {wb.sheetnames}")}
-                    target_sheet = sheet
-                else:
-                    target_sheet = wb.sheetnames[0]
-
-                # Load all sheets into DuckDB
-                import pandas as pd
-
-                con = duckdb.connect(":memory:")
-
-                for sheet_name in wb.sheetnames:
-                    ws = wb[sheet_name]
-                    rows = list(ws.iter_rows(values_only=True))
-
-                    if not rows:
-                        continue
-
-                    # Headers from first row
-                    headers = [
-                        str(c) if c is not None else f"Column_{i + 1}"
-                        for i, c in enumerate(rows[0])
-                    ]
-
-                    # Data rows
-                    records = []
-                    for row in rows[1:]:
-                        record = {}
-                        for i, val in enumerate(row):
-                            col = headers[i] if i < len(headers) else f"Column_{i + 1}"
-                            record[col] = _convert_cell_value(val)
-                        records.append(record)
-
-                    # Create table (sanitize name: spaces -> underscores)
-                    table_name = sheet_name.replace(" ", "_").replace("-", "_")
-                    if records:
-                        df = pd.DataFrame(records)
-                        con.register(f"temp_{table_name}", df)
-                        con.execute(
-                            f'CREATE TABLE "{table_name}" AS SELECT * FROM temp_{table_name}'
-                        )
-                    else:
-                        # Empty table
-                        cols_sql = ", ".join(f'"{h}" VARCHAR' for h in headers)
-                        con.execute(f'CREATE TABLE "{table_name}" ({cols_sql})')
-
-                    # Create 'data' alias for target sheet
-                    if sheet_name == target_sheet:
-                        con.execute(f'CREATE VIEW data AS SELECT * FROM "{table_name}"')
-
-                all_sheet_names = list(wb.sheetnames)
-
-            finally:
-                wb.close()
-
-            # Execute query (workbook already closed, only DuckDB needed)
-            try:
-                result = con.execute(query)
-                columns = [desc[0] for desc in result.description]
-                rows = result.fetchall()
-            finally:
-                con.close()
-
-            # Convert to dicts
-            rows_as_dicts = [dict(zip(columns, row, strict=False)) for row in rows]
-
+            statement_error = single_select_error(query)
+            if statement_error:
+                return {"error": statement_error}
+
+            # Session-scoped engine: each sheet is loaded once and cached
+            engine = get_query_engine(f"{workspace_id}/{agent_id}/{session_id}")
+            sheet_tables = engine.tables(
+                secure_path, lambda con, prefix: _load_sheet_tables(con, prefix, secure_path)
+            )
+            all_sheet_names = list(sheet_tables)
+
+            # Determine target sheet for 'data' alias
+            if sheet:
+                if sheet not in sheet_tables:
+                    return {"error": (f"Sheet '{sheet}' not found. Available: {all_sheet_names}")}
+                target_sheet = sheet
+            else:
+                target_sheet = all_sheet_names[0]
+
+            # Sheet names (spaces/dashes -> underscores) plus 'data' for the target
+            aliases = {
+                name.replace(" ", "_").replace("-", "_"): table
+                for name, table in sheet_tables.items()
+                if table
+            }
+            if sheet_tables[target_sheet]:
+                aliases["data"] = sheet_tables[target_sheet]
+
+            result = engine.query(
+                query,
+                aliases,
+                max_rows=max(max_rows, 0),
+                data_dir=data_dir,
+                spill_name=f"excel_sql_{os.path.splitext(os.path.basename(path))[0]}",
+            )
             return {
                 "success": True,
                 "path": path,
                 "target_sheet": target_sheet,
                 "available_sheets": all_sheet_names,
                 "query": query,
-                "columns": columns,
-                "column_count": len(columns),
-                "rows": rows_as_dicts,
-                "row_count": len(rows_as_dicts),
+                **result,
             }
 
         except Exception as e:
@@ -681,7 +616,7 @@ def excel_search(
             dict with list of matches containing sheet, row, column, and value
         """
         try:
-            from openpyxl import load_workbook
+            import openpyxl  # noqa: F401
         except ImportError:
             return {
                 "error": (
@@ -702,88 +637,45 @@ def excel_search(
             if not search_term:
                 return {"error": "search_term cannot be empty"}
 
-            if match_type not in ("contains", "exact", "starts_with", "ends_with"):
+            if match_type not in MATCH_TYPES:
                 return {
                     "error": "match_type must be 'contains', 'exact', 'starts_with', or 'ends_with'"
                 }
 
-            # Prepare search term
-            term = search_term if case_sensitive else search_term.lower()
+            workbook = get_workbook_cache(secure_path)
 
-            # Load workbook
-            wb = load_workbook(secure_path, read_only=True, data_only=True)
+            sheets_to_search = [sheet] if sheet else workbook.sheet_names
 
-            try:
-                sheets_to_search = [sheet] if sheet else wb.sheetnames
-
-                if sheet and sheet not in wb.sheetnames:
-                    return {"error": f"Sheet '{sheet}' not found. Available: {wb.sheetnames}"}
-
-                matches = []
-                for sheet_name in sheets_to_search:
-                    ws = wb[sheet_name]
-
-                    # Get headers for column names
-                    headers = []
-                    first_row = next(ws.iter_rows(min_row=1, max_row=1, values_only=True), None)
-                    if first_row:
-                        headers = [
-                            str(c) if c is not None else f"Column_{i + 1}"
-                            for i, c in enumerate(first_row)
-                        ]
-
-                    # Search data rows only (skip header row)
-                    for row_idx, row in enumerate(
-                        ws.iter_rows(min_row=2, values_only=True), start=2
-                    ):
-                        for col_idx, cell_value in enumerate(row):
-                            if cell_value is None:
-                                continue
-
-                            # Convert to string for comparison
-                            cell_str = str(cell_value)
-                            compare_val = cell_str if case_sensitive else cell_str.lower()
-
-                            # Check match
-                            is_match = False
-                            if match_type == "contains":
-                                is_match = term in compare_val
-                            elif match_type == "exact":
-                                is_match = term == compare_val
-                            elif match_type == "starts_with":
-                                is_match = compare_val.startswith(term)
-                            elif match_type == "ends_with":
-                                is_match = compare_val.endswith(term)
-
-                            if is_match:
-                                col_name = (
-                                    headers[col_idx]
-                                    if col_idx < len(headers)
-                                    else f"Column_{col_idx + 1}"
-                                )
-                                matches.append(
-                                    {
-                                        "sheet": sheet_name,
-                                        "row": row_idx,
-                                        "column": col_name,
-                                        "column_index": col_idx + 1,
-                                        "value": _convert_cell_value(cell_value),
-                                    }
-                                )
+            if sheet and workbook.sheet(sheet) is None:
+                return {"error": f"Sheet '{sheet}' not found. Available: {workbook.sheet_names}"}
 
-                return {
-                    "success": True,
-                    "path": path,
-                    "search_term": search_term,
-                    "match_type": match_type,
-                    "case_sensitive": case_sensitive,
-                    "sheets_searched": sheets_to_search,
-                    "matches": matches,
-                    "match_count": len(matches),
-                }
+            # Each column is scanned as one block of text, data rows only
+            matches = []
+            for sheet_name in sheets_to_search:
+                ws = workbook.sheet(sheet_name)
+                for row_index, col_idx, value in workbook.search(
+                    ws, search_term, match_type, case_sensitive
+                ):
+                    matches.append(
+                        {
+                            "sheet": sheet_name,
+                            "row": row_index + 2,
+                            "column": ws.column_name(col_idx),
+                            "column_index": col_idx + 1,
+                            "value": value,
+                        }
+                    )
 
-            finally:
-                wb.close()
+            return {
+                "success": True,
+                "path": path,
+                "search_term": search_term,
+                "match_type": match_type,
+                "case_sensitive": case_sensitive,
+                "sheets_searched": sheets_to_search,
+                "matches": matches,
+                "match_count": len(matches),
+            }
 
         except Exception as e:
             return {"error": f"Search failed: {str(e)}"}
@@ -799,3 +691,53 @@ def _convert_cell_value(value: Any) -> Any:
         return value
     # For any other type, convert to string
     return str(value)
+
+
+def _load_sheet_tables(con: Any, prefix: str, path: str) -> dict[str, str]:
+    """
+    Load every sheet of a workbook into a DuckDB table.
+
+    Returns {sheet name: table name}, with "" for sheets that have no rows.
+    """
+    import pandas as pd
+    from openpyxl import load_workbook
+
+    tables: dict[str, str] = {}
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        for index, sheet_name in enumerate(wb.sheetnames):
+            rows = list(wb[sheet_name].iter_rows(values_only=True))
+            if not rows:
+                tables[sheet_name] = ""
+                continue
+
+            # Headers from first row
+            headers = [
+                str(c) if c is not None else f"Column_{i + 1}" for i, c in enumerate(rows[0])
+            ]
+
+            # Data rows
+            records = []
+            for row in rows[1:]:
+                record = {}
+                for i, val in enumerate(row):
+                    col = headers[i] if i < len(headers) else f"Column_{i + 1}"
+                    record[col] = _convert_cell_value(val)
+                records.append(record)
+
+            table_name = f"{prefix}_{index}"
+            if records:
+                temp_name = f"{table_name}_df"
+                con.register(temp_name, pd.DataFrame(records))
+                try:
+                    con.execute(f'CREATE TABLE "{table_name}" AS SELECT * FROM {temp_name}')
+                finally:
+                    con.unregister(temp_name)
+            else:
+                # Empty table
+                cols_sql = ", ".join(f'"{h}" VARCHAR' for h in headers)
+                con.execute(f'CREATE TABLE "{table_name}" ({cols_sql})')
+            tables[sheet_name] = table_name
+    finally:
+        wb.close()
+    return tables
@@ -0,0 +1,394 @@
+"""
+On-disk columnar cache of Excel workbooks.
+
+openpyxl has to decompress and parse the whole sheet XML to read any of
+it, so reading, counting or searching a large workbook cell by cell costs
+tens of seconds per call.  The cache converts every sheet once, in a
+single read-only pass, into:
+
+- ``sheet{i}.jsonl``: one JSON array of converted values per data row,
+  with the byte offset of every ``STRIDE``-th row kept in the metadata so
+  a page of rows is one seek and a few ``readline`` calls;
+- ``sheet{i}_col{j}.txt``: the ``str()`` of every cell in column ``j``,
+  UTF-8 encoded and framed by NUL bytes (``\\0a\\0b\\0\\0c\\0``, empty cells
+  are empty), so a search is a ``bytes.find`` over the whole column;
+- ``sheet{i}_col{j}.types``: one type code byte per cell, used to rebuild
+  the JSON value of a matching cell from its text;
+- ``meta.json``: sheet names, headers, row counts and per-column stats.
+
+Caches live in a private per-user directory under the temp directory (see
+``aden_tools.utils.private_dir``), since they hold every cell of the
+workbook and are trusted when loaded.  They are keyed by the workbook's
+real path, mtime and size, and are also held in memory.  Writers call
+``invalidate_workbook_cache`` after saving, since two saves within the
+filesystem's mtime resolution can leave the size unchanged too.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Any
+
+import numpy as np
+
+from aden_tools.utils.private_dir import make_private_dir, user_temp_dir
+
+STRIDE = 64
+CACHE_VERSION = 1
+MAX_CACHED_WORKBOOKS = 16
+# Column text buffered in memory before it is appended to the column files
+FLUSH_BYTES = 8 * 1024 * 1024
+
+CACHE_DIR = user_temp_dir("aden_excel_cache")
+
+MATCH_TYPES = ("contains", "exact", "starts_with", "ends_with")
+
+# Type codes stored per cell
+_EMPTY, _TEXT, _INT, _FLOAT, _BOOL, _DATETIME = range(6)
+_SEP = b"\0"
+
+_cache: OrderedDict[str, CachedWorkbook] = OrderedDict()
+_cache_lock = threading.Lock()
+_build_locks: dict[str, threading.Lock] = {}
+
+
+@dataclass
+class CachedSheet:
+    name: str
+    # First row as excel_read returns it; None when the sheet has no rows
+    header: list[Any] | None
+    # First row as column names (str(), Column_N for blanks)
+    columns: list[str]
+    # Widest row; columns past the header are named Column_N
+    width: int = 0
+    row_count: int = 0
+    # Byte offset of data rows 0, STRIDE, 2 * STRIDE, ... in the row file
+    checkpoints: list[int] = field(default_factory=list)
+    column_stats: list[dict[str, Any]] = field(default_factory=list)
+
+    def column_name(self, index: int) -> str:
+        return self.columns[index] if index < len(self.columns) else f"Column_{index + 1}"
+
+
+@dataclass
+class CachedWorkbook:
+    path: str
+    mtime_ns: int
+    size: int
+    directory: str
+    active: str | None
+    sheets: list[CachedSheet]
+    version: int = CACHE_VERSION
+
+    @property
+    def sheet_names(self) -> list[str]:
+        return [sheet.name for sheet in self.sheets]
+
+    def sheet(self, name: str) -> CachedSheet | None:
+        for sheet in self.sheets:
+            if sheet.name == name:
+                return sheet
+        return None
+
+    def is_current(self) -> bool:
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return False
+        return (stat.st_mtime_ns, stat.st_size) == (self.mtime_ns, self.size) and os.path.isdir(
+            self.directory
+        )
+
+    def read_rows(
+        self, sheet: CachedSheet, offset: int = 0, limit: int | None = None
+    ) -> list[list[Any]]:
+        """Data rows ``offset..offset+limit`` of *sheet* as lists of converted values."""
+        if offset >= sheet.row_count or limit == 0:
+            return []
+        index = self.sheets.index(sheet)
+        checkpoint = offset // STRIDE
+        skip = offset - checkpoint * STRIDE
+        rows: list[list[Any]] = []
+        with open(os.path.join(self.directory, f"sheet{index}.jsonl"), "rb") as f:
+            f.seek(sheet.checkpoints[checkpoint])
+            for line in f:
+                if skip:
+                    skip -= 1
+                    continue
+                rows.append(json.loads(line))
+                if limit is not None and len(rows) >= limit:
+                    break
+        return rows
+
+    def search(
+        self,
+        sheet: CachedSheet,
+        term: str,
+        match_type: str = "contains",
+        case_sensitive: bool = False,
+    ) -> list[tuple[int, int, Any]]:
+        """
+        ``(data row index, column index, value)`` of every cell in *sheet*
+        whose ``str()`` matches *term*, in row-major order.
+        """
+        if not term or sheet.row_count == 0:
+            return []
+        needle = (term if case_sensitive else term.lower()).encode("utf-8")
+        if match_type in ("exact", "starts_with"):
+            needle = _SEP + needle
+        if match_type in ("exact", "ends_with"):
+            needle = needle + _SEP
+
+        index = self.sheets.index(sheet)
+        matches: list[tuple[int, int, Any]] = []
+        for column in range(sheet.width):
+            base = os.path.join(self.directory, f"sheet{index}_col{column}")
+            with open(f"{base}.txt", "rb") as f:
+                text = f.read()
+            haystack = text if case_sensitive else _lower(text)
+            if needle not in haystack:
+                continue
+            bounds = _cell_bounds(haystack)
+            cells = _find_cells(haystack, needle, bounds)
+            if not cells:
+                continue
+            with open(f"{base}.types", "rb") as f:
+                codes = f.read()
+            if haystack is not text:
+                bounds = _cell_bounds(text)
+            for cell in cells:
+                raw = text[bounds[cell] + 1 : bounds[cell + 1]].decode("utf-8")
+                matches.append((cell, column, _decode_value(codes[cell], raw)))
+        matches.sort(key=lambda match: (match[0], match[1]))
+        return matches
+
+
+def _lower(text: bytes) -> bytes:
+    if text.isascii():
+        return text.lower()
+    return text.decode("utf-8").lower().encode("utf-8")
+
+
+def _cell_bounds(text: bytes) -> np.ndarray:
+    """Positions of the NUL separators; cell k lies between bounds[k] and bounds[k + 1]."""
+    return np.flatnonzero(np.frombuffer(text, dtype=np.uint8) == 0)
+
+
+def _find_cells(text: bytes, needle: bytes, bounds: np.ndarray) -> list[int]:
+    """Indexes of the cells containing *needle*, each reported once."""
+    cells = []
+    position = text.find(needle)
+    while position != -1:
+        cell = int(np.searchsorted(bounds, position, side="right")) - 1
+        cells.append(cell)
+        # Resume at the cell's closing separator, which opens the next cell
+        position = text.find(needle, int(bounds[cell + 1]))
+    return cells
+
+
+def _decode_value(code: int, text: str) -> Any:
+    """The JSON value of a cell from its str() and type code."""
+    if code == _INT:
+        return int(text)
+    if code == _FLOAT:
+        return float(text)
+    if code == _BOOL:
+        return text == "True"
+    if code == _DATETIME:
+        return text.replace(" ", "T", 1)  # str(datetime) is isoformat(sep=" ")
+    return text
+
+
+def _type_code(value: Any) -> int:
+    if value is None:
+        return _EMPTY
+    if isinstance(value, bool):
+        return _BOOL
+    if isinstance(value, int):
+        return _INT
+    if isinstance(value, float):
+        return _FLOAT
+    if isinstance(value, datetime):
+        return _DATETIME
+    return _TEXT
+
+
+class _ColumnWriter:
+    """Buffers one column's text and type codes, appending them to disk in chunks."""
+
+    def __init__(self, base: str, padding: int):
+        self.base = base
+        # Rows seen before this column first appeared are empty
+        self.text = bytearray(_SEP * (padding + 1))
+        self.codes = bytearray(padding)
+        self.stats: dict[str, Any] = {"non_null": 0, "types": {}}
+
+    def add(self, value: Any) -> None:
+        code = _type_code(value)
+        self.codes.append(code)
+        if code == _EMPTY:
+            self.text += _SEP
+            return
+        self.text += str(value).encode("utf-8")
+        self.text += _SEP
+        stats = self.stats
+        stats["non_null"] += 1
+        type_name = type(value).__name__
+        stats["types"][type_name] = stats["types"].get(type_name, 0) + 1
+        if code in (_INT, _FLOAT):
+            if "min" not in stats or value < stats["min"]:
+                stats["min"] = value
+            if "max" not in stats or value > stats["max"]:
+                stats["max"] = value
+
+    def flush(self) -> None:
+        with open(f"{self.base}.txt", "ab") as f:
+            f.write(self.text)
+        with open(f"{self.base}.types", "ab") as f:
+            f.write(self.codes)
+        self.text.clear()
+        self.codes.clear()
+
+
+def _convert_sheet(ws: Any, directory: str, index: int) -> CachedSheet:
+    from .excel_tool import _convert_cell_value
+
+    rows = ws.iter_rows(values_only=True)
+    first_row = next(rows, None)
+    if first_row is None:
+        return CachedSheet(ws.title, header=None, columns=[])
+
+    sheet = CachedSheet(
+        ws.title,
+        header=[_convert_cell_value(c) for c in first_row],
+        columns=[str(c) if c is not None else f"Column_{i + 1}" for i, c in enumerate(first_row)],
+    )
+    writers: list[_ColumnWriter] = []
+    with open(os.path.join(directory, f"sheet{index}.jsonl"), "wb") as out:
+        for row in rows:
+            if sheet.row_count % STRIDE == 0:
+                sheet.checkpoints.append(out.tell())
+                if sum(len(writer.text) for writer in writers) >= FLUSH_BYTES:
+                    for writer in writers:
+                        writer.flush()
+            converted = [_convert_cell_value(value) for value in row]
+            out.write(json.dumps(converted).encode("utf-8") + b"\n")
+            while len(writers) < len(row):
+                base = os.path.join(directory, f"sheet{index}_col{len(writers)}")
+                writers.append(_ColumnWriter(base, sheet.row_count))
+            for column, writer in enumerate(writers):
+                writer.add(row[column] if column < len(row) else None)
+            sheet.row_count += 1
+    for writer in writers:
+        writer.flush()
+    sheet.width = len(writers)
+    sheet.column_stats = [
+        {"name": sheet.column_name(column), **writer.stats} for column, writer in enumerate(writers)
+    ]
+    return sheet
+
+
+def _build(path: str, directory: str) -> CachedWorkbook:
+    from openpyxl import load_workbook
+
+    stat = os.stat(path)
+    tmp = f"{directory}.{os.getpid()}.{threading.get_ident()}.tmp"
+    shutil.rmtree(tmp, ignore_errors=True)
+    os.makedirs(tmp, mode=0o700)
+    try:
+        wb = load_workbook(path, read_only=True, data_only=True)
+        try:
+            sheets = [_convert_sheet(wb[name], tmp, i) for i, name in enumerate(wb.sheetnames)]
+            active = wb.active.title if wb.active is not None else None
+        finally:
+            wb.close()
+        workbook = CachedWorkbook(path, stat.st_mtime_ns, stat.st_size, directory, active, sheets)
+        with open(os.path.join(tmp, "meta.json"), "w", encoding="utf-8") as f:
+            json.dump(asdict(workbook), f)
+        try:
+            os.rename(tmp, directory)
+        except OSError:
+            shutil.rmtree(tmp, ignore_errors=True)  # another process converted it first
+    except BaseException:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+    return workbook
+
+
+def _path_digest(path: str) -> str:
+    return hashlib.sha256(path.encode("utf-8")).hexdigest()[:24]
+
+
+def _cache_directory(path: str, mtime_ns: int, size: int) -> str:
+    version = hashlib.sha256(f"{mtime_ns}:{size}:{CACHE_VERSION}".encode()).hexdigest()[:12]
+    return os.path.join(CACHE_DIR, f"{_path_digest(path)}-{version}")
+
+
+def _load(directory: str, path: str) -> CachedWorkbook | None:
+    try:
+        with open(os.path.join(directory, "meta.json"), encoding="utf-8") as f:
+            data = json.load(f)
+        data["sheets"] = [CachedSheet(**sheet) for sheet in data["sheets"]]
+        workbook = CachedWorkbook(**data)
+    except (OSError, ValueError, TypeError, KeyError):
+        return None
+    if workbook.path != path or workbook.version != CACHE_VERSION or not workbook.is_current():
+        return None
+    return workbook
+
+
+def _remove_stale(path: str, keep: str = "") -> None:
+    prefix = f"{_path_digest(path)}-"
+    try:
+        entries = os.listdir(CACHE_DIR)
+    except OSError:
+        return
+    for entry in entries:
+        full = os.path.join(CACHE_DIR, entry)
+        if entry.startswith(prefix) and full != keep and not entry.endswith(".tmp"):
+            shutil.rmtree(full, ignore_errors=True)
+
+
+def get_workbook_cache(path: str) -> CachedWorkbook:
+    """The cache for *path*, converted on first use and again when the file changes."""
+    path = os.path.realpath(path)
+    with _cache_lock:
+        workbook = _cache.get(path)
+        build_lock = _build_locks.setdefault(path, threading.Lock())
+    if workbook is not None and workbook.is_current():
+        return workbook
+
+    with build_lock:
+        stat = os.stat(path)
+        # Refuses a cache directory owned by another user before anything is loaded
+        make_private_dir(CACHE_DIR)
+        directory = _cache_directory(path, stat.st_mtime_ns, stat.st_size)
+        workbook = _load(directory, path)
+        if workbook is None:
+            shutil.rmtree(directory, ignore_errors=True)
+            workbook = _build(path, directory)
+            _remove_stale(path, keep=directory)
+
+    with _cache_lock:
+        _cache[path] = workbook
+        _cache.move_to_end(path)
+        while len(_cache) > MAX_CACHED_WORKBOOKS:
+            _cache.popitem(last=False)
+    return workbook
+
+
+def invalidate_workbook_cache(path: str) -> None:
+    """Forget the cache for *path*; call after writing the workbook."""
+    path = os.path.realpath(path)
+    with _cache_lock:
+        _cache.pop(path, None)
+        build_lock = _build_locks.setdefault(path, threading.Lock())
+    with build_lock:
+        _remove_stale(path)
@@ -6,15 +6,30 @@
 Used in conjunction with the spillover system: when a tool result is too
 large, the framework writes it to a file and the agent can load it back
 with load_data().
+
+Reads go through a shared memory map of each file (see
+``aden_tools.utils.mapped_file``), so paging, line ranges and JSON paths
+are answered from lazily built indexes instead of rescanning the file.
 """
 
 from __future__ import annotations
 
+import json
+import os
 from pathlib import Path
 
 from mcp.server.fastmcp import FastMCP
 
 from aden_tools.credentials.browser import open_browser
+from aden_tools.utils.mapped_file import (
+    MappedFile,
+    append_to_file,
+    get_mapped_file,
+    invalidate_mapped_file,
+)
+
+# Bytes copied per write when edit_data rewrites a file
+COPY_CHUNK_BYTES = 1024 * 1024
 
 
 def register_tools(mcp: FastMCP) -> None:
@@ -52,6 +67,7 @@ def save_data(filename: str, data: str, data_dir: str) -> dict:
             dir_path = Path(data_dir)
             dir_path.mkdir(parents=True, exist_ok=True)
             path = dir_path / filename
+            invalidate_mapped_file(path)
             path.write_text(data, encoding="utf-8")
             lines = data.count("\n") + 1
             return {
@@ -70,10 +86,14 @@ def load_data(
         data_dir: str,
         offset_bytes: int = 0,
         limit_bytes: int = 10000,
+        line_start: int = 0,
+        line_count: int = 100,
+        json_path: str = "",
     ) -> dict:
         """
         Purpose
-            Load data from a previously saved file with byte-based pagination.
+            Load data from a previously saved file by byte range, line range
+            or JSON path.
             Efficient for files of any size (1 byte to 1 TB).
             Automatically detects safe UTF-8 boundaries to prevent character splitting.
 
@@ -81,18 +101,28 @@ def load_data(
             Retrieve large tool results that were spilled to disk.
             Read data saved by save_data or by the spillover system.
             Page through large files without loading everything into context.
+            Jump to line N of a log or JSONL file with line_start.
+            Pull one key or a slice of an array out of a JSON file with json_path.
 
         Rules & Constraints
             filename must match a file in data_dir
             Uses byte offsets for O(1) seeking (works with huge files)
             Automatically trims to valid UTF-8 character boundaries
             Returns exactly limit_bytes or less (rounded to safe boundary)
+            line_start (1-based) returns whole lines, at most limit_bytes of them
+            json_path takes precedence over line_start, which takes precedence
+            over offset_bytes
+            json_path supports keys, [n], [a:b] and [*]; JSONL files are
+            addressed as an array of lines ($[0] is the first record)
 
         Args:
             filename: The filename to load (as shown in spillover messages or save_data results).
             data_dir: Absolute path to the data directory.
             offset_bytes: Byte offset to start reading from. Default 0.
             limit_bytes: Max number of bytes to return. Default 10000 (10KB).
+            line_start: 1-based line to start reading from. Default 0 (read by bytes).
+            line_count: Number of lines to read from line_start. Default 100.
+            json_path: JSON path to select, e.g. '$.items[10:20].name'. Default '' (none).
 
         Returns:
             Dict with content, pagination info, and metadata
@@ -101,6 +131,8 @@ def load_data(
             load_data('emails.jsonl', '/data')                           # first 10KB
             load_data('emails.jsonl', '/data', offset_bytes=10000)       # next 10KB
             load_data('large.txt', '/data', limit_bytes=50000)           # first 50KB
+            load_data('app.log', '/data', line_start=5000, line_count=50)  # lines 5000-5049
+            load_data('results.json', '/data', json_path='$.items[3]')   # one array element
         """
         if not filename or ".." in filename or "/" in filename or "\\" in filename:
             return {"error": "Invalid filename"}
@@ -114,7 +146,13 @@ def load_data(
             if not path.exists():
                 return {"error": f"File not found: {filename}"}
 
-            file_size = path.stat().st_size
+            mapped = get_mapped_file(path)
+            file_size = mapped.size
+
+            if json_path:
+                return _load_json_path(mapped, filename, json_path, limit_bytes)
+            if int(line_start) > 0:
+                return _load_lines(mapped, filename, int(line_start), int(line_count), limit_bytes)
 
             # Handle edge case: offset beyond file size
             if offset_bytes >= file_size:
@@ -129,43 +167,21 @@ def load_data(
                     "has_more": False,
                 }
 
-            with open(path, "rb") as f:
-                # O(1) seek to byte offset
-                f.seek(offset_bytes)
-
-                # Read exactly limit_bytes
-                raw_bytes = f.read(limit_bytes)
-
-                # Trim to valid UTF-8 boundary
-                # Scan backwards max 4 bytes to find valid UTF-8 start
-                chunk = raw_bytes
-                text = None
-                for i in range(min(4, len(raw_bytes)) + 1):
-                    try:
-                        slice_end = len(raw_bytes) - i if i > 0 else len(raw_bytes)
-                        text = raw_bytes[:slice_end].decode("utf-8")
-                        chunk = raw_bytes[:slice_end]
-                        break
-                    except UnicodeDecodeError:
-                        continue
-
-                # If we couldn't decode at all, return error
-                if text is None:
-                    return {"error": "Could not decode file as UTF-8"}
-
-                # UTF-8 boundary is already handled above
-                next_offset = offset_bytes + len(chunk)
+            # O(1) slice of the mapping, trimmed to a UTF-8 character boundary
+            text, next_offset = mapped.read_text(offset_bytes, limit_bytes)
 
-                return {
-                    "success": True,
-                    "filename": filename,
-                    "content": text,
-                    "offset_bytes": offset_bytes,
-                    "bytes_read": len(chunk),
-                    "next_offset_bytes": next_offset,
-                    "file_size_bytes": file_size,
-                    "has_more": next_offset < file_size,
-                }
+            return {
+                "success": True,
+                "filename": filename,
+                "content": text,
+                "offset_bytes": offset_bytes,
+                "bytes_read": next_offset - offset_bytes,
+                "next_offset_bytes": next_offset,
+                "file_size_bytes": file_size,
+                "has_more": next_offset < file_size,
+            }
+        except UnicodeDecodeError:
+            return {"error": "Could not decode file as UTF-8"}
         except Exception as e:
             return {"error": f"Failed to load data: {str(e)}"}
 
@@ -296,10 +312,10 @@ def append_data(filename: str, data: str, data_dir: str) -> dict:
             dir_path = Path(data_dir)
             dir_path.mkdir(parents=True, exist_ok=True)
             path = dir_path / filename
-            with open(path, "a", encoding="utf-8") as f:
-                f.write(data)
-            appended_bytes = len(data.encode("utf-8"))
-            total_bytes = path.stat().st_size
+            encoded = data.encode("utf-8")
+            appended_bytes = len(encoded)
+            # Keeps the line index of a mapped file, so only the new bytes are indexed
+            total_bytes = append_to_file(path, encoded)
             return {
                 "success": True,
                 "filename": filename,
@@ -345,8 +361,19 @@ def edit_data(filename: str, old_text: str, new_text: str, data_dir: str) -> dic
             if not path.exists():
                 return {"error": f"File not found: {filename}"}
 
-            content = path.read_text(encoding="utf-8")
-            count = content.count(old_text)
+            if not old_text:
+                return {"error": "old_text must not be empty"}
+
+            # Search the mapping instead of decoding the whole file
+            mapped = get_mapped_file(path)
+            old = old_text.encode("utf-8")
+            new = new_text.encode("utf-8")
+            positions: list[int] = []
+            found = mapped.find(old)
+            while found >= 0:
+                positions.append(found)
+                found = mapped.find(old, found + len(old))
+            count = len(positions)
 
             if count == 0:
                 return {
@@ -364,14 +391,101 @@ def edit_data(filename: str, old_text: str, new_text: str, data_dir: str) -> dic
                     )
                 }
 
-            updated = content.replace(old_text, new_text, 1)
-            path.write_text(updated, encoding="utf-8")
+            _replace_bytes(mapped, path, positions[0], len(old), new)
 
             return {
                 "success": True,
                 "filename": filename,
-                "size_bytes": len(updated.encode("utf-8")),
+                "size_bytes": path.stat().st_size,
                 "replacements": 1,
             }
         except Exception as e:
             return {"error": f"Failed to edit data: {str(e)}"}
+
+
+def _load_lines(
+    mapped: MappedFile, filename: str, line_start: int, line_count: int, limit_bytes: int
+) -> dict:
+    """Whole lines from 1-based *line_start*, within *limit_bytes*."""
+    total_lines = mapped.line_count
+    first = line_start - 1
+    start, end = mapped.line_span(first, max(1, line_count))
+    line_truncated = False
+    if end - start > limit_bytes:
+        newline = mapped.read(start, start + limit_bytes).rfind(b"\n")
+        if newline >= 0:
+            end = start + newline + 1
+        else:
+            # A single line longer than the budget: return its start, continue by bytes
+            _, end = mapped.read_text(start, limit_bytes)
+            line_truncated = True
+    content = mapped.read(start, end).decode("utf-8")
+    lines_read = content.count("\n") + (1 if content and not content.endswith("\n") else 0)
+    next_line = min(first + max(1, lines_read), total_lines) + 1
+
+    result = {
+        "success": True,
+        "filename": filename,
+        "content": content,
+        "line_start": line_start,
+        "lines_read": 0 if line_truncated else lines_read,
+        "next_line_start": next_line,
+        "total_lines": total_lines,
+        "offset_bytes": start,
+        "bytes_read": end - start,
+        "next_offset_bytes": end,
+        "file_size_bytes": mapped.size,
+        "has_more": next_line <= total_lines,
+    }
+    if line_truncated:
+        result["line_truncated"] = True
+    return result
+
+
+def _load_json_path(mapped: MappedFile, filename: str, json_path: str, limit_bytes: int) -> dict:
+    """The value at *json_path*, pretty-printed and cut at *limit_bytes*."""
+    try:
+        value = mapped.select(json_path)
+    except KeyError as e:
+        return {"error": str(e).strip("'\"")}
+    except ValueError as e:
+        return {"error": f"Invalid json_path for {filename}: {e}"}
+
+    rendered = json.dumps(value, indent=2, ensure_ascii=False)
+    result = {"success": True, "filename": filename, "json_path": json_path}
+    if isinstance(value, list):
+        result["count"] = len(value)
+    encoded = rendered.encode("utf-8")
+    if len(encoded) > limit_bytes:
+        rendered = encoded[:limit_bytes].decode("utf-8", errors="ignore")
+        result["truncated"] = True
+        result["hint"] = "Narrow json_path (e.g. a [a:b] slice) or raise limit_bytes"
+    result["content"] = rendered
+    return result
+
+
+def _replace_bytes(
+    mapped: MappedFile, path: Path, position: int, old_length: int, new: bytes
+) -> None:
+    """Replace *old_length* bytes at *position*: in place when the size is unchanged."""
+    if len(new) == old_length:
+        invalidate_mapped_file(path)
+        with open(path, "r+b") as f:
+            f.seek(position)
+            f.write(new)
+        return
+
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp, "wb") as out:
+            for start in range(0, position, COPY_CHUNK_BYTES):
+                out.write(mapped.read(start, min(position, start + COPY_CHUNK_BYTES)))
+            out.write(new)
+            for start in range(position + old_length, mapped.size, COPY_CHUNK_BYTES):
+                out.write(mapped.read(start, min(mapped.size, start + COPY_CHUNK_BYTES)))
+        # The mapping must be closed before the file is replaced (Windows)
+        invalidate_mapped_file(path)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
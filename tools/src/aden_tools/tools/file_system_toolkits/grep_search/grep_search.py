@@ -1,9 +1,22 @@
+import base64
+import binascii
+import json
 import os
 import re
 
 from mcp.server.fastmcp import FastMCP
 
 from ..security import WORKSPACES_DIR, get_secure_path
+from .search_engine import (
+    DEFAULT_MAX_RESULTS,
+    file_entry,
+    get_trigram_index,
+    list_files,
+    prefilter_for,
+    required_literals,
+    search_digest,
+    search_files,
+)
 
 
 def register_tools(mcp: FastMCP) -> None:
@@ -17,12 +30,18 @@ def grep_search(
         agent_id: str,
         session_id: str,
         recursive: bool = False,
+        max_results: int = DEFAULT_MAX_RESULTS,
+        continuation_token: str = "",
+        include_ignored: bool = False,
+        use_index: bool = True,
     ) -> dict:
         """
         Search for a pattern in a file or directory within the session sandbox.
 
         Use this when you need to find specific content or patterns in files using regex.
-        Set recursive=True to search through all subdirectories.
+        Set recursive=True to search through all subdirectories. Directory searches skip
+        binary files, files over 10 MB, dependency/VCS folders (node_modules, .git, ...)
+        and paths listed in .gitignore/.ignore files.
 
         Args:
             path: The path to search in (file or directory, relative to session root)
@@ -31,6 +50,11 @@ def grep_search(
             agent_id: The ID of the agent
             session_id: The ID of the current session
             recursive: Whether to search recursively in directories (default: False)
+            max_results: Maximum matching lines to return (1-5000, default: 500)
+            continuation_token: next_token from a previous call, to get the next matches
+            include_ignored: Also search ignored folders and files (default: False)
+            use_index: Narrow directory searches with a trigram index of the files,
+                refreshed as files change (default: True)
 
         Returns:
             Dict with search results and match details, or error dict
@@ -42,46 +66,52 @@ def grep_search(
         except re.error as e:
             return {"error": f"Invalid regex pattern: {e.msg}"}
 
+        max_results = max(1, min(max_results, 5000))
+        digest = search_digest(pattern, path, recursive, include_ignored)
+        start = None
+        if continuation_token:
+            try:
+                token = json.loads(base64.urlsafe_b64decode(continuation_token.encode()))
+                if token["search"] != digest:
+                    return {"error": "continuation_token belongs to a different search"}
+                start = (token["file"], token["line"])
+            except (binascii.Error, ValueError, KeyError, TypeError):
+                return {"error": "Invalid continuation_token"}
+
         try:
             secure_path = get_secure_path(path, workspace_id, agent_id, session_id)
             # Use session dir root for relative path calculations
             session_root = os.path.join(WORKSPACES_DIR, workspace_id, agent_id, session_id)
 
-            matches = []
-
             if os.path.isfile(secure_path):
-                files = [secure_path]
-            elif recursive:
-                files = []
-                for root, _, filenames in os.walk(secure_path):
-                    for filename in filenames:
-                        files.append(os.path.join(root, filename))
+                entry = file_entry(secure_path)
+                entries = [entry] if entry is not None else []
+            elif not os.path.exists(secure_path):
+                raise FileNotFoundError(secure_path)
             else:
-                files = [
-                    os.path.join(secure_path, f)
-                    for f in os.listdir(secure_path)
-                    if os.path.isfile(os.path.join(secure_path, f))
-                ]
+                entries = list_files(secure_path, recursive, include_ignored)
+                literals = required_literals(pattern) if use_index else []
+                if literals:
+                    # Only files containing every trigram of the pattern's literals can match
+                    index = get_trigram_index(secure_path, include_ignored)
+                    index.refresh(entries)
+                    entries = index.candidates(entries, literals)
+
+            found, next_position = search_files(
+                entries, regex, prefilter_for(pattern), max_results, start
+            )
 
-            for file_path in files:
-                # Calculate relative path for display
-                display_path = os.path.relpath(file_path, session_root)
-                try:
-                    with open(file_path, encoding="utf-8") as f:
-                        for i, line in enumerate(f, 1):
-                            if regex.search(line):
-                                matches.append(
-                                    {
-                                        "file": display_path,
-                                        "line_number": i,
-                                        "line_content": line.strip(),
-                                    }
-                                )
-                except (UnicodeDecodeError, PermissionError):
-                    # Skips files that cannot be decoded or lack permissions
-                    continue
+            matches = [
+                {
+                    # Calculate relative path for display
+                    "file": os.path.relpath(match.entry.path, session_root),
+                    "line_number": match.line_number,
+                    "line_content": match.line.strip(),
+                }
+                for match in found
+            ]
 
-            return {
+            result = {
                 "success": True,
                 "pattern": pattern,
                 "path": path,
@@ -89,6 +119,19 @@ def grep_search(
                 "matches": matches,
                 "total_matches": len(matches),
             }
+            if next_position is not None:
+                next_token = base64.urlsafe_b64encode(
+                    json.dumps(
+                        {"search": digest, "file": next_position[0], "line": next_position[1]}
+                    ).encode()
+                ).decode()
+                result["truncated"] = True
+                result["next_token"] = next_token
+                result["hint"] = (
+                    f"Showing the first {len(matches)} matches; call again with "
+                    "continuation_token=next_token for more, or narrow the pattern or path"
+                )
+            return result
 
         # 2. Specific Exception Handling (Issue #55 Requirements)
         except FileNotFoundError:
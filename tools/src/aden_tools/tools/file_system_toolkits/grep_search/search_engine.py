@@ -0,0 +1,417 @@
+"""
+Search engine behind grep_search.
+
+A search lists the files under the search root, skipping dependency and
+VCS directories, paths matched by ``.gitignore``/``.ignore`` files, files
+over ``MAX_FILE_BYTES`` and binary files.  Files are then scanned in path
+order by a thread pool: each file is read in one call and checked with a
+single whole-text regex search before any line-by-line matching, so files
+without a match cost one C-level scan.  Results stop at a cap and resume
+from a continuation position (file, line).
+
+When the pattern contains literal text (``def load_``, ``TODO``), an
+optional per-directory trigram index narrows the files to scan.  Each file
+keeps a small bitmap of its hashed, case-folded trigrams, sized to the
+file; a file can only match if every trigram of the pattern's literals is
+set.  Bitmaps are recomputed only for files whose mtime or size changed, so
+repeated searches of a large tree read only the files that can match.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from re import _parser
+
+import numpy as np
+
+DEFAULT_MAX_RESULTS = 500
+MAX_FILE_BYTES = 10 * 1024 * 1024
+BINARY_SNIFF_BYTES = 8192
+MAX_WORKERS = 8
+MAX_INDEXES = 4
+
+IGNORE_FILES = (".gitignore", ".ignore")
+IGNORED_DIRS = frozenset(
+    {
+        ".git",
+        ".hg",
+        ".svn",
+        "node_modules",
+        "__pycache__",
+        ".venv",
+        "venv",
+        ".tox",
+        ".mypy_cache",
+        ".pytest_cache",
+        ".ruff_cache",
+    }
+)
+
+_pool: ThreadPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool() -> ThreadPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="grep")
+        return _pool
+
+
+@dataclass
+class FileEntry:
+    # Path relative to the search root, with "/" separators
+    rel: str
+    path: str
+    mtime_ns: int
+    size: int
+
+
+@dataclass
+class Match:
+    entry: FileEntry
+    line_number: int
+    line: str
+
+
+# ----------------------------------------------------------------------
+# Listing files
+# ----------------------------------------------------------------------
+
+
+@dataclass
+class _IgnoreRule:
+    # Directory of the ignore file, relative to the search root ("" for the root)
+    base: str
+    pattern: str
+    negate: bool
+    dir_only: bool
+    anchored: bool
+
+
+def _read_ignore_rules(directory: str, base: str) -> list[_IgnoreRule]:
+    rules = []
+    for name in IGNORE_FILES:
+        try:
+            with open(os.path.join(directory, name), encoding="utf-8", errors="replace") as f:
+                lines = f.read().splitlines()
+        except OSError:
+            continue
+        for line in lines:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            negate = line.startswith("!")
+            line = line[1:] if negate else line
+            dir_only = line.endswith("/")
+            line = line.rstrip("/")
+            if line.startswith("**/"):
+                line = line[3:]
+            anchored = "/" in line
+            if line:
+                rules.append(_IgnoreRule(base, line.lstrip("/"), negate, dir_only, anchored))
+    return rules
+
+
+def _is_ignored(rules: list[_IgnoreRule], rel: str, is_dir: bool) -> bool:
+    """gitignore-style matching: the last rule that matches decides."""
+    ignored = False
+    for rule in rules:
+        if rule.dir_only and not is_dir:
+            continue
+        if rule.base:
+            if not rel.startswith(rule.base + "/"):
+                continue
+            sub = rel[len(rule.base) + 1 :]
+        else:
+            sub = rel
+        target = sub if rule.anchored else sub.rsplit("/", 1)[-1]
+        if fnmatchcase(target, rule.pattern):
+            ignored = not rule.negate
+    return ignored
+
+
+def _entry(path: str, rel: str) -> FileEntry | None:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return FileEntry(rel, path, stat.st_mtime_ns, stat.st_size)
+
+
+def list_files(root: str, recursive: bool, include_ignored: bool = False) -> list[FileEntry]:
+    """Files to search under directory *root*, sorted by relative path."""
+    entries: list[FileEntry] = []
+    rules_by_dir: dict[str, list[_IgnoreRule]] = {}
+    for directory, dirnames, filenames in os.walk(root):
+        rel_dir = os.path.relpath(directory, root).replace(os.sep, "/")
+        rel_dir = "" if rel_dir == "." else rel_dir
+        parent = rel_dir.rsplit("/", 1)[0] if "/" in rel_dir else ""
+        rules = [] if include_ignored else rules_by_dir.get(parent, [])
+        if not include_ignored:
+            own = _read_ignore_rules(directory, rel_dir)
+            rules = rules + own if own else rules
+            rules_by_dir[rel_dir] = rules
+
+        def rel(name: str, rel_dir: str = rel_dir) -> str:
+            return f"{rel_dir}/{name}" if rel_dir else name
+
+        if recursive:
+            dirnames[:] = [
+                d
+                for d in dirnames
+                if include_ignored
+                or (d not in IGNORED_DIRS and not _is_ignored(rules, rel(d), is_dir=True))
+            ]
+        else:
+            dirnames[:] = []
+        for name in filenames:
+            if not include_ignored and _is_ignored(rules, rel(name), is_dir=False):
+                continue
+            entry = _entry(os.path.join(directory, name), rel(name))
+            if entry is not None and entry.size <= MAX_FILE_BYTES:
+                entries.append(entry)
+    entries.sort(key=lambda e: e.rel)
+    return entries
+
+
+def file_entry(path: str) -> FileEntry | None:
+    """Entry for searching the single file *path* (never filtered by ignore rules)."""
+    return _entry(path, os.path.basename(path))
+
+
+# ----------------------------------------------------------------------
+# Scanning
+# ----------------------------------------------------------------------
+
+
+def read_text(path: str) -> str | None:
+    """UTF-8 text of *path*, or None for binary or undecodable files."""
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+    if b"\0" in data[:BINARY_SNIFF_BYTES]:
+        return None
+    try:
+        return data.decode("utf-8")
+    except UnicodeDecodeError:
+        return None
+
+
+def prefilter_for(pattern: str, flags: int = 0) -> re.Pattern | None:
+    """
+    Whole-text regex that finds a match whenever some line would.
+
+    With MULTILINE, ``^`` and ``$`` match at line boundaries as they do per
+    line; ``\\A`` and ``\\Z`` do not, so those patterns skip the prefilter.
+    """
+    if "\\A" in pattern or "\\Z" in pattern:
+        return None
+    return re.compile(pattern, flags | re.MULTILINE)
+
+
+def scan_file(
+    entry: FileEntry, regex: re.Pattern, prefilter: re.Pattern | None
+) -> list[tuple[int, str]]:
+    """``(line number, line)`` of each matching line, like searching the file in text mode."""
+    text = read_text(entry.path)
+    if text is None:
+        return []
+    # Universal newlines, as reading the file in text mode does
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    if prefilter is not None and prefilter.search(text) is None:
+        return []
+    # Each line keeps its "\n", as iterating a text file does
+    lines = text.split("\n")
+    last = lines.pop()
+    found = []
+    for number, line in enumerate(lines, 1):
+        line += "\n"
+        if regex.search(line):
+            found.append((number, line))
+    if last and regex.search(last):
+        found.append((len(lines) + 1, last))
+    return found
+
+
+def search_files(
+    entries: list[FileEntry],
+    regex: re.Pattern,
+    prefilter: re.Pattern | None,
+    max_results: int,
+    start: tuple[str, int] | None = None,
+) -> tuple[list[Match], tuple[str, int] | None]:
+    """
+    Up to *max_results* matches in path then line order, starting at the
+    ``(rel, line)`` position *start*.  Also returns the position of the
+    next match when there are more.
+    """
+    if start is not None:
+        entries = [e for e in entries if e.rel >= start[0]]
+    pool = _get_pool()
+    remaining = iter(entries)
+    window: deque = deque()
+
+    def submit_next() -> None:
+        entry = next(remaining, None)
+        if entry is not None:
+            window.append((entry, pool.submit(scan_file, entry, regex, prefilter)))
+
+    for _ in range(MAX_WORKERS * 2):
+        submit_next()
+
+    matches: list[Match] = []
+    try:
+        while window:
+            entry, future = window.popleft()
+            submit_next()
+            for number, line in future.result():
+                if start is not None and entry.rel == start[0] and number < start[1]:
+                    continue
+                if len(matches) >= max_results:
+                    return matches, (entry.rel, number)
+                matches.append(Match(entry, number, line))
+    finally:
+        for _, future in window:
+            future.cancel()
+    return matches, None
+
+
+# ----------------------------------------------------------------------
+# Trigram index
+# ----------------------------------------------------------------------
+
+_HASH_MULTIPLIERS = (
+    np.uint64(0x9E3779B97F4A7C15),
+    np.uint64(0xC2B2AE3D27D4EB4F),
+    np.uint64(0x165667B19E3779F9),
+)
+
+
+def _trigram_hashes(text: str) -> np.ndarray:
+    """64-bit hashes of every trigram of the case-folded *text*."""
+    codes = np.frombuffer(text.casefold().encode("utf-32-le"), dtype=np.uint32)
+    if len(codes) < 3:
+        return np.empty(0, dtype=np.uint64)
+    codes = codes.astype(np.uint64)
+    a, b, c = _HASH_MULTIPLIERS
+    with np.errstate(over="ignore"):
+        mixed = codes[:-2] * a ^ codes[1:-1] * b ^ codes[2:] * c
+        return mixed * a
+
+
+def _bitmap(text: str) -> tuple[int, bytes]:
+    """``(bits, bitmap)``: one bit per hashed trigram, about 8 bits per distinct trigram."""
+    hashes = np.unique(_trigram_hashes(text))
+    bits = max(6, int(len(hashes) * 8).bit_length())
+    positions = (hashes >> np.uint64(64 - bits)).astype(np.int64)
+    flags = np.zeros(1 << bits, dtype=np.uint8)
+    flags[positions] = 1
+    return bits, np.packbits(flags, bitorder="little").tobytes()
+
+
+def required_literals(pattern: str, flags: int = 0) -> list[str]:
+    """
+    Literal runs that every match of *pattern* must contain.
+
+    Only top-level literals and literals inside plain groups are used;
+    alternations, classes and repeats end a run.
+    """
+    try:
+        parsed = _parser.parse(pattern, flags)
+    except re.error:
+        return []
+    runs: list[str] = []
+
+    def walk(items) -> None:
+        current: list[str] = []
+        for op, value in items:
+            if op is _parser.LITERAL:
+                current.append(chr(value))
+                continue
+            runs.append("".join(current))
+            current = []
+            if op is _parser.SUBPATTERN:
+                walk(value[-1])
+        runs.append("".join(current))
+
+    walk(parsed)
+    return [run for run in runs if len(run) >= 3]
+
+
+class TrigramIndex:
+    """Trigram bitmaps of the files under one directory, refreshed by mtime and size."""
+
+    def __init__(self):
+        # rel -> (mtime_ns, size, bits, bitmap); bitmap is None for binary files
+        self._files: dict[str, tuple[int, int, int, bytes | None]] = {}
+        self._lock = threading.Lock()
+        self.files_indexed = 0  # bitmaps computed so far
+
+    def refresh(self, entries: list[FileEntry]) -> None:
+        with self._lock:
+            stale = [
+                e
+                for e in entries
+                if (cached := self._files.get(e.rel)) is None or cached[:2] != (e.mtime_ns, e.size)
+            ]
+            for entry, result in zip(stale, _get_pool().map(self._index_file, stale), strict=True):
+                self._files[entry.rel] = (entry.mtime_ns, entry.size, *result)
+            self.files_indexed += len(stale)
+            live = {e.rel for e in entries}
+            for rel in [rel for rel in self._files if rel not in live]:
+                del self._files[rel]
+
+    @staticmethod
+    def _index_file(entry: FileEntry) -> tuple[int, bytes | None]:
+        text = read_text(entry.path)
+        if text is None:
+            return 0, None
+        return _bitmap(text)
+
+    def candidates(self, entries: list[FileEntry], literals: list[str]) -> list[FileEntry]:
+        """The entries whose bitmaps contain every trigram of *literals*."""
+        hashes = [int(h) for h in np.unique(np.concatenate([_trigram_hashes(s) for s in literals]))]
+        kept = []
+        for entry in entries:
+            cached = self._files.get(entry.rel)
+            if cached is None or cached[3] is None:
+                continue
+            bits, bitmap = cached[2], cached[3]
+            shift = 64 - bits
+            if all(bitmap[(h >> shift) >> 3] >> ((h >> shift) & 7) & 1 for h in hashes):
+                kept.append(entry)
+        return kept
+
+
+_indexes: OrderedDict[str, TrigramIndex] = OrderedDict()
+_indexes_lock = threading.Lock()
+
+
+def get_trigram_index(root: str, include_ignored: bool = False) -> TrigramIndex:
+    """The index for directory *root*; the least recently used ones are dropped."""
+    key = f"{os.path.realpath(root)}\0{include_ignored}"
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = _indexes[key] = TrigramIndex()
+            while len(_indexes) > MAX_INDEXES:
+                _indexes.popitem(last=False)
+        _indexes.move_to_end(key)
+        return index
+
+
+def search_digest(*parts: object) -> str:
+    """Short digest tying a continuation token to the search that produced it."""
+    return hashlib.sha256(repr(parts).encode()).hexdigest()[:12]
@@ -16,10 +16,15 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.utils import http_client
+from aden_tools.utils.pagination import Page, collect_pages, paginate_numbered, safe_filename
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
 GITHUB_API_BASE = "https://api.github.com"
+# per_page used when following pages (the API maximum)
+ISSUES_PAGE_SIZE = 100
 
 
 def _sanitize_path_param(param: str, param_name: str = "parameter") -> str:
@@ -123,7 +128,7 @@ def list_repos(
             "per_page": min(limit, 100),
         }
 
-        response = httpx.get(
+        response = http_client.get(
             url,
             headers=self._headers,
             params=params,
@@ -139,7 +144,7 @@ def get_repo(
         """Get repository information."""
         owner = _sanitize_path_param(owner, "owner")
         repo = _sanitize_path_param(repo, "repo")
-        response = httpx.get(
+        response = http_client.get(
             f"{GITHUB_API_BASE}/repos/{owner}/{repo}",
             headers=self._headers,
             timeout=30.0,
@@ -160,7 +165,7 @@ def search_repos(
         if sort:
             params["sort"] = sort
 
-        response = httpx.get(
+        response = http_client.get(
             f"{GITHUB_API_BASE}/search/repositories",
             headers=self._headers,
             params=params,
@@ -187,7 +192,7 @@ def list_issues(
             "page": max(1, page),
         }
 
-        response = httpx.get(
+        response = http_client.get(
             f"{GITHUB_API_BASE}/repos/{owner}/{repo}/issues",
             headers=self._headers,
             params=params,
@@ -204,7 +209,7 @@ def get_issue(
         """Get a specific issue."""
         owner = _sanitize_path_param(owner, "owner")
         repo = _sanitize_path_param(repo, "repo")
-        response = httpx.get(
+        response = http_client.get(
             f"{GITHUB_API_BASE}/repos/{owner}/{repo}/issues/{issue_number}",
             headers=self._headers,
             timeout=30.0,
@@ -231,7 +236,7 @@ def create_issue(
         if assignees:
             payload["assignees"] = assignees
 
-        response = httpx.post(
+        response = http_client.post(
             f"{GITHUB_API_BASE}/repos/{owner}/{repo}/issues",
             headers=self._headers,
             json=payload,
@@ -262,7 +267,7 @@ def update_issue(
         if labels is not None:
             payload["labels"] = labels
 
-        response = httpx.patch(
+        response = http_client.patch(
             f"{GITHUB_API_BASE}/repos/{owner}/{repo}/issues/{issue_number}",
             headers=self._headers,
             json=payload,
@@ -289,7 +294,7 @@ def list_pull_requests(
             "page": max(1, page),
         }
 
-        response = httpx.get(
+        response = http_client.get(
             f"{GITHUB_API_BASE}/repos/{owner}/{repo}/pulls",
             headers=self._headers,
             params=params,
@@ -306,7 +311,7 @@ def get_pull_request(
         """Get a specific pull request."""
         owner = _sanitize_path_param(owner, "owner")
         repo = _sanitize_path_param(repo, "repo")
-        response = httpx.get(
+        response = http_client.get(
             f"{GITHUB_API_BASE}/repos/{owner}/{repo}/pulls/{pull_number}",
             headers=self._headers,
             timeout=30.0,
@@ -335,7 +340,7 @@ def create_pull_request(
         if body:
             payload["body"] = body
 
-        response = httpx.post(
+        response = http_client.post(
             f"{GITHUB_API_BASE}/repos/{owner}/{repo}/pulls",
             headers=self._headers,
             json=payload,
@@ -356,7 +361,7 @@ def search_code(
             "per_page": min(limit, 100),
         }
 
-        response = httpx.get(
+        response = http_client.get(
             f"{GITHUB_API_BASE}/search/code",
             headers=self._headers,
             params=params,
@@ -379,7 +384,7 @@ def list_branches(
             "per_page": min(limit, 100),
         }
 
-        response = httpx.get(
+        response = http_client.get(
             f"{GITHUB_API_BASE}/repos/{owner}/{repo}/branches",
             headers=self._headers,
             params=params,
@@ -397,7 +402,7 @@ def get_branch(
         owner = _sanitize_path_param(owner, "owner")
         repo = _sanitize_path_param(repo, "repo")
         branch = _sanitize_path_param(branch, "branch")
-        response = httpx.get(
+        response = http_client.get(
             f"{GITHUB_API_BASE}/repos/{owner}/{repo}/branches/{branch}",
             headers=self._headers,
             timeout=30.0,
@@ -421,7 +426,7 @@ def list_stargazers(
             "page": max(1, page),
         }
 
-        response = httpx.get(
+        response = http_client.get(
             f"{GITHUB_API_BASE}/repos/{owner}/{repo}/stargazers",
             headers=self._headers,
             params=params,
@@ -437,7 +442,7 @@ def get_user_profile(
     ) -> dict[str, Any]:
         """Get a user's public profile."""
         username = _sanitize_path_param(username, "username")
-        response = httpx.get(
+        response = http_client.get(
             f"{GITHUB_API_BASE}/users/{username}",
             headers=self._headers,
             timeout=30.0,
@@ -465,7 +470,7 @@ def get_user_emails(
                 emails[profile["email"]] = "profile"
 
         # 2. Check recent public events for commit emails
-        response = httpx.get(
+        response = http_client.get(
             f"{GITHUB_API_BASE}/users/{username}/events/public",
             headers=self._headers,
             params={"per_page": 30},
@@ -641,6 +646,55 @@ def github_list_issues(
         except httpx.RequestError as e:
             return {"error": _sanitize_error_message(e)}
 
+    @mcp.tool()
+    def github_fetch_issues(
+        owner: str,
+        repo: str,
+        state: str = "open",
+        max_items: int = 500,
+        account: str = "",
+        data_dir: str = "",
+    ) -> dict:
+        """
+        Fetch up to max_items issues for a repository, following pages.
+
+        Use this instead of github_list_issues when you need more than one
+        page. Pages are fetched concurrently. Issues are saved to a JSONL data
+        file when a data directory is available; the result then holds the
+        filename and a short preview.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            state: Issue state ("open", "closed", "all")
+            max_items: Maximum number of issues to fetch (default 500)
+
+        Returns:
+            Dict with count, pages, has_more and either the issues or the
+            data filename, or error
+        """
+        client = _get_client(account)
+        if isinstance(client, dict):
+            return client
+
+        def fetch(page: int) -> Page:
+            result = client.list_issues(owner, repo, state, page, ISSUES_PAGE_SIZE)
+            if "error" in result:
+                return Page(error=result["error"])
+            return Page(items=result["data"] or [])
+
+        try:
+            return collect_pages(
+                paginate_numbered(fetch, ISSUES_PAGE_SIZE, max_items),
+                max_items,
+                data_dir,
+                safe_filename("github_issues", owner, repo),
+            )
+        except httpx.TimeoutException:
+            return {"error": "Request timed out"}
+        except httpx.RequestError as e:
+            return {"error": _sanitize_error_message(e)}
+
     @mcp.tool()
     def github_get_issue(
         owner: str,
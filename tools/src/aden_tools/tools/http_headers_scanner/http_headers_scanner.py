@@ -10,6 +10,8 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.utils.dns_resolver import resolving_transport
+
 # Security headers to check — each with severity and remediation guidance
 SECURITY_HEADERS = {
     "Strict-Transport-Security": {
@@ -118,6 +120,7 @@ async def http_headers_scan(url: str, follow_redirects: bool = True) -> dict:
                 follow_redirects=follow_redirects,
                 timeout=15,
                 verify=True,
+                transport=resolving_transport(verify=True),
             ) as client:
                 response = await client.get(url)
         except httpx.ConnectError as e:
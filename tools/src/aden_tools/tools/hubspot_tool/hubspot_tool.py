@@ -16,10 +16,14 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.utils.pagination import Page, collect_pages, paginate_cursor, safe_filename
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
 HUBSPOT_API_BASE = "https://api.hubapi.com"
+# Search API page size limit
+SEARCH_PAGE_SIZE = 100
 
 
 class _HubSpotClient:
@@ -60,6 +64,7 @@ def search_objects(
         query: str = "",
         properties: list[str] | None = None,
         limit: int = 10,
+        after: str | None = None,
     ) -> dict[str, Any]:
         """Search CRM objects."""
         body: dict[str, Any] = {"limit": min(limit, 100)}
@@ -67,6 +72,8 @@ def search_objects(
             body["query"] = query
         if properties:
             body["properties"] = properties
+        if after:
+            body["after"] = after
 
         response = httpx.post(
             f"{HUBSPOT_API_BASE}/crm/v3/objects/{object_type}/search",
@@ -191,6 +198,55 @@ def hubspot_search_contacts(
         except httpx.RequestError as e:
             return {"error": f"Network error: {e}"}
 
+    @mcp.tool()
+    def hubspot_fetch_contacts(
+        query: str = "",
+        properties: list[str] | None = None,
+        max_items: int = 500,
+        account: str = "",
+        data_dir: str = "",
+    ) -> dict:
+        """
+        Fetch up to max_items HubSpot contacts matching a search, following pages.
+
+        Use this instead of hubspot_search_contacts when you need more than one
+        page. Contacts are saved to a JSONL data file when a data directory is
+        available; the result then holds the filename and a short preview.
+
+        Args:
+            query: Search query string (empty matches all contacts)
+            properties: List of properties to return
+                (e.g., ["email", "firstname", "lastname", "phone"])
+            max_items: Maximum number of contacts to fetch (default 500)
+
+        Returns:
+            Dict with count, pages, has_more and either the contacts or the
+            data filename, or error
+        """
+        client = _get_client(account)
+        if isinstance(client, dict):
+            return client
+        properties = properties or ["email", "firstname", "lastname"]
+
+        def fetch(after: str | None) -> Page:
+            result = client.search_objects("contacts", query, properties, SEARCH_PAGE_SIZE, after)
+            if "error" in result:
+                return Page(error=result["error"])
+            next_page = result.get("paging", {}).get("next", {})
+            return Page(items=result.get("results", []), next=next_page.get("after"))
+
+        try:
+            return collect_pages(
+                paginate_cursor(fetch, max_items),
+                max_items,
+                data_dir,
+                safe_filename("hubspot_contacts"),
+            )
+        except httpx.TimeoutException:
+            return {"error": "Request timed out"}
+        except httpx.RequestError as e:
+            return {"error": f"Network error: {e}"}
+
     @mcp.tool()
     def hubspot_get_contact(
         contact_id: str,
@@ -18,6 +18,8 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.utils.fetch_cache import cached
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
@@ -165,6 +167,7 @@ def _parse_finlight_results(
             )
         return results
 
+    @cached("news_search", exclude=("api_key",))
     def _search_newsdata(
         query: str | None,
         from_date: str | None,
@@ -215,6 +218,7 @@ def _search_newsdata(
             "provider": "newsdata",
         }
 
+    @cached("news_search", exclude=("api_key",))
     def _search_finlight(
         query: str | None,
         from_date: str | None,
@@ -0,0 +1,281 @@
+"""
+Per-page text cache and keyword index for PDF files.
+
+pypdf extracts text one page at a time on a single core, and agents often
+re-read the same long report from several nodes and sessions.  Extracted
+page text is saved in a private per-user directory under the temp
+directory (see ``aden_tools.utils.private_dir``), keyed by the SHA-256 of
+the file and the page number, so each page of a given document is extracted once no
+matter where the file lives or how often it is read.
+
+Pages that are not cached yet are split into ranges and extracted in a
+process pool when there are enough of them to pay for it; otherwise (and
+on single-core machines) they are extracted in-process.  ``iter_pages``
+yields pages in order as they become available, so callers can stream
+them out rather than holding the whole document.
+
+``search_pages`` answers keyword queries from an inverted index (word ->
+pages and counts) built from the cached text of the first ``max_pages``
+pages the first time a document is searched.
+
+Example:
+    document = PdfDocument(path)
+    for index, text in document.iter_pages(range(10)):
+        ...
+    hits = document.search_pages("revenue guidance")
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import threading
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any
+
+from aden_tools.utils.private_dir import make_private_dir, user_temp_dir
+
+INDEX_VERSION = 2
+MAX_WORKERS = 4
+# Fewer uncached pages than this are extracted in-process
+PARALLEL_MIN_PAGES = 16
+PAGES_PER_TASK = 8
+SNIPPET_CHARS = 80
+
+CACHE_DIR = user_temp_dir("aden_pdf_cache")
+
+_WORD = re.compile(r"\w\w+")
+
+_digests: dict[tuple[str, int, int], str] = {}
+_digests_lock = threading.Lock()
+_pool: ProcessPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+def file_digest(path: str) -> str:
+    """SHA-256 of *path*, remembered while its mtime and size are unchanged."""
+    real = os.path.realpath(path)
+    stat = os.stat(real)
+    key = (real, stat.st_mtime_ns, stat.st_size)
+    with _digests_lock:
+        digest = _digests.get(key)
+    if digest is None:
+        sha = hashlib.sha256()
+        with open(real, "rb") as f:
+            while chunk := f.read(1024 * 1024):
+                sha.update(chunk)
+        digest = sha.hexdigest()
+        with _digests_lock:
+            _digests[key] = digest
+    return digest
+
+
+def _extract_range(path: str, indices: list[int]) -> list[str]:
+    """Text of pages *indices* of *path*; runs in a worker process."""
+    from pypdf import PdfReader
+
+    reader = PdfReader(path)
+    return [reader.pages[i].extract_text() or "" for i in indices]
+
+
+def _workers() -> int:
+    return min(MAX_WORKERS, os.cpu_count() or 1)
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=_workers())
+        return _pool
+
+
+def _reset_pool() -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+def _cache_dir_ready() -> bool:
+    """True once CACHE_DIR exists and is private to this user."""
+    try:
+        make_private_dir(CACHE_DIR)
+    except OSError:
+        return False
+    return True
+
+
+def _write_atomic(path: str, text: str) -> None:
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp, path)
+    except OSError:
+        pass  # the caller still has the text
+
+
+class PdfDocument:
+    """Cached page text of one PDF, identified by its content hash."""
+
+    def __init__(self, path: str, reader: Any = None):
+        self.path = os.path.realpath(path)
+        self.digest = file_digest(self.path)
+        self.directory = os.path.join(CACHE_DIR, self.digest)
+        # Pages are neither read from nor written to a directory we do not own
+        self.cacheable = _cache_dir_ready()
+        # Used for in-process extraction; opened lazily otherwise
+        self._reader = reader
+
+    @property
+    def reader(self) -> Any:
+        if self._reader is None:
+            from pypdf import PdfReader
+
+            self._reader = PdfReader(self.path)
+        return self._reader
+
+    @property
+    def page_count(self) -> int:
+        return len(self.reader.pages)
+
+    def _page_file(self, index: int) -> str:
+        return os.path.join(self.directory, f"page-{index + 1}.txt")
+
+    def cached_text(self, index: int) -> str | None:
+        if not self.cacheable:
+            return None
+        try:
+            with open(self._page_file(index), encoding="utf-8") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _save(self, index: int, text: str) -> None:
+        if not self.cacheable:
+            return
+        try:
+            os.makedirs(self.directory, mode=0o700, exist_ok=True)
+        except OSError:
+            return
+        _write_atomic(self._page_file(index), text)
+
+    def _submit(self, missing: list[int]) -> dict[int, tuple[Future, int]]:
+        """Submit *missing* pages to the pool in ranges; {page: (future, position)}."""
+        pool = _get_pool()
+        chunks: dict[int, tuple[Future, int]] = {}
+        for start in range(0, len(missing), PAGES_PER_TASK):
+            chunk = missing[start : start + PAGES_PER_TASK]
+            future = pool.submit(_extract_range, self.path, chunk)
+            for position, index in enumerate(chunk):
+                chunks[index] = (future, position)
+        return chunks
+
+    def iter_pages(self, indices: Iterable[int]) -> Iterator[tuple[int, str]]:
+        """``(index, text)`` for each 0-based page index, in order, extracting as needed."""
+        indices = list(indices)
+        missing = [
+            i
+            for i in dict.fromkeys(indices)
+            if not (self.cacheable and os.path.exists(self._page_file(i)))
+        ]
+        pending: dict[int, tuple[Future, int]] = {}
+        if len(missing) >= PARALLEL_MIN_PAGES and _workers() > 1:
+            try:
+                pending = self._submit(missing)
+            except (BrokenProcessPool, OSError, RuntimeError):
+                _reset_pool()
+
+        for index in indices:
+            text = self.cached_text(index)
+            if text is None:
+                if index in pending:
+                    future, position = pending.pop(index)
+                    try:
+                        text = future.result()[position]
+                    except BrokenProcessPool:
+                        _reset_pool()
+                if text is None:
+                    text = self.reader.pages[index].extract_text() or ""
+                self._save(index, text)
+            yield index, text
+
+    # ------------------------------------------------------------------
+    # Keyword index
+    # ------------------------------------------------------------------
+
+    def _index_file(self) -> str:
+        return os.path.join(self.directory, "index.json")
+
+    def keyword_index(self, max_pages: int = 100) -> dict[str, list[list[int]]]:
+        """``{word: [[page index, count], ...]}`` of the first *max_pages* pages, built once."""
+        pages = min(self.page_count, max_pages)
+        if self.cacheable:
+            try:
+                with open(self._index_file(), encoding="utf-8") as f:
+                    data = json.load(f)
+                if data.get("version") == INDEX_VERSION and data.get("pages") == pages:
+                    return data["terms"]
+            except (OSError, ValueError, KeyError):
+                pass
+
+        terms: dict[str, list[list[int]]] = {}
+        for index, text in self.iter_pages(range(pages)):
+            for word, count in Counter(_WORD.findall(text.lower())).items():
+                terms.setdefault(word, []).append([index, count])
+        if self.cacheable:
+            try:
+                os.makedirs(self.directory, mode=0o700, exist_ok=True)
+                _write_atomic(
+                    self._index_file(),
+                    json.dumps({"version": INDEX_VERSION, "pages": pages, "terms": terms}),
+                )
+            except OSError:
+                pass
+        return terms
+
+    def search_pages(
+        self, query: str, max_results: int = 20, max_pages: int = 100
+    ) -> list[dict[str, Any]]:
+        """
+        Pages among the first *max_pages* containing every word of *query*,
+        most hits first, each with its 1-based page number, hit count and a
+        snippet around the first hit.
+        """
+        words = list(dict.fromkeys(_WORD.findall(query.lower())))
+        if not words:
+            return []
+        terms = self.keyword_index(max_pages)
+        hits: dict[int, int] | None = None
+        for word in words:
+            counts = dict(terms.get(word, []))
+            if hits is None:
+                hits = counts
+            else:
+                hits = {index: n + counts[index] for index, n in hits.items() if index in counts}
+            if not hits:
+                return []
+
+        ranked = sorted(hits.items(), key=lambda item: (-item[1], item[0]))[:max_results]
+        results = []
+        for index, count in ranked:
+            results.append(
+                {"page": index + 1, "hits": count, "snippet": self._snippet(index, words[0])}
+            )
+        return results
+
+    def _snippet(self, index: int, word: str) -> str:
+        text = self.cached_text(index) or ""
+        match = re.search(rf"\b{re.escape(word)}\b", text, re.IGNORECASE)
+        if match is None:
+            return ""
+        start = max(0, match.start() - SNIPPET_CHARS)
+        end = min(len(text), match.end() + SNIPPET_CHARS)
+        return " ".join(text[start:end].split())
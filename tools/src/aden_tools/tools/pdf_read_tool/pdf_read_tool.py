@@ -13,6 +13,13 @@
 from fastmcp import FastMCP
 from pypdf import PdfReader
 
+from aden_tools.utils.pagination import safe_filename
+
+from .page_cache import PdfDocument
+
+# Content past this many characters goes to a file in data_dir, when one is given
+MAX_INLINE_CHARS = 200_000
+
 
 def register_tools(mcp: FastMCP) -> None:
     """Register PDF read tools with the MCP server."""
@@ -86,18 +93,37 @@ def parse_page_range(
         except ValueError as e:
             return {"error": f"Invalid page format: '{pages}'. {str(e)}"}
 
+    def validate_path(file_path: str) -> Path | dict[str, str]:
+        """Resolved path of an existing .pdf file, or an error dict."""
+        path = Path(file_path).resolve()
+
+        # Validate file exists
+        if not path.exists():
+            return {"error": f"PDF file not found: {file_path}"}
+
+        if not path.is_file():
+            return {"error": f"Not a file: {file_path}"}
+
+        # Check extension
+        if path.suffix.lower() != ".pdf":
+            return {"error": f"Not a PDF file (expected .pdf): {file_path}"}
+
+        return path
+
     @mcp.tool()
     def pdf_read(
         file_path: str,
         pages: str | None = None,
         max_pages: int = 100,
         include_metadata: bool = True,
+        data_dir: str = "",
     ) -> dict:
         """
         Read and extract text content from a PDF file.
 
         Returns text content with page markers and optional metadata.
         Use for reading PDFs, reports, documents, or any PDF file.
+        Use pdf_search first to find which pages of a long PDF matter.
 
         Args:
             file_path: Path to the PDF file to read (absolute or relative)
@@ -105,23 +131,15 @@ def pdf_read(
                 '1-10' for range, '1,3,5' for specific
             max_pages: Maximum number of pages to process (1-1000, memory safety)
             include_metadata: Include PDF metadata (author, title, creation date, etc.)
+            data_dir: Directory to save long content to (auto-injected)
 
         Returns:
             Dict with extracted text and metadata, or error dict
         """
         try:
-            path = Path(file_path).resolve()
-
-            # Validate file exists
-            if not path.exists():
-                return {"error": f"PDF file not found: {file_path}"}
-
-            if not path.is_file():
-                return {"error": f"Not a file: {file_path}"}
-
-            # Check extension
-            if path.suffix.lower() != ".pdf":
-                return {"error": f"Not a PDF file (expected .pdf): {file_path}"}
+            path = validate_path(file_path)
+            if isinstance(path, dict):
+                return path
 
             # Validate max_pages
             if max_pages < 1:
@@ -145,11 +163,35 @@ def pdf_read(
 
             page_indices = page_info["indices"]
 
-            # Extract text from pages
+            # Extract text from pages (cached per page, uncached ranges in parallel)
+            document = PdfDocument(str(path), reader)
             content_parts = []
-            for i in page_indices:
-                page_text = reader.pages[i].extract_text() or ""
-                content_parts.append(f"--- Page {i + 1} ---\n{page_text}")
+            inline_chars = 0
+            total_chars = 0
+            spill = None
+            spill_path = None
+            try:
+                for i, page_text in document.iter_pages(page_indices):
+                    part = f"--- Page {i + 1} ---\n{page_text}"
+                    separator = "\n\n" if total_chars else ""
+                    total_chars += len(separator) + len(part)
+                    if spill is not None:
+                        spill.write(separator + part)
+                        continue
+                    if not data_dir or total_chars <= MAX_INLINE_CHARS:
+                        content_parts.append(part)
+                        inline_chars = total_chars
+                        continue
+                    # Too long to return inline: stream every page to a file instead
+                    spill_path = Path(data_dir) / safe_filename(
+                        "pdf_read", path.stem, suffix=".txt"
+                    )
+                    spill_path.parent.mkdir(parents=True, exist_ok=True)
+                    spill = spill_path.open("w", encoding="utf-8")
+                    spill.write("\n\n".join(content_parts) + separator + part)
+            finally:
+                if spill is not None:
+                    spill.close()
 
             content = "\n\n".join(content_parts)
 
@@ -162,6 +204,15 @@ def pdf_read(
                 "char_count": len(content),
             }
 
+            if spill_path is not None:
+                result["total_chars"] = total_chars
+                result["filename"] = spill_path.name
+                result["hint"] = (
+                    f"Showing the first {len(content_parts)} page(s) ({inline_chars} of "
+                    f"{total_chars} characters); the full text was saved, read it with "
+                    f"load_data(filename='{spill_path.name}')"
+                )
+
             # Surface truncation information when requested pages exceed max_pages
             if page_info.get("truncated"):
                 requested = page_info.get("requested_pages", len(page_indices))
@@ -192,3 +243,68 @@ def pdf_read(
             return {"error": f"Permission denied: {file_path}"}
         except Exception as e:
             return {"error": f"Failed to read PDF: {str(e)}"}
+
+    @mcp.tool()
+    def pdf_search(
+        file_path: str,
+        query: str,
+        max_results: int = 20,
+        max_pages: int = 100,
+    ) -> dict:
+        """
+        Find the pages of a PDF that mention every word of a query.
+
+        Use before pdf_read on long PDFs, then read only the pages returned.
+
+        Args:
+            file_path: Path to the PDF file to search (absolute or relative)
+            query: Words to look for (case-insensitive; all must be on the page)
+            max_results: Maximum number of pages to return (1-100)
+            max_pages: Maximum number of pages to search (1-1000, memory safety)
+
+        Returns:
+            Dict with matching pages (page number, hit count, snippet), or error dict
+        """
+        try:
+            path = validate_path(file_path)
+            if isinstance(path, dict):
+                return path
+
+            if not query or not query.strip():
+                return {"error": "query cannot be empty"}
+
+            max_results = max(1, min(max_results, 100))
+            max_pages = max(1, min(max_pages, 1000))
+
+            reader = PdfReader(path)
+            if reader.is_encrypted:
+                return {"error": "Cannot read encrypted PDF. Password required."}
+
+            # The keyword index is built from the first max_pages pages the first
+            # time a PDF is searched
+            matches = PdfDocument(str(path), reader).search_pages(query, max_results, max_pages)
+            total_pages = len(reader.pages)
+
+            result: dict[str, Any] = {
+                "path": str(path),
+                "name": path.name,
+                "total_pages": total_pages,
+                "query": query,
+                "matches": matches,
+                "match_count": len(matches),
+            }
+            if total_pages > max_pages:
+                result["truncated"] = True
+                result["truncation_warning"] = (
+                    f"The PDF has {total_pages} page(s), but max_pages={max_pages}. "
+                    f"Only the first {max_pages} page(s) were searched."
+                )
+            if matches:
+                page_list = ",".join(str(m["page"]) for m in matches)
+                result["hint"] = f"Read these pages with pdf_read(pages='{page_list}')"
+            return result
+
+        except PermissionError:
+            return {"error": f"Permission denied: {file_path}"}
+        except Exception as e:
+            return {"error": f"Failed to search PDF: {str(e)}"}
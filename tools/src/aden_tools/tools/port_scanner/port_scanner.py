@@ -9,10 +9,16 @@
 from __future__ import annotations
 
 import asyncio
-import socket
 
 from fastmcp import FastMCP
 
+from aden_tools.utils.scan_engine import (
+    AdaptiveLimiter,
+    clean_hostname,
+    is_congestion,
+    resolve_host,
+)
+
 # Well-known ports and their services
 PORT_SERVICE_MAP = {
     21: "FTP",
@@ -123,6 +129,12 @@
     }
 )
 
+# Probe concurrency starts here and adapts (see ``AdaptiveLimiter``)
+INITIAL_CONCURRENCY = 20
+MAX_CONCURRENCY = 200
+# Probes that hit a congestion error are retried after the limit drops
+CONGESTION_RETRIES = 3
+
 # Ports that are risky when exposed to the internet
 DATABASE_PORTS = {1433, 3306, 5432, 6379, 27017, 27018, 9200, 9300, 5984, 11211}
 ADMIN_PORTS = {3389, 5900, 2082, 2083, 2086, 2087, 10000}
@@ -155,6 +167,100 @@
 }
 
 
+def parse_ports(ports: str) -> list[int]:
+    """Port list for "top20", "top100" or "80,443,8080"; raises ValueError otherwise."""
+    if ports == "top20":
+        return TOP20_PORTS
+    if ports == "top100":
+        return TOP100_PORTS
+    port_list = sorted({int(p.strip()) for p in ports.split(",") if p.strip()})
+    if not port_list or not all(0 < p < 65536 for p in port_list):
+        raise ValueError(ports)
+    return port_list
+
+
+def _port_entry(port: int, banner: str) -> dict:
+    """Open-port entry, with a finding when the port is risky."""
+    entry = {
+        "port": port,
+        "service": PORT_SERVICE_MAP.get(port, "unknown"),
+        "banner": banner,
+    }
+
+    # Check if this port is risky
+    if port in DATABASE_PORTS:
+        entry["severity"] = PORT_FINDINGS["database"]["severity"]
+        entry["finding"] = f"{entry['service']} port ({port}) exposed to internet"
+        entry["remediation"] = PORT_FINDINGS["database"]["remediation"]
+    elif port in ADMIN_PORTS:
+        entry["severity"] = PORT_FINDINGS["admin"]["severity"]
+        entry["finding"] = f"{entry['service']} admin port ({port}) exposed to internet"
+        entry["remediation"] = PORT_FINDINGS["admin"]["remediation"]
+    elif port in LEGACY_PORTS:
+        entry["severity"] = PORT_FINDINGS["legacy"]["severity"]
+        entry["finding"] = f"Legacy protocol {entry['service']} ({port}) still active"
+        entry["remediation"] = PORT_FINDINGS["legacy"]["remediation"]
+    return entry
+
+
+async def scan_ports(
+    hostname: str,
+    port_list: list[int] = TOP20_PORTS,
+    timeout: float = 3.0,
+    limiter: AdaptiveLimiter | None = None,
+) -> dict:
+    """
+    TCP connect scan of *hostname*, as returned by ``port_scan``.
+
+    Probes share *limiter* (a new one per call by default), so a batch of
+    hosts can be scanned under one socket budget.
+    """
+    try:
+        ip = await resolve_host(hostname)
+    except (OSError, UnicodeError):
+        return {"error": f"Could not resolve hostname: {hostname}"}
+
+    limiter = limiter or AdaptiveLimiter(INITIAL_CONCURRENCY, maximum=MAX_CONCURRENCY)
+    open_ports = []
+    closed_ports = []
+
+    async def scan_port(port: int) -> None:
+        for _attempt in range(CONGESTION_RETRIES + 1):
+            async with limiter.slot() as window:
+                result = await _check_port(ip, port, timeout)
+            if not result.get("congested"):
+                limiter.success()
+                break
+            limiter.congestion(window)
+        if result["open"]:
+            open_ports.append(_port_entry(port, result.get("banner", "")))
+        else:
+            closed_ports.append(port)
+
+    await asyncio.gather(*[scan_port(p) for p in port_list])
+
+    # Sort open ports by port number
+    open_ports.sort(key=lambda x: x["port"])
+
+    # Grade input
+    open_port_numbers = {p["port"] for p in open_ports}
+    grade_input = {
+        "no_database_ports_exposed": not bool(open_port_numbers & DATABASE_PORTS),
+        "no_admin_ports_exposed": not bool(open_port_numbers & ADMIN_PORTS),
+        "no_legacy_ports_exposed": not bool(open_port_numbers & LEGACY_PORTS),
+        "only_web_ports": open_port_numbers <= {80, 443, 8080, 8443},
+    }
+
+    return {
+        "hostname": hostname,
+        "ip": ip,
+        "ports_scanned": len(port_list),
+        "open_ports": open_ports,
+        "closed_ports": sorted(closed_ports),
+        "grade_input": grade_input,
+    }
+
+
 def register_tools(mcp: FastMCP) -> None:
     """Register port scanning tools with the MCP server."""
 
@@ -180,92 +286,12 @@ async def port_scan(
             Dict with open/closed ports, service details, security findings,
             and grade_input for the risk_scorer tool.
         """
-        # Clean hostname
-        hostname = hostname.replace("https://", "").replace("http://", "").strip("/")
-        hostname = hostname.split("/")[0]
-        if ":" in hostname:
-            hostname = hostname.split(":")[0]
-
-        timeout = min(timeout, 10.0)
-
-        # Parse port list
-        if ports == "top20":
-            port_list = TOP20_PORTS
-        elif ports == "top100":
-            port_list = TOP100_PORTS
-        else:
-            try:
-                port_list = sorted({int(p.strip()) for p in ports.split(",") if p.strip()})
-            except ValueError:
-                return {"error": f"Invalid port list: {ports}. Use 'top20', 'top100', or '80,443'"}
-
-        # Resolve hostname
         try:
-            ip = socket.gethostbyname(hostname)
-        except socket.gaierror:
-            return {"error": f"Could not resolve hostname: {hostname}"}
+            port_list = parse_ports(ports)
+        except ValueError:
+            return {"error": f"Invalid port list: {ports}. Use 'top20', 'top100', or '80,443'"}
 
-        # Scan ports concurrently
-        open_ports = []
-        closed_ports = []
-
-        # Limit concurrency to avoid overwhelming the target
-        semaphore = asyncio.Semaphore(20)
-
-        async def scan_port(port: int) -> None:
-            async with semaphore:
-                result = await _check_port(ip, port, timeout)
-                if result["open"]:
-                    entry = {
-                        "port": port,
-                        "service": PORT_SERVICE_MAP.get(port, "unknown"),
-                        "banner": result.get("banner", ""),
-                    }
-
-                    # Check if this port is risky
-                    if port in DATABASE_PORTS:
-                        entry["severity"] = PORT_FINDINGS["database"]["severity"]
-                        entry["finding"] = f"{entry['service']} port ({port}) exposed to internet"
-                        entry["remediation"] = PORT_FINDINGS["database"]["remediation"]
-                    elif port in ADMIN_PORTS:
-                        entry["severity"] = PORT_FINDINGS["admin"]["severity"]
-                        entry["finding"] = (
-                            f"{entry['service']} admin port ({port}) exposed to internet"
-                        )
-                        entry["remediation"] = PORT_FINDINGS["admin"]["remediation"]
-                    elif port in LEGACY_PORTS:
-                        entry["severity"] = PORT_FINDINGS["legacy"]["severity"]
-                        entry["finding"] = (
-                            f"Legacy protocol {entry['service']} ({port}) still active"
-                        )
-                        entry["remediation"] = PORT_FINDINGS["legacy"]["remediation"]
-
-                    open_ports.append(entry)
-                else:
-                    closed_ports.append(port)
-
-        await asyncio.gather(*[scan_port(p) for p in port_list])
-
-        # Sort open ports by port number
-        open_ports.sort(key=lambda x: x["port"])
-
-        # Grade input
-        open_port_numbers = {p["port"] for p in open_ports}
-        grade_input = {
-            "no_database_ports_exposed": not bool(open_port_numbers & DATABASE_PORTS),
-            "no_admin_ports_exposed": not bool(open_port_numbers & ADMIN_PORTS),
-            "no_legacy_ports_exposed": not bool(open_port_numbers & LEGACY_PORTS),
-            "only_web_ports": open_port_numbers <= {80, 443, 8080, 8443},
-        }
-
-        return {
-            "hostname": hostname,
-            "ip": ip,
-            "ports_scanned": len(port_list),
-            "open_ports": open_ports,
-            "closed_ports": sorted(closed_ports),
-            "grade_input": grade_input,
-        }
+        return await scan_ports(clean_hostname(hostname), port_list, min(timeout, 10.0))
 
 
 async def _check_port(ip: str, port: int, timeout: float) -> dict:
@@ -286,5 +312,8 @@ async def _check_port(ip: str, port: int, timeout: float) -> dict:
         writer.close()
         await writer.wait_closed()
         return {"open": True, "banner": banner}
-    except (TimeoutError, ConnectionRefusedError, OSError):
+    except (TimeoutError, ConnectionRefusedError):
         return {"open": False}
+    except OSError as e:
+        # Out of sockets or being reset: not an answer about the port
+        return {"open": False, "congested": is_congestion(e)}
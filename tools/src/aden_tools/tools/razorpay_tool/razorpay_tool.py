@@ -23,6 +23,8 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.utils import http_client
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
@@ -83,7 +85,7 @@ def list_payments(
         if to_timestamp is not None:
             params["to"] = to_timestamp
 
-        response = httpx.get(
+        response = http_client.get(
             f"{RAZORPAY_API_BASE}/payments",
             auth=self._auth,
             params=params,
@@ -115,7 +117,7 @@ def list_payments(
 
     def get_payment(self, payment_id: str) -> dict[str, Any]:
         """Fetch a single payment by ID."""
-        response = httpx.get(
+        response = http_client.get(
             f"{RAZORPAY_API_BASE}/payments/{payment_id}",
             auth=self._auth,
             timeout=30.0,
@@ -169,7 +171,7 @@ def create_payment_link(
             if customer_contact:
                 body["customer"]["contact"] = customer_contact
 
-        response = httpx.post(
+        response = http_client.post(
             f"{RAZORPAY_API_BASE}/payment_links",
             auth=self._auth,
             json=body,
@@ -204,7 +206,7 @@ def list_invoices(
         if type_filter:
             params["type"] = type_filter
 
-        response = httpx.get(
+        response = http_client.get(
             f"{RAZORPAY_API_BASE}/invoices",
             auth=self._auth,
             params=params,
@@ -234,7 +236,7 @@ def list_invoices(
 
     def get_invoice(self, invoice_id: str) -> dict[str, Any]:
         """Fetch invoice details by ID."""
-        response = httpx.get(
+        response = http_client.get(
             f"{RAZORPAY_API_BASE}/invoices/{invoice_id}",
             auth=self._auth,
             timeout=30.0,
@@ -271,7 +273,7 @@ def create_refund(
         if notes:
             body["notes"] = notes
 
-        response = httpx.post(
+        response = http_client.post(
             f"{RAZORPAY_API_BASE}/payments/{payment_id}/refund",
             auth=self._auth,
             json=body,
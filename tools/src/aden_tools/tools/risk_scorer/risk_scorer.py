@@ -174,6 +174,78 @@ def _score_category(grade_input: dict, checks: dict) -> tuple[int, list[str]]:
     return score, findings
 
 
+def score_results(inputs: dict[str, dict | None]) -> dict:
+    """
+    Score parsed scan results, keyed by category (see ``ALL_CHECKS``).
+
+    A category that is missing or None is skipped and its weight is spread
+    over the others.  Results may be full tool outputs or bare grade_input dicts.
+    """
+    categories = {}
+    all_findings: list[tuple[str, str, int]] = []  # (category, finding, category_score)
+    weighted_sum = 0.0
+    total_weight = 0.0
+
+    for category, checks in ALL_CHECKS.items():
+        raw = inputs.get(category)
+        weight = CATEGORY_WEIGHTS[category]
+
+        if raw is None:
+            # Category not scanned — skip it and redistribute weight
+            categories[category] = {
+                "score": None,
+                "grade": "N/A",
+                "weight": weight,
+                "findings_count": 0,
+                "skipped": True,
+            }
+            continue
+
+        # Extract grade_input from the tool output
+        grade_input = raw.get("grade_input", raw)
+
+        score, findings = _score_category(grade_input, checks)
+        grade = _score_to_grade(score)
+
+        categories[category] = {
+            "score": score,
+            "grade": grade,
+            "weight": weight,
+            "findings_count": len(findings),
+            "skipped": False,
+        }
+
+        weighted_sum += score * weight
+        total_weight += weight
+
+        for f in findings:
+            all_findings.append((category, f, score))
+
+    # Calculate overall score (normalize if some categories were skipped)
+    if total_weight > 0:
+        overall_score = round(weighted_sum / total_weight)
+    else:
+        overall_score = 0
+
+    overall_grade = _score_to_grade(overall_score)
+
+    # Build top risks — sorted by category score (worst first), then by finding
+    all_findings.sort(key=lambda x: (x[2], x[0]))
+    top_risks = []
+    for category, finding, _cat_score in all_findings[:10]:
+        cat_grade = categories[category]["grade"]
+        cat_label = category.replace("_", " ").title()
+        top_risks.append(f"{finding} ({cat_label}: {cat_grade})")
+
+    return {
+        "overall_score": overall_score,
+        "overall_grade": overall_grade,
+        "categories": categories,
+        "top_risks": top_risks,
+        "grade_scale": GRADE_SCALE,
+    }
+
+
 def register_tools(mcp: FastMCP) -> None:
     """Register risk scoring tools with the MCP server."""
 
@@ -206,76 +278,13 @@ def risk_score(
             Dict with overall_score, overall_grade, per-category scores/grades,
             top_risks list, and grade_scale reference.
         """
-        # Parse inputs and extract grade_input dicts
-        inputs = {
-            "ssl_tls": _parse_json(ssl_results),
-            "http_headers": _parse_json(headers_results),
-            "dns_security": _parse_json(dns_results),
-            "network_exposure": _parse_json(ports_results),
-            "technology": _parse_json(tech_results),
-            "attack_surface": _parse_json(subdomain_results),
-        }
-
-        categories = {}
-        all_findings: list[tuple[str, str, int]] = []  # (category, finding, category_score)
-        weighted_sum = 0.0
-        total_weight = 0.0
-
-        for category, checks in ALL_CHECKS.items():
-            raw = inputs[category]
-            weight = CATEGORY_WEIGHTS[category]
-
-            if raw is None:
-                # Category not scanned — skip it and redistribute weight
-                categories[category] = {
-                    "score": None,
-                    "grade": "N/A",
-                    "weight": weight,
-                    "findings_count": 0,
-                    "skipped": True,
-                }
-                continue
-
-            # Extract grade_input from the tool output
-            grade_input = raw.get("grade_input", raw)
-
-            score, findings = _score_category(grade_input, checks)
-            grade = _score_to_grade(score)
-
-            categories[category] = {
-                "score": score,
-                "grade": grade,
-                "weight": weight,
-                "findings_count": len(findings),
-                "skipped": False,
+        return score_results(
+            {
+                "ssl_tls": _parse_json(ssl_results),
+                "http_headers": _parse_json(headers_results),
+                "dns_security": _parse_json(dns_results),
+                "network_exposure": _parse_json(ports_results),
+                "technology": _parse_json(tech_results),
+                "attack_surface": _parse_json(subdomain_results),
             }
-
-            weighted_sum += score * weight
-            total_weight += weight
-
-            for f in findings:
-                all_findings.append((category, f, score))
-
-        # Calculate overall score (normalize if some categories were skipped)
-        if total_weight > 0:
-            overall_score = round(weighted_sum / total_weight)
-        else:
-            overall_score = 0
-
-        overall_grade = _score_to_grade(overall_score)
-
-        # Build top risks — sorted by category score (worst first), then by finding
-        all_findings.sort(key=lambda x: (x[2], x[0]))
-        top_risks = []
-        for category, finding, _cat_score in all_findings[:10]:
-            cat_grade = categories[category]["grade"]
-            cat_label = category.replace("_", " ").title()
-            top_risks.append(f"{finding} ({cat_label}: {cat_grade})")
-
-        return {
-            "overall_score": overall_score,
-            "overall_grade": overall_grade,
-            "categories": categories,
-            "top_risks": top_risks,
-            "grade_scale": GRADE_SCALE,
-        }
+        )
@@ -23,6 +23,8 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.utils.fetch_cache import cached
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
@@ -36,6 +38,7 @@ class _SerpAPIClient:
     def __init__(self, api_key: str):
         self._api_key = api_key
 
+    @cached("serpapi", exclude=("self",))
     def _request(self, params: dict[str, Any]) -> dict[str, Any]:
         """Make a GET request to SerpAPI."""
         params["api_key"] = self._api_key
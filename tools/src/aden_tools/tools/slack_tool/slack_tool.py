@@ -16,10 +16,25 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.utils import http_client
+from aden_tools.utils.pagination import Page, collect_pages, paginate_cursor, safe_filename
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
 SLACK_API_BASE = "https://slack.com/api"
+# conversations.history page size used when following cursors (Slack suggests <= 200)
+HISTORY_PAGE_SIZE = 200
+
+
+def _format_message(msg: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "ts": msg.get("ts"),
+        "user": msg.get("user"),
+        "text": msg.get("text"),
+        "type": msg.get("type"),
+        "thread_ts": msg.get("thread_ts"),
+    }
 
 
 class _SlackClient:
@@ -87,7 +102,7 @@ def post_message(
         if blocks:
             body["blocks"] = blocks
 
-        response = httpx.post(
+        response = http_client.post(
             f"{SLACK_API_BASE}/chat.postMessage",
             headers=self._headers,
             json=body,
@@ -110,7 +125,7 @@ def list_conversations(
         if cursor:
             params["cursor"] = cursor
 
-        response = httpx.get(
+        response = http_client.get(
             f"{SLACK_API_BASE}/conversations.list",
             headers=self._headers,
             params=params,
@@ -124,6 +139,7 @@ def get_history(
         limit: int = 20,
         oldest: str | None = None,
         latest: str | None = None,
+        cursor: str | None = None,
     ) -> dict[str, Any]:
         """Get message history from a channel."""
         params: dict[str, Any] = {
@@ -134,8 +150,10 @@ def get_history(
             params["oldest"] = oldest
         if latest:
             params["latest"] = latest
+        if cursor:
+            params["cursor"] = cursor
 
-        response = httpx.get(
+        response = http_client.get(
             f"{SLACK_API_BASE}/conversations.history",
             headers=self._headers,
             params=params,
@@ -155,7 +173,7 @@ def add_reaction(
             "timestamp": timestamp,
             "name": name.strip(":"),  # Remove colons if present
         }
-        response = httpx.post(
+        response = http_client.post(
             f"{SLACK_API_BASE}/reactions.add",
             headers=self._headers,
             json=body,
@@ -165,7 +183,7 @@ def add_reaction(
 
     def get_user_info(self, user_id: str) -> dict[str, Any]:
         """Get information about a user."""
-        response = httpx.get(
+        response = http_client.get(
             f"{SLACK_API_BASE}/users.info",
             headers=self._headers,
             params={"user": user_id},
@@ -175,7 +193,7 @@ def get_user_info(self, user_id: str) -> dict[str, Any]:
 
     def auth_test(self) -> dict[str, Any]:
         """Test authentication and get bot info."""
-        response = httpx.post(
+        response = http_client.post(
             f"{SLACK_API_BASE}/auth.test",
             headers=self._headers,
             timeout=30.0,
@@ -198,7 +216,7 @@ def update_message(
         if blocks:
             body["blocks"] = blocks
 
-        response = httpx.post(
+        response = http_client.post(
             f"{SLACK_API_BASE}/chat.update",
             headers=self._headers,
             json=body,
@@ -208,7 +226,7 @@ def update_message(
 
     def delete_message(self, channel: str, ts: str) -> dict[str, Any]:
         """Delete a message."""
-        response = httpx.post(
+        response = http_client.post(
             f"{SLACK_API_BASE}/chat.delete",
             headers=self._headers,
             json={"channel": channel, "ts": ts},
@@ -232,7 +250,7 @@ def schedule_message(
         if thread_ts:
             body["thread_ts"] = thread_ts
 
-        response = httpx.post(
+        response = http_client.post(
             f"{SLACK_API_BASE}/chat.scheduleMessage",
             headers=self._headers,
             json=body,
@@ -246,7 +264,7 @@ def create_channel(
         is_private: bool = False,
     ) -> dict[str, Any]:
         """Create a new channel."""
-        response = httpx.post(
+        response = http_client.post(
             f"{SLACK_API_BASE}/conversations.create",
             headers=self._headers,
             json={"name": name, "is_private": is_private},
@@ -256,7 +274,7 @@ def create_channel(
 
     def archive_channel(self, channel: str) -> dict[str, Any]:
         """Archive a channel."""
-        response = httpx.post(
+        response = http_client.post(
             f"{SLACK_API_BASE}/conversations.archive",
             headers=self._headers,
             json={"channel": channel},
@@ -266,7 +284,7 @@ def archive_channel(self, channel: str) -> dict[str, Any]:
 
     def invite_to_channel(self, channel: str, users: str) -> dict[str, Any]:
         """Invite users to a channel (comma-separated user IDs)."""
-        response = httpx.post(
+        response = http_client.post(
             f"{SLACK_API_BASE}/conversations.invite",
             headers=self._headers,
             json={"channel": channel, "users": users},
@@ -286,7 +304,7 @@ def remove_reaction(
             "timestamp": timestamp,
             "name": name.strip(":"),
         }
-        response = httpx.post(
+        response = http_client.post(
             f"{SLACK_API_BASE}/reactions.remove",
             headers=self._headers,
             json=body,
@@ -296,7 +314,7 @@ def remove_reaction(
 
     def list_users(self, limit: int = 100) -> dict[str, Any]:
         """List users in the workspace."""
-        response = httpx.get(
+        response = http_client.get(
             f"{SLACK_API_BASE}/users.list",
             headers=self._headers,
             params={"limit": min(limit, 1000)},
@@ -324,7 +342,7 @@ def upload_file(
             "filename": filename,
             "length": length,
         }
-        url_response = httpx.get(
+        url_response = http_client.get(
             f"{SLACK_API_BASE}/files.getUploadURLExternal",
             headers=self._headers,
             params=params,
@@ -341,7 +359,7 @@ def upload_file(
             return {"error": "Failed to get upload URL from Slack"}
 
         # Step 2: Upload file content to the URL
-        upload_response = httpx.post(
+        upload_response = http_client.post(
             upload_url,
             content=content_bytes,
             headers={"Content-Type": "application/octet-stream"},
@@ -359,7 +377,7 @@ def upload_file(
         if initial_comment:
             complete_body["initial_comment"] = initial_comment
 
-        complete_response = httpx.post(
+        complete_response = http_client.post(
             f"{SLACK_API_BASE}/files.completeUploadExternal",
             headers=self._headers,
             json=complete_body,
@@ -377,7 +395,7 @@ def upload_file(
 
     def set_channel_topic(self, channel: str, topic: str) -> dict[str, Any]:
         """Set the topic for a channel."""
-        response = httpx.post(
+        response = http_client.post(
             f"{SLACK_API_BASE}/conversations.setTopic",
             headers=self._headers,
             json={"channel": channel, "topic": topic},
@@ -400,7 +418,7 @@ def search_messages(
         """
         # Use user token if available (search requires user token)
         headers = self._user_headers()
-        response = httpx.get(
+        response = http_client.get(
             f"{SLACK_API_BASE}/search.messages",
             headers=headers,
             params={
@@ -425,7 +443,7 @@ def get_thread_replies(
         limit: int = 50,
     ) -> dict[str, Any]:
         """Get all replies in a thread."""
-        response = httpx.get(
+        response = http_client.get(
             f"{SLACK_API_BASE}/conversations.replies",
             headers=self._headers,
             params={
@@ -439,7 +457,7 @@ def get_thread_replies(
 
     def pin_message(self, channel: str, timestamp: str) -> dict[str, Any]:
         """Pin a message to a channel."""
-        response = httpx.post(
+        response = http_client.post(
             f"{SLACK_API_BASE}/pins.add",
             headers=self._headers,
             json={"channel": channel, "timestamp": timestamp},
@@ -449,7 +467,7 @@ def pin_message(self, channel: str, timestamp: str) -> dict[str, Any]:
 
     def unpin_message(self, channel: str, timestamp: str) -> dict[str, Any]:
         """Unpin a message from a channel."""
-        response = httpx.post(
+        response = http_client.post(
             f"{SLACK_API_BASE}/pins.remove",
             headers=self._headers,
             json={"channel": channel, "timestamp": timestamp},
@@ -459,7 +477,7 @@ def unpin_message(self, channel: str, timestamp: str) -> dict[str, Any]:
 
     def list_pins(self, channel: str) -> dict[str, Any]:
         """List pinned items in a channel."""
-        response = httpx.get(
+        response = http_client.get(
             f"{SLACK_API_BASE}/pins.list",
             headers=self._headers,
             params={"channel": channel},
@@ -484,7 +502,7 @@ def add_bookmark(
         if emoji:
             body["emoji"] = emoji
 
-        response = httpx.post(
+        response = http_client.post(
             f"{SLACK_API_BASE}/bookmarks.add",
             headers=self._headers,
             json=body,
@@ -498,7 +516,7 @@ def list_scheduled_messages(self, channel: str | None = None) -> dict[str, Any]:
         if channel:
             params["channel"] = channel
 
-        response = httpx.post(
+        response = http_client.post(
             f"{SLACK_API_BASE}/chat.scheduledMessages.list",
             headers=self._headers,
             json=params,
@@ -512,7 +530,7 @@ def delete_scheduled_message(
         scheduled_message_id: str,
     ) -> dict[str, Any]:
         """Delete a scheduled message."""
-        response = httpx.post(
+        response = http_client.post(
             f"{SLACK_API_BASE}/chat.deleteScheduledMessage",
             headers=self._headers,
             json={
@@ -525,7 +543,7 @@ def delete_scheduled_message(
 
     def open_dm(self, users: str) -> dict[str, Any]:
         """Open a DM or multi-person DM. Returns channel ID."""
-        response = httpx.post(
+        response = http_client.post(
             f"{SLACK_API_BASE}/conversations.open",
             headers=self._headers,
             json={"users": users},
@@ -535,7 +553,7 @@ def open_dm(self, users: str) -> dict[str, Any]:
 
     def get_permalink(self, channel: str, message_ts: str) -> dict[str, Any]:
         """Get a permanent link to a message."""
-        response = httpx.get(
+        response = http_client.get(
             f"{SLACK_API_BASE}/chat.getPermalink",
             headers=self._headers,
             params={"channel": channel, "message_ts": message_ts},
@@ -559,7 +577,7 @@ def post_ephemeral(
         if blocks:
             body["blocks"] = blocks
 
-        response = httpx.post(
+        response = http_client.post(
             f"{SLACK_API_BASE}/chat.postEphemeral",
             headers=self._headers,
             json=body,
@@ -582,7 +600,7 @@ def open_modal(
             trigger_id: From slash command or button interaction
             view: Modal view definition (type: "modal", title, blocks, etc.)
         """
-        response = httpx.post(
+        response = http_client.post(
             f"{SLACK_API_BASE}/views.open",
             headers=self._headers,
             json={
@@ -599,7 +617,7 @@ def update_modal(
         view: dict[str, Any],
     ) -> dict[str, Any]:
         """Update an existing modal view."""
-        response = httpx.post(
+        response = http_client.post(
             f"{SLACK_API_BASE}/views.update",
             headers=self._headers,
             json={
@@ -616,7 +634,7 @@ def push_modal(
         view: dict[str, Any],
     ) -> dict[str, Any]:
         """Push a new view onto the modal stack."""
-        response = httpx.post(
+        response = http_client.post(
             f"{SLACK_API_BASE}/views.push",
             headers=self._headers,
             json={
@@ -638,7 +656,7 @@ def publish_home_tab(
             user_id: User whose home tab to update
             view: Home tab view (type: "home", blocks)
         """
-        response = httpx.post(
+        response = http_client.post(
             f"{SLACK_API_BASE}/views.publish",
             headers=self._headers,
             json={
@@ -672,7 +690,7 @@ def set_user_status(
         if expiration is not None:
             profile["status_expiration"] = expiration
 
-        response = httpx.post(
+        response = http_client.post(
             f"{SLACK_API_BASE}/users.profile.set",
             headers=self._user_headers(),
             json={"profile": profile},
@@ -686,7 +704,7 @@ def set_presence(self, presence: str) -> dict[str, Any]:
         Args:
             presence: 'auto' or 'away'
         """
-        response = httpx.post(
+        response = http_client.post(
             f"{SLACK_API_BASE}/users.setPresence",
             headers=self._headers,
             json={"presence": presence},
@@ -696,7 +714,7 @@ def set_presence(self, presence: str) -> dict[str, Any]:
 
     def get_presence(self, user_id: str) -> dict[str, Any]:
         """Get a user's presence status."""
-        response = httpx.get(
+        response = http_client.get(
             f"{SLACK_API_BASE}/users.getPresence",
             headers=self._headers,
             params={"user": user_id},
@@ -725,7 +743,7 @@ def create_reminder(
         if user:
             body["user"] = user
 
-        response = httpx.post(
+        response = http_client.post(
             f"{SLACK_API_BASE}/reminders.add",
             headers=self._headers,
             json=body,
@@ -735,7 +753,7 @@ def create_reminder(
 
     def list_reminders(self) -> dict[str, Any]:
         """List all reminders for the authenticated user."""
-        response = httpx.get(
+        response = http_client.get(
             f"{SLACK_API_BASE}/reminders.list",
             headers=self._headers,
             timeout=30.0,
@@ -744,7 +762,7 @@ def list_reminders(self) -> dict[str, Any]:
 
     def delete_reminder(self, reminder_id: str) -> dict[str, Any]:
         """Delete a reminder by ID."""
-        response = httpx.post(
+        response = http_client.post(
             f"{SLACK_API_BASE}/reminders.delete",
             headers=self._headers,
             json={"reminder": reminder_id},
@@ -779,7 +797,7 @@ def create_usergroup(
         if channels:
             body["channels"] = ",".join(channels)
 
-        response = httpx.post(
+        response = http_client.post(
             f"{SLACK_API_BASE}/usergroups.create",
             headers=self._headers,
             json=body,
@@ -798,7 +816,7 @@ def update_usergroup_members(
             usergroup_id: The ID of the user group
             users: List of user IDs to set as members
         """
-        response = httpx.post(
+        response = http_client.post(
             f"{SLACK_API_BASE}/usergroups.users.update",
             headers=self._headers,
             json={
@@ -811,7 +829,7 @@ def update_usergroup_members(
 
     def list_usergroups(self) -> dict[str, Any]:
         """List all user groups in the workspace."""
-        response = httpx.get(
+        response = http_client.get(
             f"{SLACK_API_BASE}/usergroups.list",
             headers=self._headers,
             params={"include_count": True, "include_users": True},
@@ -825,7 +843,7 @@ def list_usergroups(self) -> dict[str, Any]:
 
     def list_emoji(self) -> dict[str, Any]:
         """List all custom emoji in the workspace."""
-        response = httpx.get(
+        response = http_client.get(
             f"{SLACK_API_BASE}/emoji.list",
             headers=self._headers,
             timeout=30.0,
@@ -851,7 +869,7 @@ def create_canvas(
         if document_content:
             body["document_content"] = document_content
 
-        response = httpx.post(
+        response = http_client.post(
             f"{SLACK_API_BASE}/canvases.create",
             headers=self._headers,
             json=body,
@@ -870,7 +888,7 @@ def edit_canvas(
             canvas_id: The canvas document ID
             changes: List of change operations (insert_at_start, insert_at_end, etc.)
         """
-        response = httpx.post(
+        response = http_client.post(
             f"{SLACK_API_BASE}/canvases.edit",
             headers=self._headers,
             json={
@@ -976,7 +994,7 @@ def trigger_workflow(
         """
         body = payload or {}
 
-        response = httpx.post(
+        response = http_client.post(
             webhook_url,
             json=body,
             timeout=30.0,
@@ -1060,7 +1078,7 @@ def find_user_by_email(
         Args:
             email: User's email address
         """
-        response = httpx.get(
+        response = http_client.get(
             f"{SLACK_API_BASE}/users.lookupByEmail",
             headers=self._headers,
             params={"email": email},
@@ -1079,7 +1097,7 @@ def kick_user_from_channel(
             channel: Channel ID
             user: User ID to remove
         """
-        response = httpx.post(
+        response = http_client.post(
             f"{SLACK_API_BASE}/conversations.kick",
             headers=self._headers,
             json={"channel": channel, "user": user},
@@ -1096,7 +1114,7 @@ def delete_file(
         Args:
             file_id: The file ID to delete
         """
-        response = httpx.post(
+        response = http_client.post(
             f"{SLACK_API_BASE}/files.delete",
             headers=self._headers,
             json={"file": file_id},
@@ -1111,7 +1129,7 @@ def get_team_stats(self) -> dict[str, Any]:
         and basic team info.
         """
         # Get team info
-        team_response = httpx.get(
+        team_response = http_client.get(
             f"{SLACK_API_BASE}/team.info",
             headers=self._headers,
             timeout=30.0,
@@ -1119,7 +1137,7 @@ def get_team_stats(self) -> dict[str, Any]:
         team_data = self._handle_response(team_response)
 
         # Get user count
-        users_response = httpx.get(
+        users_response = http_client.get(
             f"{SLACK_API_BASE}/users.list",
             headers=self._headers,
             params={"limit": 1},  # Just need cursor metadata
@@ -1289,16 +1307,7 @@ def slack_get_channel_history(
             result = client.get_history(channel, limit)
             if "error" in result:
                 return result
-            messages = [
-                {
-                    "ts": msg.get("ts"),
-                    "user": msg.get("user"),
-                    "text": msg.get("text"),
-                    "type": msg.get("type"),
-                    "thread_ts": msg.get("thread_ts"),
-                }
-                for msg in result.get("messages", [])
-            ]
+            messages = [_format_message(msg) for msg in result.get("messages", [])]
             return {
                 "success": True,
                 "messages": messages,
@@ -1309,6 +1318,57 @@ def slack_get_channel_history(
         except httpx.RequestError as e:
             return {"error": f"Network error: {e}"}
 
+    @mcp.tool()
+    def slack_fetch_channel_history(
+        channel: str,
+        max_items: int = 500,
+        oldest: str | None = None,
+        latest: str | None = None,
+        account: str = "",
+        data_dir: str = "",
+    ) -> dict:
+        """
+        Fetch up to max_items messages from a Slack channel, following pages.
+
+        Use this instead of slack_get_channel_history when you need more than
+        one page. Messages are saved to a JSONL data file when a data directory
+        is available; the result then holds the filename and a short preview.
+
+        Args:
+            channel: Channel ID (e.g., 'C0123456789')
+            max_items: Maximum number of messages to fetch (default 500)
+            oldest: Only messages after this Unix timestamp
+            latest: Only messages before this Unix timestamp
+
+        Returns:
+            Dict with count, pages, has_more and either the messages or the
+            data filename, or error
+        """
+        client = _get_client(account)
+        if isinstance(client, dict):
+            return client
+
+        def fetch(cursor: str | None) -> Page:
+            result = client.get_history(channel, HISTORY_PAGE_SIZE, oldest, latest, cursor)
+            if "error" in result:
+                return Page(error=result["error"])
+            return Page(
+                items=[_format_message(msg) for msg in result.get("messages", [])],
+                next=result.get("response_metadata", {}).get("next_cursor") or None,
+            )
+
+        try:
+            return collect_pages(
+                paginate_cursor(fetch, max_items),
+                max_items,
+                data_dir,
+                safe_filename("slack_history", channel),
+            )
+        except httpx.TimeoutException:
+            return {"error": "Request timed out"}
+        except httpx.RequestError as e:
+            return {"error": f"Network error: {e}"}
+
     # --- Reactions ---
 
     @mcp.tool()
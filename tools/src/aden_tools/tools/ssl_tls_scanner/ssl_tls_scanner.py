@@ -8,13 +8,15 @@
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
-import socket
 import ssl
 from datetime import UTC, datetime
 
 from fastmcp import FastMCP
 
+from aden_tools.utils.scan_engine import clean_hostname, resolve_host
+
 # Weak ciphers that should be flagged
 WEAK_CIPHERS = {
     "RC4",
@@ -29,12 +31,207 @@
 # TLS versions considered insecure
 INSECURE_TLS_VERSIONS = {"TLSv1", "TLSv1.0", "TLSv1.1", "SSLv2", "SSLv3"}
 
+# Seconds for the TCP connect plus TLS handshake
+HANDSHAKE_TIMEOUT = 10.0
+
+
+async def _handshake(
+    hostname: str, port: int, ctx: ssl.SSLContext, timeout: float
+) -> tuple[str, tuple | None, bytes | None, dict]:
+    """Connect, complete the TLS handshake and return (version, cipher, DER cert, cert)."""
+    ip = await resolve_host(hostname)
+    _reader, writer = await asyncio.wait_for(
+        asyncio.open_connection(ip, port, ssl=ctx, server_hostname=hostname),
+        timeout=timeout,
+    )
+    try:
+        conn = writer.get_extra_info("ssl_object")
+        return (
+            conn.version() or "unknown",
+            conn.cipher(),
+            conn.getpeercert(binary_form=True),
+            conn.getpeercert() or {},
+        )
+    finally:
+        writer.close()
+        try:
+            await asyncio.wait_for(writer.wait_closed(), timeout=timeout)
+        except (OSError, TimeoutError, ssl.SSLError):
+            pass
+
+
+async def scan_tls(hostname: str, port: int = 443, timeout: float = HANDSHAKE_TIMEOUT) -> dict:
+    """Inspect *hostname*'s TLS setup, as returned by ``ssl_tls_scan``."""
+    issues: list[dict] = []
+
+    try:
+        # We still verify but catch errors to report them as findings
+        ctx = ssl.create_default_context()
+        try:
+            tls_version, cipher_info, cert_der, cert_dict = await _handshake(
+                hostname, port, ctx, timeout
+            )
+        except ssl.SSLCertVerificationError as e:
+            # Still try to gather info with verification disabled
+            ctx_noverify = ssl.create_default_context()
+            ctx_noverify.check_hostname = False
+            ctx_noverify.verify_mode = ssl.CERT_NONE
+            tls_version, cipher_info, cert_der, cert_dict = await _handshake(
+                hostname, port, ctx_noverify, timeout
+            )
+            issues.append(
+                {
+                    "severity": "critical",
+                    "finding": f"SSL certificate verification failed: {e}",
+                    "remediation": (
+                        "Obtain a valid certificate from a trusted CA. "
+                        "Let's Encrypt provides free certificates."
+                    ),
+                }
+            )
+
+        cipher_name = cipher_info[0] if cipher_info else "unknown"
+        cipher_bits = cipher_info[2] if cipher_info else 0
+
+    except TimeoutError:
+        return {"error": f"Connection to {hostname}:{port} timed out"}
+    except ConnectionRefusedError:
+        return {"error": f"Connection to {hostname}:{port} refused. Port may be closed."}
+    except OSError as e:
+        return {"error": f"Connection failed: {e}"}
+
+    # Parse certificate details
+    subject = _format_dn(cert_dict.get("subject", ()))
+    issuer = _format_dn(cert_dict.get("issuer", ()))
+
+    not_before_str = cert_dict.get("notBefore", "")
+    not_after_str = cert_dict.get("notAfter", "")
+
+    not_before = _parse_cert_date(not_before_str)
+    not_after = _parse_cert_date(not_after_str)
+    now = datetime.now(UTC)
+
+    days_until_expiry = (not_after - now).days if not_after else None
+
+    # SAN (Subject Alternative Names)
+    san_list = []
+    for san_type, san_value in cert_dict.get("subjectAltName", ()):
+        if san_type == "DNS":
+            san_list.append(san_value)
+
+    # Self-signed check
+    self_signed = subject == issuer
+
+    # Certificate fingerprint
+    cert_sha256 = hashlib.sha256(cert_der).hexdigest() if cert_der else ""
+
+    # --- Check for issues ---
+
+    # TLS version
+    tls_version_ok = tls_version not in INSECURE_TLS_VERSIONS
+    if not tls_version_ok:
+        issues.append(
+            {
+                "severity": "high",
+                "finding": f"Insecure TLS version: {tls_version}",
+                "remediation": (
+                    "Disable TLS 1.0 and 1.1 in your server configuration. Use TLS 1.2 or 1.3 only."
+                ),
+            }
+        )
+
+    # Cipher strength
+    strong_cipher = True
+    if any(weak in cipher_name.upper() for weak in WEAK_CIPHERS):
+        strong_cipher = False
+        issues.append(
+            {
+                "severity": "high",
+                "finding": f"Weak cipher suite: {cipher_name}",
+                "remediation": (
+                    "Configure your server to use strong cipher suites only. "
+                    "Prefer AES-GCM and ChaCha20-Poly1305."
+                ),
+            }
+        )
+    if cipher_bits and cipher_bits < 128:
+        strong_cipher = False
+        issues.append(
+            {
+                "severity": "high",
+                "finding": f"Cipher key length too short: {cipher_bits} bits",
+                "remediation": "Use cipher suites with at least 128-bit keys.",
+            }
+        )
+
+    # Certificate validity
+    cert_valid = True
+    cert_expiring_soon = False
+
+    if not_after and now > not_after:
+        cert_valid = False
+        issues.append(
+            {
+                "severity": "critical",
+                "finding": "SSL certificate has expired",
+                "remediation": "Renew the SSL certificate immediately.",
+            }
+        )
+    elif days_until_expiry is not None and days_until_expiry <= 30:
+        cert_expiring_soon = True
+        issues.append(
+            {
+                "severity": "medium",
+                "finding": f"SSL certificate expires in {days_until_expiry} days",
+                "remediation": "Renew the SSL certificate before it expires.",
+            }
+        )
+
+    if self_signed:
+        cert_valid = False
+        issues.append(
+            {
+                "severity": "high",
+                "finding": "Self-signed certificate detected",
+                "remediation": (
+                    "Replace with a certificate from a trusted CA. "
+                    "Let's Encrypt provides free certificates."
+                ),
+            }
+        )
+
+    return {
+        "hostname": hostname,
+        "port": port,
+        "tls_version": tls_version,
+        "cipher": cipher_name,
+        "cipher_bits": cipher_bits,
+        "certificate": {
+            "subject": subject,
+            "issuer": issuer,
+            "not_before": not_before.isoformat() if not_before else not_before_str,
+            "not_after": not_after.isoformat() if not_after else not_after_str,
+            "days_until_expiry": days_until_expiry,
+            "san": san_list,
+            "self_signed": self_signed,
+            "sha256_fingerprint": cert_sha256,
+        },
+        "issues": issues,
+        "grade_input": {
+            "tls_version_ok": tls_version_ok,
+            "cert_valid": cert_valid,
+            "cert_expiring_soon": cert_expiring_soon,
+            "strong_cipher": strong_cipher,
+            "self_signed": self_signed,
+        },
+    }
+
 
 def register_tools(mcp: FastMCP) -> None:
     """Register SSL/TLS scanning tools with the MCP server."""
 
     @mcp.tool()
-    def ssl_tls_scan(hostname: str, port: int = 443) -> dict:
+    async def ssl_tls_scan(hostname: str, port: int = 443) -> dict:
         """
         Scan a host's SSL/TLS configuration and certificate.
 
@@ -50,188 +247,7 @@ def ssl_tls_scan(hostname: str, port: int = 443) -> dict:
             Dict with TLS version, cipher, certificate details, issues found,
             and grade_input for the risk_scorer tool.
         """
-        # Strip protocol prefix if provided
-        hostname = hostname.replace("https://", "").replace("http://", "").strip("/")
-        # Strip path
-        hostname = hostname.split("/")[0]
-        # Strip port from hostname if embedded
-        if ":" in hostname:
-            hostname = hostname.split(":")[0]
-
-        issues: list[dict] = []
-
-        try:
-            # Create SSL context that accepts all certs (we want to inspect, not reject)
-            ctx = ssl.create_default_context()
-            # We still verify but catch errors to report them as findings
-            conn = ctx.wrap_socket(socket.socket(), server_hostname=hostname)
-            conn.settimeout(10)
-
-            try:
-                conn.connect((hostname, port))
-            except ssl.SSLCertVerificationError as e:
-                # Still try to gather info with verification disabled
-                ctx_noverify = ssl.create_default_context()
-                ctx_noverify.check_hostname = False
-                ctx_noverify.verify_mode = ssl.CERT_NONE
-                conn = ctx_noverify.wrap_socket(socket.socket(), server_hostname=hostname)
-                conn.settimeout(10)
-                conn.connect((hostname, port))
-                issues.append(
-                    {
-                        "severity": "critical",
-                        "finding": f"SSL certificate verification failed: {e}",
-                        "remediation": (
-                            "Obtain a valid certificate from a trusted CA. "
-                            "Let's Encrypt provides free certificates."
-                        ),
-                    }
-                )
-
-            # Gather TLS info
-            tls_version = conn.version() or "unknown"
-            cipher_info = conn.cipher()
-            cipher_name = cipher_info[0] if cipher_info else "unknown"
-            cipher_bits = cipher_info[2] if cipher_info else 0
-
-            # Get certificate
-            cert_der = conn.getpeercert(binary_form=True)
-            cert_dict = conn.getpeercert()
-            conn.close()
-
-        except TimeoutError:
-            return {"error": f"Connection to {hostname}:{port} timed out"}
-        except ConnectionRefusedError:
-            return {"error": f"Connection to {hostname}:{port} refused. Port may be closed."}
-        except OSError as e:
-            return {"error": f"Connection failed: {e}"}
-
-        # Parse certificate details
-        subject = _format_dn(cert_dict.get("subject", ()))
-        issuer = _format_dn(cert_dict.get("issuer", ()))
-
-        not_before_str = cert_dict.get("notBefore", "")
-        not_after_str = cert_dict.get("notAfter", "")
-
-        not_before = _parse_cert_date(not_before_str)
-        not_after = _parse_cert_date(not_after_str)
-        now = datetime.now(UTC)
-
-        days_until_expiry = (not_after - now).days if not_after else None
-
-        # SAN (Subject Alternative Names)
-        san_list = []
-        for san_type, san_value in cert_dict.get("subjectAltName", ()):
-            if san_type == "DNS":
-                san_list.append(san_value)
-
-        # Self-signed check
-        self_signed = subject == issuer
-
-        # Certificate fingerprint
-        cert_sha256 = hashlib.sha256(cert_der).hexdigest() if cert_der else ""
-
-        # --- Check for issues ---
-
-        # TLS version
-        tls_version_ok = tls_version not in INSECURE_TLS_VERSIONS
-        if not tls_version_ok:
-            issues.append(
-                {
-                    "severity": "high",
-                    "finding": f"Insecure TLS version: {tls_version}",
-                    "remediation": (
-                        "Disable TLS 1.0 and 1.1 in your server configuration. "
-                        "Use TLS 1.2 or 1.3 only."
-                    ),
-                }
-            )
-
-        # Cipher strength
-        strong_cipher = True
-        if any(weak in cipher_name.upper() for weak in WEAK_CIPHERS):
-            strong_cipher = False
-            issues.append(
-                {
-                    "severity": "high",
-                    "finding": f"Weak cipher suite: {cipher_name}",
-                    "remediation": (
-                        "Configure your server to use strong cipher suites only. "
-                        "Prefer AES-GCM and ChaCha20-Poly1305."
-                    ),
-                }
-            )
-        if cipher_bits and cipher_bits < 128:
-            strong_cipher = False
-            issues.append(
-                {
-                    "severity": "high",
-                    "finding": f"Cipher key length too short: {cipher_bits} bits",
-                    "remediation": "Use cipher suites with at least 128-bit keys.",
-                }
-            )
-
-        # Certificate validity
-        cert_valid = True
-        cert_expiring_soon = False
-
-        if not_after and now > not_after:
-            cert_valid = False
-            issues.append(
-                {
-                    "severity": "critical",
-                    "finding": "SSL certificate has expired",
-                    "remediation": "Renew the SSL certificate immediately.",
-                }
-            )
-        elif days_until_expiry is not None and days_until_expiry <= 30:
-            cert_expiring_soon = True
-            issues.append(
-                {
-                    "severity": "medium",
-                    "finding": f"SSL certificate expires in {days_until_expiry} days",
-                    "remediation": "Renew the SSL certificate before it expires.",
-                }
-            )
-
-        if self_signed:
-            cert_valid = False
-            issues.append(
-                {
-                    "severity": "high",
-                    "finding": "Self-signed certificate detected",
-                    "remediation": (
-                        "Replace with a certificate from a trusted CA. "
-                        "Let's Encrypt provides free certificates."
-                    ),
-                }
-            )
-
-        return {
-            "hostname": hostname,
-            "port": port,
-            "tls_version": tls_version,
-            "cipher": cipher_name,
-            "cipher_bits": cipher_bits,
-            "certificate": {
-                "subject": subject,
-                "issuer": issuer,
-                "not_before": not_before.isoformat() if not_before else not_before_str,
-                "not_after": not_after.isoformat() if not_after else not_after_str,
-                "days_until_expiry": days_until_expiry,
-                "san": san_list,
-                "self_signed": self_signed,
-                "sha256_fingerprint": cert_sha256,
-            },
-            "issues": issues,
-            "grade_input": {
-                "tls_version_ok": tls_version_ok,
-                "cert_valid": cert_valid,
-                "cert_expiring_soon": cert_expiring_soon,
-                "strong_cipher": strong_cipher,
-                "self_signed": self_signed,
-            },
-        }
+        return await scan_tls(clean_hostname(hostname), port)
 
 
 def _format_dn(dn_tuple: tuple) -> str:
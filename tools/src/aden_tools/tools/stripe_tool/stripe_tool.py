@@ -28,6 +28,8 @@
 import stripe
 from fastmcp import FastMCP
 
+from aden_tools.utils.pagination import Page, collect_pages, paginate_cursor, safe_filename
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
@@ -1157,6 +1159,47 @@ def stripe_list_customers(
         except stripe.StripeError as e:
             return _stripe_error(e)
 
+    @mcp.tool()
+    def stripe_fetch_customers(
+        max_items: int = 500,
+        email: str | None = None,
+        data_dir: str = "",
+    ) -> dict:
+        """
+        Fetch up to max_items Stripe customers, following pages.
+
+        Use this instead of stripe_list_customers when you need more than one
+        page. Customers are saved to a JSONL data file when a data directory
+        is available; the result then holds the filename and a short preview.
+
+        Args:
+            max_items: Maximum number of customers to fetch (default 500)
+            email: Filter by email address
+
+        Returns:
+            Dict with count, pages, has_more and either the customers or the
+            data filename, or error
+        """
+        client = _get_client()
+        if isinstance(client, dict):
+            return client
+
+        def fetch(starting_after: str | None) -> Page:
+            result = client.list_customers(100, starting_after, email)
+            customers = result["customers"]
+            last_id = customers[-1]["id"] if result["has_more"] and customers else None
+            return Page(items=customers, next=last_id)
+
+        try:
+            return collect_pages(
+                paginate_cursor(fetch, max_items),
+                max_items,
+                data_dir,
+                safe_filename("stripe_customers"),
+            )
+        except stripe.StripeError as e:
+            return _stripe_error(e)
+
     # --- Subscription Tools ---
 
     @mcp.tool()
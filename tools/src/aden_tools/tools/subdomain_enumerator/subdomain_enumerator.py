@@ -12,6 +12,9 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.utils.dns_resolver import resolving_transport
+from aden_tools.utils.scan_engine import clean_hostname, resolve_all
+
 # Subdomain keywords that indicate potentially sensitive environments
 INTERESTING_KEYWORDS = {
     "staging": {
@@ -72,11 +75,103 @@
 }
 
 
+async def enumerate_subdomains(domain: str, max_results: int = 50, probe: bool = False) -> dict:
+    """Subdomains of *domain* from CT logs, as returned by ``subdomain_enumerate``."""
+    max_results = min(max_results, 200)
+
+    try:
+        async with httpx.AsyncClient(timeout=30, transport=resolving_transport()) as client:
+            response = await client.get(
+                "https://crt.sh/",
+                params={"q": f"%.{domain}", "output": "json"},
+            )
+
+            if response.status_code != 200:
+                return {
+                    "error": f"crt.sh returned HTTP {response.status_code}",
+                    "domain": domain,
+                }
+
+            data = response.json()
+
+    except httpx.TimeoutException:
+        return {"error": "crt.sh request timed out (try again later)", "domain": domain}
+    except Exception as e:
+        return {"error": f"CT log query failed: {e}", "domain": domain}
+
+    # Extract unique subdomains
+    raw_names: set[str] = set()
+    for entry in data:
+        name_value = entry.get("name_value", "")
+        # Can contain multiple names separated by newlines
+        for name in name_value.split("\n"):
+            name = name.strip().lower()
+            if name and name.endswith(f".{domain}") or name == domain:
+                raw_names.add(name)
+
+    # Filter out wildcards and deduplicate
+    subdomains = sorted(
+        {name for name in raw_names if not name.startswith("*.")},
+    )
+
+    # Limit results
+    subdomains = subdomains[:max_results]
+
+    # Identify interesting subdomains
+    interesting = []
+    for sub in subdomains:
+        # Get the subdomain prefix (everything before the base domain)
+        prefix = sub.replace(f".{domain}", "").lower()
+        for keyword, info in INTERESTING_KEYWORDS.items():
+            if re.search(rf"\b{keyword}\b", prefix) or prefix == keyword:
+                interesting.append(
+                    {
+                        "subdomain": sub,
+                        "reason": info["reason"],
+                        "severity": info["severity"],
+                        "remediation": info["remediation"],
+                    }
+                )
+                break
+
+    # Grade input
+    has_dev_staging = any(
+        i["severity"] in ("medium", "high")
+        and any(kw in i["subdomain"] for kw in ("staging", "dev", "test", "debug"))
+        for i in interesting
+    )
+    has_admin = any(any(kw in i["subdomain"] for kw in ("admin", "backup")) for i in interesting)
+    # "reasonable" = fewer than 50 subdomains
+    reasonable_surface = len(subdomains) < 50
+
+    grade_input = {
+        "no_dev_staging_exposed": not has_dev_staging,
+        "no_admin_exposed": not has_admin,
+        "reasonable_surface_area": reasonable_surface,
+    }
+
+    result = {
+        "domain": domain,
+        "source": "crt.sh (Certificate Transparency)",
+        "total_found": len(subdomains),
+        "subdomains": subdomains,
+        "interesting": interesting,
+        "grade_input": grade_input,
+    }
+
+    if probe:
+        addresses = await resolve_all(subdomains)
+        result["resolved"] = {name: ip for name, ip in addresses.items() if ip}
+        result["live_subdomains"] = [name for name in subdomains if addresses.get(name)]
+
+    return result
+
+
 def register_tools(mcp: FastMCP) -> None:
     """Register subdomain enumeration tools with the MCP server."""
 
     @mcp.tool()
-    async def subdomain_enumerate(domain: str, max_results: int = 50) -> dict:
+    async def subdomain_enumerate(domain: str, max_results: int = 50, probe: bool = False) -> dict:
         """
         Discover subdomains using Certificate Transparency (CT) logs.
 
@@ -87,97 +182,11 @@ async def subdomain_enumerate(domain: str, max_results: int = 50) -> dict:
         Args:
             domain: Base domain to enumerate (e.g., "example.com"). No protocol prefix.
             max_results: Maximum number of subdomains to return (default 50, max 200).
+            probe: Also resolve every subdomain (concurrently) and report which are live.
 
         Returns:
             Dict with discovered subdomains, interesting findings,
-            and grade_input for the risk_scorer tool.
+            and grade_input for the risk_scorer tool. With probe, also
+            resolved (name -> IP) and live_subdomains.
         """
-        # Clean domain
-        domain = domain.replace("https://", "").replace("http://", "").strip("/")
-        domain = domain.split("/")[0]
-        if ":" in domain:
-            domain = domain.split(":")[0]
-
-        max_results = min(max_results, 200)
-
-        try:
-            async with httpx.AsyncClient(timeout=30) as client:
-                response = await client.get(
-                    "https://crt.sh/",
-                    params={"q": f"%.{domain}", "output": "json"},
-                )
-
-                if response.status_code != 200:
-                    return {
-                        "error": f"crt.sh returned HTTP {response.status_code}",
-                        "domain": domain,
-                    }
-
-                data = response.json()
-
-        except httpx.TimeoutException:
-            return {"error": "crt.sh request timed out (try again later)", "domain": domain}
-        except Exception as e:
-            return {"error": f"CT log query failed: {e}", "domain": domain}
-
-        # Extract unique subdomains
-        raw_names: set[str] = set()
-        for entry in data:
-            name_value = entry.get("name_value", "")
-            # Can contain multiple names separated by newlines
-            for name in name_value.split("\n"):
-                name = name.strip().lower()
-                if name and name.endswith(f".{domain}") or name == domain:
-                    raw_names.add(name)
-
-        # Filter out wildcards and deduplicate
-        subdomains = sorted(
-            {name for name in raw_names if not name.startswith("*.")},
-        )
-
-        # Limit results
-        subdomains = subdomains[:max_results]
-
-        # Identify interesting subdomains
-        interesting = []
-        for sub in subdomains:
-            # Get the subdomain prefix (everything before the base domain)
-            prefix = sub.replace(f".{domain}", "").lower()
-            for keyword, info in INTERESTING_KEYWORDS.items():
-                if re.search(rf"\b{keyword}\b", prefix) or prefix == keyword:
-                    interesting.append(
-                        {
-                            "subdomain": sub,
-                            "reason": info["reason"],
-                            "severity": info["severity"],
-                            "remediation": info["remediation"],
-                        }
-                    )
-                    break
-
-        # Grade input
-        has_dev_staging = any(
-            i["severity"] in ("medium", "high")
-            and any(kw in i["subdomain"] for kw in ("staging", "dev", "test", "debug"))
-            for i in interesting
-        )
-        has_admin = any(
-            any(kw in i["subdomain"] for kw in ("admin", "backup")) for i in interesting
-        )
-        # "reasonable" = fewer than 50 subdomains
-        reasonable_surface = len(subdomains) < 50
-
-        grade_input = {
-            "no_dev_staging_exposed": not has_dev_staging,
-            "no_admin_exposed": not has_admin,
-            "reasonable_surface_area": reasonable_surface,
-        }
-
-        return {
-            "domain": domain,
-            "source": "crt.sh (Certificate Transparency)",
-            "total_found": len(subdomains),
-            "subdomains": subdomains,
-            "interesting": interesting,
-            "grade_input": grade_input,
-        }
+        return await enumerate_subdomains(clean_hostname(domain), max_results, probe)
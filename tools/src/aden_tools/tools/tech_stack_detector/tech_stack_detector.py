@@ -13,6 +13,9 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.utils.dns_resolver import resolving_transport
+from aden_tools.utils.fetch_cache import cached
+
 # Patterns to detect JS frameworks/libraries in HTML source
 JS_PATTERNS = {
     "React": [
@@ -111,24 +114,9 @@
 def register_tools(mcp: FastMCP) -> None:
     """Register tech stack detection tools with the MCP server."""
 
-    @mcp.tool()
-    async def tech_stack_detect(url: str) -> dict:
-        """
-        Detect the technology stack of a website through passive analysis.
-
-        Identifies web server, framework, CMS, JavaScript libraries, CDN,
-        analytics, and security configuration by analyzing HTTP responses,
-        HTML content, cookies, and common paths. Non-intrusive.
-
-        Args:
-            url: URL to analyze (e.g., "https://example.com"). Auto-prefixes https://.
-
-        Returns:
-            Dict with detected technologies, security configuration,
-            and grade_input for the risk_scorer tool.
-        """
-        if not url.startswith(("http://", "https://")):
-            url = "https://" + url
+    @cached("tech_stack_detect")
+    async def _detect(url: str) -> dict:
+        """Analyze *url*; results are cached per URL (see ``fetch_cache``)."""
         # Ensure trailing slash for base URL
         base_url = url.rstrip("/")
 
@@ -137,6 +125,7 @@ async def tech_stack_detect(url: str) -> dict:
                 follow_redirects=True,
                 timeout=15,
                 verify=True,
+                transport=resolving_transport(verify=True),
             ) as client:
                 # Main page request
                 response = await client.get(base_url)
@@ -242,6 +231,26 @@ async def tech_stack_detect(url: str) -> dict:
             "grade_input": grade_input,
         }
 
+    @mcp.tool()
+    async def tech_stack_detect(url: str) -> dict:
+        """
+        Detect the technology stack of a website through passive analysis.
+
+        Identifies web server, framework, CMS, JavaScript libraries, CDN,
+        analytics, and security configuration by analyzing HTTP responses,
+        HTML content, cookies, and common paths. Non-intrusive.
+
+        Args:
+            url: URL to analyze (e.g., "https://example.com"). Auto-prefixes https://.
+
+        Returns:
+            Dict with detected technologies, security configuration,
+            and grade_input for the risk_scorer tool.
+        """
+        if not url.startswith(("http://", "https://")):
+            url = "https://" + url
+        return await _detect(url)
+
 
 def _detect_server(headers: httpx.Headers) -> dict | None:
     """Detect web server from headers."""
@@ -1,5 +1,6 @@
 """Web Scrape Tool - Extract content from web pages."""
 
+from .browser_pool import BrowserPool, close_browser_pool, get_browser_pool
 from .web_scrape_tool import register_tools
 
-__all__ = ["register_tools"]
+__all__ = ["BrowserPool", "close_browser_pool", "get_browser_pool", "register_tools"]
@@ -0,0 +1,188 @@
+"""
+Long-lived Chromium pool for web_scrape.
+
+Launching Chromium takes about a second and a few hundred MB, and research
+agents scrape dozens of URLs per run.  ``BrowserPool`` keeps up to
+``POOL_SIZE`` browsers running for the life of the event loop and gives
+every request its own browser context (cookies, storage and cache are not
+shared between requests):
+
+- browsers are launched lazily, a new one only when every running browser
+  is busy and the pool is below its size;
+- at most ``MAX_CONCURRENT_PAGES`` pages are open at once, further
+  requests wait for a free slot;
+- a browser is retired after serving ``RECYCLE_AFTER_PAGES`` pages (and
+  closed once its last page is done), which bounds Chromium's memory
+  growth; a browser that crashed is replaced on the next request.
+
+Playwright objects belong to the event loop that created them, so there is
+one pool per loop (see ``get_browser_pool``).
+
+Example:
+    pool = get_browser_pool(async_playwright, Stealth)
+    async with pool.page() as page:
+        await page.goto(url)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import weakref
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass
+from typing import Any
+
+from playwright.async_api import Error as PlaywrightError
+
+logger = logging.getLogger(__name__)
+
+POOL_SIZE = 2
+MAX_CONCURRENT_PAGES = 4
+RECYCLE_AFTER_PAGES = 50
+
+LAUNCH_ARGS = [
+    "--no-sandbox",
+    "--disable-setuid-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-blink-features=AutomationControlled",
+]
+
+
+@dataclass
+class _PooledBrowser:
+    browser: Any
+    pages: int = 0  # pages started, including open ones
+    active: int = 0
+
+
+class BrowserPool:
+    """Warm Chromium browsers handing out one isolated context per page."""
+
+    def __init__(
+        self,
+        start_playwright: Callable[[], Any],
+        stealth: Callable[[], Any] | None = None,
+        context_options: dict[str, Any] | None = None,
+        size: int = POOL_SIZE,
+        max_concurrency: int = MAX_CONCURRENT_PAGES,
+        recycle_after: int = RECYCLE_AFTER_PAGES,
+    ):
+        self.size = max(1, size)
+        self.recycle_after = max(1, recycle_after)
+        self._start_playwright = start_playwright
+        self._stealth = stealth
+        self._context_options = context_options or {}
+        self._slots = asyncio.Semaphore(max(1, max_concurrency))
+        self._lock = asyncio.Lock()
+        self._stack: contextlib.AsyncExitStack | None = None
+        self._playwright: Any = None
+        self._browsers: list[_PooledBrowser] = []
+        self.launched = 0
+        self.pages_served = 0
+
+    @property
+    def browser_count(self) -> int:
+        return len(self._browsers)
+
+    async def _launch(self) -> _PooledBrowser:
+        if self._playwright is None:
+            stack = contextlib.AsyncExitStack()
+            self._playwright = await stack.enter_async_context(self._start_playwright())
+            self._stack = stack
+        browser = await self._playwright.chromium.launch(headless=True, args=LAUNCH_ARGS)
+        self.launched += 1
+        entry = _PooledBrowser(browser)
+        self._browsers.append(entry)
+        return entry
+
+    async def warm(self, count: int | None = None) -> None:
+        """Launch browsers up front so the first requests do not pay for it."""
+        async with self._lock:
+            while len(self._browsers) < min(self.size, count or self.size):
+                await self._launch()
+
+    async def _checkout(self) -> _PooledBrowser:
+        async with self._lock:
+            live = [b for b in self._browsers if b.pages < self.recycle_after]
+            entry = min(live, key=lambda b: b.active, default=None)
+            if entry is None or (entry.active and len(live) < self.size):
+                entry = await self._launch()
+            entry.active += 1
+            entry.pages += 1
+            return entry
+
+    async def _checkin(self, entry: _PooledBrowser, broken: bool = False) -> None:
+        entry.active -= 1
+        retire = broken or (entry.pages >= self.recycle_after and not entry.active)
+        if retire and entry in self._browsers:
+            self._browsers.remove(entry)
+            with contextlib.suppress(Exception):
+                await entry.browser.close()
+
+    @contextlib.asynccontextmanager
+    async def page(self) -> AsyncIterator[Any]:
+        """A new page in a fresh context; the context is closed on exit."""
+        async with self._slots:
+            entry = await self._checkout()
+            try:
+                context = await entry.browser.new_context(**self._context_options)
+            except PlaywrightError as e:
+                # The browser died (crash, OOM kill); replace it once
+                logger.debug("Replacing dead pooled browser: %s", e)
+                await self._checkin(entry, broken=True)
+                entry = await self._checkout()
+                try:
+                    context = await entry.browser.new_context(**self._context_options)
+                except BaseException:
+                    await self._checkin(entry, broken=True)
+                    raise
+            try:
+                page = await context.new_page()
+                if self._stealth is not None:
+                    await self._stealth().apply_stealth_async(page)
+                yield page
+            finally:
+                self.pages_served += 1
+                with contextlib.suppress(Exception):
+                    await context.close()
+                await self._checkin(entry)
+
+    async def close(self) -> None:
+        """Close every browser and stop Playwright."""
+        async with self._lock:
+            browsers, self._browsers = self._browsers, []
+            for entry in browsers:
+                with contextlib.suppress(Exception):
+                    await entry.browser.close()
+            if self._stack is not None:
+                with contextlib.suppress(Exception):
+                    await self._stack.aclose()
+            self._stack = None
+            self._playwright = None
+
+
+_pools: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, BrowserPool] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_browser_pool(
+    start_playwright: Callable[[], Any],
+    stealth: Callable[[], Any] | None = None,
+    **options: Any,
+) -> BrowserPool:
+    """The running event loop's pool, created with these arguments on first use."""
+    loop = asyncio.get_running_loop()
+    pool = _pools.get(loop)
+    if pool is None:
+        pool = _pools[loop] = BrowserPool(start_playwright, stealth, **options)
+    return pool
+
+
+async def close_browser_pool() -> None:
+    """Close the running event loop's pool, if it has one."""
+    pool = _pools.pop(asyncio.get_running_loop(), None)
+    if pool is not None:
+        await pool.close()
@@ -4,13 +4,23 @@
 Uses Playwright with stealth for headless browser scraping,
 enabling JavaScript-rendered content and bot detection evasion.
 Uses BeautifulSoup for HTML parsing and content extraction.
+
+Pages are first fetched over plain HTTP; static pages with enough text are
+extracted from that response and never touch the browser.  Everything else
+is rendered in a pooled, long-lived Chromium (see ``browser_pool``).
+
+Results are kept in the shared fetch cache (see ``aden_tools.utils.fetch_cache``);
+once expired, a page that sent an ``ETag`` or ``Last-Modified`` header is
+revalidated with a conditional GET before it is scraped again.
 """
 
 from __future__ import annotations
 
+import re
 from typing import Any
 from urllib.parse import urljoin
 
+import httpx
 from bs4 import BeautifulSoup
 from fastmcp import FastMCP
 from playwright.async_api import (
@@ -20,6 +30,12 @@
 )
 from playwright_stealth import Stealth
 
+from aden_tools.utils import http_client
+from aden_tools.utils.fetch_cache import CacheEntry, Fetched, get_fetch_cache
+from aden_tools.utils.http_client import RetryPolicy
+
+from .browser_pool import get_browser_pool
+
 # Browser-like User-Agent for actual page requests
 BROWSER_USER_AGENT = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -27,6 +43,250 @@
     "Chrome/131.0.0.0 Safari/537.36"
 )
 
+RENDER_MODES = ("auto", "always", "never")
+HTML_CONTENT_TYPES = ("text/html", "application/xhtml+xml")
+
+# Readiness waits after DOMContentLoaded, instead of a fixed sleep
+NETWORK_IDLE_TIMEOUT_MS = 5000
+SELECTOR_TIMEOUT_MS = 10000
+STATIC_FETCH_TIMEOUT = 15.0
+# Static HTML with less main-content text than this is rendered in the browser
+STATIC_MIN_TEXT = 200
+# Empty app shells and "please enable JavaScript" pages need rendering
+_JS_SHELL = re.compile(
+    r"<div\s+id=[\"'](?:root|app|__next|__nuxt)[\"'][^>]*>\s*</div>"
+    r"|enable javascript|javascript is (?:required|disabled)",
+    re.IGNORECASE,
+)
+
+# The browser is the fallback, so the fast path does not retry
+_NO_RETRY = RetryPolicy(max_retries=0)
+
+_NOISE_TAGS = ["script", "style", "nav", "footer", "header", "aside", "noscript", "iframe"]
+
+
+async def _fetch_static(url: str, headers: dict[str, str] | None = None) -> httpx.Response:
+    """GET *url* over plain HTTP on the pooled client."""
+    return await http_client.arequest(
+        "GET",
+        url,
+        headers={
+            "User-Agent": BROWSER_USER_AGENT,
+            "Accept-Language": "en-US,en;q=0.9",
+            **(headers or {}),
+        },
+        follow_redirects=True,
+        timeout=STATIC_FETCH_TIMEOUT,
+        retry=_NO_RETRY,
+    )
+
+
+def _parse(html: str) -> BeautifulSoup:
+    """Parse HTML and remove noise elements."""
+    soup = BeautifulSoup(html, "html.parser")
+    for tag in soup(_NOISE_TAGS):
+        tag.decompose()
+    return soup
+
+
+def _main_text(soup: BeautifulSoup, selector: str | None) -> str | None:
+    """Whitespace-collapsed text of *selector* or the main content; None if unmatched."""
+    if selector:
+        content_elem = soup.select_one(selector)
+        if not content_elem:
+            return None
+        text = content_elem.get_text(separator=" ", strip=True)
+    else:
+        # Auto-detect main content
+        main_content = (
+            soup.find("article")
+            or soup.find("main")
+            or soup.find(attrs={"role": "main"})
+            or soup.find(class_=["content", "post", "entry", "article-body"])
+            or soup.find("body")
+        )
+        text = main_content.get_text(separator=" ", strip=True) if main_content else ""
+    return " ".join(text.split())
+
+
+def _extract(
+    soup: BeautifulSoup,
+    text: str,
+    url: str,
+    base_url: str,
+    include_links: bool,
+    max_length: int,
+) -> dict[str, Any]:
+    """Build the tool result from a parsed page and its main text."""
+    title = soup.title.get_text(strip=True) if soup.title else ""
+
+    description = ""
+    meta_desc = soup.find("meta", attrs={"name": "description"})
+    if meta_desc:
+        description = meta_desc.get("content", "")
+
+    # Truncate if needed
+    if len(text) > max_length:
+        text = text[:max_length] + "..."
+
+    result: dict[str, Any] = {
+        "url": url,
+        "title": title,
+        "description": description,
+        "content": text,
+        "length": len(text),
+    }
+
+    # Extract links if requested
+    if include_links:
+        links: list[dict[str, str]] = []
+        for a in soup.find_all("a", href=True)[:50]:
+            href = a["href"]
+            # Convert relative URLs to absolute URLs (base_url is the final URL after redirects)
+            absolute_href = urljoin(base_url, href)
+            link_text = a.get_text(strip=True)
+            if link_text and absolute_href:
+                links.append({"text": link_text, "href": absolute_href})
+        result["links"] = links
+
+    return result
+
+
+def _skip_non_html(url: str, content_type: str) -> dict[str, Any] | None:
+    if not any(t in content_type for t in HTML_CONTENT_TYPES):
+        return {
+            "error": f"Skipping non-HTML content (Content-Type: {content_type})",
+            "url": url,
+            "skipped": True,
+        }
+    return None
+
+
+async def _scrape_static(
+    url: str,
+    selector: str | None,
+    include_links: bool,
+    max_length: int,
+    required: bool,
+) -> Fetched | dict[str, Any] | None:
+    """
+    Scrape *url* from its raw HTML.  Returns None when the page looks like it
+    needs JavaScript (or could not be fetched), unless *required*.
+    """
+    try:
+        response = await _fetch_static(url)
+    except httpx.TimeoutException:
+        return {"error": "Request timed out"} if required else None
+    except httpx.HTTPError as e:
+        return {"error": f"Request failed: {e!s}"} if required else None
+
+    if response.status_code != 200:
+        # Bot walls often answer plain clients with 403; the browser may get through
+        return {"error": f"HTTP {response.status_code}: Failed to fetch URL"} if required else None
+
+    content_type = response.headers.get("content-type", "").lower()
+    skipped = _skip_non_html(url, content_type)
+    if skipped:
+        return skipped
+
+    soup = _parse(response.text)
+    text = _main_text(soup, selector)
+    if not required and (
+        text is None or len(text) < STATIC_MIN_TEXT or _JS_SHELL.search(response.text)
+    ):
+        return None
+    if text is None:
+        return {"error": f"No elements found matching selector: {selector}"}
+    result = _extract(soup, text, url, str(response.url), include_links, max_length)
+    result["rendered"] = False
+    return Fetched.from_headers(result, response.headers)
+
+
+async def _wait_until_ready(page: Any, selector: str | None) -> None:
+    """Wait for *selector*, or for the network to go idle, within a bounded time."""
+    try:
+        if selector:
+            await page.wait_for_selector(selector, state="attached", timeout=SELECTOR_TIMEOUT_MS)
+        else:
+            await page.wait_for_load_state("networkidle", timeout=NETWORK_IDLE_TIMEOUT_MS)
+    except PlaywrightTimeout:
+        pass  # pages that keep polling never go idle; extract what has rendered
+
+
+async def _scrape(
+    url: str,
+    selector: str | None,
+    include_links: bool,
+    max_length: int,
+    render: str,
+) -> Fetched | dict[str, Any]:
+    """Scrape *url*, over plain HTTP when possible and in the browser otherwise."""
+    try:
+        # Fast path: plain HTTP fetch, no browser
+        if render != "always":
+            result = await _scrape_static(
+                url, selector, include_links, max_length, required=render == "never"
+            )
+            if result is not None:
+                return result
+
+        # Render in a pooled browser with a fresh, isolated context
+        pool = get_browser_pool(
+            async_playwright,
+            Stealth,
+            context_options={
+                "viewport": {"width": 1920, "height": 1080},
+                "user_agent": BROWSER_USER_AGENT,
+                "locale": "en-US",
+            },
+        )
+        async with pool.page() as page:
+            response = await page.goto(
+                url,
+                wait_until="domcontentloaded",
+                timeout=60000,
+            )
+
+            if response is None:
+                return {"error": "Navigation failed: no response received"}
+
+            if response.status != 200:
+                return {"error": f"HTTP {response.status}: Failed to fetch URL"}
+
+            # Validate Content-Type
+            content_type = response.headers.get("content-type", "").lower()
+            skipped = _skip_non_html(url, content_type)
+            if skipped:
+                return skipped
+
+            await _wait_until_ready(page, selector)
+
+            # Get fully rendered HTML
+            html_content = await page.content()
+            final_url = str(response.url)  # Use final URL after redirects
+            headers = response.headers
+
+        soup = _parse(html_content)
+        text = _main_text(soup, selector)
+        if text is None:
+            return {"error": f"No elements found matching selector: {selector}"}
+        result = _extract(soup, text, url, final_url, include_links, max_length)
+        result["rendered"] = True
+        return Fetched.from_headers(result, headers)
+
+    except PlaywrightTimeout:
+        return {"error": "Request timed out"}
+    except PlaywrightError as e:
+        return {"error": f"Browser error: {e!s}"}
+    except Exception as e:
+        return {"error": f"Scraping failed: {e!s}"}
+
+
+async def _not_modified(url: str, entry: CacheEntry) -> bool:
+    """Ask the origin whether a cached page changed since it was scraped."""
+    response = await _fetch_static(url, entry.conditional_headers())
+    return response.status_code == 304
+
 
 def register_tools(mcp: FastMCP) -> None:
     """Register web scrape tools with the MCP server."""
@@ -37,6 +297,7 @@ async def web_scrape(
         selector: str | None = None,
         include_links: bool = False,
         max_length: int = 50000,
+        render: str = "auto",
     ) -> dict:
         """
         Scrape and extract text content from a webpage.
@@ -50,9 +311,12 @@ async def web_scrape(
             selector: CSS selector to target specific content (e.g., 'article', '.main-content')
             include_links: Include extracted links in the response
             max_length: Maximum length of extracted text (1000-500000)
+            render: 'auto' fetches static pages without the browser and renders the rest,
+                'always' always uses the browser, 'never' never does
 
         Returns:
-            Dict with scraped content (url, title, description, content, length) or error dict
+            Dict with scraped content (url, title, description, content, length,
+            rendered) or error dict
         """
         try:
             # Validate URL
@@ -62,122 +326,20 @@ async def web_scrape(
             # Validate max_length
             max_length = max(1000, min(max_length, 500000))
 
-            # Launch headless browser with stealth
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(
-                    headless=True,
-                    args=[
-                        "--no-sandbox",
-                        "--disable-setuid-sandbox",
-                        "--disable-dev-shm-usage",
-                        "--disable-blink-features=AutomationControlled",
-                    ],
-                )
-                try:
-                    context = await browser.new_context(
-                        viewport={"width": 1920, "height": 1080},
-                        user_agent=BROWSER_USER_AGENT,
-                        locale="en-US",
-                    )
-                    page = await context.new_page()
-                    await Stealth().apply_stealth_async(page)
-
-                    response = await page.goto(
-                        url,
-                        wait_until="domcontentloaded",
-                        timeout=60000,
-                    )
-
-                    # Give JS a moment to render dynamic content
-                    await page.wait_for_timeout(2000)
-
-                    if response is None:
-                        return {"error": "Navigation failed: no response received"}
-
-                    if response.status != 200:
-                        return {"error": f"HTTP {response.status}: Failed to fetch URL"}
-
-                    # Validate Content-Type
-                    content_type = response.headers.get("content-type", "").lower()
-                    if not any(t in content_type for t in ["text/html", "application/xhtml+xml"]):
-                        return {
-                            "error": (f"Skipping non-HTML content (Content-Type: {content_type})"),
-                            "url": url,
-                            "skipped": True,
-                        }
-
-                    # Get fully rendered HTML
-                    html_content = await page.content()
-                finally:
-                    await browser.close()
-
-            # Parse rendered HTML with BeautifulSoup
-            soup = BeautifulSoup(html_content, "html.parser")
-
-            # Remove noise elements
-            for tag in soup(
-                ["script", "style", "nav", "footer", "header", "aside", "noscript", "iframe"]
-            ):
-                tag.decompose()
-
-            # Get title and description
-            title = soup.title.get_text(strip=True) if soup.title else ""
-
-            description = ""
-            meta_desc = soup.find("meta", attrs={"name": "description"})
-            if meta_desc:
-                description = meta_desc.get("content", "")
-
-            # Target content
-            if selector:
-                content_elem = soup.select_one(selector)
-                if not content_elem:
-                    return {"error": f"No elements found matching selector: {selector}"}
-                text = content_elem.get_text(separator=" ", strip=True)
-            else:
-                # Auto-detect main content
-                main_content = (
-                    soup.find("article")
-                    or soup.find("main")
-                    or soup.find(attrs={"role": "main"})
-                    or soup.find(class_=["content", "post", "entry", "article-body"])
-                    or soup.find("body")
-                )
-                text = main_content.get_text(separator=" ", strip=True) if main_content else ""
-
-            # Clean up whitespace
-            text = " ".join(text.split())
-
-            # Truncate if needed
-            if len(text) > max_length:
-                text = text[:max_length] + "..."
-
-            result: dict[str, Any] = {
-                "url": url,
-                "title": title,
-                "description": description,
-                "content": text,
-                "length": len(text),
-            }
-
-            # Extract links if requested
-            if include_links:
-                links: list[dict[str, str]] = []
-                base_url = str(response.url)  # Use final URL after redirects
-                for a in soup.find_all("a", href=True)[:50]:
-                    href = a["href"]
-                    # Convert relative URLs to absolute URLs
-                    absolute_href = urljoin(base_url, href)
-                    link_text = a.get_text(strip=True)
-                    if link_text and absolute_href:
-                        links.append({"text": link_text, "href": absolute_href})
-                result["links"] = links
-
-            return result
-
-        except PlaywrightTimeout:
-            return {"error": "Request timed out"}
-        except PlaywrightError as e:
-            return {"error": f"Browser error: {e!s}"}
+            if render not in RENDER_MODES:
+                return {"error": f"render must be one of {', '.join(RENDER_MODES)}"}
+
+            return await get_fetch_cache().aget_or_fetch(
+                "web_scrape",
+                {
+                    "url": url,
+                    "selector": selector,
+                    "include_links": include_links,
+                    "max_length": max_length,
+                    "render": render,
+                },
+                lambda: _scrape(url, selector, include_links, max_length, render),
+                revalidate=lambda entry: _not_modified(url, entry),
+            )
         except Exception as e:
             return {"error": f"Scraping failed: {e!s}"}
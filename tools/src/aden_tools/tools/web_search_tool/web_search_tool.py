@@ -17,6 +17,8 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.utils.fetch_cache import cached
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
@@ -27,6 +29,7 @@ def register_tools(
 ) -> None:
     """Register web search tools with the MCP server."""
 
+    @cached("web_search", exclude=("api_key", "cse_id"))
     def _search_google(
         query: str,
         num_results: int,
@@ -84,6 +87,7 @@ def _search_google(
             "provider": "google",
         }
 
+    @cached("web_search", exclude=("api_key",))
     def _search_brave(
         query: str,
         num_results: int,
@@ -2,6 +2,26 @@
 Utility functions for Aden Tools.
 """
 
+from .dns_resolver import DnsResolver, get_resolver, resolving_transport
 from .env_helpers import get_env_var
+from .fetch_cache import FetchCache, Fetched, cached, get_fetch_cache
+from .http_client import HttpClientRegistry, RetryPolicy, get_http_registry
+from .pagination import Page, collect_pages, paginate_cursor, paginate_numbered
 
-__all__ = ["get_env_var"]
+__all__ = [
+    "DnsResolver",
+    "get_resolver",
+    "resolving_transport",
+    "get_env_var",
+    "FetchCache",
+    "Fetched",
+    "cached",
+    "get_fetch_cache",
+    "HttpClientRegistry",
+    "RetryPolicy",
+    "get_http_registry",
+    "Page",
+    "collect_pages",
+    "paginate_cursor",
+    "paginate_numbered",
+]
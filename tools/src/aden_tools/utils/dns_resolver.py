@@ -0,0 +1,326 @@
+"""
+Shared async DNS resolver for the network tools.
+
+The security scanners look the same names up over and over: a batch scan
+resolves every subdomain to see which are live, then the port and TLS
+scans resolve each one again, and every DNS scan asks the same nameservers
+for the same NS and DKIM records.  ``DnsResolver`` answers all of them from
+one in-process cache:
+
+- answers are kept for their record TTL (capped at ``MAX_TTL``);
+- NXDOMAIN and "no such record" answers are cached too, for the SOA minimum
+  TTL of the zone (RFC 2308), or ``NEGATIVE_TTL`` when there is no SOA;
+- identical lookups running at the same time on one event loop share a
+  single query;
+- the nameserver configuration (``/etc/resolv.conf``) is read once, not per
+  scan.
+
+``address()`` returns the IP to connect to for a hostname.  It asks the
+system resolver (``getaddrinfo``) for ``localhost``, single-label and
+``.local`` names, and for any name DNS has no address for or when no
+nameserver is reachable, so names from ``/etc/hosts``, nsswitch or
+split-horizon DNS keep working; its failures are cached too.  httpx clients can
+route their own lookups through the cache with ``resolving_transport()``;
+when a proxy is configured in the environment it returns ``None`` instead,
+so the client keeps httpx's default transport and its proxy support.
+
+Usage:
+
+    resolver = get_resolver()
+    ip = await resolver.address("example.com")
+    answer = await resolver.resolve("_dmarc.example.com", "TXT")
+
+    async with httpx.AsyncClient(transport=resolving_transport()) as client:
+        ...
+
+Tests point a ``DnsResolver(nameservers=["127.0.0.1"], port=...)`` at a
+local stub server.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import ipaddress
+import socket
+import threading
+import time
+import urllib.request
+from collections import Counter, OrderedDict
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any
+
+import httpcore
+import httpx
+
+try:
+    import dns.asyncresolver
+    import dns.exception
+    import dns.name
+    import dns.rdatatype
+    import dns.resolver
+
+    _DNS_AVAILABLE = True
+except ImportError:
+    _DNS_AVAILABLE = False
+
+# Seconds per lookup, including retries across nameservers
+DEFAULT_TIMEOUT = 10.0
+# Longest time an answer is kept, whatever its TTL
+MAX_TTL = 24 * 3600.0
+# Negative answers without an SOA record, and system resolver failures
+NEGATIVE_TTL = 60.0
+MAX_NEGATIVE_TTL = 3600.0
+# System resolver answers carry no TTL
+SYSTEM_TTL = 300.0
+MAX_ENTRIES = 10_000
+
+
+class DnsResolver:
+    """
+    Async DNS resolver with a TTL-respecting positive and negative cache.
+
+    Thread-safe; can be shared between event loops.
+    """
+
+    def __init__(
+        self,
+        nameservers: list[str] | None = None,
+        port: int = 53,
+        timeout: float = DEFAULT_TIMEOUT,
+        max_entries: int = MAX_ENTRIES,
+    ):
+        self.nameservers = nameservers
+        self.port = port
+        self.timeout = timeout
+        self.max_entries = max_entries
+        self._resolver: dns.asyncresolver.Resolver | None = None
+        self._cache: OrderedDict[tuple, tuple[float, Any]] = OrderedDict()
+        self._flights: dict[tuple, asyncio.Task] = {}
+        self._lock = threading.Lock()
+        self._stats: Counter[str] = Counter()
+
+    @property
+    def resolver(self) -> dns.asyncresolver.Resolver:
+        """The underlying dnspython resolver, configured on first use."""
+        if not _DNS_AVAILABLE:
+            raise RuntimeError("dnspython is not installed. Install it with: pip install dnspython")
+        if self._resolver is None:
+            resolver = dns.asyncresolver.Resolver(configure=self.nameservers is None)
+            if self.nameservers is not None:
+                resolver.nameservers = list(self.nameservers)
+                resolver.port = self.port
+            resolver.timeout = self.timeout
+            resolver.lifetime = self.timeout
+            self._resolver = resolver
+        return self._resolver
+
+    async def resolve(self, name: str, rdtype: str = "A") -> dns.resolver.Answer:
+        """
+        Records of type *rdtype* for *name*, like ``dns.asyncresolver.resolve``.
+
+        Raises the same ``dns.exception.DNSException`` subclasses; NXDOMAIN
+        and NoAnswer are served from the cache until their negative TTL ends.
+        """
+        key = (name.strip().rstrip(".").lower(), rdtype.upper())
+        return await self._single_flight(key, lambda: self._query(*key))
+
+    async def address(self, hostname: str, family: int = socket.AF_INET) -> str:
+        """
+        First IPv4 (or, with ``AF_INET6``, IPv6) address of *hostname*.
+
+        Raises ``socket.gaierror`` when the name does not resolve.
+        """
+        host = hostname.strip().rstrip(".").lower()
+        with contextlib.suppress(ValueError):
+            return str(ipaddress.ip_address(host))
+
+        if _DNS_AVAILABLE and not _is_local_name(host):
+            try:
+                answer = await self.resolve(host, "AAAA" if family == socket.AF_INET6 else "A")
+                return answer[0].address
+            except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer):
+                pass  # may still be in the hosts file or a split-horizon zone
+            except (dns.exception.DNSException, OSError):
+                pass  # no usable nameserver; let the system resolver try
+        key = (host, "system", family)
+        return await self._single_flight(key, lambda: self._system_address(host, family))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    def stats(self) -> dict:
+        """Query, cache hit and coalescing counts."""
+        with self._lock:
+            hits = self._stats["hits"] + self._stats["negative_hits"]
+            lookups = hits + self._stats["queries"]
+            return {
+                **{k: self._stats[k] for k in ("queries", "hits", "negative_hits", "coalesced")},
+                "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+                "entries": len(self._cache),
+            }
+
+    async def _single_flight(self, key: tuple, query: Callable[[], Awaitable[Any]]) -> Any:
+        """Answer from the cache, or run *query* once for all concurrent callers."""
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None and cached[0] > time.monotonic():
+                self._cache.move_to_end(key)
+                value = cached[1]
+                self._stats["negative_hits" if isinstance(value, Exception) else "hits"] += 1
+                if isinstance(value, Exception):
+                    raise value.with_traceback(None)
+                return value
+
+        loop = asyncio.get_running_loop()
+        flight_key = (id(loop), key)
+        task = self._flights.get(flight_key)
+        if task is None:
+            task = self._flights[flight_key] = loop.create_task(query())
+            task.add_done_callback(lambda done: self._landed(flight_key, done))
+        else:
+            self._count("coalesced")
+        return await asyncio.shield(task)
+
+    def _landed(self, flight_key: tuple, task: asyncio.Task) -> None:
+        self._flights.pop(flight_key, None)
+        if not task.cancelled():
+            task.exception()  # retrieved by the waiters, if any are left
+
+    async def _query(self, name: str, rdtype: str) -> dns.resolver.Answer:
+        self._count("queries")
+        try:
+            answer = await self.resolver.resolve(dns.name.from_text(name), rdtype)
+        except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer) as e:
+            ttl = _negative_ttl(e)
+            ttl = NEGATIVE_TTL if ttl is None else min(ttl, MAX_NEGATIVE_TTL)
+            self._store((name, rdtype), e, ttl)
+            raise
+        self._store((name, rdtype), answer, min(answer.expiration - time.time(), MAX_TTL))
+        return answer
+
+    async def _system_address(self, host: str, family: int) -> str:
+        self._count("queries")
+        loop = asyncio.get_running_loop()
+        try:
+            infos = await loop.getaddrinfo(host, None, family=family, type=socket.SOCK_STREAM)
+            if not infos:
+                raise socket.gaierror(socket.EAI_NONAME, f"No address for {host}")
+        except socket.gaierror as e:
+            self._store((host, "system", family), e, NEGATIVE_TTL)
+            raise
+        address = infos[0][4][0]
+        self._store((host, "system", family), address, SYSTEM_TTL)
+        return address
+
+    def _store(self, key: tuple, value: Any, ttl: float) -> None:
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._cache[key] = (time.monotonic() + ttl, value)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+
+    def _count(self, stat: str) -> None:
+        with self._lock:
+            self._stats[stat] += 1
+
+
+def _is_local_name(host: str) -> bool:
+    """Names only the system resolver knows (hosts file, search domains, mDNS)."""
+    return "." not in host or host.endswith((".localhost", ".local"))
+
+
+def _negative_ttl(error: Exception) -> float | None:
+    """Negative caching TTL from the SOA in the authority section (RFC 2308)."""
+    responses = list((error.kwargs.get("responses") or {}).values())
+    if error.kwargs.get("response") is not None:
+        responses.append(error.kwargs["response"])
+    for response in responses:
+        for rrset in response.authority:
+            if rrset.rdtype == dns.rdatatype.SOA:
+                return float(min(rrset.ttl, rrset[0].minimum))
+    return None
+
+
+class ResolvingBackend(httpcore.AsyncNetworkBackend):
+    """httpcore network backend that resolves hostnames with a ``DnsResolver``."""
+
+    def __init__(self, backend: httpcore.AsyncNetworkBackend, resolver: DnsResolver | None = None):
+        self._backend = backend
+        self._resolver = resolver
+
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: float | None = None,
+        local_address: str | None = None,
+        socket_options: Iterable | None = None,
+    ) -> httpcore.AsyncNetworkStream:
+        resolver = self._resolver or get_resolver()
+        try:
+            try:
+                ip = await resolver.address(host)
+            except socket.gaierror:
+                ip = await resolver.address(host, socket.AF_INET6)
+        except socket.gaierror as e:
+            raise httpcore.ConnectError(f"Could not resolve {host}: {e}") from e
+        return await self._backend.connect_tcp(
+            ip, port, timeout=timeout, local_address=local_address, socket_options=socket_options
+        )
+
+    async def connect_unix_socket(
+        self, path: str, timeout: float | None = None, socket_options: Iterable | None = None
+    ) -> httpcore.AsyncNetworkStream:
+        return await self._backend.connect_unix_socket(
+            path, timeout=timeout, socket_options=socket_options
+        )
+
+    async def sleep(self, seconds: float) -> None:
+        await self._backend.sleep(seconds)
+
+
+def _env_proxies_configured() -> bool:
+    """True when ``HTTP(S)_PROXY`` or ``ALL_PROXY`` is set, as httpx reads them."""
+    return any(urllib.request.getproxies().get(scheme) for scheme in ("http", "https", "all"))
+
+
+def resolving_transport(
+    resolver: DnsResolver | None = None, **kwargs: Any
+) -> httpx.AsyncHTTPTransport | None:
+    """
+    ``httpx.AsyncHTTPTransport(**kwargs)`` whose lookups go through *resolver*
+    (the shared one by default).  TLS SNI and the Host header still use the
+    hostname from the URL.
+
+    Returns ``None`` when a proxy is configured in the environment: httpx
+    only honours ``HTTP(S)_PROXY`` when the client has no explicit
+    transport, and the proxy resolves the names then.  Pass *kwargs* that
+    matter (such as ``verify``) to the client as well.
+    """
+    if _env_proxies_configured():
+        return None
+    transport = httpx.AsyncHTTPTransport(**kwargs)
+    # httpx does not expose httpcore's network_backend option; when its
+    # internals change, the transport just keeps using the system resolver.
+    pool = getattr(transport, "_pool", None)
+    if pool is not None and hasattr(pool, "_network_backend"):
+        pool._network_backend = ResolvingBackend(pool._network_backend, resolver)
+    return transport
+
+
+_resolver: DnsResolver | None = None
+_resolver_lock = threading.Lock()
+
+
+def get_resolver() -> DnsResolver:
+    """The process-wide resolver."""
+    global _resolver
+    if _resolver is None:
+        with _resolver_lock:
+            if _resolver is None:
+                _resolver = DnsResolver()
+    return _resolver
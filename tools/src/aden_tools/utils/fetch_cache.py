@@ -0,0 +1,533 @@
+"""
+Shared on-disk cache for web fetches and search API results.
+
+web_scrape, web_search, news_search, the Exa and SerpAPI tools and
+tech_stack_detect get called with the same URLs and queries again and again
+(from different nodes, on retries, across sessions), and every call costs
+latency and API quota.  ``FetchCache`` keeps their results in one SQLite
+file in a private (mode 0o700) per-user directory under the temp directory.
+The cache is shared by every process and session of that user, so a page
+or search result fetched for one agent or workspace is served to the others:
+
+- entries are keyed by tool name and request parameters (never API keys)
+  and expire after a per-tool TTL (``DEFAULT_TTLS``);
+- an expired entry stored with an ``ETag`` or ``Last-Modified`` validator
+  is revalidated with a conditional request first; ``304 Not Modified``
+  renews it without downloading or re-processing the page;
+- the file is capped at ``MAX_CACHE_BYTES``, least recently used entries
+  are evicted first;
+- concurrent identical requests within a process are collapsed into one
+  (single flight): the first caller fetches, the others wait for its result;
+- error results are never stored.
+
+Hit, miss, revalidation and eviction counts per tool are reported by
+``FetchCache.stats()``.  Set ``ADEN_FETCH_CACHE=0`` to bypass the cache.
+
+Usage:
+
+    @cached("web_search", exclude=("api_key",))
+    def _search_brave(query: str, num_results: int, api_key: str) -> dict: ...
+
+or, when the entry should be revalidatable:
+
+    result = await get_fetch_cache().aget_or_fetch(
+        "web_scrape",
+        {"url": url},
+        lambda: scrape(url),  # may return Fetched(result, etag=..., last_modified=...)
+        revalidate=lambda entry: not_modified(url, entry.conditional_headers()),
+    )
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import Counter, defaultdict
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+from .private_dir import make_private_dir, user_temp_dir
+
+logger = logging.getLogger(__name__)
+
+MAX_CACHE_BYTES = 256 * 1024 * 1024
+# Eviction trims the cache to this fraction of the cap, so it does not run on every store
+EVICT_TO = 0.9
+
+DEFAULT_TTL = 3600.0
+# Seconds a result stays fresh, per tool
+DEFAULT_TTLS: dict[str, float] = {
+    "web_scrape": 3600.0,
+    "web_search": 6 * 3600.0,
+    "news_search": 15 * 60.0,
+    "exa_search": 6 * 3600.0,
+    "serpapi": 24 * 3600.0,
+    "tech_stack_detect": 24 * 3600.0,
+}
+
+# One directory per user: entries are keyed without API keys, so they must not
+# be readable by (or served to) other users on the machine.
+CACHE_DIR = user_temp_dir("aden_fetch_cache")
+CACHE_FILE = "cache-v1.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    tool TEXT NOT NULL,
+    value TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    stored_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    etag TEXT,
+    last_modified TEXT
+);
+CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at);
+"""
+
+STAT_NAMES = ("hits", "misses", "revalidated", "coalesced", "stored", "evicted")
+
+
+def cache_enabled() -> bool:
+    """False when ``ADEN_FETCH_CACHE`` is set to 0/false/off/no."""
+    value = os.environ.get("ADEN_FETCH_CACHE", "1").strip().lower()
+    return value not in ("0", "false", "off", "no")
+
+
+def cache_key(tool: str, params: Any) -> str:
+    """Stable hash of a tool name and its JSON-able request parameters."""
+    blob = json.dumps([tool, params], sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(blob.encode()).hexdigest()
+
+
+def _cacheable(value: Any) -> bool:
+    return not (isinstance(value, dict) and "error" in value)
+
+
+@dataclass
+class Fetched:
+    """A fetched value with the HTTP validators to revalidate it with later."""
+
+    value: Any
+    etag: str | None = None
+    last_modified: str | None = None
+
+    @classmethod
+    def from_headers(cls, value: Any, headers: Any) -> Fetched:
+        """Take ``ETag``/``Last-Modified`` from a response's headers (any mapping)."""
+        return cls(value, headers.get("etag"), headers.get("last-modified"))
+
+
+@dataclass
+class CacheEntry:
+    value: Any
+    stored_at: float
+    expires_at: float
+    etag: str | None = None
+    last_modified: str | None = None
+
+    @property
+    def fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+    @property
+    def revalidatable(self) -> bool:
+        return bool(self.etag or self.last_modified)
+
+    def conditional_headers(self) -> dict[str, str]:
+        """``If-None-Match``/``If-Modified-Since`` headers for a conditional request."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+@dataclass
+class _Flight:
+    done: threading.Event = field(default_factory=threading.Event)
+    value: Any = None
+    error: BaseException | None = None
+
+
+class FetchCache:
+    """SQLite-backed result cache with TTLs, revalidation, LRU eviction and single flight."""
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str] | None = None,
+        max_bytes: int = MAX_CACHE_BYTES,
+        ttls: dict[str, float] | None = None,
+    ):
+        self.path = os.fspath(path) if path else os.path.join(CACHE_DIR, CACHE_FILE)
+        # Only the default location is locked down; an explicit path is the caller's
+        self._private_dir = None if path else CACHE_DIR
+        self.max_bytes = max_bytes
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self._db: sqlite3.Connection | None = None
+        self._db_lock = threading.Lock()
+        self._flights: dict[str, _Flight] = {}
+        self._async_flights: dict[tuple[int, str], asyncio.Future[Any]] = {}
+        self._flight_lock = threading.Lock()
+        self._stats: defaultdict[str, Counter[str]] = defaultdict(Counter)
+
+    def ttl_for(self, tool: str) -> float:
+        return self.ttls.get(tool, DEFAULT_TTL)
+
+    # -- storage --------------------------------------------------------------
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._db is None:
+            try:
+                if self._private_dir:
+                    make_private_dir(self._private_dir)
+                else:
+                    os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            except OSError as e:
+                # Surfaces like any other storage failure: the call bypasses the cache
+                raise sqlite3.OperationalError(f"Fetch cache directory unusable: {e}") from e
+            db = sqlite3.connect(
+                self.path, timeout=10.0, isolation_level=None, check_same_thread=False
+            )
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.executescript(_SCHEMA)
+            self._db = db
+        return self._db
+
+    def _execute(self, sql: str, args: Iterable[Any] = ()) -> list[tuple[Any, ...]]:
+        with self._db_lock:
+            return self._connect().execute(sql, tuple(args)).fetchall()
+
+    def lookup(self, key: str) -> CacheEntry | None:
+        """The stored entry for *key*, fresh or not; None if there is none."""
+        try:
+            with self._db_lock:
+                db = self._connect()
+                rows = db.execute(
+                    "SELECT value, stored_at, expires_at, etag, last_modified "
+                    "FROM entries WHERE key = ?",
+                    (key,),
+                ).fetchall()
+                if rows:
+                    db.execute(
+                        "UPDATE entries SET accessed_at = ? WHERE key = ?", (time.time(), key)
+                    )
+        except sqlite3.Error as e:
+            logger.debug("Fetch cache lookup failed: %s", e)
+            return None
+        if not rows:
+            return None
+        value, stored_at, expires_at, etag, last_modified = rows[0]
+        return CacheEntry(json.loads(value), stored_at, expires_at, etag, last_modified)
+
+    def store(
+        self,
+        tool: str,
+        key: str,
+        value: Any,
+        ttl: float | None = None,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> bool:
+        """Store *value* under *key*; False if it is not JSON-serializable or too large."""
+        try:
+            blob = json.dumps(value, separators=(",", ":"))
+        except (TypeError, ValueError):
+            return False
+        size = len(blob) + len(key)
+        if size > self.max_bytes:
+            return False
+        now = time.time()
+        expires_at = now + (self.ttl_for(tool) if ttl is None else ttl)
+        try:
+            self._execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, tool, blob, size, now, expires_at, now, etag, last_modified),
+            )
+            self._evict()
+        except sqlite3.Error as e:
+            logger.debug("Fetch cache store failed: %s", e)
+            return False
+        self._count(tool, "stored")
+        return True
+
+    def renew(self, tool: str, key: str, ttl: float | None = None) -> None:
+        """Give *key* a new TTL, after the origin confirmed it is unchanged."""
+        expires_at = time.time() + (self.ttl_for(tool) if ttl is None else ttl)
+        try:
+            self._execute("UPDATE entries SET expires_at = ? WHERE key = ?", (expires_at, key))
+        except sqlite3.Error as e:
+            logger.debug("Fetch cache renew failed: %s", e)
+
+    def _evict(self) -> None:
+        (total,) = self._execute("SELECT COALESCE(SUM(size), 0) FROM entries")[0]
+        if total <= self.max_bytes:
+            return
+        excess = total - int(self.max_bytes * EVICT_TO)
+        victims: list[str] = []
+        for key, tool, size in self._execute(
+            "SELECT key, tool, size FROM entries ORDER BY accessed_at"
+        ):
+            if excess <= 0:
+                break
+            victims.append(key)
+            excess -= size
+            self._count(tool, "evicted")
+        self._execute(
+            f"DELETE FROM entries WHERE key IN ({', '.join('?' * len(victims))})", victims
+        )
+
+    def invalidate(self, tool: str, params: Any) -> None:
+        """Drop the entry for one request."""
+        try:
+            self._execute("DELETE FROM entries WHERE key = ?", (cache_key(tool, params),))
+        except sqlite3.Error as e:
+            logger.debug("Fetch cache invalidate failed: %s", e)
+
+    def clear(self, tool: str | None = None) -> None:
+        """Drop every entry, or every entry of *tool*."""
+        if tool is None:
+            self._execute("DELETE FROM entries")
+        else:
+            self._execute("DELETE FROM entries WHERE tool = ?", (tool,))
+
+    def close(self) -> None:
+        with self._db_lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    # -- metrics --------------------------------------------------------------
+
+    def _count(self, tool: str, stat: str) -> None:
+        with self._flight_lock:
+            self._stats[tool][stat] += 1
+
+    def stats(self) -> dict[str, Any]:
+        """Hit/miss/revalidation/eviction counts of this process, in total and per tool."""
+        with self._flight_lock:
+            tools = {
+                tool: {name: counts[name] for name in STAT_NAMES}
+                for tool, counts in self._stats.items()
+            }
+        totals = {name: sum(t[name] for t in tools.values()) for name in STAT_NAMES}
+        lookups = totals["hits"] + totals["revalidated"] + totals["misses"]
+        try:
+            entries, size = self._execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries")[0]
+        except sqlite3.Error:
+            entries = size = 0
+        return {
+            **totals,
+            "hit_rate": round((totals["hits"] + totals["revalidated"]) / lookups, 4)
+            if lookups
+            else 0.0,
+            "entries": entries,
+            "bytes": size,
+            "tools": tools,
+        }
+
+    # -- fetching -------------------------------------------------------------
+
+    def _keep(
+        self,
+        tool: str,
+        key: str,
+        result: Any,
+        ttl: float | None,
+        cacheable: Callable[[Any], bool],
+    ) -> Any:
+        fetched = result if isinstance(result, Fetched) else Fetched(result)
+        if cacheable(fetched.value):
+            self.store(tool, key, fetched.value, ttl, fetched.etag, fetched.last_modified)
+        return fetched.value
+
+    def get_or_fetch(
+        self,
+        tool: str,
+        params: Any,
+        fetch: Callable[[], Any],
+        *,
+        ttl: float | None = None,
+        revalidate: Callable[[CacheEntry], bool] | None = None,
+        cacheable: Callable[[Any], bool] = _cacheable,
+    ) -> Any:
+        """
+        The cached result of *tool* for *params*, calling *fetch* on a miss.
+
+        *fetch* returns the value, or a ``Fetched`` carrying validators.  When
+        the entry has expired but has validators, ``revalidate(entry)`` is
+        asked first; True means the origin answered 304 and the entry is kept.
+        Values rejected by *cacheable* (by default, dicts with an ``error``
+        key) are returned but not stored.
+        """
+        if not cache_enabled():
+            result = fetch()
+            return result.value if isinstance(result, Fetched) else result
+
+        key = cache_key(tool, params)
+        entry = self.lookup(key)
+        if entry is not None and entry.fresh:
+            self._count(tool, "hits")
+            return entry.value
+
+        with self._flight_lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+        if not leader:
+            self._count(tool, "coalesced")
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        try:
+            if entry is not None and revalidate is not None and entry.revalidatable:
+                try:
+                    unchanged = revalidate(entry)
+                except Exception as e:
+                    logger.debug("Revalidation failed for %s: %s", tool, e)
+                    unchanged = False
+                if unchanged:
+                    self.renew(tool, key, ttl)
+                    self._count(tool, "revalidated")
+                    flight.value = entry.value
+                    return entry.value
+            self._count(tool, "misses")
+            flight.value = self._keep(tool, key, fetch(), ttl, cacheable)
+            return flight.value
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._flight_lock:
+                del self._flights[key]
+            flight.done.set()
+
+    async def aget_or_fetch(
+        self,
+        tool: str,
+        params: Any,
+        fetch: Callable[[], Awaitable[Any]],
+        *,
+        ttl: float | None = None,
+        revalidate: Callable[[CacheEntry], Awaitable[bool]] | None = None,
+        cacheable: Callable[[Any], bool] = _cacheable,
+    ) -> Any:
+        """``get_or_fetch`` for coroutines; identical requests on one event loop share a fetch."""
+        if not cache_enabled():
+            result = await fetch()
+            return result.value if isinstance(result, Fetched) else result
+
+        key = cache_key(tool, params)
+        entry = self.lookup(key)
+        if entry is not None and entry.fresh:
+            self._count(tool, "hits")
+            return entry.value
+
+        flight_key = (id(asyncio.get_running_loop()), key)
+        while (waiter := self._async_flights.get(flight_key)) is not None:
+            self._count(tool, "coalesced")
+            try:
+                return await asyncio.shield(waiter)
+            except asyncio.CancelledError:
+                if not waiter.cancelled():
+                    raise  # this task was cancelled, not the fetch
+                # the fetching task was cancelled; take over
+
+        future = self._async_flights[flight_key] = asyncio.get_running_loop().create_future()
+        try:
+            if entry is not None and revalidate is not None and entry.revalidatable:
+                try:
+                    unchanged = await revalidate(entry)
+                except Exception as e:
+                    logger.debug("Revalidation failed for %s: %s", tool, e)
+                    unchanged = False
+                if unchanged:
+                    self.renew(tool, key, ttl)
+                    self._count(tool, "revalidated")
+                    future.set_result(entry.value)
+                    return entry.value
+            self._count(tool, "misses")
+            value = self._keep(tool, key, await fetch(), ttl, cacheable)
+            future.set_result(value)
+            return value
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # retrieved by waiters if there are any; don't log it
+            raise
+        finally:
+            del self._async_flights[flight_key]
+
+
+_cache: FetchCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_fetch_cache() -> FetchCache:
+    """The process-wide cache."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = FetchCache()
+    return _cache
+
+
+def cached(
+    tool: str,
+    *,
+    exclude: Iterable[str] = (),
+    ttl: float | None = None,
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Cache a fetch function's results under *tool*, keyed by its arguments.
+
+    Arguments named in *exclude* (API keys, ``self``) are left out of the
+    key; the function name is part of it.  Works on sync and async functions.
+    """
+    skip = set(exclude)
+
+    def decorate(fn: Callable[..., Any]) -> Callable[..., Any]:
+        signature = inspect.signature(fn)
+
+        def params(args: tuple[Any, ...], kwargs: dict[str, Any]) -> dict[str, Any]:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = {k: v for k, v in bound.arguments.items() if k not in skip}
+            return {"fn": fn.__name__, **arguments}
+
+        if inspect.iscoroutinefunction(fn):
+
+            @functools.wraps(fn)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                return await get_fetch_cache().aget_or_fetch(
+                    tool, params(args, kwargs), lambda: fn(*args, **kwargs), ttl=ttl
+                )
+
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            return get_fetch_cache().get_or_fetch(
+                tool, params(args, kwargs), lambda: fn(*args, **kwargs), ttl=ttl
+            )
+
+        return wrapper
+
+    return decorate
@@ -0,0 +1,354 @@
+"""
+Pooled HTTP clients for Aden Tools.
+
+Module-level ``httpx.get``/``httpx.post`` calls open a new connection (and
+TLS session) for every request.  This module keeps one ``httpx.Client`` per
+origin (scheme, host, port) for the life of the process, so repeated calls
+to the same API reuse keep-alive connections, and negotiate HTTP/2 when the
+optional ``h2`` package is installed.
+
+Every request goes through one retry policy:
+
+- 429 responses, and 403 responses that say the rate limit is exhausted,
+  are retried after the delay given by ``Retry-After`` or the common
+  rate-limit reset headers (falling back to exponential backoff);
+- 502/503/504 responses and connection failures are retried with backoff,
+  for idempotent methods only;
+- a server asking to wait longer than ``RetryPolicy.max_wait`` gets its
+  response returned immediately instead.
+
+Usage mirrors the httpx top-level API:
+
+    from aden_tools.utils import http_client
+
+    response = http_client.get(f"{API_BASE}/items", headers=headers, timeout=30.0)
+
+Async code can use ``await http_client.arequest("GET", url)``; async
+clients are pooled per event loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import email.utils
+import os
+import random
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+DEFAULT_TIMEOUT = httpx.Timeout(30.0, connect=10.0)
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=20,
+    max_keepalive_connections=10,
+    keepalive_expiry=60.0,
+)
+
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+# Connection-level failures where the request did not reach the server
+# (or a pooled keep-alive connection was closed under us).
+RETRY_EXCEPTIONS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.RemoteProtocolError)
+
+# Headers giving seconds to wait, checked in order
+_DELAY_HEADERS = ("retry-after", "x-ratelimit-reset-after", "ratelimit-reset")
+# Headers giving the epoch second the limit resets at
+_RESET_HEADERS = ("x-ratelimit-reset", "x-rate-limit-reset")
+
+
+def retry_after_seconds(headers: Any, now: float | None = None) -> float | None:
+    """
+    Seconds the server asked us to wait, from rate-limit headers.
+
+    Understands ``Retry-After`` (seconds or HTTP date), the
+    ``X-RateLimit-Reset-After`` / ``RateLimit-Reset`` delays and the
+    ``X-RateLimit-Reset`` epoch timestamp.  Returns None if none is usable.
+    """
+    now = time.time() if now is None else now
+    for name in _DELAY_HEADERS + _RESET_HEADERS:
+        value = headers.get(name)
+        if not isinstance(value, str) or not value.strip():
+            continue
+        try:
+            seconds = float(value)
+        except ValueError:
+            if name != "retry-after":
+                continue
+            try:
+                seconds = email.utils.parsedate_to_datetime(value).timestamp() - now
+            except (TypeError, ValueError):
+                continue
+        else:
+            if name in _RESET_HEADERS:
+                seconds -= now
+        return max(seconds, 0.0)
+    return None
+
+
+def is_rate_limited(response: httpx.Response) -> bool:
+    """True for 429s and for 403s that report an exhausted rate limit (GitHub)."""
+    if response.status_code == 429:
+        return True
+    if response.status_code == 403:
+        headers = response.headers
+        return headers.get("x-ratelimit-remaining") == "0" or "retry-after" in headers
+    return False
+
+
+@dataclass
+class RetryPolicy:
+    """When and how long to wait before retrying a request."""
+
+    max_retries: int = 2
+    backoff_base: float = 0.25
+    backoff_max: float = 8.0
+    # Longest server-requested wait honoured; longer waits return the response
+    max_wait: float = 30.0
+
+    def backoff(self, attempt: int) -> float:
+        """Exponential backoff with full jitter for retry *attempt* (0-based)."""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2**attempt))
+
+    def delay_for_response(
+        self, method: str, response: httpx.Response, attempt: int
+    ) -> float | None:
+        """Seconds to wait before retrying *response*, or None to return it."""
+        if attempt >= self.max_retries:
+            return None
+        rate_limited = is_rate_limited(response)
+        if not rate_limited:
+            if response.status_code not in RETRY_STATUSES:
+                return None
+            if method not in IDEMPOTENT_METHODS and "retry-after" not in response.headers:
+                return None
+        requested = retry_after_seconds(response.headers)
+        if requested is None:
+            return self.backoff(attempt)
+        return requested if requested <= self.max_wait else None
+
+    def delay_for_error(self, method: str, error: Exception, attempt: int) -> float | None:
+        """Seconds to wait before retrying after *error*, or None to raise it."""
+        if attempt >= self.max_retries or not isinstance(error, RETRY_EXCEPTIONS):
+            return None
+        if method not in IDEMPOTENT_METHODS and not isinstance(error, httpx.ConnectError):
+            return None
+        return self.backoff(attempt)
+
+
+def origin_of(url: str | httpx.URL) -> str:
+    """``scheme://host:port`` of *url*, the key clients are pooled by."""
+    parsed = httpx.URL(url)
+    port = parsed.port or (443 if parsed.scheme == "https" else 80)
+    return f"{parsed.scheme}://{parsed.host}:{port}"
+
+
+class HttpClientRegistry:
+    """Per-process pool of httpx clients, one per origin."""
+
+    def __init__(
+        self,
+        timeout: httpx.Timeout = DEFAULT_TIMEOUT,
+        limits: httpx.Limits = DEFAULT_LIMITS,
+        http2: bool | None = None,
+        retry: RetryPolicy | None = None,
+    ):
+        self.timeout = timeout
+        self.limits = limits
+        self.http2 = HTTP2_AVAILABLE if http2 is None else http2
+        self.retry = retry or RetryPolicy()
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        self._clients: dict[str, httpx.Client] = {}
+        self._async_clients: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[str, httpx.AsyncClient]
+        ] = weakref.WeakKeyDictionary()
+
+    def _check_fork(self) -> None:
+        # Connections must not be shared with a forked child process.
+        if os.getpid() != self._pid:
+            self._pid = os.getpid()
+            self._clients = {}
+            self._async_clients = weakref.WeakKeyDictionary()
+
+    # ------------------------------------------------------------------
+    # Clients
+    # ------------------------------------------------------------------
+
+    def client(self, url: str | httpx.URL) -> httpx.Client:
+        """The pooled sync client for *url*'s origin."""
+        key = origin_of(url)
+        with self._lock:
+            self._check_fork()
+            client = self._clients.get(key)
+            if client is None or client.is_closed:
+                client = httpx.Client(timeout=self.timeout, limits=self.limits, http2=self.http2)
+                self._clients[key] = client
+            return client
+
+    def async_client(self, url: str | httpx.URL) -> httpx.AsyncClient:
+        """The pooled async client for *url*'s origin on the running event loop."""
+        key = origin_of(url)
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            self._check_fork()
+            clients = self._async_clients.setdefault(loop, {})
+            client = clients.get(key)
+            if client is None or client.is_closed:
+                client = httpx.AsyncClient(
+                    timeout=self.timeout, limits=self.limits, http2=self.http2
+                )
+                clients[key] = client
+            return client
+
+    def close(self) -> None:
+        """Close every sync client (async clients close with ``aclose``)."""
+        with self._lock:
+            clients, self._clients = self._clients, {}
+        for client in clients.values():
+            client.close()
+
+    async def aclose(self) -> None:
+        """Close the async clients of the running event loop."""
+        with self._lock:
+            clients = self._async_clients.pop(asyncio.get_running_loop(), {})
+        for client in clients.values():
+            await client.aclose()
+
+    # ------------------------------------------------------------------
+    # Requests
+    # ------------------------------------------------------------------
+
+    def request(
+        self,
+        method: str,
+        url: str | httpx.URL,
+        *,
+        retry: RetryPolicy | None = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Send a request on the pooled client, retrying per *retry*."""
+        client = self.client(url)
+        return self._send(method, lambda: client.request(method, url, **kwargs), retry)
+
+    def get(self, url: str | httpx.URL, **kwargs: Any) -> httpx.Response:
+        return self._verb("get", url, kwargs)
+
+    def post(self, url: str | httpx.URL, **kwargs: Any) -> httpx.Response:
+        return self._verb("post", url, kwargs)
+
+    def put(self, url: str | httpx.URL, **kwargs: Any) -> httpx.Response:
+        return self._verb("put", url, kwargs)
+
+    def patch(self, url: str | httpx.URL, **kwargs: Any) -> httpx.Response:
+        return self._verb("patch", url, kwargs)
+
+    def delete(self, url: str | httpx.URL, **kwargs: Any) -> httpx.Response:
+        return self._verb("delete", url, kwargs)
+
+    def _verb(self, verb: str, url: str | httpx.URL, kwargs: dict[str, Any]) -> httpx.Response:
+        # Client.get/post/... take the same arguments as httpx.get/post/...
+        retry = kwargs.pop("retry", None)
+        send = getattr(self.client(url), verb)
+        return self._send(verb, lambda: send(url, **kwargs), retry)
+
+    def _send(self, method: str, send, retry: RetryPolicy | None) -> httpx.Response:
+        policy = retry or self.retry
+        method = method.upper()
+        attempt = 0
+        while True:
+            try:
+                response = send()
+            except httpx.HTTPError as e:
+                delay = policy.delay_for_error(method, e, attempt)
+                if delay is None:
+                    raise
+            else:
+                delay = policy.delay_for_response(method, response, attempt)
+                if delay is None:
+                    return response
+                response.close()
+            time.sleep(delay)
+            attempt += 1
+
+    async def arequest(
+        self,
+        method: str,
+        url: str | httpx.URL,
+        *,
+        retry: RetryPolicy | None = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Async ``request`` on the event loop's pooled client."""
+        policy = retry or self.retry
+        method = method.upper()
+        client = self.async_client(url)
+        attempt = 0
+        while True:
+            try:
+                response = await client.request(method, url, **kwargs)
+            except httpx.HTTPError as e:
+                delay = policy.delay_for_error(method, e, attempt)
+                if delay is None:
+                    raise
+            else:
+                delay = policy.delay_for_response(method, response, attempt)
+                if delay is None:
+                    return response
+                await response.aclose()
+            await asyncio.sleep(delay)
+            attempt += 1
+
+
+_registry: HttpClientRegistry | None = None
+_registry_lock = threading.Lock()
+
+
+def get_http_registry() -> HttpClientRegistry:
+    """The process-wide client registry."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = HttpClientRegistry()
+                atexit.register(_registry.close)
+    return _registry
+
+
+def request(method: str, url: str | httpx.URL, **kwargs: Any) -> httpx.Response:
+    return get_http_registry().request(method, url, **kwargs)
+
+
+def get(url: str | httpx.URL, **kwargs: Any) -> httpx.Response:
+    return get_http_registry().get(url, **kwargs)
+
+
+def post(url: str | httpx.URL, **kwargs: Any) -> httpx.Response:
+    return get_http_registry().post(url, **kwargs)
+
+
+def put(url: str | httpx.URL, **kwargs: Any) -> httpx.Response:
+    return get_http_registry().put(url, **kwargs)
+
+
+def patch(url: str | httpx.URL, **kwargs: Any) -> httpx.Response:
+    return get_http_registry().patch(url, **kwargs)
+
+
+def delete(url: str | httpx.URL, **kwargs: Any) -> httpx.Response:
+    return get_http_registry().delete(url, **kwargs)
+
+
+async def arequest(method: str, url: str | httpx.URL, **kwargs: Any) -> httpx.Response:
+    return await get_http_registry().arequest(method, url, **kwargs)
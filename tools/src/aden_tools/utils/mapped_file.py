@@ -0,0 +1,410 @@
+"""
+Memory-mapped data files with lazy line and JSON indexes.
+
+The data tools used to open a file, seek and read on every call, and could
+only address it by byte offset.  ``get_mapped_file`` keeps one read-only
+mmap per file, shared by every caller in the process and reused until the
+file changes, and builds two indexes the first time they are needed:
+
+- a newline index holding the byte offset of every ``STRIDE``-th line, so
+  line N is one lookup plus at most ``STRIDE`` short scans, and a byte
+  offset maps back to its line with a binary search;
+- a JSON index recording the byte span of each member of a container the
+  first time the container is visited, so ``$.items[1200].name`` parses
+  only the value it returns.  JSONL files are addressed as an array whose
+  elements are the lines.
+
+Appends made through ``append_to_file`` carry the newline index of the
+cached mapping over to the grown file, so only the new bytes are scanned.
+
+Example:
+    mapped = get_mapped_file(path)
+    text, end = mapped.read_text(0, 10_000)
+    start, stop = mapped.line_span(100, 20)
+    value = mapped.select("$.items[3].name")
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from typing import Any
+
+import numpy as np
+
+# One checkpoint per STRIDE lines
+STRIDE = 64
+MAX_OPEN = 16
+# Bytes scanned for newlines per numpy pass
+SCAN_BYTES = 16 * 1024 * 1024
+
+_NEWLINE = 0x0A
+_QUOTE, _COLON, _COMMA = 0x22, 0x3A, 0x2C
+_OPENERS = (0x7B, 0x5B)
+_CLOSERS = (0x7D, 0x5D)
+_WHITESPACE = (0x20, 0x09, 0x0A, 0x0D)
+
+# A complete string (whole, so brackets inside it are skipped) or a structural byte
+_TOKEN = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"|[\[\]{},:]')
+
+Span = tuple[int, int]
+
+
+class _LineRecords(Sequence):
+    """The lines of a JSONL file as a sequence of spans."""
+
+    def __init__(self, mapped: MappedFile):
+        self._mapped = mapped
+
+    def __len__(self) -> int:
+        return self._mapped.line_count
+
+    def __getitem__(self, index):  # type: ignore[override]
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return self._mapped._strip(*self._mapped.line_span(index, 1))
+
+
+class MappedFile:
+    """A read-only mapping of one file and its lazily built indexes."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        stat = os.fstat(self._file.fileno())
+        self.size = stat.st_size
+        self.mtime_ns = stat.st_mtime_ns
+        self.inode = stat.st_ino
+        self._map: Any = (
+            mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self.size else b""
+        )
+        self._lock = threading.Lock()
+        # Byte offset of lines 0, STRIDE, 2 * STRIDE, ...
+        self._checkpoints = np.zeros(1, dtype=np.int64)
+        self._newlines = 0
+        self._indexed_to = 0
+        self._jsonl: bool | None = None
+        self._containers: dict[int, dict[str, Span] | list[Span] | None] = {}
+
+    def unchanged(self, stat: os.stat_result) -> bool:
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino) == (
+            self.mtime_ns,
+            self.size,
+            self.inode,
+        )
+
+    def close(self) -> None:
+        try:
+            if isinstance(self._map, mmap.mmap):
+                self._map.close()
+        except BufferError:
+            pass  # still being read elsewhere; freed with the last reference
+        self._file.close()
+
+    # ------------------------------------------------------------------
+    # Bytes and text
+    # ------------------------------------------------------------------
+
+    def read(self, start: int, end: int) -> bytes:
+        return self._map[start:end]
+
+    def find(self, needle: bytes, start: int = 0) -> int:
+        return self._map.find(needle, start)
+
+    def _char_boundary(self, start: int, end: int) -> int:
+        """*end*, moved back so a UTF-8 character is not split (forward if none fits)."""
+        if end >= self.size:
+            return self.size
+        if end <= start:
+            return start
+        lead = end - 1
+        while lead > start and lead > end - 4 and self._map[lead] & 0xC0 == 0x80:
+            lead -= 1
+        first = self._map[lead]
+        width = 1 if first < 0xC0 else 2 if first < 0xE0 else 3 if first < 0xF0 else 4
+        if lead + width <= end:
+            return end
+        # Always return at least one character, or a caller paging by end never advances
+        return lead if lead > start else min(self.size, lead + width)
+
+    def read_text(self, offset: int, limit: int) -> tuple[str, int]:
+        """Decode up to *limit* bytes from *offset*; returns ``(text, end offset)``."""
+        end = self._char_boundary(offset, min(self.size, offset + max(0, limit)))
+        return self._map[offset:end].decode("utf-8"), end
+
+    # ------------------------------------------------------------------
+    # Line index
+    # ------------------------------------------------------------------
+
+    def _index_lines(self) -> None:
+        with self._lock:
+            if self._indexed_to >= self.size:
+                return
+            data = np.frombuffer(self._map, dtype=np.uint8)
+            try:
+                picks = [self._checkpoints]
+                count = self._newlines
+                pos = self._indexed_to
+                while pos < self.size:
+                    stop = min(self.size, pos + SCAN_BYTES)
+                    newlines = np.flatnonzero(data[pos:stop] == _NEWLINE) + pos
+                    # Line k * STRIDE starts after newline number k * STRIDE
+                    first = -(count + 1) % STRIDE
+                    picks.append(newlines[first::STRIDE] + 1)
+                    count += len(newlines)
+                    pos = stop
+            finally:
+                del data  # the mapping cannot be closed while a view exists
+            self._checkpoints = np.concatenate(picks)
+            self._newlines = count
+            self._indexed_to = self.size
+
+    @property
+    def line_count(self) -> int:
+        """Number of lines; a final newline does not start another line."""
+        self._index_lines()
+        if self.size and self._map[self.size - 1] != _NEWLINE:
+            return self._newlines + 1
+        return self._newlines
+
+    def line_offset(self, line: int) -> int:
+        """Byte offset where 0-based *line* starts (the file size past the last line)."""
+        if line >= self.line_count:
+            return self.size
+        pos = int(self._checkpoints[line // STRIDE])
+        for _ in range(line % STRIDE):
+            pos = self._map.find(b"\n", pos) + 1
+        return pos
+
+    def line_span(self, line: int, count: int) -> Span:
+        """Byte range of *count* lines starting at 0-based *line*, newlines included."""
+        start = self.line_offset(line)
+        if count > STRIDE:
+            return start, self.line_offset(line + count)
+        end = start
+        for _ in range(count):
+            newline = self._map.find(b"\n", end)
+            if newline < 0:
+                return start, self.size
+            end = newline + 1
+        return start, end
+
+    def line_at(self, offset: int) -> int:
+        """0-based line containing byte *offset*."""
+        self._index_lines()
+        block = int(np.searchsorted(self._checkpoints, offset, side="right")) - 1
+        line = block * STRIDE
+        pos = int(self._checkpoints[block])
+        while True:
+            newline = self._map.find(b"\n", pos, offset)
+            if newline < 0:
+                return line
+            line += 1
+            pos = newline + 1
+
+    # ------------------------------------------------------------------
+    # JSON index
+    # ------------------------------------------------------------------
+
+    def _strip(self, start: int, end: int) -> Span:
+        while start < end and self._map[start] in _WHITESPACE:
+            start += 1
+        while end > start and self._map[end - 1] in _WHITESPACE:
+            end -= 1
+        return start, end
+
+    def _is_jsonl(self) -> bool:
+        if self._jsonl is None:
+            self._jsonl = False
+            if self.line_count > 1:
+                start, end = self._strip(*self.line_span(0, 1))
+                if end > start and self._map[start] in _OPENERS:
+                    try:
+                        json.loads(self._map[start:end])
+                        self._jsonl = True
+                    except ValueError:
+                        pass
+        return self._jsonl
+
+    def _scan_container(self, span: Span) -> dict[str, Span] | list[Span] | None:
+        """Byte spans of the members of the object or array at *span*."""
+        start, end = span
+        if end <= start or self._map[start] not in _OPENERS:
+            return None
+        is_object = self._map[start] == _OPENERS[0]
+        members: dict[str, Span] | list[Span] = {} if is_object else []
+        depth = 0
+        key: str | None = None
+        item_start = start + 1
+        for token in _TOKEN.finditer(self._map, start, end):
+            pos = token.start()
+            char = self._map[pos]
+            if char == _QUOTE:
+                if depth == 1 and is_object and key is None:
+                    key = json.loads(token.group())
+                continue
+            if char in _OPENERS:
+                depth += 1
+            elif char in _CLOSERS:
+                depth -= 1
+                if depth == 0:
+                    self._add_member(members, key, item_start, pos)
+                    break
+            elif depth == 1:
+                if char == _COLON:
+                    item_start = token.end()
+                elif char == _COMMA:
+                    self._add_member(members, key, item_start, pos)
+                    item_start = token.end()
+                    key = None
+        return members
+
+    def _add_member(
+        self, members: dict[str, Span] | list[Span], key: str | None, start: int, end: int
+    ) -> None:
+        span = self._strip(start, end)
+        if span[0] == span[1]:
+            return
+        if isinstance(members, dict):
+            if key is not None:
+                members[key] = span
+        else:
+            members.append(span)
+
+    def _members(self, span: Span) -> dict[str, Span] | Sequence[Span] | None:
+        if span == (-1, -1):
+            return _LineRecords(self)
+        with self._lock:
+            if span[0] in self._containers:
+                return self._containers[span[0]]
+        members = self._scan_container(span)
+        with self._lock:
+            self._containers[span[0]] = members
+        return members
+
+    def _root(self) -> Span:
+        if self._is_jsonl():
+            return (-1, -1)
+        root = self._strip(0, self.size)
+        if root[0] == root[1] or self._map[root[0]] not in _OPENERS:
+            raise ValueError("File is not a JSON object, JSON array or JSONL")
+        return root
+
+    def parse(self, span: Span) -> Any:
+        if span == (-1, -1):
+            return [json.loads(self._map[s:e]) for s, e in _LineRecords(self)]
+        return json.loads(self._map[span[0] : span[1]])
+
+    def select_spans(self, json_path: str) -> tuple[list[Span], bool]:
+        """Spans matched by *json_path*, and whether a wildcard or slice fanned out."""
+        from framework.graph.spillover import parse_json_path
+
+        spans = [self._root()]
+        fanned_out = False
+        for step in parse_json_path(json_path):
+            matched: list[Span] = []
+            for span in spans:
+                members = self._members(span)
+                if members is None:
+                    continue
+                if isinstance(step, slice):
+                    fanned_out = True
+                    if isinstance(members, dict):
+                        if step == slice(None):
+                            matched.extend(members.values())
+                    else:
+                        matched.extend(members[step])
+                elif isinstance(members, dict):
+                    if step in members:
+                        matched.append(members[step])
+                elif step.lstrip("-").isdigit():
+                    index = int(step)
+                    if -len(members) <= index < len(members):
+                        matched.append(members[index])
+            spans = matched
+            if not spans:
+                raise KeyError(f"json_path '{json_path}' matched nothing")
+        return spans, fanned_out
+
+    def select(self, json_path: str) -> Any:
+        """
+        Value at *json_path* (keys, ``[n]``, ``[a:b]``, ``[*]``), parsing only
+        what is returned.  A wildcard or slice makes the result a list.
+        """
+        spans, fanned_out = self.select_spans(json_path)
+        values = [self.parse(span) for span in spans]
+        return values if fanned_out else values[0]
+
+
+_open: OrderedDict[str, MappedFile] = OrderedDict()
+_open_lock = threading.Lock()
+
+
+def _remember(mapped: MappedFile) -> None:
+    with _open_lock:
+        _open[mapped.path] = mapped
+        _open.move_to_end(mapped.path)
+        while len(_open) > MAX_OPEN:
+            _open.popitem(last=False)  # closed when its last reader lets go
+
+
+def get_mapped_file(path: str | os.PathLike) -> MappedFile:
+    """The shared mapping of *path*, remapped when the file has changed."""
+    real = os.path.realpath(path)
+    stat = os.stat(real)
+    with _open_lock:
+        mapped = _open.get(real)
+        if mapped is not None and mapped.unchanged(stat):
+            _open.move_to_end(real)
+            return mapped
+    mapped = MappedFile(real)
+    _remember(mapped)
+    return mapped
+
+
+def invalidate_mapped_file(path: str | os.PathLike) -> None:
+    """Drop and close the mapping of *path*; call before rewriting or replacing it."""
+    real = os.path.realpath(path)
+    with _open_lock:
+        mapped = _open.pop(real, None)
+    if mapped is not None:
+        mapped.close()
+
+
+def append_to_file(path: str | os.PathLike, data: bytes) -> int:
+    """
+    Append *data* to *path* (creating it) and return the new size.
+
+    If the file was mapped and unchanged until this append, the new mapping
+    keeps the old newline index and only the appended bytes are scanned.
+    """
+    real = os.path.realpath(path)
+    with _open_lock:
+        previous = _open.get(real)
+    try:
+        before = os.stat(real)
+    except FileNotFoundError:
+        before = None
+    with open(real, "ab") as f:
+        f.write(data)
+    if previous is None or before is None or not previous.unchanged(before):
+        invalidate_mapped_file(real)
+        return os.path.getsize(real)
+
+    mapped = MappedFile(real)
+    with previous._lock:
+        if previous._indexed_to == previous.size:
+            mapped._checkpoints = previous._checkpoints
+            mapped._newlines = previous._newlines
+            mapped._indexed_to = previous._indexed_to
+    _remember(mapped)
+    return mapped.size
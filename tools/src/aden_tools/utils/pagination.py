@@ -0,0 +1,197 @@
+"""
+Pagination helpers for "fetch up to N items" tool variants.
+
+List endpoints return one page per call, so an agent that needs 500 items
+spends a turn per page.  These helpers walk the pages inside one tool call:
+
+- ``paginate_numbered`` prefetches page-number APIs (``page``/``per_page``)
+  concurrently, a few pages ahead, and yields them in order;
+- ``paginate_cursor`` pipelines cursor APIs (``cursor``, ``starting_after``,
+  ``after``): the next page is requested as soon as its cursor is known,
+  while the caller is still handling the current one;
+- ``collect_pages`` stops at ``max_items`` and, when a ``data_dir`` is
+  available, streams items to a JSONL file there (readable with
+  ``load_data``) so only a short summary and preview enter the conversation.
+
+Example:
+    def fetch(page: int) -> Page:
+        result = client.list_issues(owner, repo, page=page, limit=100)
+        if "error" in result:
+            return Page(error=result["error"])
+        return Page(items=result["data"])
+
+    pages = paginate_numbered(fetch, page_size=100, max_items=max_items)
+    return collect_pages(pages, max_items, data_dir, "github_issues.jsonl")
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+DEFAULT_MAX_ITEMS = 500
+DEFAULT_CONCURRENCY = 4
+PREVIEW_ITEMS = 5
+
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^A-Za-z0-9._-]+")
+
+
+@dataclass
+class Page:
+    """One page of a list endpoint."""
+
+    items: list[Any] = field(default_factory=list)
+    # Cursor for the next page; None when this is the last page
+    next: Any = None
+    error: str | None = None
+
+
+def paginate_numbered(
+    fetch: Callable[[int], Page],
+    page_size: int,
+    max_items: int = DEFAULT_MAX_ITEMS,
+    first_page: int = 1,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> Iterator[Page]:
+    """
+    Yield pages of a page-number API in order, prefetching concurrently.
+
+    Up to *concurrency* pages are in flight at once.  Iteration ends after
+    a short (or empty) page, an error page, or once *max_items* items have
+    been yielded; prefetched pages past the end are discarded.
+    """
+    last_page = first_page + max(-(-max_items // max(page_size, 1)), 1) - 1
+    with ThreadPoolExecutor(max_workers=max(concurrency, 1)) as pool:
+        in_flight: deque[Future[Page]] = deque()
+        next_page = first_page
+        try:
+            while True:
+                while len(in_flight) < max(concurrency, 1) and next_page <= last_page:
+                    in_flight.append(pool.submit(fetch, next_page))
+                    next_page += 1
+                if not in_flight:
+                    return
+                number = next_page - len(in_flight)
+                page = in_flight.popleft().result()
+                full = not page.error and len(page.items) >= page_size
+                if full and page.next is None:
+                    page.next = number + 1
+                yield page
+                if not full:
+                    return
+        finally:
+            for future in in_flight:
+                future.cancel()
+
+
+def paginate_cursor(
+    fetch: Callable[[Any], Page],
+    max_items: int = DEFAULT_MAX_ITEMS,
+) -> Iterator[Page]:
+    """
+    Yield pages of a cursor API, fetching the next page while the caller
+    handles the current one.  The first call gets ``None`` as its cursor.
+    """
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        future: Future[Page] | None = pool.submit(fetch, None)
+        seen = 0
+        try:
+            while future is not None:
+                page = future.result()
+                seen += len(page.items)
+                future = None
+                if not page.error and page.next is not None and page.items and seen < max_items:
+                    future = pool.submit(fetch, page.next)
+                yield page
+        finally:
+            if future is not None:
+                future.cancel()
+
+
+def safe_filename(*parts: str, suffix: str = ".jsonl") -> str:
+    """A data_dir filename built from *parts* (e.g. tool name and resource)."""
+    stem = "_".join(_UNSAFE_FILENAME_CHARS.sub("-", p).strip("-") for p in parts if p)
+    return f"{stem or 'items'}_{int(time.time())}{suffix}"
+
+
+def collect_pages(
+    pages: Iterable[Page],
+    max_items: int = DEFAULT_MAX_ITEMS,
+    data_dir: str = "",
+    filename: str = "",
+) -> dict[str, Any]:
+    """
+    Gather up to *max_items* items from *pages*.
+
+    With a *data_dir*, items are written one JSON object per line to
+    ``data_dir/filename`` as pages arrive, and the result holds the count,
+    the filename and a short preview.  Without one, the items are returned
+    inline.  An error on the first page is returned as the tool's error; a
+    later error is reported alongside the items fetched so far.
+    """
+    items: list[Any] = []
+    count = 0
+    page_count = 0
+    has_more = False
+    error: str | None = None
+    out = None
+    path: Path | None = None
+    if data_dir:
+        path = Path(data_dir) / (filename or safe_filename("items"))
+    try:
+        for page in pages:
+            if page.error:
+                error = page.error
+                break
+            page_count += 1
+            room = max_items - count
+            batch = page.items[:room]
+            if path is not None:
+                if out is None:
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    out = path.open("w", encoding="utf-8")
+                for item in batch:
+                    out.write(json.dumps(item, default=str) + "\n")
+                if len(items) < PREVIEW_ITEMS:
+                    items.extend(batch[: PREVIEW_ITEMS - len(items)])
+            else:
+                items.extend(batch)
+            count += len(batch)
+            if count >= max_items:
+                has_more = len(page.items) > room or page.next is not None
+                break
+    finally:
+        if out is not None:
+            out.close()
+
+    if error and count == 0:
+        return {"error": error}
+
+    result: dict[str, Any] = {
+        "success": True,
+        "count": count,
+        "pages": page_count,
+        "has_more": has_more,
+    }
+    if path is not None:
+        if out is None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("", encoding="utf-8")
+        result["filename"] = path.name
+        result["preview"] = items
+        result["hint"] = (
+            f"All {count} items were saved one JSON object per line; "
+            f"read them with load_data(filename='{path.name}')"
+        )
+    else:
+        result["items"] = items
+    if error:
+        result["error"] = f"Stopped after {count} items: {error}"
+    return result
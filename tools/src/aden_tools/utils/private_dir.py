@@ -0,0 +1,37 @@
+"""
+Per-user private directories under the temp directory.
+
+The on-disk caches (fetched pages, extracted PDF text, converted workbooks,
+CSV offset indexes, Parquet copies) hold the contents of the user's files
+and are trusted when read back.  A shared, predictably named directory in
+``/tmp`` would let other local users read that data or plant entries, so
+each cache lives in a directory suffixed with the user's uid, created with
+mode 0o700 and refused when it is owned by someone else.
+
+Example:
+    CACHE_DIR = user_temp_dir("aden_pdf_cache")
+    make_private_dir(CACHE_DIR)  # raises PermissionError if another user owns it
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+
+
+def user_temp_dir(name: str) -> str:
+    """``<tempdir>/<name>-<uid>`` (just ``<name>`` where there are no uids)."""
+    suffix = f"-{os.getuid()}" if hasattr(os, "getuid") else ""
+    return os.path.join(tempfile.gettempdir(), f"{name}{suffix}")
+
+
+def make_private_dir(path: str) -> None:
+    """Create *path* readable only by the current user, or refuse to use it."""
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    if not hasattr(os, "getuid"):
+        return
+    st = os.stat(path)
+    if st.st_uid != os.getuid():
+        raise PermissionError(f"{path} is owned by another user")
+    if st.st_mode & 0o077:
+        os.chmod(path, 0o700)
@@ -0,0 +1,318 @@
+"""
+Session-scoped DuckDB query engine for the CSV and Excel SQL tools.
+
+Agents usually run several queries against the same file.  Instead of
+opening a fresh DuckDB connection and re-parsing the file on every call,
+each session keeps one engine whose tables are cached by file path and
+reused until the file's mtime or size changes:
+
+- CSV files up to ``MATERIALIZE_MAX_BYTES`` are parsed once into an
+  in-memory table; larger ones are converted once to Parquet in a private per-user
+  cache directory (see ``aden_tools.utils.private_dir``) and queried
+  through a view, so only the columns and row groups
+  a query touches are read;
+- other formats (Excel sheets) are loaded by a caller-supplied loader.
+
+Each query runs on its own cursor with temporary views (``data``, sheet
+names) pointing at the cached tables, and results are streamed within a
+row and byte budget.  Rows past the budget are written to a JSONL file in
+``data_dir`` when one is given, instead of entering the conversation.
+
+Example:
+    engine = get_query_engine(f"{workspace_id}/{agent_id}/{session_id}")
+    tables = engine.csv_tables(secure_path)
+    result = engine.query("SELECT COUNT(*) FROM data", tables, data_dir=data_dir)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from .pagination import safe_filename
+from .private_dir import make_private_dir, user_temp_dir
+
+DEFAULT_MAX_ROWS = 1000
+# Approximate JSON size of the rows returned inline
+DEFAULT_MAX_BYTES = 256 * 1024
+# CSVs larger than this are converted to Parquet instead of loaded in memory
+MATERIALIZE_MAX_BYTES = 256 * 1024 * 1024
+MAX_CACHED_FILES = 16
+MAX_SESSIONS = 8
+FETCH_BATCH_ROWS = 2048
+
+# Parquet copies of user files: one directory per user, one subdirectory per session
+DEFAULT_CACHE_DIR = user_temp_dir("aden_query_cache")
+
+# (connection, table name prefix) -> {alias: table name}
+TableLoader = Callable[[Any, str], dict[str, str]]
+
+
+def file_signature(path: str) -> tuple[str, int, int]:
+    """(real path, mtime in ns, size) - cached tables are reused while it matches."""
+    real = os.path.realpath(path)
+    stat = os.stat(real)
+    return real, stat.st_mtime_ns, stat.st_size
+
+
+def _quote_ident(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _quote_literal(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
+
+
+def single_select_error(sql: str) -> str | None:
+    """
+    Error message unless *sql* is exactly one SELECT statement.
+
+    Engines are reused across calls, so a trailing ``SET``/``ATTACH``
+    statement would otherwise outlive the query.
+    """
+    import duckdb
+
+    try:
+        statements = duckdb.extract_statements(sql)
+    except duckdb.Error as e:
+        return f"Query failed: {e}"
+    if len(statements) != 1:
+        return "Only a single SELECT statement is allowed"
+    if statements[0].type != duckdb.StatementType.SELECT:
+        return "Only SELECT queries are allowed for security reasons"
+    return None
+
+
+@dataclass
+class _CachedFile:
+    signature: tuple[str, int, int]
+    # Table names start with this; so do any files written to the cache dir
+    prefix: str
+    tables: dict[str, str]
+
+
+class QueryEngine:
+    """One DuckDB database plus the tables loaded into it, keyed by file."""
+
+    def __init__(
+        self,
+        cache_dir: str | None = None,
+        materialize_max_bytes: int = MATERIALIZE_MAX_BYTES,
+        max_files: int = MAX_CACHED_FILES,
+    ):
+        import duckdb
+
+        self._con = duckdb.connect(":memory:")
+        self.cache_dir = cache_dir or DEFAULT_CACHE_DIR
+        self.materialize_max_bytes = materialize_max_bytes
+        self.max_files = max_files
+        self._files: OrderedDict[str, _CachedFile] = OrderedDict()
+        self._lock = threading.RLock()
+        self.loads = 0  # files parsed so far (cache misses)
+
+    # ------------------------------------------------------------------
+    # Tables
+    # ------------------------------------------------------------------
+
+    def tables(self, path: str, loader: TableLoader, variant: str = "") -> dict[str, str]:
+        """
+        Cached ``{alias: table}`` for *path*, calling *loader* when the file
+        is new or has changed.  *variant* separates loads of the same file
+        with different options.
+        """
+        signature = file_signature(path)
+        key = f"{signature[0]}\0{variant}"
+        with self._lock:
+            cached = self._files.get(key)
+            if cached is not None and cached.signature == signature:
+                self._files.move_to_end(key)
+                return dict(cached.tables)
+            if cached is not None:
+                self._drop(self._files.pop(key))
+
+            digest = hashlib.sha256(repr((key, signature)).encode()).hexdigest()[:12]
+            prefix = f"t_{digest}"
+            tables = loader(self._con, prefix)
+            self.loads += 1
+            self._files[key] = _CachedFile(signature, prefix, tables)
+            while len(self._files) > self.max_files:
+                self._drop(self._files.popitem(last=False)[1])
+            return dict(tables)
+
+    def csv_tables(self, path: str) -> dict[str, str]:
+        """``{"data": table}`` for a CSV file, parsed once per version of the file."""
+        return self.tables(path, lambda con, prefix: self._load_csv(con, prefix, path))
+
+    def _load_csv(self, con: Any, prefix: str, path: str) -> dict[str, str]:
+        source = f"read_csv_auto({_quote_literal(os.path.realpath(path))})"
+        if os.path.getsize(path) <= self.materialize_max_bytes:
+            con.execute(f"CREATE TABLE {prefix} AS SELECT * FROM {source}")
+        else:
+            self._make_cache_dir()
+            parquet = os.path.join(self.cache_dir, f"{prefix}.parquet")
+            con.execute(
+                f"COPY (SELECT * FROM {source}) TO {_quote_literal(parquet)} (FORMAT PARQUET)"
+            )
+            con.execute(
+                f"CREATE VIEW {prefix} AS SELECT * FROM read_parquet({_quote_literal(parquet)})"
+            )
+        return {"data": prefix}
+
+    def _make_cache_dir(self) -> None:
+        """Create the cache dir (and the default parent of session dirs) private to this user."""
+        if os.path.dirname(self.cache_dir) == DEFAULT_CACHE_DIR:
+            make_private_dir(DEFAULT_CACHE_DIR)
+        make_private_dir(self.cache_dir)
+
+    def _drop(self, cached: _CachedFile) -> None:
+        for table in set(cached.tables.values()):
+            row = self._con.execute(
+                "SELECT table_type FROM information_schema.tables WHERE table_name = ?", [table]
+            ).fetchone()
+            if row is not None:
+                kind = "VIEW" if row[0] == "VIEW" else "TABLE"
+                self._con.execute(f"DROP {kind} {_quote_ident(table)}")
+        self._remove_cache_files(cached.prefix)
+
+    def _remove_cache_files(self, prefix: str) -> None:
+        for cached_file in Path(self.cache_dir).glob(f"{prefix}*"):
+            cached_file.unlink(missing_ok=True)
+
+    def close(self) -> None:
+        with self._lock:
+            for cached in self._files.values():
+                self._remove_cache_files(cached.prefix)
+            self._files.clear()
+            self._con.close()
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def query(
+        self,
+        sql: str,
+        tables: dict[str, str],
+        max_rows: int = DEFAULT_MAX_ROWS,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        data_dir: str = "",
+        spill_name: str = "query",
+    ) -> dict[str, Any]:
+        """
+        Run *sql* with each alias in *tables* bound to its cached table.
+
+        Returns ``columns``, ``rows`` (at most *max_rows* rows and roughly
+        *max_bytes* of JSON) and ``row_count``.  When the result is larger,
+        ``truncated`` is set; with a *data_dir* every row is also written to
+        a JSONL file there and ``total_rows``/``filename`` are reported.
+        """
+        cursor = self._con.cursor()
+        try:
+            for alias, table in tables.items():
+                cursor.execute(
+                    f"CREATE OR REPLACE TEMP VIEW {_quote_ident(alias)} "
+                    f"AS SELECT * FROM {_quote_ident(table)}"
+                )
+            result = cursor.execute(sql)
+            columns = [desc[0] for desc in result.description]
+            return self._stream(result, columns, max_rows, max_bytes, data_dir, spill_name)
+        finally:
+            cursor.close()
+
+    def _stream(
+        self,
+        result: Any,
+        columns: list[str],
+        max_rows: int,
+        max_bytes: int,
+        data_dir: str,
+        spill_name: str,
+    ) -> dict[str, Any]:
+        rows: list[dict[str, Any]] = []
+        size = 0
+        total = 0
+        truncated = False
+        spill = None
+        spill_path = None
+        try:
+            while batch := result.fetchmany(FETCH_BATCH_ROWS):
+                for values in batch:
+                    row = dict(zip(columns, values, strict=False))
+                    total += 1
+                    if spill is not None:
+                        spill.write(json.dumps(row, default=str) + "\n")
+                        continue
+                    line = json.dumps(row, default=str)
+                    if len(rows) < max_rows and size + len(line) <= max_bytes:
+                        rows.append(row)
+                        size += len(line) + 2
+                        continue
+                    truncated = True
+                    if not data_dir:
+                        break
+                    spill_path = Path(data_dir) / safe_filename(spill_name)
+                    spill_path.parent.mkdir(parents=True, exist_ok=True)
+                    spill = spill_path.open("w", encoding="utf-8")
+                    for kept in rows:
+                        spill.write(json.dumps(kept, default=str) + "\n")
+                    spill.write(line + "\n")
+                if truncated and spill is None:
+                    break
+        finally:
+            if spill is not None:
+                spill.close()
+
+        output: dict[str, Any] = {
+            "columns": columns,
+            "column_count": len(columns),
+            "rows": rows,
+            "row_count": len(rows),
+        }
+        if truncated:
+            output["truncated"] = True
+            if spill_path is not None:
+                output["total_rows"] = total
+                output["filename"] = spill_path.name
+                output["hint"] = (
+                    f"Showing {len(rows)} of {total} rows; all rows were saved one JSON "
+                    f"object per line, read them with load_data(filename='{spill_path.name}')"
+                )
+            else:
+                output["hint"] = (
+                    f"Showing the first {len(rows)} rows; add LIMIT, filters or "
+                    "aggregates to narrow the result"
+                )
+        return output
+
+
+_engines: OrderedDict[str, QueryEngine] = OrderedDict()
+_engines_lock = threading.Lock()
+
+
+def get_query_engine(session_key: str) -> QueryEngine:
+    """The engine for one session; the least recently used sessions are closed."""
+    with _engines_lock:
+        engine = _engines.get(session_key)
+        if engine is None:
+            engine = QueryEngine(
+                cache_dir=os.path.join(DEFAULT_CACHE_DIR, _session_dir(session_key))
+            )
+            _engines[session_key] = engine
+            while len(_engines) > MAX_SESSIONS:
+                _, evicted = _engines.popitem(last=False)
+                evicted.close()
+                shutil.rmtree(evicted.cache_dir, ignore_errors=True)
+        _engines.move_to_end(session_key)
+        return engine
+
+
+def _session_dir(session_key: str) -> str:
+    return hashlib.sha256(session_key.encode()).hexdigest()[:16]
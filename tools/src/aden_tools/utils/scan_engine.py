@@ -0,0 +1,165 @@
+"""
+Async scanning engine shared by the security scanning tools.
+
+The scanners (ports, SSL/TLS, DNS, subdomains) all do many small network
+operations against one or many hosts.  This module gives them:
+
+- ``clean_hostname``: the host part of whatever the agent passed in;
+- ``resolve_host``: cached name resolution that does not block the event
+  loop (see ``dns_resolver``);
+- ``AdaptiveLimiter``: a concurrency limit that grows while operations
+  succeed and is halved (at most once per window) when they hit local
+  resource limits (too many open files, no buffer space) or the target
+  starts resetting connections, instead of a hard-coded semaphore;
+- ``scan_hosts``: runs a scan over a batch of hosts and yields each host's
+  result as soon as it is done, so callers can stream results onward.
+
+Example:
+    limiter = AdaptiveLimiter(initial=50, maximum=500)
+    async for host, result in scan_hosts(hosts, lambda h: scan_ports(h, limiter=limiter)):
+        ...
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import errno
+import socket
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from typing import Any
+
+from .dns_resolver import get_resolver
+
+# Errors that mean "slow down" rather than "the port is closed"
+CONGESTION_ERRNOS = frozenset(
+    {
+        errno.EMFILE,
+        errno.ENFILE,
+        errno.ENOBUFS,
+        errno.EAGAIN,
+        errno.EADDRNOTAVAIL,
+        errno.ECONNRESET,
+    }
+)
+
+DEFAULT_HOST_CONCURRENCY = 10
+
+
+def clean_hostname(value: str) -> str:
+    """Strip scheme, path and port from a URL or ``host:port`` string."""
+    host = value.strip().replace("https://", "").replace("http://", "").strip("/")
+    host = host.split("/")[0]
+    if ":" in host:
+        host = host.split(":")[0]
+    return host.lower()
+
+
+def is_congestion(error: BaseException) -> bool:
+    """True for OS errors that signal local or remote overload."""
+    return isinstance(error, OSError) and error.errno in CONGESTION_ERRNOS
+
+
+async def resolve_host(hostname: str, family: int = socket.AF_INET) -> str:
+    """
+    First address of *hostname*, resolved without blocking the event loop
+    and cached for its TTL by the shared ``DnsResolver``.
+
+    Raises ``socket.gaierror`` when the name does not resolve.
+    """
+    return await get_resolver().address(hostname, family)
+
+
+async def resolve_all(hostnames: Iterable[str], limit: int = 50) -> dict[str, str | None]:
+    """Resolve many names concurrently; unresolvable names map to None."""
+    semaphore = asyncio.Semaphore(limit)
+
+    async def resolve(name: str) -> str | None:
+        async with semaphore:
+            try:
+                return await resolve_host(name)
+            except (OSError, UnicodeError):
+                return None
+
+    names = list(dict.fromkeys(hostnames))
+    addresses = await asyncio.gather(*(resolve(name) for name in names))
+    return dict(zip(names, addresses, strict=True))
+
+
+class AdaptiveLimiter:
+    """
+    AIMD concurrency limit for network probes.
+
+    Every ``limit`` successful operations raise the limit by one, up to
+    ``maximum``; a congestion signal halves it, down to ``minimum``.  Only
+    operations started after the last decrease can trigger the next one, so
+    a burst of failures from one window counts once.
+    """
+
+    def __init__(self, initial: int = 20, minimum: int = 1, maximum: int = 200):
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.limit = min(max(initial, self.minimum), self.maximum)
+        self.peak = 0
+        self.decreases = 0
+        self._active = 0
+        self._successes = 0
+        self._window = 0
+        self._condition = asyncio.Condition()
+
+    @contextlib.asynccontextmanager
+    async def slot(self) -> AsyncIterator[int]:
+        """Wait for a free slot; yields the window to report the outcome against."""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._active < self.limit)
+            self._active += 1
+            self.peak = max(self.peak, self._active)
+        try:
+            yield self._window
+        finally:
+            async with self._condition:
+                self._active -= 1
+                self._condition.notify_all()
+
+    def success(self) -> None:
+        self._successes += 1
+        if self._successes >= self.limit and self.limit < self.maximum:
+            self.limit += 1
+            self._successes = 0
+
+    def congestion(self, window: int) -> None:
+        if window != self._window:
+            return
+        self._window += 1
+        self._successes = 0
+        self.decreases += 1
+        self.limit = max(self.minimum, self.limit // 2)
+
+
+async def scan_hosts(
+    hosts: Iterable[str],
+    scan: Callable[[str], Awaitable[Any]],
+    concurrency: int = DEFAULT_HOST_CONCURRENCY,
+) -> AsyncIterator[tuple[str, Any]]:
+    """
+    Run ``scan(host)`` for every host, at most *concurrency* at a time.
+
+    Yields ``(host, result)`` in completion order.  A scan that raises
+    yields ``{"error": ...}`` for its host instead of ending the batch.
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def run(host: str) -> tuple[str, Any]:
+        async with semaphore:
+            try:
+                return host, await scan(host)
+            except Exception as e:
+                return host, {"error": f"Scan failed: {e}"}
+
+    tasks = [asyncio.ensure_future(run(host)) for host in dict.fromkeys(hosts)]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
@@ -8,6 +8,18 @@
 from aden_tools.credentials import CredentialStoreAdapter
 
 
+@pytest.fixture(autouse=True)
+def no_fetch_cache(monkeypatch):
+    """Bypass the shared fetch cache so mocked responses never leak between tests."""
+    monkeypatch.setenv("ADEN_FETCH_CACHE", "0")
+
+
+@pytest.fixture(autouse=True)
+def fresh_dns_resolver(monkeypatch):
+    """Give each test an empty DNS cache."""
+    monkeypatch.setattr("aden_tools.utils.dns_resolver._resolver", None)
+
+
 @pytest.fixture
 def mcp() -> FastMCP:
     """Create a fresh FastMCP instance for testing."""
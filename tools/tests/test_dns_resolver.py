@@ -0,0 +1,291 @@
+"""Tests for the shared caching DNS resolver, against a local stub nameserver."""
+
+from __future__ import annotations
+
+import asyncio
+import socket
+
+import dns.message
+import dns.rcode
+import dns.rdatatype
+import dns.resolver
+import dns.rrset
+import httpx
+import pytest
+
+from aden_tools.tools.dns_security_scanner.dns_security_scanner import scan_dns
+from aden_tools.utils.dns_resolver import DnsResolver, resolving_transport
+
+SOA = "ns1.example.test. admin.example.test. 1 3600 600 86400 30"
+
+
+class StubNameserver(asyncio.DatagramProtocol):
+    """
+    Answers from ``records``: ``(name, type) -> (ttl, [rdata, ...])``.
+
+    Unknown names get NXDOMAIN, known names asked for another type get an
+    empty answer; both carry the zone's SOA when ``soa`` is set.
+    """
+
+    def __init__(self, records, soa=SOA):
+        self.records = records
+        self.soa = soa
+        self.queries: list[tuple[str, str]] = []
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, data, addr):
+        query = dns.message.from_wire(data)
+        question = query.question[0]
+        key = (str(question.name).rstrip("."), dns.rdatatype.to_text(question.rdtype))
+        self.queries.append(key)
+        response = dns.message.make_response(query)
+        if key in self.records:
+            ttl, rdatas = self.records[key]
+            response.answer.append(dns.rrset.from_text(question.name, ttl, "IN", key[1], *rdatas))
+        else:
+            if not any(name == key[0] for name, _ in self.records):
+                response.set_rcode(dns.rcode.NXDOMAIN)
+            if self.soa:
+                response.authority.append(
+                    dns.rrset.from_text("example.test.", 300, "IN", "SOA", self.soa)
+                )
+        self.transport.sendto(response.to_wire(), addr)
+
+
+@pytest.fixture
+async def nameserver():
+    servers = []
+
+    async def start(records, soa=SOA):
+        loop = asyncio.get_running_loop()
+        transport, server = await loop.create_datagram_endpoint(
+            lambda: StubNameserver(records, soa), local_addr=("127.0.0.1", 0)
+        )
+        servers.append(transport)
+        resolver = DnsResolver(["127.0.0.1"], transport.get_extra_info("sockname")[1], 2.0)
+        return server, resolver
+
+    yield start
+    for transport in servers:
+        transport.close()
+
+
+class SystemHosts(dict):
+    """Stands in for the system resolver: a hosts table that records lookups."""
+
+    def __init__(self):
+        super().__init__()
+        self.lookups: list[str] = []
+
+    async def getaddrinfo(self, host, port, *, family=0, type=0, proto=0, flags=0):
+        self.lookups.append(host)
+        if host not in self:
+            raise socket.gaierror(socket.EAI_NONAME, "Name or service not known")
+        return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", (self[host], 0))]
+
+
+@pytest.fixture
+async def system_hosts(monkeypatch):
+    hosts = SystemHosts()
+    monkeypatch.setattr(asyncio.get_running_loop(), "getaddrinfo", hosts.getaddrinfo)
+    return hosts
+
+
+class TestCaching:
+    async def test_answers_are_cached(self, nameserver):
+        server, resolver = await nameserver({("www.example.test", "A"): (300, ["192.0.2.1"])})
+
+        first = await resolver.resolve("www.example.test", "A")
+        second = await resolver.resolve("WWW.example.test.", "a")
+
+        assert first[0].address == second[0].address == "192.0.2.1"
+        assert server.queries == [("www.example.test", "A")]
+        assert resolver.stats()["hits"] == 1
+
+    async def test_zero_ttl_is_not_cached(self, nameserver):
+        server, resolver = await nameserver({("www.example.test", "A"): (0, ["192.0.2.1"])})
+
+        await resolver.resolve("www.example.test")
+        await resolver.resolve("www.example.test")
+
+        assert len(server.queries) == 2
+
+    async def test_nxdomain_is_cached(self, nameserver):
+        server, resolver = await nameserver({})
+
+        for _ in range(3):
+            with pytest.raises(dns.resolver.NXDOMAIN):
+                await resolver.resolve("gone.example.test", "TXT")
+
+        assert len(server.queries) == 1
+        assert resolver.stats()["negative_hits"] == 2
+
+    async def test_no_answer_is_cached(self, nameserver):
+        server, resolver = await nameserver({("example.test", "A"): (300, ["192.0.2.1"])})
+
+        for _ in range(2):
+            with pytest.raises(dns.resolver.NoAnswer):
+                await resolver.resolve("example.test", "CAA")
+
+        assert len(server.queries) == 1
+
+    async def test_negative_ttl_follows_the_soa_minimum(self, nameserver):
+        server, resolver = await nameserver({}, soa=SOA.replace(" 30", " 0"))
+
+        for _ in range(2):
+            with pytest.raises(dns.resolver.NXDOMAIN):
+                await resolver.resolve("gone.example.test")
+
+        assert len(server.queries) == 2
+
+    async def test_concurrent_lookups_share_one_query(self, nameserver):
+        server, resolver = await nameserver({("www.example.test", "A"): (300, ["192.0.2.1"])})
+
+        answers = await asyncio.gather(*(resolver.resolve("www.example.test") for _ in range(20)))
+
+        assert {a[0].address for a in answers} == {"192.0.2.1"}
+        assert len(server.queries) == 1
+        assert resolver.stats()["coalesced"] == 19
+
+    async def test_oldest_entries_are_evicted(self, nameserver):
+        records = {(f"h{i}.example.test", "A"): (300, [f"192.0.2.{i}"]) for i in range(5)}
+        server, resolver = await nameserver(records)
+        resolver.max_entries = 3
+
+        for i in range(5):
+            await resolver.resolve(f"h{i}.example.test")
+        await resolver.resolve("h0.example.test")
+
+        assert resolver.stats()["entries"] == 3
+        assert len(server.queries) == 6
+
+
+class TestAddress:
+    async def test_ip_literals_are_returned_as_is(self):
+        resolver = DnsResolver(["192.0.2.53"])
+
+        assert await resolver.address("127.0.0.1") == "127.0.0.1"
+        assert await resolver.address("::1") == "::1"
+        assert resolver.stats()["queries"] == 0
+
+    async def test_single_label_names_use_the_system_resolver(self):
+        resolver = DnsResolver(["192.0.2.53"])
+
+        assert await resolver.address("localhost") == "127.0.0.1"
+        assert await resolver.address("localhost") == "127.0.0.1"
+        assert resolver.stats()["queries"] == 1
+
+    async def test_dotted_names_use_dns(self, nameserver):
+        server, resolver = await nameserver(
+            {
+                ("api.example.test", "A"): (300, ["192.0.2.7"]),
+                ("api.example.test", "AAAA"): (300, ["2001:db8::7"]),
+            }
+        )
+
+        assert await resolver.address("api.example.test") == "192.0.2.7"
+        assert await resolver.address("api.example.test", socket.AF_INET6) == "2001:db8::7"
+
+    async def test_names_missing_from_dns_fall_back_to_the_system_resolver(
+        self, nameserver, system_hosts
+    ):
+        server, resolver = await nameserver({})
+        system_hosts["db.internal"] = "10.0.0.5"
+
+        assert await resolver.address("db.internal") == "10.0.0.5"
+        assert await resolver.address("db.internal") == "10.0.0.5"
+        assert len(server.queries) == 1
+        assert system_hosts.lookups == ["db.internal"]
+
+    async def test_unknown_names_raise_gaierror(self, nameserver, system_hosts):
+        server, resolver = await nameserver({})
+
+        for _ in range(2):
+            with pytest.raises(socket.gaierror):
+                await resolver.address("gone.example.test")
+
+        assert len(server.queries) == 1
+        assert system_hosts.lookups == ["gone.example.test"]
+
+
+class TestResolvingTransport:
+    async def test_httpx_connects_to_the_resolved_address(self, nameserver):
+        server, resolver = await nameserver({("web.example.test", "A"): (300, ["127.0.0.1"])})
+        requests = []
+
+        async def handle(reader, writer):
+            requests.append(await reader.readuntil(b"\r\n\r\n"))
+            writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\nConnection: close\r\n\r\nok")
+            await writer.drain()
+            writer.close()
+
+        http = await asyncio.start_server(handle, "127.0.0.1", 0)
+        port = http.sockets[0].getsockname()[1]
+        try:
+            async with httpx.AsyncClient(transport=resolving_transport(resolver)) as client:
+                for _ in range(2):
+                    response = await client.get(f"http://web.example.test:{port}/")
+                    assert response.text == "ok"
+        finally:
+            http.close()
+
+        assert b"host: web.example.test" in requests[0].lower()
+        assert server.queries == [("web.example.test", "A")]
+
+    async def test_unresolvable_host_raises_connect_error(self, nameserver):
+        server, resolver = await nameserver({})
+
+        async with httpx.AsyncClient(transport=resolving_transport(resolver)) as client:
+            with pytest.raises(httpx.ConnectError):
+                await client.get("http://gone.example.test/")
+
+    async def test_environment_proxy_is_still_used(self, nameserver, monkeypatch):
+        server, resolver = await nameserver({})
+        requests = []
+
+        async def handle(reader, writer):
+            requests.append(await reader.readuntil(b"\r\n\r\n"))
+            writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\nConnection: close\r\n\r\nok")
+            await writer.drain()
+            writer.close()
+
+        proxy = await asyncio.start_server(handle, "127.0.0.1", 0)
+        port = proxy.sockets[0].getsockname()[1]
+        monkeypatch.setenv("HTTP_PROXY", f"http://127.0.0.1:{port}")
+        monkeypatch.delenv("NO_PROXY", raising=False)
+        try:
+            transport = resolving_transport(resolver)
+            async with httpx.AsyncClient(transport=transport) as client:
+                response = await client.get("http://web.example.test/")
+        finally:
+            proxy.close()
+
+        assert transport is None
+        assert response.text == "ok"
+        assert requests[0].startswith(b"GET http://web.example.test/ HTTP/1.1")
+        assert server.queries == []
+
+
+class TestDnsScanFanOut:
+    async def test_repeat_scans_are_answered_from_the_cache(self, nameserver):
+        server, resolver = await nameserver(
+            {
+                ("example.test", "TXT"): (300, ['"v=spf1 -all"']),
+                ("_dmarc.example.test", "TXT"): (300, ['"v=DMARC1; p=reject"']),
+                ("example.test", "NS"): (300, ["ns1.example.test."]),
+                ("ns1.example.test", "A"): (300, ["127.0.0.1"]),
+            }
+        )
+
+        first = await scan_dns("example.test", resolver)
+        queries = len(server.queries)
+        second = await scan_dns("example.test", resolver)
+
+        assert first == second
+        assert first["spf"]["policy"] == "hardfail"
+        assert first["dmarc"]["policy"] == "reject"
+        # SPF, DMARC, 8 DKIM selectors, DNSKEY, MX, CAA, NS and the NS address
+        assert queries == 15
+        assert len(server.queries) == queries
@@ -0,0 +1,358 @@
+"""Tests for the shared fetch/result cache."""
+
+import asyncio
+import os
+import stat
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from aden_tools.tools.web_scrape_tool import browser_pool, web_scrape_tool
+from aden_tools.tools.web_search_tool import web_search_tool
+from aden_tools.utils import fetch_cache
+from aden_tools.utils.fetch_cache import FetchCache, Fetched, cache_key, cached
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("ADEN_FETCH_CACHE", "1")
+    cache = FetchCache(tmp_path / "cache.sqlite3")
+    monkeypatch.setattr(fetch_cache, "_cache", cache)
+    yield cache
+    cache.close()
+
+
+class Origin:
+    """Local HTTP server that honours If-None-Match, counting full and 304 responses."""
+
+    def __init__(self, delay: float = 0.0):
+        self.body = "<p>" + "Cached article text that is long enough to be static. " * 10 + "</p>"
+        self.version = 1
+        self.delay = delay
+        self.full = 0
+        self.not_modified = 0
+        origin = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                time.sleep(origin.delay)
+                etag = f'"v{origin.version}"'
+                if self.headers.get("If-None-Match") == etag:
+                    origin.not_modified += 1
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.end_headers()
+                    return
+                origin.full += 1
+                html = (
+                    f"<html><title>v{origin.version} {self.path}</title>"
+                    f"<body><article>{origin.body}</article></body></html>"
+                ).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("ETag", etag)
+                self.send_header("Content-Length", str(len(html)))
+                self.end_headers()
+                self.wfile.write(html)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def url(self, path: str = "/") -> str:
+        return f"http://127.0.0.1:{self.server.server_port}{path}"
+
+
+@pytest.fixture
+def origin():
+    origin = Origin()
+    yield origin
+    origin.server.shutdown()
+
+
+@pytest.fixture
+def web_scrape_fn(mcp, monkeypatch):
+    monkeypatch.setattr(browser_pool, "_pools", browser_pool.weakref.WeakKeyDictionary())
+    web_scrape_tool.register_tools(mcp)
+    return mcp._tool_manager._tools["web_scrape"].fn
+
+
+class TestGetOrFetch:
+    def test_miss_then_hit(self, cache):
+        fetch = MagicMock(return_value={"results": [1, 2]})
+
+        first = cache.get_or_fetch("web_search", {"q": "a"}, fetch)
+        second = cache.get_or_fetch("web_search", {"q": "a"}, fetch)
+
+        assert first == second == {"results": [1, 2]}
+        assert fetch.call_count == 1
+        stats = cache.stats()
+        assert (stats["misses"], stats["hits"], stats["stored"]) == (1, 1, 1)
+        assert stats["tools"]["web_search"]["hits"] == 1
+        assert stats["hit_rate"] == 0.5
+        assert stats["entries"] == 1
+
+    def test_different_params_and_tools_are_separate(self, cache):
+        fetch = MagicMock(side_effect=lambda: {"n": fetch.call_count})
+
+        cache.get_or_fetch("web_search", {"q": "a"}, fetch)
+        cache.get_or_fetch("web_search", {"q": "b"}, fetch)
+        cache.get_or_fetch("news_search", {"q": "a"}, fetch)
+
+        assert fetch.call_count == 3
+        assert cache_key("t", {"a": 1, "b": 2}) == cache_key("t", {"b": 2, "a": 1})
+
+    def test_expired_entries_are_fetched_again(self, cache):
+        cache.ttls["web_search"] = 0
+        fetch = MagicMock(return_value={"results": []})
+
+        cache.get_or_fetch("web_search", {"q": "a"}, fetch)
+        cache.get_or_fetch("web_search", {"q": "a"}, fetch)
+
+        assert fetch.call_count == 2
+
+    def test_per_call_ttl_overrides_the_tool_ttl(self, cache):
+        fetch = MagicMock(return_value={"results": []})
+
+        cache.get_or_fetch("web_search", {"q": "a"}, fetch, ttl=0)
+        cache.get_or_fetch("web_search", {"q": "a"}, fetch, ttl=0)
+
+        assert fetch.call_count == 2
+
+    def test_errors_are_not_cached(self, cache):
+        fetch = MagicMock(return_value={"error": "rate limited"})
+
+        cache.get_or_fetch("web_search", {"q": "a"}, fetch)
+        cache.get_or_fetch("web_search", {"q": "a"}, fetch)
+
+        assert fetch.call_count == 2
+        assert cache.stats()["entries"] == 0
+
+    def test_revalidation(self, cache):
+        cache.ttls["web_scrape"] = 0
+        fetch = MagicMock(return_value=Fetched({"content": "x"}, etag='"1"'))
+        revalidate = MagicMock(return_value=True)
+
+        cache.get_or_fetch("web_scrape", {"url": "u"}, fetch, revalidate=revalidate)
+        result = cache.get_or_fetch("web_scrape", {"url": "u"}, fetch, revalidate=revalidate)
+
+        assert result == {"content": "x"}
+        assert fetch.call_count == 1
+        entry = revalidate.call_args.args[0]
+        assert entry.conditional_headers() == {"If-None-Match": '"1"'}
+        assert cache.stats()["revalidated"] == 1
+
+        revalidate.return_value = False
+        cache.get_or_fetch("web_scrape", {"url": "u"}, fetch, revalidate=revalidate)
+        assert fetch.call_count == 2
+
+    def test_lru_eviction_keeps_the_cache_under_its_cap(self, cache):
+        cache.max_bytes = 5000
+        value = {"text": "x" * 900}
+        for i in range(4):
+            cache.get_or_fetch("web_search", {"q": i}, lambda: value)
+        cache.get_or_fetch("web_search", {"q": 0}, lambda: value)  # 0 is now most recent
+
+        for i in range(4, 7):
+            cache.get_or_fetch("web_search", {"q": i}, lambda: value)
+
+        stats = cache.stats()
+        assert stats["bytes"] <= cache.max_bytes
+        assert stats["evicted"] >= 2
+        assert cache.lookup(cache_key("web_search", {"q": 0})) is not None
+        assert cache.lookup(cache_key("web_search", {"q": 1})) is None
+
+    def test_single_flight_across_threads(self, cache):
+        calls = 0
+
+        def fetch():
+            nonlocal calls
+            calls += 1
+            time.sleep(0.2)
+            return {"results": ["slow"]}
+
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(cache.get_or_fetch("exa_search", {"q": 1}, fetch))
+            )
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert calls == 1
+        assert results == [{"results": ["slow"]}] * 8
+        stats = cache.stats()["tools"]["exa_search"]
+        assert stats["misses"] == 1
+        assert stats["coalesced"] + stats["hits"] == 7
+
+    async def test_single_flight_across_tasks(self, cache):
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return {"results": ["slow"]}
+
+        results = await asyncio.gather(
+            *(cache.aget_or_fetch("web_scrape", {"url": "u"}, fetch) for _ in range(10))
+        )
+
+        assert calls == 1
+        assert results == [{"results": ["slow"]}] * 10
+        assert cache.stats()["coalesced"] == 9
+
+    async def test_failed_fetch_is_raised_to_every_waiter(self, cache):
+        async def fetch():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("down")
+
+        results = await asyncio.gather(
+            *(cache.aget_or_fetch("web_scrape", {"url": "u"}, fetch) for _ in range(3)),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert cache.stats()["entries"] == 0
+
+    def test_disabled_cache_always_fetches(self, cache, monkeypatch):
+        monkeypatch.setenv("ADEN_FETCH_CACHE", "0")
+        fetch = MagicMock(return_value=Fetched({"results": []}, etag='"1"'))
+
+        assert cache.get_or_fetch("web_search", {"q": "a"}, fetch) == {"results": []}
+        cache.get_or_fetch("web_search", {"q": "a"}, fetch)
+
+        assert fetch.call_count == 2
+        assert cache.stats()["entries"] == 0
+
+    def test_entries_are_shared_between_instances(self, cache):
+        cache.get_or_fetch("serpapi", {"q": "a"}, lambda: {"organic_results": []})
+        other = FetchCache(cache.path)
+
+        assert other.get_or_fetch("serpapi", {"q": "a"}, MagicMock()) == {"organic_results": []}
+        other.close()
+
+    @pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX permissions")
+    def test_default_directory_is_private_to_the_user(self, tmp_path, monkeypatch):
+        assert fetch_cache.CACHE_DIR.endswith(f"aden_fetch_cache-{os.getuid()}")
+        cache_dir = tmp_path / "shared"
+        cache_dir.mkdir(mode=0o777)
+        cache_dir.chmod(0o777)
+        monkeypatch.setenv("ADEN_FETCH_CACHE", "1")
+        monkeypatch.setattr(fetch_cache, "CACHE_DIR", str(cache_dir))
+        cache = FetchCache()
+
+        cache.get_or_fetch("serpapi", {"q": "a"}, lambda: {"organic_results": []})
+        cache.close()
+
+        assert cache.path == str(cache_dir / fetch_cache.CACHE_FILE)
+        assert stat.S_IMODE(cache_dir.stat().st_mode) == 0o700
+
+
+class TestCachedDecorator:
+    def test_excluded_arguments_are_not_part_of_the_key(self, cache):
+        calls = []
+
+        @cached("web_search", exclude=("api_key",))
+        def search(query, num_results=10, api_key=""):
+            calls.append(api_key)
+            return {"query": query}
+
+        search("hive", api_key="key-1")
+        search("hive", 10, api_key="key-2")
+        search("hive", num_results=5, api_key="key-1")
+
+        assert calls == ["key-1", "key-1"]
+        assert search.__name__ == "search"
+
+    def test_web_search_reuses_results(self, cache, mcp, monkeypatch):
+        monkeypatch.setenv("BRAVE_SEARCH_API_KEY", "test-key")
+        web_search_tool.register_tools(mcp)
+        web_search = mcp._tool_manager._tools["web_search"].fn
+        response = MagicMock(status_code=200)
+        response.json.return_value = {"web": {"results": [{"title": "Hive", "url": "u"}]}}
+
+        with patch("httpx.get", return_value=response) as get:
+            first = web_search(query="aden hive")
+            second = web_search(query="aden hive")
+            web_search(query="aden hive", num_results=3)
+
+        assert first == second
+        assert get.call_count == 2
+        assert cache.stats()["tools"]["web_search"]["hits"] == 1
+
+
+class TestWebScrape:
+    async def test_etag_revalidation_against_a_local_server(self, cache, origin, web_scrape_fn):
+        cache.ttls["web_scrape"] = 0  # every call finds an expired entry
+        url = origin.url("/article")
+
+        first = await web_scrape_fn(url=url)
+        second = await web_scrape_fn(url=url)
+
+        assert second == first
+        assert first["title"] == "v1 /article"
+        assert (origin.full, origin.not_modified) == (1, 1)
+        assert cache.stats()["tools"]["web_scrape"]["revalidated"] == 1
+
+        origin.version = 2
+        third = await web_scrape_fn(url=url)
+
+        assert third["title"] == "v2 /article"
+        # the conditional GET got a 200, then the page was scraped
+        assert (origin.full, origin.not_modified) == (3, 1)
+
+    async def test_fresh_pages_are_not_refetched(self, cache, origin, web_scrape_fn):
+        url = origin.url("/fresh")
+
+        results = [await web_scrape_fn(url=url) for _ in range(3)]
+        await web_scrape_fn(url=url, max_length=2000)
+
+        assert results[0] == results[1] == results[2]
+        assert origin.full == 2
+        assert origin.not_modified == 0
+
+    async def test_concurrent_scrapes_share_one_fetch(self, cache, origin, web_scrape_fn):
+        origin.delay = 0.1
+
+        results = await asyncio.gather(*(web_scrape_fn(url=origin.url("/same")) for _ in range(5)))
+
+        assert origin.full == 1
+        assert len({r["title"] for r in results}) == 1
+
+    async def test_failed_scrapes_are_not_cached(self, cache, web_scrape_fn):
+        url = "http://127.0.0.1:9/unreachable"
+
+        await web_scrape_fn(url=url, render="never")
+        await web_scrape_fn(url=url, render="never")
+
+        assert cache.stats()["misses"] == 2
+        assert cache.stats()["entries"] == 0
+
+
+async def test_repeated_scrapes_hit_the_cache(cache, web_scrape_fn):
+    """20 pages scraped 3 times: one request per page, then cache hits with the same result."""
+    origin = Origin()
+    urls = [origin.url(f"/page/{i}") for i in range(20)]
+    try:
+        with patch.dict("os.environ", {"ADEN_FETCH_CACHE": "0"}):
+            uncached = [await web_scrape_fn(url=url) for url in urls]
+        requests_uncached = origin.full
+
+        results = [await web_scrape_fn(url=url) for _ in range(3) for url in urls]
+    finally:
+        origin.server.shutdown()
+
+    stats = cache.stats()["tools"]["web_scrape"]
+    assert results == uncached * 3
+    assert origin.full - requests_uncached == 20
+    assert (stats["misses"], stats["hits"]) == (20, 40)
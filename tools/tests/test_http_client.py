@@ -0,0 +1,168 @@
+"""Tests for the pooled HTTP client registry."""
+
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from aden_tools.utils.http_client import (
+    HttpClientRegistry,
+    RetryPolicy,
+    origin_of,
+    retry_after_seconds,
+)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self._respond()
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        self.rfile.read(length)
+        self._respond()
+
+    def _respond(self):
+        server = self.server
+        server.connections.add(self.client_address)
+        server.requests.append(self.command)
+        status, headers = server.script.pop(0) if server.script else (200, {})
+        body = b'{"ok": true}'
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    httpd.connections = set()
+    httpd.requests = []
+    httpd.script = []  # (status, headers) for the next responses
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    httpd.url = f"http://127.0.0.1:{httpd.server_address[1]}"
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def registry():
+    registry = HttpClientRegistry(retry=RetryPolicy(backoff_base=0.01))
+    yield registry
+    registry.close()
+
+
+class TestPooling:
+    def test_one_client_per_origin(self, registry):
+        a = registry.client("https://api.example.com/v1/a")
+        assert registry.client("https://api.example.com:443/v2/b") is a
+        assert registry.client("https://other.example.com/") is not a
+
+    def test_origin_of(self):
+        assert origin_of("http://host/path?q=1") == "http://host:80"
+        assert origin_of("https://host:8443/") == "https://host:8443"
+
+    def test_requests_reuse_one_connection(self, server, registry):
+        for _ in range(10):
+            assert registry.get(f"{server.url}/items").status_code == 200
+
+        assert len(server.requests) == 10
+        assert len(server.connections) == 1
+
+
+class TestRetries:
+    def test_429_honours_retry_after(self, server, registry):
+        server.script = [(429, {"Retry-After": "0"}), (429, {"Retry-After": "0"})]
+
+        response = registry.post(f"{server.url}/send", json={"a": 1})
+
+        assert response.status_code == 200
+        assert server.requests == ["POST"] * 3
+
+    def test_gives_up_after_max_retries(self, server, registry):
+        server.script = [(503, {})] * 5
+
+        response = registry.get(f"{server.url}/flaky")
+
+        assert response.status_code == 503
+        assert len(server.requests) == 3
+
+    def test_5xx_post_is_not_retried(self, server, registry):
+        server.script = [(503, {})]
+
+        response = registry.post(f"{server.url}/create", json={})
+
+        assert response.status_code == 503
+        assert server.requests == ["POST"]
+
+    def test_long_retry_after_returns_immediately(self, server, registry):
+        server.script = [(429, {"Retry-After": "3600"})]
+
+        started = time.monotonic()
+        response = registry.get(f"{server.url}/limited")
+
+        assert response.status_code == 429
+        assert time.monotonic() - started < 1
+
+    def test_connection_errors_are_retried_for_get(self, registry):
+        attempts = []
+
+        def refuse(request):
+            attempts.append(request)
+            raise httpx.ConnectError("refused", request=request)
+
+        registry._clients[origin_of("http://down.test")] = httpx.Client(
+            transport=httpx.MockTransport(refuse)
+        )
+
+        with pytest.raises(httpx.ConnectError):
+            registry.get("http://down.test/x")
+        assert len(attempts) == 3
+
+
+class TestRetryAfter:
+    def test_seconds_and_http_date(self):
+        now = 1_700_000_000.0
+        assert retry_after_seconds(httpx.Headers({"Retry-After": "7"}), now) == 7
+        date = formatdate(now + 30, usegmt=True)
+        assert retry_after_seconds(httpx.Headers({"Retry-After": date}), now) == 30
+
+    def test_rate_limit_reset_headers(self):
+        now = 1_700_000_000.0
+        github = httpx.Headers({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(now + 5)})
+        discord = httpx.Headers({"X-RateLimit-Reset-After": "1.5"})
+        assert retry_after_seconds(github, now) == 5
+        assert retry_after_seconds(discord, now) == 1.5
+        assert retry_after_seconds(httpx.Headers({"Retry-After": "soon"}), now) is None
+
+
+def test_pooled_requests_reuse_one_connection(server, registry):
+    """One-shot httpx calls open a connection each; the registry reuses one."""
+    n = 50
+    url = f"{server.url}/bench"
+
+    for _ in range(n):
+        httpx.get(url)
+    one_shot_connections = len(server.connections)
+
+    server.connections.clear()
+    for _ in range(n):
+        registry.get(url)
+
+    assert one_shot_connections == n
+    assert len(server.connections) == 1
@@ -0,0 +1,193 @@
+"""Tests for the memory-mapped data file indexes."""
+
+import json
+
+import pytest
+
+from aden_tools.utils import mapped_file
+from aden_tools.utils.mapped_file import (
+    STRIDE,
+    append_to_file,
+    get_mapped_file,
+    invalidate_mapped_file,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch):
+    monkeypatch.setattr(mapped_file, "_open", mapped_file.OrderedDict())
+
+
+@pytest.fixture
+def lines():
+    return [f"line {i} " + "é" * (i % 5) for i in range(5 * STRIDE + 7)]
+
+
+@pytest.fixture
+def text_file(tmp_path, lines):
+    path = tmp_path / "lines.txt"
+    path.write_text("\n".join(lines), encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def json_file(tmp_path):
+    doc = {
+        "items": [
+            {"name": f"n{i}", "tags": ["a,b]", '"{q}"'], "nested": {"value": i}} for i in range(150)
+        ],
+        "meta": {"count": 150, "empty": [], "none": None},
+    }
+    path = tmp_path / "doc.json"
+    path.write_text(json.dumps(doc, indent=2), encoding="utf-8")
+    return path, doc
+
+
+class TestLines:
+    def test_line_spans_match_split(self, text_file, lines):
+        mapped = get_mapped_file(text_file)
+
+        assert mapped.line_count == len(lines)
+        for line in (0, 1, STRIDE - 1, STRIDE, STRIDE + 1, 3 * STRIDE, len(lines) - 1):
+            for count in (1, 5, STRIDE + 3):
+                start, end = mapped.line_span(line, count)
+                expected = "\n".join(lines[line : line + count])
+                assert mapped.read(start, end).decode().rstrip("\n") == expected
+            assert mapped.line_at(mapped.line_offset(line)) == line
+            assert mapped.line_at(mapped.line_offset(line) + 3) == line
+
+    def test_trailing_newline_does_not_add_a_line(self, tmp_path):
+        path = tmp_path / "a.txt"
+        path.write_bytes(b"a\nb\n")
+
+        assert get_mapped_file(path).line_count == 2
+        assert get_mapped_file(path).line_span(2, 1) == (4, 4)
+
+    def test_empty_file(self, tmp_path):
+        path = tmp_path / "empty.txt"
+        path.write_bytes(b"")
+        mapped = get_mapped_file(path)
+
+        assert mapped.line_count == 0
+        assert mapped.read_text(0, 100) == ("", 0)
+
+    def test_read_text_never_splits_a_character(self, tmp_path):
+        path = tmp_path / "u.txt"
+        path.write_text("aé€😀b", encoding="utf-8")
+        mapped = get_mapped_file(path)
+
+        offset, pieces = 0, []
+        while offset < mapped.size:
+            text, offset = mapped.read_text(offset, 2)
+            pieces.append(text)
+
+        assert "".join(pieces) == "aé€😀b"
+        assert all(pieces)
+
+    def test_append_keeps_line_index(self, text_file, lines):
+        mapped = get_mapped_file(text_file)
+        assert mapped.line_count == len(lines)
+
+        append_to_file(text_file, b"\nextra one\nextra two")
+        grown = get_mapped_file(text_file)
+
+        assert grown is not mapped
+        assert grown._indexed_to == mapped.size  # only the appended bytes are left to scan
+        assert grown.line_count == len(lines) + 2
+        start, end = grown.line_span(len(lines) - 1, 3)
+        assert grown.read(start, end).decode() == f"{lines[-1]}\nextra one\nextra two"
+
+    def test_changed_file_is_remapped(self, text_file):
+        mapped = get_mapped_file(text_file)
+        assert get_mapped_file(text_file) is mapped
+
+        text_file.write_text("replaced\n")
+
+        assert get_mapped_file(text_file).line_count == 1
+        invalidate_mapped_file(text_file)
+        assert text_file.name not in str(list(mapped_file._open))
+
+
+class TestJsonPath:
+    def test_parse_json_path(self):
+        from framework.graph.spillover import parse_json_path
+
+        assert parse_json_path("$.items[0:5].name") == ["items", slice(0, 5), "name"]
+        assert parse_json_path("$['a.b'][*][-1]") == ["a.b", slice(None), "-1"]
+        with pytest.raises(ValueError):
+            parse_json_path("$.a[1:x]")
+
+    @pytest.mark.parametrize(
+        "path",
+        [
+            "$.items[5].name",
+            "$.items[-1].nested.value",
+            "$.items[2:4]",
+            "$.items[*].nested.value",
+            "$.items.7.tags[0]",
+            "$.items[3].tags[1]",
+            "$['meta']['none']",
+            "$.meta.empty",
+            "$.meta[*]",
+            "$",
+        ],
+    )
+    def test_select_matches_parsed_document(self, json_file, path):
+        from framework.graph.spillover import select_json_path
+
+        file, doc = json_file
+
+        assert get_mapped_file(file).select(path) == select_json_path(doc, path)
+
+    def test_only_visited_containers_are_indexed(self, json_file):
+        mapped = get_mapped_file(json_file[0])
+
+        mapped.select("$.items[120].name")
+
+        # root, items and items[120]
+        assert len(mapped._containers) == 3
+
+    def test_no_match_and_not_json(self, json_file, text_file):
+        with pytest.raises(KeyError):
+            get_mapped_file(json_file[0]).select("$.missing")
+        with pytest.raises(ValueError):
+            get_mapped_file(text_file).select("$.a")
+
+    def test_jsonl_records_are_lines(self, tmp_path):
+        path = tmp_path / "rows.jsonl"
+        rows = [{"id": i, "name": f"row {i}"} for i in range(200)]
+        path.write_text("\n".join(json.dumps(r) for r in rows) + "\n")
+        mapped = get_mapped_file(path)
+
+        assert mapped.select("$[150]") == rows[150]
+        assert mapped.select("$[-1].name") == "row 199"
+        assert mapped.select("$[10:13].id") == [10, 11, 12]
+        assert len(mapped.select("$[*]")) == 200
+
+
+def test_line_jumps_reuse_one_mapping_and_index(tmp_path, monkeypatch):
+    """Reading lines deep in a file maps it once and scans it for newlines once."""
+    path = tmp_path / "big.log"
+    with open(path, "w") as f:
+        for i in range(20_000):
+            f.write(f"2024-01-01T00:00:00 INFO request {i} served in {i % 97} ms\n")
+    lines = path.read_text(encoding="utf-8").split("\n")
+    targets = [15_000, 19_990, 42, 10_000, 17_500] * 4
+    scans = []
+    index_lines = mapped_file.MappedFile._index_lines
+
+    def counting_index_lines(self):
+        if self._indexed_to < self.size:
+            scans.append(self.path)
+        index_lines(self)
+
+    monkeypatch.setattr(mapped_file.MappedFile, "_index_lines", counting_index_lines)
+
+    first = get_mapped_file(path)
+    for line in targets:
+        mapped = get_mapped_file(path)
+        start, end = mapped.line_span(line, 1)
+
+        assert mapped is first
+        assert mapped.read(start, end).decode().rstrip("\n") == lines[line]
+    assert scans == [first.path]
@@ -0,0 +1,128 @@
+"""Tests for the pagination helpers."""
+
+import json
+import threading
+import time
+
+from aden_tools.utils.pagination import (
+    Page,
+    collect_pages,
+    paginate_cursor,
+    paginate_numbered,
+)
+
+
+def _numbered_api(total: int, page_size: int, delay: float = 0.0):
+    """A fake page-number API over range(total) that records its calls."""
+    calls: list[int] = []
+    lock = threading.Lock()
+    state = {"running": 0, "peak": 0}
+
+    def fetch(page: int) -> Page:
+        with lock:
+            calls.append(page)
+            state["running"] += 1
+            state["peak"] = max(state["peak"], state["running"])
+        time.sleep(delay)
+        with lock:
+            state["running"] -= 1
+        start = (page - 1) * page_size
+        return Page(items=list(range(start, min(start + page_size, total))))
+
+    return fetch, calls, state
+
+
+class TestNumbered:
+    def test_pages_arrive_in_order_and_stop_at_short_page(self):
+        fetch, calls, _ = _numbered_api(total=25, page_size=10)
+
+        result = collect_pages(paginate_numbered(fetch, 10, max_items=100), max_items=100)
+
+        assert result["items"] == list(range(25))
+        assert result["pages"] == 3
+        assert result["has_more"] is False
+        # Pages past the end may have been prefetched, but never past the cap
+        assert set(calls) <= set(range(1, 11))
+
+    def test_pages_are_fetched_concurrently(self):
+        fetch, _, state = _numbered_api(total=400, page_size=10, delay=0.05)
+
+        started = time.monotonic()
+        result = collect_pages(
+            paginate_numbered(fetch, 10, max_items=80, concurrency=4), max_items=80
+        )
+
+        assert result["count"] == 80
+        assert state["peak"] == 4
+        # 8 pages of 50ms, four at a time
+        assert time.monotonic() - started < 0.35
+
+    def test_max_items_truncates_and_reports_more(self):
+        fetch, calls, _ = _numbered_api(total=100, page_size=10)
+
+        result = collect_pages(paginate_numbered(fetch, 10, max_items=15), max_items=15)
+
+        assert result["items"] == list(range(15))
+        assert result["has_more"] is True
+        assert sorted(calls) == [1, 2]
+
+
+class TestCursor:
+    def test_next_page_is_fetched_while_caller_works(self):
+        fetched_at: dict[int, float] = {}
+
+        def fetch(cursor):
+            index = cursor or 0
+            fetched_at[index] = time.monotonic()
+            return Page(items=[index], next=index + 1 if index < 2 else None)
+
+        handled_at = []
+        for page in paginate_cursor(fetch, max_items=10):
+            time.sleep(0.05)
+            handled_at.append((page.items[0], time.monotonic()))
+
+        assert [index for index, _ in handled_at] == [0, 1, 2]
+        # Page 1 was requested before the caller finished with page 0
+        assert fetched_at[1] < handled_at[0][1]
+
+    def test_stops_at_max_items(self):
+        calls = []
+
+        def fetch(cursor):
+            calls.append(cursor)
+            n = cursor or 0
+            return Page(items=[n, n + 1], next=n + 2)
+
+        result = collect_pages(paginate_cursor(fetch, max_items=5), max_items=5)
+
+        assert result["items"] == [0, 1, 2, 3, 4]
+        assert result["has_more"] is True
+        assert calls == [None, 2, 4]
+
+
+class TestCollect:
+    def test_items_stream_to_data_dir(self, tmp_path):
+        pages = [Page(items=[{"id": i} for i in range(10)], next="c"), Page(items=[{"id": 10}])]
+
+        result = collect_pages(
+            iter(pages), max_items=50, data_dir=str(tmp_path), filename="x.jsonl"
+        )
+
+        assert result["count"] == 11
+        assert result["filename"] == "x.jsonl"
+        assert "items" not in result
+        assert result["preview"] == [{"id": i} for i in range(5)]
+        lines = (tmp_path / "x.jsonl").read_text().splitlines()
+        assert [json.loads(line)["id"] for line in lines] == list(range(11))
+
+    def test_first_page_error_is_the_result(self):
+        assert collect_pages(iter([Page(error="Invalid token")])) == {"error": "Invalid token"}
+
+    def test_later_error_keeps_partial_results(self):
+        pages = [Page(items=[1, 2], next="c"), Page(error="rate limited")]
+
+        result = collect_pages(iter(pages))
+
+        assert result["success"] is True
+        assert result["items"] == [1, 2]
+        assert result["error"] == "Stopped after 2 items: rate limited"
@@ -0,0 +1,149 @@
+"""Tests for the session-scoped DuckDB query engine."""
+
+import json
+import os
+import stat
+import time
+
+import pytest
+
+duckdb = pytest.importorskip("duckdb")
+
+from aden_tools.utils import query_engine  # noqa: E402
+from aden_tools.utils.query_engine import QueryEngine, single_select_error  # noqa: E402
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = QueryEngine(cache_dir=str(tmp_path / "cache"))
+    yield engine
+    engine.close()
+
+
+def _write_csv(path, rows: int, start: int = 0):
+    lines = ["id,category,amount"]
+    lines += [f"{i},{'abc'[i % 3]},{i * 1.5}" for i in range(start, start + rows)]
+    path.write_text("\n".join(lines) + "\n")
+    return path
+
+
+class TestTableCache:
+    def test_file_is_parsed_once_across_queries(self, engine, tmp_path):
+        csv = _write_csv(tmp_path / "a.csv", 100)
+
+        for _ in range(5):
+            tables = engine.csv_tables(str(csv))
+            result = engine.query("SELECT COUNT(*) AS n FROM data", tables)
+            assert result["rows"] == [{"n": 100}]
+
+        assert engine.loads == 1
+
+    def test_changed_file_is_reloaded(self, engine, tmp_path):
+        csv = _write_csv(tmp_path / "a.csv", 10)
+        engine.query("SELECT * FROM data", engine.csv_tables(str(csv)))
+
+        _write_csv(csv, 20)
+        os.utime(csv, ns=(time.time_ns(), time.time_ns() + 1_000_000))
+        result = engine.query("SELECT COUNT(*) AS n FROM data", engine.csv_tables(str(csv)))
+
+        assert result["rows"] == [{"n": 20}]
+        assert engine.loads == 2
+
+    def test_large_csv_is_queried_through_parquet(self, tmp_path):
+        engine = QueryEngine(cache_dir=str(tmp_path / "cache"), materialize_max_bytes=0)
+        csv = _write_csv(tmp_path / "big.csv", 1000)
+
+        tables = engine.csv_tables(str(csv))
+        result = engine.query("SELECT SUM(amount) AS total FROM data WHERE category = 'a'", tables)
+
+        assert result["rows"][0]["total"] == sum(i * 1.5 for i in range(0, 1000, 3))
+        assert len(list((tmp_path / "cache").glob("*.parquet"))) == 1
+        engine.close()
+        assert list((tmp_path / "cache").glob("*.parquet")) == []
+
+    @pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX permissions")
+    def test_parquet_copies_are_private_to_the_user(self, tmp_path, monkeypatch):
+        shared = tmp_path / "shared"
+        shared.mkdir(mode=0o777)
+        shared.chmod(0o777)
+        monkeypatch.setattr(query_engine, "DEFAULT_CACHE_DIR", str(shared))
+        engine = QueryEngine(cache_dir=str(shared / "session"), materialize_max_bytes=0)
+
+        engine.csv_tables(str(_write_csv(tmp_path / "big.csv", 10)))
+        engine.close()
+
+        assert stat.S_IMODE(shared.stat().st_mode) == 0o700
+        assert stat.S_IMODE((shared / "session").stat().st_mode) == 0o700
+
+    def test_least_recently_used_files_are_dropped(self, tmp_path):
+        engine = QueryEngine(cache_dir=str(tmp_path / "cache"), max_files=2)
+        paths = [str(_write_csv(tmp_path / f"{n}.csv", 5)) for n in range(3)]
+
+        first = engine.csv_tables(paths[0])["data"]
+        engine.csv_tables(paths[1])
+        engine.csv_tables(paths[2])
+
+        assert not engine._con.execute(
+            "SELECT * FROM information_schema.tables WHERE table_name = ?", [first]
+        ).fetchall()
+        engine.close()
+
+
+class TestResultBudget:
+    def test_rows_past_the_budget_are_truncated(self, engine, tmp_path):
+        tables = engine.csv_tables(str(_write_csv(tmp_path / "a.csv", 500)))
+
+        result = engine.query("SELECT * FROM data ORDER BY id", tables, max_rows=10)
+
+        assert result["row_count"] == 10
+        assert result["truncated"] is True
+        assert "total_rows" not in result
+
+    def test_byte_budget_applies_too(self, engine, tmp_path):
+        tables = engine.csv_tables(str(_write_csv(tmp_path / "a.csv", 500)))
+
+        result = engine.query("SELECT * FROM data", tables, max_bytes=200)
+
+        assert 0 < result["row_count"] < 10
+        assert result["truncated"] is True
+
+    def test_large_results_spill_to_data_dir(self, engine, tmp_path):
+        tables = engine.csv_tables(str(_write_csv(tmp_path / "a.csv", 500)))
+        data_dir = tmp_path / "data"
+
+        result = engine.query(
+            "SELECT id FROM data ORDER BY id", tables, max_rows=10, data_dir=str(data_dir)
+        )
+
+        assert result["row_count"] == 10
+        assert result["total_rows"] == 500
+        lines = (data_dir / result["filename"]).read_text().splitlines()
+        assert [json.loads(line)["id"] for line in lines] == list(range(500))
+
+
+def test_only_a_single_select_is_allowed():
+    assert single_select_error("SELECT * FROM data") is None
+    assert "single" in single_select_error("SELECT 1; SET threads = 1")
+    assert "SELECT" in single_select_error("ATTACH 'x.db'")
+
+
+def test_cached_queries_match_a_fresh_connection(engine, tmp_path):
+    """Queries on the cached table return what a per-query connection did, parsing once."""
+    csv = _write_csv(tmp_path / "a.csv", 5_000)
+    queries = [
+        "SELECT COUNT(*) FROM data",
+        "SELECT category, SUM(amount) FROM data GROUP BY category ORDER BY category",
+        "SELECT MAX(amount) FROM data WHERE category = 'c'",
+        "SELECT * FROM data ORDER BY amount DESC LIMIT 5",
+    ]
+
+    for query in queries:
+        con = duckdb.connect(":memory:")
+        con.execute(f"CREATE TABLE data AS SELECT * FROM read_csv_auto('{csv}')")
+        expected = con.execute(query).fetchall()
+        con.close()
+
+        result = engine.query(query, engine.csv_tables(str(csv)))
+        assert [tuple(row.values()) for row in result["rows"]] == expected
+
+    assert engine.loads == 1
@@ -394,7 +394,7 @@ def test_register_tools_registers_all_tools(self):
         mcp = MagicMock()
         mcp.tool.return_value = lambda fn: fn
         register_tools(mcp)
-        assert mcp.tool.call_count == 4
+        assert mcp.tool.call_count == 5
 
     def test_no_credentials_returns_error(self):
         mcp = MagicMock()
@@ -672,4 +672,5 @@ def test_apollo_spec_tools(self):
         assert "apollo_enrich_company" in spec.tools
         assert "apollo_search_people" in spec.tools
         assert "apollo_search_companies" in spec.tools
-        assert len(spec.tools) == 4
+        assert "apollo_fetch_people" in spec.tools
+        assert len(spec.tools) == 5
@@ -0,0 +1,220 @@
+"""Tests for the pooled Chromium browsers behind web_scrape."""
+
+import asyncio
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from playwright.async_api import Error as PlaywrightError
+
+from aden_tools.tools.web_scrape_tool import browser_pool, web_scrape_tool
+from aden_tools.tools.web_scrape_tool.browser_pool import BrowserPool, get_browser_pool
+
+
+class FakeContext:
+    def __init__(self, browser):
+        self.browser = browser
+        self.closed = False
+
+    async def new_page(self):
+        await asyncio.sleep(0)
+        return object()
+
+    async def close(self):
+        self.closed = True
+        self.browser.open_contexts -= 1
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.contexts: list[FakeContext] = []
+        self.open_contexts = 0
+        self.peak_contexts = 0
+        self.closed = False
+        self.dead = False
+
+    async def new_context(self, **options):
+        if self.dead:
+            raise PlaywrightError("Target page, context or browser has been closed")
+        context = FakeContext(self)
+        self.contexts.append(context)
+        self.open_contexts += 1
+        self.peak_contexts = max(self.peak_contexts, self.open_contexts)
+        return context
+
+    async def close(self):
+        self.closed = True
+
+
+class FakePlaywright:
+    def __init__(self):
+        self.launched: list[FakeBrowser] = []
+        self.stopped = False
+        self.chromium = self
+
+    async def launch(self, **kwargs):
+        browser = FakeBrowser()
+        self.launched.append(browser)
+        return browser
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        self.stopped = True
+
+
+@pytest.fixture
+def playwright():
+    return FakePlaywright()
+
+
+def make_pool(playwright, **options):
+    return BrowserPool(lambda: playwright, **options)
+
+
+class TestBrowserPool:
+    async def test_browser_is_reused_with_a_fresh_context_per_page(self, playwright):
+        pool = make_pool(playwright)
+
+        for _ in range(5):
+            async with pool.page():
+                pass
+
+        assert len(playwright.launched) == 1
+        browser = playwright.launched[0]
+        assert len(browser.contexts) == 5
+        assert all(context.closed for context in browser.contexts)
+        assert pool.pages_served == 5
+
+    async def test_concurrency_limit_and_pool_size(self, playwright):
+        pool = make_pool(playwright, size=2, max_concurrency=3)
+        running = peak = 0
+
+        async def visit():
+            nonlocal running, peak
+            async with pool.page():
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+
+        await asyncio.gather(*(visit() for _ in range(12)))
+
+        assert peak == 3
+        assert len(playwright.launched) == 2
+        assert pool.pages_served == 12
+
+    async def test_browsers_are_recycled_after_k_pages(self, playwright):
+        pool = make_pool(playwright, size=1, recycle_after=3)
+
+        for _ in range(7):
+            async with pool.page():
+                pass
+
+        assert len(playwright.launched) == 3
+        assert [b.closed for b in playwright.launched] == [True, True, False]
+        assert pool.browser_count == 1
+
+    async def test_dead_browser_is_replaced(self, playwright):
+        pool = make_pool(playwright)
+        async with pool.page():
+            pass
+        playwright.launched[0].dead = True
+
+        async with pool.page():
+            pass
+
+        assert len(playwright.launched) == 2
+        assert playwright.launched[0].closed
+        assert pool.browser_count == 1
+
+    async def test_error_in_page_still_releases_the_context(self, playwright):
+        pool = make_pool(playwright, max_concurrency=1)
+
+        with pytest.raises(RuntimeError):
+            async with pool.page():
+                raise RuntimeError("boom")
+        async with pool.page():
+            pass
+
+        assert all(context.closed for context in playwright.launched[0].contexts)
+
+    async def test_warm_and_close(self, playwright):
+        pool = make_pool(playwright, size=3)
+
+        await pool.warm()
+        assert len(playwright.launched) == 3
+        await pool.close()
+
+        assert all(browser.closed for browser in playwright.launched)
+        assert playwright.stopped
+
+    async def test_one_pool_per_event_loop(self, monkeypatch, playwright):
+        monkeypatch.setattr(browser_pool, "_pools", browser_pool.weakref.WeakKeyDictionary())
+
+        first = get_browser_pool(lambda: playwright)
+
+        assert get_browser_pool(lambda: playwright) is first
+
+
+def _chromium_installed() -> bool:
+    root = os.environ.get("PLAYWRIGHT_BROWSERS_PATH") or os.path.expanduser(
+        "~/.cache/ms-playwright"
+    )
+    return os.path.isdir(root) and any(name.startswith("chromium") for name in os.listdir(root))
+
+
+@pytest.fixture
+def local_site():
+    """20 static article pages on a local HTTP server."""
+    body = "<p>" + "Benchmark paragraph with enough text to count as static. " * 20 + "</p>"
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            html = f"<html><title>{self.path}</title><body><article>{body}</article></body></html>"
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.end_headers()
+            self.wfile.write(html.encode())
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield [f"http://127.0.0.1:{server.server_port}/page/{i}" for i in range(20)]
+    server.shutdown()
+
+
+@pytest.fixture
+def web_scrape_fn(mcp, monkeypatch):
+    monkeypatch.setattr(browser_pool, "_pools", browser_pool.weakref.WeakKeyDictionary())
+    web_scrape_tool.register_tools(mcp)
+    return mcp._tool_manager._tools["web_scrape"].fn
+
+
+async def test_static_pages_skip_the_browser(web_scrape_fn, local_site):
+    """Static pages from a local server are scraped over HTTP; no browser pool is created."""
+    results = [await web_scrape_fn(url=url) for url in local_site]
+
+    assert [r["title"] for r in results] == [url[url.index("/page") :] for url in local_site]
+    assert not any(r["rendered"] for r in results)
+    assert not browser_pool._pools
+
+
+@pytest.mark.skipif(not _chromium_installed(), reason="Chromium is not installed")
+async def test_rendered_pages_share_the_pooled_browsers(web_scrape_fn, local_site):
+    """Rendering several pages at once launches at most the pool size, not one per URL."""
+    urls = local_site[:5]
+
+    results = await asyncio.gather(*(web_scrape_fn(url=url, render="always") for url in urls))
+    pool = browser_pool._pools[asyncio.get_running_loop()]
+    launched, served = pool.launched, pool.pages_served
+    await browser_pool.close_browser_pool()
+
+    assert [r["title"] for r in results] == [url[url.index("/page") :] for url in urls]
+    assert all(r["rendered"] for r in results)
+    assert served == len(urls)
+    assert launched <= browser_pool.POOL_SIZE
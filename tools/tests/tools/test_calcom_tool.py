@@ -91,7 +91,7 @@ def test_credentials_from_env(self, mcp: FastMCP, monkeypatch):
         register_tools(mcp)
 
         # Tool should not return credential error
-        with patch("httpx.get") as mock_get:
+        with patch("httpx.Client.get") as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {"bookings": []}
@@ -113,7 +113,7 @@ class TestListBookings:
 
     def test_list_bookings_success(self, calcom_tools, monkeypatch):
         """List bookings returns bookings on success."""
-        with patch("httpx.get") as mock_get:
+        with patch("httpx.Client.get") as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {
@@ -131,7 +131,7 @@ def test_list_bookings_success(self, calcom_tools, monkeypatch):
 
     def test_list_bookings_with_filters(self, calcom_tools):
         """List bookings accepts filter parameters."""
-        with patch("httpx.get") as mock_get:
+        with patch("httpx.Client.get") as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {"bookings": []}
@@ -158,7 +158,7 @@ class TestGetBooking:
 
     def test_get_booking_success(self, calcom_tools):
         """Get booking returns booking details."""
-        with patch("httpx.get") as mock_get:
+        with patch("httpx.Client.get") as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {
@@ -172,7 +172,7 @@ def test_get_booking_success(self, calcom_tools):
 
     def test_get_booking_not_found(self, calcom_tools):
         """Get booking returns error for non-existent booking."""
-        with patch("httpx.get") as mock_get:
+        with patch("httpx.Client.get") as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 404
             mock_get.return_value = mock_response
@@ -188,7 +188,7 @@ class TestCreateBooking:
 
     def test_create_booking_success(self, calcom_tools):
         """Create booking succeeds with valid data."""
-        with patch("httpx.post") as mock_post:
+        with patch("httpx.Client.post") as mock_post:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {"id": 456, "status": "accepted"}
@@ -227,7 +227,7 @@ class TestCancelBooking:
 
     def test_cancel_booking_success(self, calcom_tools):
         """Cancel booking succeeds."""
-        with patch("httpx.request") as mock_request:
+        with patch("httpx.Client.request") as mock_request:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {"success": True}
@@ -245,7 +245,7 @@ def test_cancel_booking_success(self, calcom_tools):
 
     def test_cancel_booking_with_reason(self, calcom_tools):
         """Cancel booking includes cancellation reason."""
-        with patch("httpx.request") as mock_request:
+        with patch("httpx.Client.request") as mock_request:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {"success": True}
@@ -263,7 +263,7 @@ class TestGetAvailability:
 
     def test_get_availability_success(self, calcom_tools):
         """Get availability returns slots."""
-        with patch("httpx.get") as mock_get:
+        with patch("httpx.Client.get") as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {
@@ -297,7 +297,7 @@ class TestUpdateSchedule:
 
     def test_update_schedule_with_availability(self, calcom_tools):
         """Update schedule passes availability to the API."""
-        with patch("httpx.patch") as mock_patch:
+        with patch("httpx.Client.patch") as mock_patch:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {"schedule": {"id": 1}}
@@ -316,7 +316,7 @@ class TestListSchedules:
 
     def test_list_schedules_success(self, calcom_tools):
         """List schedules returns schedules on success."""
-        with patch("httpx.get") as mock_get:
+        with patch("httpx.Client.get") as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {
@@ -333,7 +333,7 @@ def test_list_schedules_success(self, calcom_tools):
 
     def test_list_schedules_empty(self, calcom_tools):
         """List schedules returns empty list when no schedules configured."""
-        with patch("httpx.get") as mock_get:
+        with patch("httpx.Client.get") as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {"schedules": []}
@@ -349,7 +349,7 @@ class TestListEventTypes:
 
     def test_list_event_types_success(self, calcom_tools):
         """List event types returns event types."""
-        with patch("httpx.get") as mock_get:
+        with patch("httpx.Client.get") as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {
@@ -370,7 +370,7 @@ class TestGetEventType:
 
     def test_get_event_type_success(self, calcom_tools):
         """Get event type returns details."""
-        with patch("httpx.get") as mock_get:
+        with patch("httpx.Client.get") as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {
@@ -394,7 +394,7 @@ class TestErrorHandling:
 
     def test_401_unauthorized(self, calcom_tools):
         """401 response returns authentication error."""
-        with patch("httpx.get") as mock_get:
+        with patch("httpx.Client.get") as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 401
             mock_get.return_value = mock_response
@@ -406,7 +406,7 @@ def test_401_unauthorized(self, calcom_tools):
 
     def test_429_rate_limit(self, calcom_tools):
         """429 response returns rate limit error."""
-        with patch("httpx.get") as mock_get:
+        with patch("httpx.Client.get") as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 429
             mock_get.return_value = mock_response
@@ -418,7 +418,7 @@ def test_429_rate_limit(self, calcom_tools):
 
     def test_timeout_error(self, calcom_tools):
         """Timeout returns appropriate error."""
-        with patch("httpx.get") as mock_get:
+        with patch("httpx.Client.get") as mock_get:
             mock_get.side_effect = httpx.TimeoutException("Request timed out")
 
             result = calcom_tools["list_bookings"]()
@@ -428,7 +428,7 @@ def test_timeout_error(self, calcom_tools):
 
     def test_network_error(self, calcom_tools):
         """Network error returns appropriate error."""
-        with patch("httpx.get") as mock_get:
+        with patch("httpx.Client.get") as mock_get:
             mock_get.side_effect = httpx.RequestError("Connection failed")
 
             result = calcom_tools["list_bookings"]()
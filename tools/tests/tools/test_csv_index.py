@@ -0,0 +1,161 @@
+"""Tests for the CSV row-offset index used by csv_read, csv_info and csv_append."""
+
+import csv
+import os
+import stat
+from pathlib import Path
+
+import pytest
+
+from aden_tools.tools.csv_tool import csv_index
+from aden_tools.tools.csv_tool.csv_index import extend_csv_index, get_csv_index
+
+
+@pytest.fixture(autouse=True)
+def index_dir(tmp_path: Path, monkeypatch):
+    """Keep sidecars in the test's tmp dir and start with an empty memory cache."""
+    directory = tmp_path / "index"
+    monkeypatch.setattr(csv_index, "INDEX_DIR", str(directory))
+    monkeypatch.setattr(csv_index, "_cache", csv_index.OrderedDict())
+    return directory
+
+
+@pytest.fixture
+def tricky_csv(tmp_path: Path) -> Path:
+    """Quoted newlines, blank lines and ragged rows across several strides."""
+    lines = ["id,text,extra"]
+    for i in range(300):
+        if i % 7 == 0:
+            lines.append(f'{i},"line one\nline two, with comma",x')
+        elif i % 11 == 0:
+            lines.append(f"{i},short")
+        elif i % 13 == 0:
+            lines.append(f"{i},long,row,with,extras")
+        else:
+            lines.append(f"{i},plain {i},")
+        if i % 50 == 0:
+            lines.append("")
+    path = tmp_path / "tricky.csv"
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return path
+
+
+def _dict_reader_rows(path: Path) -> list[dict]:
+    with open(path, encoding="utf-8", newline="") as f:
+        return list(csv.DictReader(f))
+
+
+def test_every_page_matches_dict_reader(tricky_csv: Path):
+    expected = _dict_reader_rows(tricky_csv)
+    index = get_csv_index(str(tricky_csv))
+
+    assert index.total_rows == len(expected) == 300
+    assert index.columns == ["id", "text", "extra"]
+    for offset in (0, 1, 63, 64, 65, 127, 200, 299, 300):
+        assert index.read_rows(offset, 10) == expected[offset : offset + 10]
+    assert index.read_rows(250) == expected[250:]
+
+
+def test_negative_offset_reads_from_the_first_row(tricky_csv: Path):
+    expected = _dict_reader_rows(tricky_csv)
+
+    assert get_csv_index(str(tricky_csv)).read_rows(-5, 3) == expected[:3]
+
+
+def test_column_projection(tricky_csv: Path):
+    rows = get_csv_index(str(tricky_csv)).read_rows(7, 2, columns=["text"])
+
+    assert rows == [{"text": "line one\nline two, with comma"}, {"text": "plain 8"}]
+
+
+def test_sidecar_is_reused_by_a_fresh_process(tricky_csv: Path, index_dir: Path, monkeypatch):
+    get_csv_index(str(tricky_csv))
+    assert len(list(index_dir.glob("*.json"))) == 1
+
+    monkeypatch.setattr(csv_index, "_cache", csv_index.OrderedDict())
+    monkeypatch.setattr(csv_index, "_build", lambda path: pytest.fail("index was rebuilt"))
+
+    assert get_csv_index(str(tricky_csv)).total_rows == 300
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX permissions")
+def test_index_directory_is_private_to_the_user(tricky_csv: Path, index_dir: Path):
+    index_dir.mkdir(mode=0o777)
+    index_dir.chmod(0o777)
+
+    get_csv_index(str(tricky_csv))
+
+    assert stat.S_IMODE(index_dir.stat().st_mode) == 0o700
+    assert len(list(index_dir.glob("*.json"))) == 1
+
+
+def test_sidecars_of_another_user_are_ignored(tricky_csv: Path, index_dir: Path, monkeypatch):
+    get_csv_index(str(tricky_csv))
+    monkeypatch.setattr(csv_index, "_cache", csv_index.OrderedDict())
+
+    def refuse(path):
+        raise PermissionError(f"{path} is owned by another user")
+
+    monkeypatch.setattr(csv_index, "make_private_dir", refuse)
+    built = []
+    original = csv_index._build
+    monkeypatch.setattr(csv_index, "_build", lambda path: built.append(path) or original(path))
+
+    assert get_csv_index(str(tricky_csv)).total_rows == 300
+    assert built == [str(tricky_csv.resolve())]
+
+
+def test_changed_file_is_reindexed(tmp_path: Path):
+    path = tmp_path / "a.csv"
+    path.write_text("a\n1\n2\n")
+    assert get_csv_index(str(path)).total_rows == 2
+
+    path.write_text("a\n1\n2\n3\n")
+
+    assert get_csv_index(str(path)).total_rows == 3
+
+
+def test_extend_after_append_matches_full_rebuild(tricky_csv: Path, monkeypatch):
+    index = get_csv_index(str(tricky_csv))
+    with open(tricky_csv, "a", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        for i in range(300, 400):
+            writer.writerow([i, f"appended\n{i}", ""])
+
+    extended = extend_csv_index(index)
+    monkeypatch.setattr(csv_index, "_cache", csv_index.OrderedDict())
+    rebuilt = csv_index._build(str(tricky_csv))
+
+    assert extended.total_rows == rebuilt.total_rows == 400
+    assert extended.checkpoints == rebuilt.checkpoints
+    assert extended.read_rows(395, 2) == _dict_reader_rows(tricky_csv)[395:397]
+
+
+def test_empty_file_has_no_columns(tmp_path: Path):
+    path = tmp_path / "empty.csv"
+    path.write_text("")
+
+    index = get_csv_index(str(path))
+
+    assert index.columns is None
+    assert index.read_rows(0, 10) == []
+
+
+def test_paging_builds_the_index_once(tmp_path: Path, monkeypatch):
+    """Paging through a file scans it once; every page matches a DictReader rescan."""
+    path = tmp_path / "big.csv"
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["id", "name", "value"])
+        writer.writerows([i, f"name {i}", i * 3] for i in range(20_000))
+    page, pages = 1000, range(0, 20_000, 2500)
+    builds = []
+    build = csv_index._build
+    monkeypatch.setattr(csv_index, "_build", lambda p: builds.append(p) or build(p))
+
+    with open(path, encoding="utf-8", newline="") as f:
+        rows = list(csv.DictReader(f))
+    pages_read = [get_csv_index(str(path)).read_rows(offset, page) for offset in pages]
+
+    assert pages_read == [rows[offset : offset + page] for offset in pages]
+    assert builds == [str(path)]
@@ -360,6 +360,36 @@ def test_offset_beyond_rows(self, csv_tool_fn, basic_csv, tmp_path):
         assert result["rows"] == []
         assert result["total_rows"] == 3
 
+    def test_read_selected_columns(self, csv_tool_fn, basic_csv, tmp_path):
+        """Only the requested columns are returned."""
+        with patch("aden_tools.tools.file_system_toolkits.security.WORKSPACES_DIR", str(tmp_path)):
+            result = csv_tool_fn(
+                path="basic.csv",
+                workspace_id=TEST_WORKSPACE_ID,
+                agent_id=TEST_AGENT_ID,
+                session_id=TEST_SESSION_ID,
+                columns=["name"],
+                offset=1,
+            )
+
+        assert result["success"] is True
+        assert result["columns"] == ["name"]
+        assert result["rows"] == [{"name": "Bob"}, {"name": "Charlie"}]
+
+    def test_read_unknown_column(self, csv_tool_fn, basic_csv, tmp_path):
+        """Unknown column names are reported."""
+        with patch("aden_tools.tools.file_system_toolkits.security.WORKSPACES_DIR", str(tmp_path)):
+            result = csv_tool_fn(
+                path="basic.csv",
+                workspace_id=TEST_WORKSPACE_ID,
+                agent_id=TEST_AGENT_ID,
+                session_id=TEST_SESSION_ID,
+                columns=["salary"],
+            )
+
+        assert "error" in result
+        assert "salary" in result["error"]
+
 
 class TestCsvWrite:
     """Tests for csv_write function."""
@@ -890,3 +920,54 @@ def test_unicode_data(self, csv_tools, session_dir, tmp_path):
         assert result["success"] is True
         assert result["row_count"] == 1
         assert result["rows"][0]["名前"] == "商品B"
+
+    def test_multiple_statements_blocked(self, csv_tools, products_csv, tmp_path):
+        """Reject a second statement after the SELECT."""
+        with patch("aden_tools.tools.file_system_toolkits.security.WORKSPACES_DIR", str(tmp_path)):
+            result = csv_tools["csv_sql"](
+                path="products.csv",
+                workspace_id=TEST_WORKSPACE_ID,
+                agent_id=TEST_AGENT_ID,
+                session_id=TEST_SESSION_ID,
+                query="SELECT * FROM data; SET threads = 1",
+            )
+
+        assert "error" in result
+        assert "single" in result["error"]
+
+    def test_large_result_spills_to_data_dir(self, csv_tools, large_csv, tmp_path):
+        """Rows past max_rows are saved to a data file."""
+        data_dir = tmp_path / "data"
+        with patch("aden_tools.tools.file_system_toolkits.security.WORKSPACES_DIR", str(tmp_path)):
+            result = csv_tools["csv_sql"](
+                path="large.csv",
+                workspace_id=TEST_WORKSPACE_ID,
+                agent_id=TEST_AGENT_ID,
+                session_id=TEST_SESSION_ID,
+                query="SELECT * FROM data",
+                max_rows=3,
+                data_dir=str(data_dir),
+            )
+
+        assert result["success"] is True
+        assert result["row_count"] == 3
+        assert result["truncated"] is True
+        lines = (data_dir / result["filename"]).read_text().splitlines()
+        assert len(lines) == result["total_rows"]
+
+    def test_query_sees_file_changes(self, csv_tools, products_csv, tmp_path):
+        """A cached table is reloaded after the CSV is rewritten."""
+        query = {
+            "path": "products.csv",
+            "workspace_id": TEST_WORKSPACE_ID,
+            "agent_id": TEST_AGENT_ID,
+            "session_id": TEST_SESSION_ID,
+            "query": "SELECT COUNT(*) AS n FROM data",
+        }
+        with patch("aden_tools.tools.file_system_toolkits.security.WORKSPACES_DIR", str(tmp_path)):
+            first = csv_tools["csv_sql"](**query)
+            products_csv.write_text("id,name\n1,Only\n")
+            second = csv_tools["csv_sql"](**query)
+
+        assert first["rows"] == [{"n": 5}]
+        assert second["rows"] == [{"n": 1}]
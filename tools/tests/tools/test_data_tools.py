@@ -0,0 +1,138 @@
+"""Tests for the data tools (save_data, load_data, append_data, edit_data)."""
+
+import json
+
+import pytest
+from fastmcp import FastMCP
+
+from aden_tools.tools.file_system_toolkits.data_tools import register_tools
+from aden_tools.utils import mapped_file
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch):
+    monkeypatch.setattr(mapped_file, "_open", mapped_file.OrderedDict())
+
+
+@pytest.fixture
+def tools():
+    mcp = FastMCP("test-server")
+    register_tools(mcp)
+    return {name: tool.fn for name, tool in mcp._tool_manager._tools.items()}
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    return str(tmp_path / "data")
+
+
+class TestLoadData:
+    def test_byte_paging_round_trips_unicode(self, tools, data_dir):
+        text = "naïve café → 😀 " * 50
+        tools["save_data"]("u.txt", text, data_dir)
+
+        offset, pieces = 0, []
+        while True:
+            result = tools["load_data"]("u.txt", data_dir, offset_bytes=offset, limit_bytes=7)
+            pieces.append(result["content"])
+            offset = result["next_offset_bytes"]
+            if not result["has_more"]:
+                break
+
+        assert "".join(pieces) == text
+        assert result["file_size_bytes"] == len(text.encode())
+
+    def test_offset_beyond_end(self, tools, data_dir):
+        tools["save_data"]("a.txt", "abc", data_dir)
+
+        result = tools["load_data"]("a.txt", data_dir, offset_bytes=10)
+
+        assert result["content"] == ""
+        assert result["has_more"] is False
+
+    def test_line_range(self, tools, data_dir):
+        tools["save_data"]("log.txt", "\n".join(f"row {i}" for i in range(1, 501)), data_dir)
+
+        result = tools["load_data"]("log.txt", data_dir, line_start=200, line_count=3)
+
+        assert result["content"] == "row 200\nrow 201\nrow 202\n"
+        assert result["lines_read"] == 3
+        assert result["next_line_start"] == 203
+        assert result["total_lines"] == 500
+        assert result["has_more"] is True
+
+        last = tools["load_data"]("log.txt", data_dir, line_start=499, line_count=10)
+        assert last["content"] == "row 499\nrow 500"
+        assert last["has_more"] is False
+
+    def test_line_range_respects_limit_bytes(self, tools, data_dir):
+        tools["save_data"]("log.txt", "\n".join("x" * 10 for _ in range(100)), data_dir)
+
+        result = tools["load_data"](
+            "log.txt", data_dir, line_start=1, line_count=50, limit_bytes=35
+        )
+
+        assert result["lines_read"] == 3
+        assert result["next_line_start"] == 4
+
+    def test_overlong_line_is_cut(self, tools, data_dir):
+        tools["save_data"]("wide.txt", "a" * 100 + "\nnext", data_dir)
+
+        result = tools["load_data"]("wide.txt", data_dir, line_start=1, limit_bytes=10)
+
+        assert result["content"] == "a" * 10
+        assert result["line_truncated"] is True
+        assert result["next_offset_bytes"] == 10
+        assert result["next_line_start"] == 2
+
+    def test_json_path(self, tools, data_dir):
+        doc = {"items": [{"id": i, "name": f"item {i}"} for i in range(100)]}
+        tools["save_data"]("doc.json", json.dumps(doc, indent=2), data_dir)
+
+        one = tools["load_data"]("doc.json", data_dir, json_path="$.items[42].name")
+        many = tools["load_data"]("doc.json", data_dir, json_path="$.items[1:4].id")
+        small = tools["load_data"]("doc.json", data_dir, json_path="$.items", limit_bytes=50)
+        missing = tools["load_data"]("doc.json", data_dir, json_path="$.nope")
+
+        assert json.loads(one["content"]) == "item 42"
+        assert json.loads(many["content"]) == [1, 2, 3]
+        assert many["count"] == 3
+        assert small["truncated"] is True
+        assert len(small["content"].encode()) <= 50
+        assert missing == {"error": "json_path '$.nope' matched nothing"}
+
+    def test_json_path_on_text_file(self, tools, data_dir):
+        tools["save_data"]("notes.txt", "just text", data_dir)
+
+        result = tools["load_data"]("notes.txt", data_dir, json_path="$.a")
+
+        assert "Invalid json_path for notes.txt" in result["error"]
+
+
+class TestWrites:
+    def test_load_sees_save_append_and_edit(self, tools, data_dir):
+        tools["save_data"]("r.txt", "one\ntwo", data_dir)
+        assert tools["load_data"]("r.txt", data_dir, line_start=2)["content"] == "two"
+
+        appended = tools["append_data"]("r.txt", "\nthree", data_dir)
+        assert appended["size_bytes"] == len("one\ntwo\nthree")
+        assert tools["load_data"]("r.txt", data_dir, line_start=3)["content"] == "three"
+
+        edited = tools["edit_data"]("r.txt", "two", "TWO!", data_dir)
+        assert edited["size_bytes"] == len("one\nTWO!\nthree")
+        assert tools["load_data"]("r.txt", data_dir)["content"] == "one\nTWO!\nthree"
+
+    def test_edit_same_size_in_place(self, tools, data_dir, tmp_path):
+        tools["save_data"]("r.txt", "alpha beta gamma", data_dir)
+
+        result = tools["edit_data"]("r.txt", "beta", "BETA", data_dir)
+
+        assert result["replacements"] == 1
+        assert (tmp_path / "data" / "r.txt").read_text() == "alpha BETA gamma"
+
+    def test_edit_requires_unique_non_empty_match(self, tools, data_dir):
+        tools["save_data"]("r.txt", "aa bb aa", data_dir)
+
+        assert "found 2 times" in tools["edit_data"]("r.txt", "aa", "x", data_dir)["error"]
+        assert "not found" in tools["edit_data"]("r.txt", "zz", "x", data_dir)["error"]
+        assert "must not be empty" in tools["edit_data"]("r.txt", "", "x", data_dir)["error"]
@@ -640,6 +640,19 @@ def test_get_info_basic_xlsx(self, excel_tools, basic_xlsx, tmp_path):
         assert result["sheets"][0]["columns"] == ["name", "age", "city"]
         assert result["sheets"][0]["row_count"] == 3
 
+    def test_get_info_column_stats(self, excel_tools, basic_xlsx, tmp_path):
+        """Per-column stats are reported with each sheet."""
+        with patch("aden_tools.tools.file_system_toolkits.security.WORKSPACES_DIR", str(tmp_path)):
+            result = excel_tools["excel_info"](
+                path="basic.xlsx",
+                workspace_id=TEST_WORKSPACE_ID,
+                agent_id=TEST_AGENT_ID,
+                session_id=TEST_SESSION_ID,
+            )
+
+        age = result["sheets"][0]["column_stats"][1]
+        assert age == {"name": "age", "non_null": 3, "types": {"int": 3}, "min": 25, "max": 35}
+
     def test_get_info_multi_sheet_xlsx(self, excel_tools, multi_sheet_xlsx, tmp_path):
         """Get info about a multi-sheet Excel file."""
         with patch("aden_tools.tools.file_system_toolkits.security.WORKSPACES_DIR", str(tmp_path)):
@@ -1116,6 +1129,26 @@ def test_search_no_matches(self, excel_tools, basic_xlsx, tmp_path):
         assert result["match_count"] == 0
         assert result["matches"] == []
 
+    def test_search_sees_appended_rows(self, excel_tools, basic_xlsx, tmp_path):
+        """excel_append invalidates the cached workbook."""
+        with patch("aden_tools.tools.file_system_toolkits.security.WORKSPACES_DIR", str(tmp_path)):
+            ids = {
+                "path": "basic.xlsx",
+                "workspace_id": TEST_WORKSPACE_ID,
+                "agent_id": TEST_AGENT_ID,
+                "session_id": TEST_SESSION_ID,
+            }
+            before = excel_tools["excel_search"](**ids, search_term="Seattle")
+            excel_tools["excel_append"](**ids, rows=[{"name": "Dan", "age": 40, "city": "Seattle"}])
+            after = excel_tools["excel_search"](**ids, search_term="Seattle")
+            info = excel_tools["excel_info"](**ids)
+
+        assert before["match_count"] == 0
+        assert after["matches"] == [
+            {"sheet": "Sheet1", "row": 5, "column": "city", "column_index": 3, "value": "Seattle"}
+        ]
+        assert info["sheets"][0]["row_count"] == 4
+
     def test_search_empty_term_error(self, excel_tools, basic_xlsx, tmp_path):
         """Return error for empty search term."""
         with patch("aden_tools.tools.file_system_toolkits.security.WORKSPACES_DIR", str(tmp_path)):
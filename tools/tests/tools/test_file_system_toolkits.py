@@ -533,6 +533,67 @@ def test_grep_search_multiple_matches_per_line(
         assert result["success"] is True
         assert result["total_matches"] == 2  # Line 1 and Line 3
 
+    def test_grep_search_skips_ignored_and_binary_files(
+        self, grep_search_fn, mock_workspace, mock_secure_path, tmp_path
+    ):
+        """Dependency folders, .gitignore'd paths and binary files are skipped."""
+        (tmp_path / ".gitignore").write_text("*.log\nbuild/\n")
+        (tmp_path / "app.py").write_text("needle\n")
+        (tmp_path / "debug.log").write_text("needle\n")
+        (tmp_path / "image.bin").write_bytes(b"\0needle")
+        for folder in ("node_modules/pkg", "build"):
+            (tmp_path / folder).mkdir(parents=True)
+            (tmp_path / folder / "x.js").write_text("needle\n")
+
+        result = grep_search_fn(path=".", pattern="needle", recursive=True, **mock_workspace)
+        everything = grep_search_fn(
+            path=".", pattern="needle", recursive=True, include_ignored=True, **mock_workspace
+        )
+
+        assert [m["file"].rsplit(os.sep, 1)[-1] for m in result["matches"]] == ["app.py"]
+        assert everything["total_matches"] == 4
+
+    def test_grep_search_continuation_token(
+        self, grep_search_fn, mock_workspace, mock_secure_path, tmp_path
+    ):
+        """Capped results resume where they stopped and add up to the full result."""
+        for n in range(3):
+            (tmp_path / f"f{n}.txt").write_text("".join(f"hit {i}\n" for i in range(4)))
+        full = grep_search_fn(path=".", pattern="hit", recursive=True, **mock_workspace)
+
+        pages, token = [], ""
+        while True:
+            result = grep_search_fn(
+                path=".",
+                pattern="hit",
+                recursive=True,
+                max_results=5,
+                continuation_token=token,
+                **mock_workspace,
+            )
+            pages.extend(result["matches"])
+            if not result.get("truncated"):
+                break
+            token = result["next_token"]
+
+        assert full["total_matches"] == 12
+        assert pages == full["matches"]
+
+        other = grep_search_fn(path=".", pattern="miss", continuation_token=token, **mock_workspace)
+        assert "different search" in other["error"]
+
+    def test_grep_search_anchors_and_crlf(
+        self, grep_search_fn, mock_workspace, mock_secure_path, tmp_path
+    ):
+        """^ and $ still apply per line, including on Windows line endings."""
+        (tmp_path / "code.py").write_bytes(b"x = 1\r\ndef run():\r\n    def inner(): pass\r\n")
+
+        starts = grep_search_fn(path=".", pattern="^def", **mock_workspace)
+        ends = grep_search_fn(path=".", pattern=r"\):$", **mock_workspace)
+
+        assert [m["line_number"] for m in starts["matches"]] == [2]
+        assert [m["line_number"] for m in ends["matches"]] == [2]
+
 
 class TestExecuteCommandTool:
     """Tests for execute_command_tool."""
@@ -10,6 +10,7 @@
 
 from __future__ import annotations
 
+import json
 from unittest.mock import MagicMock, patch
 
 import httpx
@@ -70,7 +71,7 @@ def test_handle_response_422(self):
         assert "error" in result
         assert "Validation" in result["error"]
 
-    @patch("aden_tools.tools.github_tool.github_tool.httpx.get")
+    @patch("aden_tools.tools.github_tool.github_tool.httpx.Client.get")
     def test_list_repos(self, mock_get):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -86,7 +87,7 @@ def test_list_repos(self, mock_get):
         assert result["success"] is True
         assert len(result["data"]) == 2
 
-    @patch("aden_tools.tools.github_tool.github_tool.httpx.get")
+    @patch("aden_tools.tools.github_tool.github_tool.httpx.Client.get")
     def test_list_repos_authenticated_user(self, mock_get):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -98,7 +99,7 @@ def test_list_repos_authenticated_user(self, mock_get):
         call_url = mock_get.call_args.args[0]
         assert "/user/repos" in call_url
 
-    @patch("aden_tools.tools.github_tool.github_tool.httpx.get")
+    @patch("aden_tools.tools.github_tool.github_tool.httpx.Client.get")
     def test_get_repo(self, mock_get):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -115,7 +116,7 @@ def test_get_repo(self, mock_get):
         assert result["success"] is True
         assert result["data"]["name"] == "test-repo"
 
-    @patch("aden_tools.tools.github_tool.github_tool.httpx.get")
+    @patch("aden_tools.tools.github_tool.github_tool.httpx.Client.get")
     def test_search_repos(self, mock_get):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -130,7 +131,7 @@ def test_search_repos(self, mock_get):
         assert result["success"] is True
         assert "items" in result["data"]
 
-    @patch("aden_tools.tools.github_tool.github_tool.httpx.get")
+    @patch("aden_tools.tools.github_tool.github_tool.httpx.Client.get")
     def test_list_issues(self, mock_get):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -145,7 +146,7 @@ def test_list_issues(self, mock_get):
         assert result["success"] is True
         assert len(result["data"]) == 2
 
-    @patch("aden_tools.tools.github_tool.github_tool.httpx.get")
+    @patch("aden_tools.tools.github_tool.github_tool.httpx.Client.get")
     def test_get_issue(self, mock_get):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -161,7 +162,7 @@ def test_get_issue(self, mock_get):
         assert result["success"] is True
         assert result["data"]["title"] == "Test Issue"
 
-    @patch("aden_tools.tools.github_tool.github_tool.httpx.post")
+    @patch("aden_tools.tools.github_tool.github_tool.httpx.Client.post")
     def test_create_issue(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 201
@@ -181,7 +182,7 @@ def test_create_issue(self, mock_post):
         call_json = mock_post.call_args.kwargs["json"]
         assert call_json["labels"] == ["bug"]
 
-    @patch("aden_tools.tools.github_tool.github_tool.httpx.patch")
+    @patch("aden_tools.tools.github_tool.github_tool.httpx.Client.patch")
     def test_update_issue(self, mock_patch):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -197,7 +198,7 @@ def test_update_issue(self, mock_patch):
         assert result["success"] is True
         assert result["data"]["state"] == "closed"
 
-    @patch("aden_tools.tools.github_tool.github_tool.httpx.get")
+    @patch("aden_tools.tools.github_tool.github_tool.httpx.Client.get")
     def test_list_pull_requests(self, mock_get):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -211,7 +212,7 @@ def test_list_pull_requests(self, mock_get):
         assert result["success"] is True
         assert len(result["data"]) == 1
 
-    @patch("aden_tools.tools.github_tool.github_tool.httpx.get")
+    @patch("aden_tools.tools.github_tool.github_tool.httpx.Client.get")
     def test_get_pull_request(self, mock_get):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -228,7 +229,7 @@ def test_get_pull_request(self, mock_get):
         assert result["success"] is True
         assert result["data"]["title"] == "Test PR"
 
-    @patch("aden_tools.tools.github_tool.github_tool.httpx.post")
+    @patch("aden_tools.tools.github_tool.github_tool.httpx.Client.post")
     def test_create_pull_request(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 201
@@ -246,7 +247,7 @@ def test_create_pull_request(self, mock_post):
         assert result["success"] is True
         assert result["data"]["number"] == 10
 
-    @patch("aden_tools.tools.github_tool.github_tool.httpx.get")
+    @patch("aden_tools.tools.github_tool.github_tool.httpx.Client.get")
     def test_search_code(self, mock_get):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -261,7 +262,7 @@ def test_search_code(self, mock_get):
         assert result["success"] is True
         assert "items" in result["data"]
 
-    @patch("aden_tools.tools.github_tool.github_tool.httpx.get")
+    @patch("aden_tools.tools.github_tool.github_tool.httpx.Client.get")
     def test_list_branches(self, mock_get):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -276,7 +277,7 @@ def test_list_branches(self, mock_get):
         assert result["success"] is True
         assert len(result["data"]) == 2
 
-    @patch("aden_tools.tools.github_tool.github_tool.httpx.get")
+    @patch("aden_tools.tools.github_tool.github_tool.httpx.Client.get")
     def test_get_branch(self, mock_get):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -317,7 +318,7 @@ def test_no_credentials_returns_error(self, mcp):
     def test_env_var_token(self, mcp):
         """Token from GITHUB_TOKEN env var is used."""
         with patch("os.getenv", return_value="ghp_env_token"):
-            with patch("aden_tools.tools.github_tool.github_tool.httpx.get") as mock_get:
+            with patch("aden_tools.tools.github_tool.github_tool.httpx.Client.get") as mock_get:
                 mock_response = MagicMock()
                 mock_response.status_code = 200
                 mock_response.json.return_value = []
@@ -336,7 +337,7 @@ def test_credential_store_token(self, mcp):
         mock_credentials = MagicMock()
         mock_credentials.get.return_value = "ghp_store_token"
 
-        with patch("aden_tools.tools.github_tool.github_tool.httpx.get") as mock_get:
+        with patch("aden_tools.tools.github_tool.github_tool.httpx.Client.get") as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = []
@@ -360,7 +361,7 @@ class TestGitHubListRepos:
     def mcp(self):
         return FastMCP("test-server")
 
-    @patch("aden_tools.tools.github_tool.github_tool.httpx.get")
+    @patch("aden_tools.tools.github_tool.github_tool.httpx.Client.get")
     def test_list_repos_success(self, mock_get, mcp):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -375,7 +376,7 @@ def test_list_repos_success(self, mock_get, mcp):
 
             assert result["success"] is True
 
-    @patch("aden_tools.tools.github_tool.github_tool.httpx.get")
+    @patch("aden_tools.tools.github_tool.github_tool.httpx.Client.get")
     def test_list_repos_timeout(self, mock_get, mcp):
         mock_get.side_effect = httpx.TimeoutException("Timeout")
 
@@ -388,7 +389,7 @@ def test_list_repos_timeout(self, mock_get, mcp):
             assert "error" in result
             assert "timed out" in result["error"]
 
-    @patch("aden_tools.tools.github_tool.github_tool.httpx.get")
+    @patch("aden_tools.tools.github_tool.github_tool.httpx.Client.get")
     def test_list_repos_network_error(self, mock_get, mcp):
         mock_get.side_effect = httpx.RequestError("Network error")
 
@@ -407,7 +408,7 @@ class TestGitHubGetRepo:
     def mcp(self):
         return FastMCP("test-server")
 
-    @patch("aden_tools.tools.github_tool.github_tool.httpx.get")
+    @patch("aden_tools.tools.github_tool.github_tool.httpx.Client.get")
     def test_get_repo_success(self, mock_get, mcp):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -428,7 +429,7 @@ class TestGitHubSearchRepos:
     def mcp(self):
         return FastMCP("test-server")
 
-    @patch("aden_tools.tools.github_tool.github_tool.httpx.get")
+    @patch("aden_tools.tools.github_tool.github_tool.httpx.Client.get")
     def test_search_repos_success(self, mock_get, mcp):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -449,7 +450,7 @@ class TestGitHubIssues:
     def mcp(self):
         return FastMCP("test-server")
 
-    @patch("aden_tools.tools.github_tool.github_tool.httpx.get")
+    @patch("aden_tools.tools.github_tool.github_tool.httpx.Client.get")
     def test_list_issues_success(self, mock_get, mcp):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -464,7 +465,7 @@ def test_list_issues_success(self, mock_get, mcp):
 
             assert result["success"] is True
 
-    @patch("aden_tools.tools.github_tool.github_tool.httpx.get")
+    @patch("aden_tools.tools.github_tool.github_tool.httpx.Client.get")
     def test_get_issue_success(self, mock_get, mcp):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -479,7 +480,7 @@ def test_get_issue_success(self, mock_get, mcp):
 
             assert result["success"] is True
 
-    @patch("aden_tools.tools.github_tool.github_tool.httpx.post")
+    @patch("aden_tools.tools.github_tool.github_tool.httpx.Client.post")
     def test_create_issue_success(self, mock_post, mcp):
         mock_response = MagicMock()
         mock_response.status_code = 201
@@ -494,7 +495,7 @@ def test_create_issue_success(self, mock_post, mcp):
 
             assert result["success"] is True
 
-    @patch("aden_tools.tools.github_tool.github_tool.httpx.patch")
+    @patch("aden_tools.tools.github_tool.github_tool.httpx.Client.patch")
     def test_update_issue_success(self, mock_patch, mcp):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -509,13 +510,38 @@ def test_update_issue_success(self, mock_patch, mcp):
 
             assert result["success"] is True
 
+    @patch("aden_tools.tools.github_tool.github_tool.httpx.Client.get")
+    def test_fetch_issues_follows_pages_into_data_dir(self, mock_get, mcp, tmp_path):
+        def page_of_issues(url, params, **kwargs):
+            start = (params["page"] - 1) * 100
+            response = MagicMock()
+            response.status_code = 200
+            response.json.return_value = [
+                {"number": n} for n in range(start, min(start + 100, 250))
+            ]
+            return response
+
+        mock_get.side_effect = page_of_issues
+
+        with patch("os.getenv", return_value="ghp_test"):
+            register_tools(mcp, credentials=None)
+            fetch_issues = mcp._tool_manager._tools["github_fetch_issues"].fn
+
+            result = fetch_issues(owner="owner", repo="repo", data_dir=str(tmp_path))
+
+        assert result["success"] is True
+        assert result["count"] == 250
+        assert result["pages"] == 3
+        lines = (tmp_path / result["filename"]).read_text().splitlines()
+        assert [json.loads(line)["number"] for line in lines] == list(range(250))
+
 
 class TestGitHubPullRequests:
     @pytest.fixture
     def mcp(self):
         return FastMCP("test-server")
 
-    @patch("aden_tools.tools.github_tool.github_tool.httpx.get")
+    @patch("aden_tools.tools.github_tool.github_tool.httpx.Client.get")
     def test_list_pull_requests_success(self, mock_get, mcp):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -530,7 +556,7 @@ def test_list_pull_requests_success(self, mock_get, mcp):
 
             assert result["success"] is True
 
-    @patch("aden_tools.tools.github_tool.github_tool.httpx.get")
+    @patch("aden_tools.tools.github_tool.github_tool.httpx.Client.get")
     def test_get_pull_request_success(self, mock_get, mcp):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -545,7 +571,7 @@ def test_get_pull_request_success(self, mock_get, mcp):
 
             assert result["success"] is True
 
-    @patch("aden_tools.tools.github_tool.github_tool.httpx.post")
+    @patch("aden_tools.tools.github_tool.github_tool.httpx.Client.post")
     def test_create_pull_request_success(self, mock_post, mcp):
         mock_response = MagicMock()
         mock_response.status_code = 201
@@ -572,7 +598,7 @@ class TestGitHubSearch:
     def mcp(self):
         return FastMCP("test-server")
 
-    @patch("aden_tools.tools.github_tool.github_tool.httpx.get")
+    @patch("aden_tools.tools.github_tool.github_tool.httpx.Client.get")
     def test_search_code_success(self, mock_get, mcp):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -593,7 +619,7 @@ class TestGitHubBranches:
     def mcp(self):
         return FastMCP("test-server")
 
-    @patch("aden_tools.tools.github_tool.github_tool.httpx.get")
+    @patch("aden_tools.tools.github_tool.github_tool.httpx.Client.get")
     def test_list_branches_success(self, mock_get, mcp):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -608,7 +634,7 @@ def test_list_branches_success(self, mock_get, mcp):
 
             assert result["success"] is True
 
-    @patch("aden_tools.tools.github_tool.github_tool.httpx.get")
+    @patch("aden_tools.tools.github_tool.github_tool.httpx.Client.get")
     def test_get_branch_success(self, mock_get, mcp):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -0,0 +1,143 @@
+"""Tests for the grep_search engine: ignore rules, literal extraction and the trigram index."""
+
+import os
+import re
+import time
+from pathlib import Path
+
+import pytest
+
+from aden_tools.tools.file_system_toolkits.grep_search import search_engine
+from aden_tools.tools.file_system_toolkits.grep_search.search_engine import (
+    TrigramIndex,
+    list_files,
+    prefilter_for,
+    required_literals,
+    search_files,
+)
+
+
+def _rels(entries) -> list[str]:
+    return [e.rel for e in entries]
+
+
+def test_nested_ignore_files_and_negation(tmp_path: Path):
+    (tmp_path / ".gitignore").write_text("*.tmp\n!keep.tmp\n/top.txt\n")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / ".ignore").write_text("secret/\n")
+    (tmp_path / "sub" / "secret").mkdir()
+    for name in ("a.tmp", "keep.tmp", "top.txt", "sub/top.txt", "sub/b.py", "sub/secret/c.py"):
+        (tmp_path / name).write_text("x")
+
+    assert _rels(list_files(str(tmp_path), recursive=True)) == [
+        ".gitignore",
+        "keep.tmp",
+        "sub/.ignore",
+        "sub/b.py",
+        "sub/top.txt",
+    ]
+    assert _rels(list_files(str(tmp_path), recursive=False)) == [".gitignore", "keep.tmp"]
+
+
+def test_oversized_files_are_skipped(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(search_engine, "MAX_FILE_BYTES", 10)
+    (tmp_path / "small.txt").write_text("tiny")
+    (tmp_path / "big.txt").write_text("x" * 11)
+
+    assert _rels(list_files(str(tmp_path), recursive=True)) == ["small.txt"]
+
+
+@pytest.mark.parametrize(
+    ("pattern", "literals"),
+    [
+        (r"def load_\w+\(", ["def load_"]),
+        ("(?i)TODO: (fix)me", ["TODO: ", "fixme"[:3]]),
+        ("foo|barbaz", []),
+        (r"[a-z]+\d{3}", []),
+    ],
+)
+def test_required_literals(pattern, literals):
+    assert required_literals(pattern) == literals
+
+
+def test_index_candidates_are_a_superset_of_matches(tmp_path: Path):
+    words = ["alpha", "Beta", "gamma", "delta", "ÉCOLE", "straße"]
+    for i in range(60):
+        (tmp_path / f"f{i:02}.txt").write_text(f"{words[i % 6]} {i}\nfiller {i * 7}\n")
+    entries = list_files(str(tmp_path), recursive=True)
+    index = TrigramIndex()
+    index.refresh(entries)
+
+    for pattern in ["(?i)beta", "gamma 1", "(?i)école", "straße", "filler 14\\b"]:
+        regex = re.compile(pattern)
+        expected, _ = search_files(entries, regex, prefilter_for(pattern), 1000)
+        narrowed = index.candidates(entries, required_literals(pattern))
+        found, _ = search_files(narrowed, regex, prefilter_for(pattern), 1000)
+
+        assert [(m.entry.rel, m.line_number) for m in found] == [
+            (m.entry.rel, m.line_number) for m in expected
+        ]
+        assert len(narrowed) < len(entries)
+
+
+def test_index_refreshes_changed_files_only(tmp_path: Path):
+    for i in range(5):
+        (tmp_path / f"f{i}.txt").write_text("old text")
+    index = TrigramIndex()
+    index.refresh(list_files(str(tmp_path), recursive=True))
+    assert index.files_indexed == 5
+
+    changed = tmp_path / "f3.txt"
+    changed.write_text("brand new text")
+    os.utime(changed, ns=(time.time_ns(), time.time_ns() + 1_000_000))
+    (tmp_path / "f4.txt").unlink()
+    entries = list_files(str(tmp_path), recursive=True)
+    index.refresh(entries)
+
+    assert index.files_indexed == 6
+    assert _rels(index.candidates(entries, ["brand new"])) == ["f3.txt"]
+
+
+def test_repeated_searches_index_once_and_match_a_full_scan(tmp_path: Path):
+    """
+    Repeated searches of a tree for rare symbols: the indexed engine returns
+    what a line-by-line walk finds, indexes each file once and reads only
+    the candidate files.
+    """
+    for d in range(10):
+        folder = tmp_path / f"pkg{d}"
+        folder.mkdir()
+        for f in range(20):
+            lines = [f"def function_{d}_{f}_{n}(value):\n    return value\n" for n in range(20)]
+            (folder / f"mod{f}.py").write_text("".join(lines))
+    patterns = [
+        r"function_7_12_5\b",
+        "function_9_19_19",
+        r"missing_symbol\(",
+        "def function_3_3_3",
+    ]
+
+    def legacy(pattern: str) -> list:
+        regex, found = re.compile(pattern), []
+        for root, _, names in os.walk(tmp_path):
+            for name in names:
+                path = os.path.join(root, name)
+                with open(path, encoding="utf-8") as f:
+                    for number, line in enumerate(f, 1):
+                        if regex.search(line):
+                            found.append((os.path.relpath(path, tmp_path), number))
+        return sorted(found)
+
+    index = TrigramIndex()
+    candidate_counts = []
+    for pattern in patterns:
+        entries = list_files(str(tmp_path), recursive=True)
+        index.refresh(entries)
+        candidates = index.candidates(entries, required_literals(pattern))
+        candidate_counts.append(len(candidates))
+        found, _ = search_files(candidates, re.compile(pattern), prefilter_for(pattern), 500)
+
+        assert sorted((m.entry.rel, m.line_number) for m in found) == legacy(pattern)
+
+    assert index.files_indexed == 200
+    assert max(candidate_counts) < 200
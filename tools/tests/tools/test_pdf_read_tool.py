@@ -1,11 +1,25 @@
 """Tests for pdf_read tool (FastMCP)."""
 
+import os
+import shutil
+import stat
 from pathlib import Path
 
 import pytest
 from fastmcp import FastMCP
+from pypdf import PdfReader
+from pypdf._page import PageObject
 
-from aden_tools.tools.pdf_read_tool import register_tools
+from aden_tools.tools.pdf_read_tool import page_cache, pdf_read_tool, register_tools
+from aden_tools.tools.pdf_read_tool.page_cache import PdfDocument
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path: Path, monkeypatch):
+    """Keep extracted pages in the test's tmp dir."""
+    directory = tmp_path / "pdf_cache"
+    monkeypatch.setattr(page_cache, "CACHE_DIR", str(directory))
+    return directory
 
 
 @pytest.fixture
@@ -15,6 +29,54 @@ def pdf_read_fn(mcp: FastMCP):
     return mcp._tool_manager._tools["pdf_read"].fn
 
 
+@pytest.fixture
+def pdf_search_fn(mcp: FastMCP):
+    """Register and return the pdf_search tool function."""
+    register_tools(mcp)
+    return mcp._tool_manager._tools["pdf_search"].fn
+
+
+def make_pdf(path: Path, texts: list[str]) -> Path:
+    """Write a PDF with one Helvetica text page per entry of *texts*."""
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [%s] /Count %d >>"
+        % (b" ".join(b"%d 0 R" % (4 + 2 * i) for i in range(len(texts))), len(texts)),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    for i, text in enumerate(texts):
+        lines = " ".join(f"({line}) Tj T*" for line in text.split("\n"))
+        stream = f"BT /F1 12 Tf 72 720 Td 14 TL {lines} ET".encode()
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % (5 + 2 * i)
+        )
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1,
+        xref,
+    )
+    path.write_bytes(bytes(out))
+    return path
+
+
+@pytest.fixture
+def report_pdf(tmp_path: Path) -> Path:
+    texts = [f"Page {i + 1} of the report\nnothing to see" for i in range(40)]
+    texts[4] = "Revenue guidance raised\nrevenue up ten percent, revenue"
+    texts[21] = "Costs flat\nrevenue down"
+    texts[30] = "Guidance unchanged"
+    return make_pdf(tmp_path / "report.pdf", texts)
+
+
 class TestPdfReadTool:
     """Tests for pdf_read tool."""
 
@@ -111,3 +173,165 @@ def __init__(self, path: Path) -> None:  # noqa: ARG002
         # New behavior: explicit truncation metadata instead of silent truncation
         assert result.get("truncated") is True
         assert "truncation_warning" in result
+
+
+class TestPdfPageCache:
+    """Tests for per-page caching, parallel extraction and spilling."""
+
+    def test_read_real_pdf(self, pdf_read_fn, report_pdf: Path):
+        result = pdf_read_fn(file_path=str(report_pdf), pages="5-6")
+
+        assert result["pages_extracted"] == 2
+        assert result["content"].startswith("--- Page 5 ---\nRevenue guidance raised")
+        assert "--- Page 6 ---\nPage 6 of the report" in result["content"]
+
+    def test_second_read_uses_cached_pages(self, pdf_read_fn, report_pdf, monkeypatch):
+        first = pdf_read_fn(file_path=str(report_pdf), pages="1-10")
+        monkeypatch.setattr(
+            PageObject, "extract_text", lambda *a, **k: pytest.fail("page re-extracted")
+        )
+
+        assert pdf_read_fn(file_path=str(report_pdf), pages="1-10") == first
+
+    def test_cache_is_keyed_by_content_not_path(self, report_pdf, tmp_path, monkeypatch):
+        list(PdfDocument(str(report_pdf)).iter_pages(range(3)))
+        copy = tmp_path / "copy.pdf"
+        shutil.copy(report_pdf, copy)
+        monkeypatch.setattr(
+            PageObject, "extract_text", lambda *a, **k: pytest.fail("page re-extracted")
+        )
+
+        pages = list(PdfDocument(str(copy)).iter_pages(range(3)))
+
+        assert pages[2] == (2, "Page 3 of the report\nnothing to see\n")
+
+    def test_process_pool_matches_in_process_extraction(self, report_pdf, monkeypatch):
+        expected = [page.extract_text() for page in PdfReader(report_pdf).pages]
+        monkeypatch.setattr(page_cache, "_workers", lambda: 2)
+        monkeypatch.setattr(page_cache, "PARALLEL_MIN_PAGES", 2)
+        submitted = []
+        original_submit = PdfDocument._submit
+
+        def submit(self, missing):
+            submitted.extend(missing)
+            return original_submit(self, missing)
+
+        monkeypatch.setattr(PdfDocument, "_submit", submit)
+        try:
+            pages = list(PdfDocument(str(report_pdf)).iter_pages(range(40)))
+        finally:
+            page_cache._reset_pool()
+
+        assert submitted == list(range(40))
+        assert [text for _, text in pages] == expected
+
+    def test_long_content_is_streamed_to_data_dir(
+        self, pdf_read_fn, report_pdf, tmp_path, monkeypatch
+    ):
+        monkeypatch.setattr(pdf_read_tool, "MAX_INLINE_CHARS", 200)
+        full = pdf_read_fn(file_path=str(report_pdf))["content"]
+        data_dir = tmp_path / "data"
+
+        result = pdf_read_fn(file_path=str(report_pdf), data_dir=str(data_dir))
+
+        assert result["total_chars"] == len(full)
+        assert len(result["content"]) <= 200
+        assert full.startswith(result["content"])
+        assert (data_dir / result["filename"]).read_text() == full
+
+    def test_repeated_full_reads_extract_each_page_once(self, pdf_read_fn, tmp_path, monkeypatch):
+        """A long PDF read three times matches pypdf and is extracted on the first read only."""
+        texts = [
+            "\n".join(f"Line {line} of page {page}: quarterly figures" for line in range(40))
+            for page in range(60)
+        ]
+        pdf = make_pdf(tmp_path / "long.pdf", texts)
+        fresh = [page.extract_text() for page in PdfReader(pdf).pages]
+
+        first = pdf_read_fn(file_path=str(pdf), max_pages=60, include_metadata=False)
+        monkeypatch.setattr(
+            PageObject, "extract_text", lambda *a, **k: pytest.fail("page re-extracted")
+        )
+        again = [
+            pdf_read_fn(file_path=str(pdf), max_pages=60, include_metadata=False) for _ in range(2)
+        ]
+
+        assert first["pages_extracted"] == 60
+        assert all(page in first["content"] for page in fresh)
+        assert again == [first, first]
+
+    @pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX permissions")
+    def test_cache_directory_is_private_to_the_user(self, report_pdf, cache_dir):
+        cache_dir.mkdir(mode=0o777)
+        cache_dir.chmod(0o777)
+
+        list(PdfDocument(str(report_pdf)).iter_pages(range(2)))
+
+        assert stat.S_IMODE(cache_dir.stat().st_mode) == 0o700
+
+    def test_cache_directory_of_another_user_is_not_used(self, report_pdf, cache_dir, monkeypatch):
+        def refuse(path):
+            raise PermissionError(f"{path} is owned by another user")
+
+        monkeypatch.setattr(page_cache, "make_private_dir", refuse)
+        document = PdfDocument(str(report_pdf))
+
+        pages = list(document.iter_pages(range(2)))
+
+        assert pages[1] == (1, "Page 2 of the report\nnothing to see\n")
+        assert not cache_dir.exists()
+
+
+class TestPdfSearch:
+    """Tests for pdf_search tool."""
+
+    def test_pages_with_every_word_most_hits_first(self, pdf_search_fn, report_pdf):
+        result = pdf_search_fn(file_path=str(report_pdf), query="revenue")
+
+        assert [(m["page"], m["hits"]) for m in result["matches"]] == [(5, 3), (22, 1)]
+        assert result["matches"][0]["snippet"].startswith("Revenue guidance raised")
+        assert result["hint"] == "Read these pages with pdf_read(pages='5,22')"
+
+        both = pdf_search_fn(file_path=str(report_pdf), query="Revenue GUIDANCE")
+        assert [m["page"] for m in both["matches"]] == [5]
+
+    def test_no_matches(self, pdf_search_fn, report_pdf):
+        result = pdf_search_fn(file_path=str(report_pdf), query="dividend")
+
+        assert result["match_count"] == 0
+        assert "hint" not in result
+
+    def test_index_is_reused(self, pdf_search_fn, report_pdf, monkeypatch):
+        pdf_search_fn(file_path=str(report_pdf), query="revenue")
+        monkeypatch.setattr(PdfDocument, "iter_pages", lambda *a: pytest.fail("index was rebuilt"))
+
+        result = pdf_search_fn(file_path=str(report_pdf), query="guidance")
+
+        assert [m["page"] for m in result["matches"]] == [5, 31]
+
+    def test_search_is_capped_at_max_pages(self, pdf_search_fn, report_pdf, monkeypatch):
+        extracted = []
+        original = PdfDocument.iter_pages
+
+        def iter_pages(self, indices):
+            indices = list(indices)
+            extracted.extend(indices)
+            return original(self, indices)
+
+        monkeypatch.setattr(PdfDocument, "iter_pages", iter_pages)
+
+        result = pdf_search_fn(file_path=str(report_pdf), query="guidance", max_pages=10)
+
+        assert [m["page"] for m in result["matches"]] == [5]
+        assert result["truncated"] is True
+        assert extracted == list(range(10))
+
+    def test_empty_query_error(self, pdf_search_fn, report_pdf):
+        result = pdf_search_fn(file_path=str(report_pdf), query="  ")
+
+        assert result == {"error": "query cannot be empty"}
+
+    def test_file_not_found(self, pdf_search_fn, tmp_path):
+        result = pdf_search_fn(file_path=str(tmp_path / "missing.pdf"), query="x")
+
+        assert "not found" in result["error"].lower()
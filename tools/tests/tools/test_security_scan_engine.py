@@ -0,0 +1,411 @@
+"""Tests for the async security scanning engine, against local listeners."""
+
+from __future__ import annotations
+
+import asyncio
+import datetime
+import errno
+import ssl
+import time
+
+import dns.message
+import dns.rcode
+import dns.rdatatype
+import dns.rrset
+import pytest
+
+from aden_tools.tools.batch_security_scanner import batch_security_scanner, iter_host_scans
+from aden_tools.tools.dns_security_scanner.dns_security_scanner import scan_dns
+from aden_tools.tools.port_scanner import port_scanner
+from aden_tools.tools.port_scanner.port_scanner import scan_ports
+from aden_tools.tools.risk_scorer.risk_scorer import score_results
+from aden_tools.tools.ssl_tls_scanner.ssl_tls_scanner import scan_tls
+from aden_tools.tools.subdomain_enumerator import subdomain_enumerator
+from aden_tools.utils.dns_resolver import DnsResolver
+from aden_tools.utils.scan_engine import (
+    AdaptiveLimiter,
+    clean_hostname,
+    resolve_all,
+    resolve_host,
+    scan_hosts,
+)
+
+
+async def _serve(handler, ssl_context=None, host="127.0.0.1", port=0):
+    server = await asyncio.start_server(handler, host=host, port=port, ssl=ssl_context)
+    return server, server.sockets[0].getsockname()[1]
+
+
+async def _banner(reader, writer, text=b"SSH-2.0-TestServer\r\n", delay=0.0):
+    await asyncio.sleep(delay)
+    writer.write(text)
+    await writer.drain()
+    writer.close()
+
+
+async def _silent(reader, writer):
+    writer.close()
+
+
+@pytest.fixture
+async def listeners():
+    """Two open ports (one with a banner) and one closed port on 127.0.0.1."""
+    banner, banner_port = await _serve(_banner)
+    silent, silent_port = await _serve(_silent)
+    closed, closed_port = await _serve(_silent)
+    closed.close()
+    await closed.wait_closed()
+    yield banner_port, silent_port, closed_port
+    for server in (banner, silent):
+        server.close()
+        await server.wait_closed()
+
+
+@pytest.fixture(scope="module")
+def tls_context(tmp_path_factory):
+    """Server context with a self-signed certificate for 127.0.0.1."""
+    x509 = pytest.importorskip("cryptography.x509")
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+    from cryptography.x509.oid import NameOID
+
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "scanner-test")])
+    now = datetime.datetime.now(datetime.UTC)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(days=1))
+        .not_valid_after(now + datetime.timedelta(days=90))
+        .sign(key, hashes.SHA256())
+    )
+    directory = tmp_path_factory.mktemp("tls")
+    cert_file, key_file = directory / "cert.pem", directory / "key.pem"
+    cert_file.write_bytes(cert.public_bytes(serialization.Encoding.PEM))
+    key_file.write_bytes(
+        key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+    )
+    context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    context.load_cert_chain(cert_file, key_file)
+    return context
+
+
+class TestEngine:
+    def test_clean_hostname(self):
+        assert clean_hostname("https://Example.com:8443/path") == "example.com"
+        assert clean_hostname(" api.example.com ") == "api.example.com"
+
+    async def test_resolution_does_not_block(self, monkeypatch):
+        assert await resolve_host("localhost") == "127.0.0.1"
+
+        async def fake_resolve(name):
+            if name == "gone.example":
+                raise OSError("no such host")
+            return "127.0.0.1"
+
+        monkeypatch.setattr("aden_tools.utils.scan_engine.resolve_host", fake_resolve)
+        assert await resolve_all(["a.example", "gone.example", "a.example"]) == {
+            "a.example": "127.0.0.1",
+            "gone.example": None,
+        }
+
+    async def test_limiter_grows_on_success_and_halves_once_per_window(self):
+        limiter = AdaptiveLimiter(initial=4, maximum=6)
+        for _ in range(4):
+            limiter.success()
+        assert limiter.limit == 5
+
+        async with limiter.slot() as window:
+            pass
+        limiter.congestion(window)
+        limiter.congestion(window)  # same window: no second decrease
+
+        assert limiter.limit == 2
+        assert limiter.decreases == 1
+
+    async def test_limiter_caps_concurrency(self):
+        limiter = AdaptiveLimiter(initial=3, maximum=3)
+        running = 0
+
+        async def work():
+            nonlocal running
+            async with limiter.slot():
+                running += 1
+                assert running <= 3
+                await asyncio.sleep(0.01)
+                running -= 1
+
+        await asyncio.gather(*(work() for _ in range(20)))
+        assert limiter.peak == 3
+
+    async def test_scan_hosts_yields_in_completion_order(self):
+        delays = {"slow": 0.05, "fast": 0.0, "broken": None}
+
+        async def scan(host):
+            if delays[host] is None:
+                raise RuntimeError("boom")
+            await asyncio.sleep(delays[host])
+            return {"delay": delays[host]}
+
+        results = [item async for item in scan_hosts(["slow", "fast", "broken"], scan)]
+
+        assert [host for host, _ in results][-1] == "slow"
+        assert dict(results)["broken"] == {"error": "Scan failed: boom"}
+
+
+class TestPortScan:
+    async def test_open_closed_and_banner(self, listeners):
+        banner_port, silent_port, closed_port = listeners
+
+        result = await scan_ports("127.0.0.1", [banner_port, silent_port, closed_port], 1.0)
+
+        assert [p["port"] for p in result["open_ports"]] == sorted([banner_port, silent_port])
+        banners = {p["port"]: p["banner"] for p in result["open_ports"]}
+        assert banners[banner_port] == "SSH-2.0-TestServer"
+        assert result["closed_ports"] == [closed_port]
+        assert result["ip"] == "127.0.0.1"
+
+    async def test_congestion_is_retried_not_reported_closed(self, listeners, monkeypatch):
+        banner_port = listeners[0]
+        real_check = port_scanner._check_port
+        failures = iter([True, True])
+
+        async def flaky_check(ip, port, timeout):
+            if next(failures, False):
+                return {"open": False, "congested": True}
+            return await real_check(ip, port, timeout)
+
+        monkeypatch.setattr(port_scanner, "_check_port", flaky_check)
+        limiter = AdaptiveLimiter(initial=8)
+
+        result = await scan_ports("127.0.0.1", [banner_port], 1.0, limiter)
+
+        assert [p["port"] for p in result["open_ports"]] == [banner_port]
+        assert limiter.limit < 8
+
+    async def test_out_of_sockets_is_congestion(self, monkeypatch):
+        async def no_sockets(*args, **kwargs):
+            raise OSError(errno.EMFILE, "Too many open files")
+
+        monkeypatch.setattr(asyncio, "open_connection", no_sockets)
+
+        assert await port_scanner._check_port("127.0.0.1", 80, 1.0) == {
+            "open": False,
+            "congested": True,
+        }
+
+    async def test_unresolvable_host(self):
+        result = await scan_ports("bad host name", [80], 1.0)
+
+        assert result == {"error": "Could not resolve hostname: bad host name"}
+
+
+class TestTlsScan:
+    async def test_self_signed_local_server(self, tls_context):
+        server, port = await _serve(_silent, ssl_context=tls_context)
+        try:
+            result = await scan_tls("127.0.0.1", port, timeout=5.0)
+        finally:
+            server.close()
+            await server.wait_closed()
+
+        assert result["tls_version"] in ("TLSv1.2", "TLSv1.3")
+        assert result["grade_input"]["tls_version_ok"]
+        assert result["certificate"]["sha256_fingerprint"]
+        assert any("verification failed" in i["finding"] for i in result["issues"])
+
+    async def test_closed_port(self, listeners):
+        result = await scan_tls("127.0.0.1", listeners[2], timeout=2.0)
+
+        assert "refused" in result["error"]
+
+
+class FakeDnsServer(asyncio.DatagramProtocol):
+    """Answers TXT/MX queries from a zone dict; NXDOMAIN for everything else."""
+
+    def __init__(self, records):
+        self.records = records
+        self.queries = 0
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, data, addr):
+        self.queries += 1
+        query = dns.message.from_wire(data)
+        question = query.question[0]
+        response = dns.message.make_response(query)
+        key = (str(question.name).rstrip("."), dns.rdatatype.to_text(question.rdtype))
+        if key in self.records:
+            response.answer.append(
+                dns.rrset.from_text(question.name, 300, "IN", key[1], *self.records[key])
+            )
+        else:
+            response.set_rcode(dns.rcode.NXDOMAIN)
+        self.transport.sendto(response.to_wire(), addr)
+
+
+class TestDnsScan:
+    async def test_records_from_a_local_nameserver(self):
+        records = {
+            ("example.test", "TXT"): ['"v=spf1 include:_spf.example.test -all"'],
+            ("_dmarc.example.test", "TXT"): ['"v=DMARC1; p=reject"'],
+            ("google._domainkey.example.test", "TXT"): ['"v=DKIM1; k=rsa; p=abc"'],
+            ("example.test", "MX"): ["10 mail.example.test."],
+        }
+        loop = asyncio.get_running_loop()
+        transport, server = await loop.create_datagram_endpoint(
+            lambda: FakeDnsServer(records), local_addr=("127.0.0.1", 0)
+        )
+        resolver = DnsResolver(["127.0.0.1"], transport.get_extra_info("sockname")[1], 5.0)
+        try:
+            result = await scan_dns("example.test", resolver)
+        finally:
+            transport.close()
+
+        assert result["spf"]["policy"] == "hardfail"
+        assert result["dmarc"]["policy"] == "reject"
+        assert result["dkim"]["selectors_found"] == ["google"]
+        assert result["mx_records"] == ["10 mail.example.test."]
+        assert result["grade_input"]["zone_transfer_blocked"]
+        assert not result["grade_input"]["dnssec_enabled"]
+        assert server.queries >= 14
+
+
+class TestSubdomainProbe:
+    async def test_probe_marks_live_subdomains(self, monkeypatch):
+        class FakeResponse:
+            status_code = 200
+
+            def json(self):
+                return [
+                    {"name_value": "api.example.test\nold.example.test"},
+                    {"name_value": "*.example.test"},
+                ]
+
+        class FakeClient:
+            def __init__(self, **kwargs):
+                pass
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                pass
+
+            async def get(self, url, params=None):
+                return FakeResponse()
+
+        async def fake_resolve_all(names):
+            return {name: "127.0.0.1" if name.startswith("api.") else None for name in names}
+
+        monkeypatch.setattr(subdomain_enumerator.httpx, "AsyncClient", FakeClient)
+        monkeypatch.setattr(subdomain_enumerator, "resolve_all", fake_resolve_all)
+
+        result = await subdomain_enumerator.enumerate_subdomains("example.test", probe=True)
+
+        assert result["subdomains"] == ["api.example.test", "old.example.test"]
+        assert result["live_subdomains"] == ["api.example.test"]
+        assert result["resolved"] == {"api.example.test": "127.0.0.1"}
+
+
+class TestBatch:
+    @pytest.fixture
+    def batch_fn(self, mcp):
+        batch_security_scanner.register_tools(mcp)
+        return mcp._tool_manager._tools["security_scan_batch"].fn
+
+    async def test_scans_every_host_and_scores_each(self, batch_fn, listeners, tls_context):
+        banner_port, silent_port, closed_port = listeners
+        server, tls_port = await _serve(_silent, ssl_context=tls_context)
+        try:
+            result = await batch_fn(
+                hosts="127.0.0.1, localhost",
+                scans="ssl,ports",
+                ports=f"{banner_port},{closed_port}",
+                timeout=1.0,
+                ssl_port=tls_port,
+            )
+        finally:
+            server.close()
+            await server.wait_closed()
+
+        assert result["hosts_scanned"] == 2
+        assert {r["host"] for r in result["results"]} == {"127.0.0.1", "localhost"}
+        for host_result in result["results"]:
+            assert host_result["ports"]["open_ports"][0]["port"] == banner_port
+            assert host_result["ssl"]["grade_input"]["tls_version_ok"]
+            assert host_result["risk"]["categories"]["ssl_tls"]["skipped"] is False
+            assert host_result["risk"]["categories"]["dns_security"]["skipped"] is True
+        assert len(result["ranked"]) == 2
+        assert result["failed_hosts"] == []
+
+    async def test_risk_matches_the_risk_scorer(self, listeners):
+        results = [
+            r async for r in iter_host_scans(["127.0.0.1"], ("ports",), [listeners[0]], timeout=1.0)
+        ]
+
+        expected = score_results({"network_exposure": results[0]["ports"]})
+        expected.pop("grade_scale")
+        assert results[0]["risk"] == expected
+
+    async def test_results_stream_as_hosts_finish(self, monkeypatch):
+        async def fake_scan_tls(host, port):
+            await asyncio.sleep({"slow.test": 0.1, "fast.test": 0.0}[host])
+            return {"grade_input": {"tls_version_ok": True}}
+
+        monkeypatch.setattr(batch_security_scanner, "scan_tls", fake_scan_tls)
+        seen = []
+
+        async for result in iter_host_scans(["slow.test", "fast.test"], ("ssl",)):
+            seen.append((result["host"], time.perf_counter()))
+
+        assert [host for host, _ in seen] == ["fast.test", "slow.test"]
+        assert seen[1][1] - seen[0][1] > 0.05
+
+    async def test_validation(self, batch_fn):
+        assert "error" in await batch_fn(hosts="a.test", scans="ssl,exploit")
+        assert "error" in await batch_fn(hosts="a.test", ports="80,x")
+        assert "error" in await batch_fn()
+
+
+async def test_batch_scans_hosts_concurrently_on_one_socket_budget(monkeypatch, listeners):
+    """Every host's port scan is in flight at once and shares one limiter."""
+    banner_port, silent_port, _ = listeners
+    hosts = [f"host{i}.test" for i in range(8)]
+    in_flight = 0
+    all_started = asyncio.Event()
+    limiters = set()
+
+    async def fake_scan_ports(host, port_list, timeout, limiter):
+        nonlocal in_flight
+        limiters.add(id(limiter))
+        in_flight += 1
+        if in_flight == len(hosts):
+            all_started.set()
+        # Only returns once every host has started, so a serial scan times out.
+        await asyncio.wait_for(all_started.wait(), timeout=5)
+        return await scan_ports("127.0.0.1", port_list, timeout, limiter)
+
+    monkeypatch.setattr(batch_security_scanner, "scan_ports", fake_scan_ports)
+
+    results = [
+        result
+        async for result in iter_host_scans(
+            hosts, ("ports",), port_list=[banner_port, silent_port], timeout=2.0
+        )
+    ]
+
+    assert sorted(r["host"] for r in results) == hosts
+    assert len(limiters) == 1
+    for result in results:
+        assert [p["port"] for p in result["ports"]["open_ports"]] == sorted(
+            [banner_port, silent_port]
+        )
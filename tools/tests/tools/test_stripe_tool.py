@@ -1089,7 +1089,7 @@ def test_register_tools_registers_all_tools(self):
         mcp = MagicMock()
         mcp.tool.return_value = lambda fn: fn
         register_tools(mcp)
-        assert mcp.tool.call_count == 51
+        assert mcp.tool.call_count == 52
 
     def test_no_credentials_returns_error(self):
         mcp = MagicMock()
@@ -1596,7 +1596,7 @@ def test_stripe_spec_tool_count(self):
         from aden_tools.credentials import CREDENTIAL_SPECS
 
         spec = CREDENTIAL_SPECS["stripe"]
-        assert len(spec.tools) == 51
+        assert len(spec.tools) == 52
 
     def test_stripe_spec_tools_include_core_methods(self):
         from aden_tools.credentials import CREDENTIAL_SPECS
@@ -1608,6 +1608,7 @@ def test_stripe_spec_tools_include_core_methods(self):
             "stripe_get_customer_by_email",
             "stripe_update_customer",
             "stripe_list_customers",
+            "stripe_fetch_customers",
             "stripe_get_subscription",
             "stripe_get_subscription_status",
             "stripe_list_subscriptions",
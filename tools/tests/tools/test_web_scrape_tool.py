@@ -2,10 +2,22 @@
 
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 from fastmcp import FastMCP
 
-from aden_tools.tools.web_scrape_tool import register_tools
+from aden_tools.tools.web_scrape_tool import browser_pool, register_tools, web_scrape_tool
+
+_FETCH_STATIC = web_scrape_tool._fetch_static
+
+
+@pytest.fixture(autouse=True)
+def browser_only(monkeypatch):
+    """Skip the plain-HTTP fast path and start every test with no pooled browser."""
+    monkeypatch.setattr(
+        web_scrape_tool, "_fetch_static", AsyncMock(side_effect=httpx.ConnectError("offline"))
+    )
+    monkeypatch.setattr(browser_pool, "_pools", browser_pool.weakref.WeakKeyDictionary())
 
 
 @pytest.fixture
@@ -349,3 +361,86 @@ async def test_empty_href_skipped(self, mock_pw, mock_stealth, web_scrape_fn):
         # Empty and whitespace-only text should be filtered
         assert "" not in texts
         assert len([t for t in texts if not t.strip()]) == 0
+
+
+ARTICLE = "<p>" + "Static pages are read without starting a browser. " * 10 + "</p>"
+
+
+@pytest.fixture
+def static_site():
+    """A local HTTP server with a static article, an app shell, a PDF and a 404."""
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    pages = {
+        "/article": ("text/html", f"<html><title>Doc</title><body><article>{ARTICLE}</article>"),
+        "/shell": ("text/html", '<html><body><div id="root"></div></body></html>'),
+        "/file.pdf": ("application/pdf", "%PDF-1.4"),
+    }
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            content_type, body = pages.get(self.path, ("text/html", "missing"))
+            self.send_response(200 if self.path in pages else 404)
+            self.send_header("Content-Type", content_type)
+            self.end_headers()
+            self.wfile.write(body.encode())
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+
+
+class TestStaticFastPath:
+    """Static pages are served from a plain HTTP fetch; the rest go to the browser."""
+
+    @pytest.fixture(autouse=True)
+    def http_fetch(self, monkeypatch):
+        monkeypatch.setattr(web_scrape_tool, "_fetch_static", _FETCH_STATIC)
+
+    @pytest.mark.asyncio
+    @patch(_PW_PATH)
+    async def test_static_page_skips_browser(self, mock_pw, web_scrape_fn, static_site):
+        result = await web_scrape_fn(url=f"{static_site}/article", include_links=True)
+
+        assert result["rendered"] is False
+        assert result["title"] == "Doc"
+        assert result["content"].startswith("Static pages are read")
+        mock_pw.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch(_STEALTH_PATH)
+    @patch(_PW_PATH)
+    async def test_app_shell_is_rendered(self, mock_pw, mock_stealth, web_scrape_fn, static_site):
+        mock_cm, _, page = _make_playwright_mocks("<html><body><main>Rendered</main></body></html>")
+        mock_pw.return_value = mock_cm
+        mock_stealth.return_value.apply_stealth_async = AsyncMock()
+
+        result = await web_scrape_fn(url=f"{static_site}/shell")
+
+        assert result["rendered"] is True
+        assert result["content"] == "Rendered"
+        page.wait_for_load_state.assert_awaited_once_with("networkidle", timeout=5000)
+        page.wait_for_timeout.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch(_PW_PATH)
+    async def test_render_never(self, mock_pw, web_scrape_fn, static_site):
+        shell = await web_scrape_fn(url=f"{static_site}/shell", render="never")
+        missing = await web_scrape_fn(url=f"{static_site}/nope", render="never")
+        pdf = await web_scrape_fn(url=f"{static_site}/file.pdf")
+
+        assert shell["rendered"] is False
+        assert missing == {"error": "HTTP 404: Failed to fetch URL"}
+        assert pdf["skipped"] is True
+        mock_pw.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_invalid_render_mode(self, web_scrape_fn):
+        result = await web_scrape_fn(url="https://example.com", render="sometimes")
+
+        assert "render must be one of" in result["error"]
@@ -0,0 +1,198 @@
+"""Tests for the columnar workbook cache used by excel_read, excel_info and excel_search."""
+
+import os
+import stat
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("openpyxl")
+
+from openpyxl import Workbook, load_workbook  # noqa: E402
+
+from aden_tools.tools.excel_tool import workbook_cache  # noqa: E402
+from aden_tools.tools.excel_tool.excel_tool import _convert_cell_value  # noqa: E402
+from aden_tools.tools.excel_tool.workbook_cache import (  # noqa: E402
+    MATCH_TYPES,
+    get_workbook_cache,
+    invalidate_workbook_cache,
+)
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path: Path, monkeypatch):
+    """Keep caches in the test's tmp dir and start with an empty memory cache."""
+    directory = tmp_path / "cache"
+    monkeypatch.setattr(workbook_cache, "CACHE_DIR", str(directory))
+    monkeypatch.setattr(workbook_cache, "_cache", workbook_cache.OrderedDict())
+    return directory
+
+
+@pytest.fixture
+def mixed_xlsx(tmp_path: Path) -> Path:
+    """Mixed types, blanks, unicode and a row wider than the header, across strides."""
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Mixed"
+    ws.append(["name", "amount", None, "when"])
+    for i in range(200):
+        row = [
+            f"Name {i}" if i % 9 else "İstanbul office",
+            i * 1.5 if i % 2 else i,
+            i % 3 == 0 if i % 5 else None,
+            datetime(2024, 1, 1 + i % 28, i % 24, 30),
+        ]
+        if i == 150:
+            row.append("extra 150")
+        ws.append(row)
+    other = wb.create_sheet("Other")
+    other.append(["key"])
+    other.append(["name 1"])
+    other.append(["Name 1"])
+    wb.create_sheet("Empty")
+    path = tmp_path / "mixed.xlsx"
+    wb.save(path)
+    return path
+
+
+def _legacy_search(path: Path, term: str, match_type: str, case_sensitive: bool) -> list:
+    """The cell-by-cell openpyxl search excel_search used before the cache."""
+    term = term if case_sensitive else term.lower()
+    wb = load_workbook(path, read_only=True, data_only=True)
+    matches = []
+    for sheet_name in wb.sheetnames:
+        for row_idx, row in enumerate(wb[sheet_name].iter_rows(min_row=2, values_only=True)):
+            for col_idx, cell_value in enumerate(row):
+                if cell_value is None:
+                    continue
+                value = str(cell_value) if case_sensitive else str(cell_value).lower()
+                if {
+                    "contains": term in value,
+                    "exact": term == value,
+                    "starts_with": value.startswith(term),
+                    "ends_with": value.endswith(term),
+                }[match_type]:
+                    matches.append((sheet_name, row_idx, col_idx, _convert_cell_value(cell_value)))
+    wb.close()
+    return matches
+
+
+def _cached_search(path: Path, term: str, match_type: str, case_sensitive: bool) -> list:
+    workbook = get_workbook_cache(str(path))
+    return [
+        (sheet.name, row, column, value)
+        for sheet in workbook.sheets
+        for row, column, value in workbook.search(sheet, term, match_type, case_sensitive)
+    ]
+
+
+@pytest.mark.parametrize("match_type", MATCH_TYPES)
+@pytest.mark.parametrize("case_sensitive", [False, True])
+@pytest.mark.parametrize("term", ["name 1", "1", "istanbul", "True", "2024-01-05 10", ".5", "0"])
+def test_search_matches_cell_by_cell_scan(mixed_xlsx, term, match_type, case_sensitive):
+    expected = _legacy_search(mixed_xlsx, term, match_type, case_sensitive)
+
+    assert _cached_search(mixed_xlsx, term, match_type, case_sensitive) == expected
+
+
+def test_rows_and_counts_match_openpyxl(mixed_xlsx):
+    wb = load_workbook(mixed_xlsx, read_only=True, data_only=True)
+    expected = [
+        [_convert_cell_value(c) for c in row] for row in wb["Mixed"].iter_rows(values_only=True)
+    ]
+    wb.close()
+
+    workbook = get_workbook_cache(str(mixed_xlsx))
+    sheet = workbook.sheet("Mixed")
+
+    assert workbook.active == "Mixed"
+    assert sheet.header == expected[0]
+    assert sheet.columns == ["name", "amount", "Column_3", "when", "Column_5"]
+    assert sheet.row_count == 200
+    assert sheet.width == 5
+    for offset in (0, 1, 63, 64, 65, 150, 199, 200):
+        assert workbook.read_rows(sheet, offset, 10) == expected[1:][offset : offset + 10]
+    assert workbook.read_rows(sheet, 190) == expected[191:]
+    assert workbook.sheet("Empty").header is None
+
+
+def test_column_stats(mixed_xlsx):
+    stats = get_workbook_cache(str(mixed_xlsx)).sheet("Mixed").column_stats
+
+    assert stats[1] == {
+        "name": "amount",
+        "non_null": 200,
+        "types": {"int": 100, "float": 100},
+        "min": 0,
+        "max": 199 * 1.5,
+    }
+    assert stats[2]["non_null"] == 160
+    assert stats[2]["types"] == {"bool": 160}
+    assert stats[4] == {"name": "Column_5", "non_null": 1, "types": {"str": 1}}
+
+
+def test_cache_is_reused_by_a_fresh_process(mixed_xlsx, monkeypatch):
+    get_workbook_cache(str(mixed_xlsx))
+
+    monkeypatch.setattr(workbook_cache, "_cache", workbook_cache.OrderedDict())
+    monkeypatch.setattr(workbook_cache, "_build", lambda *args: pytest.fail("reconverted"))
+
+    assert get_workbook_cache(str(mixed_xlsx)).sheet("Mixed").row_count == 200
+
+
+def test_changed_workbook_is_reconverted(tmp_path, cache_dir):
+    path = tmp_path / "a.xlsx"
+    wb = Workbook()
+    wb.active.append(["a"])
+    wb.active.append([1])
+    wb.save(path)
+    assert get_workbook_cache(str(path)).sheets[0].row_count == 1
+
+    wb.active.append([2])
+    wb.save(path)
+    invalidate_workbook_cache(str(path))
+
+    assert get_workbook_cache(str(path)).sheets[0].row_count == 2
+    assert len(list(cache_dir.iterdir())) == 1
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX permissions")
+def test_cache_directory_is_private_to_the_user(mixed_xlsx, cache_dir):
+    cache_dir.mkdir(mode=0o777)
+    cache_dir.chmod(0o777)
+
+    get_workbook_cache(str(mixed_xlsx))
+
+    assert stat.S_IMODE(cache_dir.stat().st_mode) == 0o700
+
+
+def test_cache_directory_of_another_user_is_refused(mixed_xlsx, monkeypatch):
+    def refuse(path):
+        raise PermissionError(f"{path} is owned by another user")
+
+    monkeypatch.setattr(workbook_cache, "make_private_dir", refuse)
+    monkeypatch.setattr(workbook_cache, "_load", lambda *args: pytest.fail("cache loaded"))
+
+    with pytest.raises(PermissionError):
+        get_workbook_cache(str(mixed_xlsx))
+
+
+def test_repeated_searches_convert_the_workbook_once(tmp_path, monkeypatch):
+    """Repeated searches of one workbook match openpyxl and convert it only once."""
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Data")
+    ws.append(["id", "name", "city", "amount", "note"])
+    for i in range(1_000):
+        ws.append([i, f"customer {i}", ("Paris", "Lima", "Oslo")[i % 3], i * 0.25, f"n{i % 97}"])
+    path = tmp_path / "data.xlsx"
+    wb.save(path)
+    searches = [("lima", "exact"), ("customer 19", "starts_with"), ("n42", "contains")] * 2
+    builds = []
+    build = workbook_cache._build
+    monkeypatch.setattr(workbook_cache, "_build", lambda p, d: builds.append(p) or build(p, d))
+
+    for term, match in searches:
+        assert _cached_search(path, term, match, False) == _legacy_search(path, term, match, False)
+
+    assert builds == [str(path)]